@@ -36,6 +36,7 @@ def create_dag_bag() -> DBDagBag:
     """Create DagBag with configurable LRU+TTL caching for API server usage."""
     cache_size = conf.getint("api", "dag_cache_size", fallback=64)
     cache_ttl_config = conf.getint("api", "dag_cache_ttl", fallback=3600)
+    cache_max_tasks = conf.getint("api", "dag_cache_max_tasks", fallback=0)
 
     if cache_size < 0:
         log.warning("dag_cache_size must be >= 0, using unbounded dict")
@@ -51,7 +52,7 @@ def create_dag_bag() -> DBDagBag:
     # Disable TTL if cache_ttl is 0
     cache_ttl: int | None = cache_ttl_config if cache_ttl_config > 0 else None
 
-    return DBDagBag(cache_size=cache_size, cache_ttl=cache_ttl)
+    return DBDagBag(cache_size=cache_size, cache_ttl=cache_ttl, cache_max_tasks=max(cache_max_tasks, 0))
 
 
 def dag_bag_from_app(request: Request) -> DBDagBag:
@@ -65,9 +66,9 @@ def dag_bag_from_app(request: Request) -> DBDagBag:
 
 
 def get_latest_version_of_dag(
-    dag_bag: DBDagBag, dag_id: str, session: Session, include_reason: bool = False
+    dag_bag: DBDagBag, dag_id: str, session: Session, include_reason: bool = False, lazy: bool = False
 ) -> SerializedDAG:
-    dag = dag_bag.get_latest_version_of_dag(dag_id, session=session)
+    dag = dag_bag.get_latest_version_of_dag(dag_id, session=session, lazy=lazy)
     if not dag:
         if include_reason:
             raise HTTPException(
@@ -20,8 +20,9 @@ from __future__ import annotations
 import contextlib
 import textwrap
 from collections.abc import Generator, Iterable
+from typing import Annotated
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from itsdangerous import BadSignature, URLSafeSerializer
 from pydantic import NonNegativeInt, PositiveInt
@@ -101,6 +102,13 @@ def get_log(
     full_content: bool = False,
     map_index: int = -1,
     token: str | None = None,
+    tail_lines: Annotated[
+        PositiveInt | None, Query(description="Only return this many log lines, the last ones.")
+    ] = None,
+    levels: Annotated[
+        list[str] | None,
+        Query(description="Only return the log lines of these levels. Can be set multiple times."),
+    ] = None,
 ):
     """Get logs for a specific task instance."""
     if not token:
@@ -161,12 +169,21 @@ def get_log(
         with contextlib.suppress(TaskNotFound):
             ti.task = dag.get_task(ti.task_id)
 
+    # The selected lines are read once, so there is nothing to continue reading
+    select_lines = tail_lines is not None or bool(levels)
+
     if accept == Mimetype.NDJSON:  # only specified application/x-ndjson will return streaming response
         # LogMetadata(TypedDict) is used as type annotation for log_reader; added ignore to suppress mypy error
-        raw_stream = task_log_reader.read_log_stream(ti, try_number, metadata)  # type: ignore[arg-type]
+        raw_stream = task_log_reader.read_log_stream(
+            ti,
+            try_number,
+            metadata,  # type: ignore[arg-type]
+            tail_lines=tail_lines,
+            levels=levels,
+        )
         log_stream = _buffered_ndjson_stream(raw_stream)
         headers = None
-        if not metadata.get("end_of_log", False):
+        if not select_lines and not metadata.get("end_of_log", False):
             headers = {
                 "Airflow-Continuation-Token": URLSafeSerializer(request.app.state.secret_key).dumps(metadata)
             }
@@ -175,6 +192,14 @@ def get_log(
     # application/json, or something else we don't understand.
     # Return JSON format, which will be more easily for users to debug.
 
+    if select_lines:
+        return TaskInstancesLogResponse.model_construct(
+            continuation_token=None,
+            content=list(
+                task_log_reader.read_log_lines(ti, try_number, tail_lines=tail_lines, levels=levels)
+            ),
+        )
+
     # LogMetadata(TypedDict) is used as type annotation for log_reader; added ignore to suppress mypy error
     structured_log_stream, out_metadata = task_log_reader.read_log_chunks(ti, try_number, metadata)  # type: ignore[arg-type]
     encoded_token = None
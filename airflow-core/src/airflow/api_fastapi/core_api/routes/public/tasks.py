@@ -104,7 +104,7 @@ def get_tasks(
 )
 def get_task(dag_id: str, task_id, session: SessionDep, dag_bag: DagBagDep) -> TaskResponse:
     """Get simplified representation of a task."""
-    dag = get_latest_version_of_dag(dag_bag, dag_id, session)
+    dag = get_latest_version_of_dag(dag_bag, dag_id, session, lazy=True)
     try:
         task = dag.get_task(task_id=task_id)
     except TaskNotFound:
@@ -22,11 +22,12 @@ from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 import structlog
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy import exists, select
 from sqlalchemy.orm import Session, joinedload, load_only
 
+from airflow import __version__ as airflow_version
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.dagbag import DagBagDep
 from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
@@ -59,6 +60,8 @@ from airflow.api_fastapi.core_api.services.ui.grid import (
     _find_aggregates,
     _get_aggs_for_node,
     _merge_node_dicts,
+    get_grid_ti_summary_cache,
+    get_ti_summary_fingerprints,
 )
 from airflow.api_fastapi.core_api.services.ui.task_group import (
     get_task_group_children_getter,
@@ -69,6 +72,7 @@ from airflow.models.dagrun import DagRun
 from airflow.models.deadline import Deadline
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.session import create_session
 
 if TYPE_CHECKING:
@@ -79,6 +83,37 @@ log = structlog.get_logger(logger_name=__name__)
 grid_router = AirflowRouter(prefix="/grid", tags=["Grid"])
 
 
+def _etag(*parts: str) -> str:
+    """Return a weak ETag for a response built from these parts, and by this version of Airflow."""
+    digest = md5(airflow_version.encode())
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\n")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """
+    Return a ``304 Not Modified`` response if the client already has the response with this ETag.
+
+    Browsers send the ETag of the response they cached in the ``If-None-Match`` header, and show
+    the cached response again when they get a ``304``: grids which did not change are then
+    refreshed without being sent again.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" not in tags and etag.removeprefix("W/") not in tags:
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    # ``no-cache`` lets browsers keep the response, as long as they check it is still current.
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
 def _get_latest_serdag(dag_id, session):
     serdag = session.scalar(
         select(SerializedDagModel)
@@ -256,11 +291,14 @@ def get_dag_structure(
             )
         ),
     ],
+    response_model=list[GridRunsResponse],
     response_model_exclude_none=True,
 )
 def get_grid_runs(
     dag_id: str,
     session: SessionDep,
+    request: Request,
+    response: Response,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -282,8 +320,12 @@ def get_grid_runs(
     state: QueryDagRunStateFilter,
     triggering_user: QueryDagRunTriggeringUserSearch,
     triggering_user_prefix: QueryDagRunTriggeringUserPrefixSearch,
-) -> list[GridRunsResponse]:
-    """Get info about a run for the grid."""
+) -> list[GridRunsResponse] | Response:
+    """
+    Get info about a run for the grid.
+
+    The response has an ETag; it is not sent again to clients which already have it.
+    """
     # Retrieve, sort the previous Dag Runs
     has_missed_deadline = (
         exists()
@@ -349,6 +391,10 @@ def get_grid_runs(
                 }
             )
         )
+    etag = _etag(*(grid_run.model_dump_json(exclude_none=True) for grid_run in grid_runs))
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+    response.headers.update(_cache_headers(etag))
     return grid_runs
 
 
@@ -447,8 +493,9 @@ def _build_ti_summaries(
 def get_grid_ti_summaries_stream(
     dag_id: str,
     dag_bag: DagBagDep,
+    request: Request,
     run_ids: Annotated[list[str] | None, Query()] = None,
-) -> StreamingResponse:
+) -> Response:
     """
     Stream TI summaries for multiple Dag runs as NDJSON (one JSON line per run).
 
@@ -459,7 +506,20 @@ def get_grid_ti_summaries_stream(
     The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
     (keyed by ``dag_version_id``), which avoids repeated deserialization across
     runs of the same version *and* across requests.
+
+    The task instances of the runs are only read when they changed since their
+    summary was last built: a fingerprint of the task instances of every run,
+    computed by the database, tells which summaries can be served from the
+    app-wide ``GridTISummaryCache``. The fingerprints are also the ETag of the
+    response, which is not sent again to clients which already have it.
     """
+    run_ids = list(dict.fromkeys(run_ids or []))
+    with create_session(scoped=False) as session:
+        fingerprints = get_ti_summary_fingerprints(dag_id, run_ids, session) if run_ids else {}
+    etag = _etag(dag_id, *(f"{run_id}={fingerprints.get(run_id)}" for run_id in run_ids))
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+    summary_cache = get_grid_ti_summary_cache()
 
     def _generate() -> Generator[str, None, None]:
         # Each iteration opens and closes its own DB session so the connection is
@@ -467,7 +527,14 @@ def get_grid_ti_summaries_stream(
         # database connection open for the entire stream duration.
         # See https://github.com/apache/airflow/issues/65010.
 
-        for run_id in run_ids or []:
+        for run_id in run_ids:
+            fingerprint = fingerprints.get(run_id)
+            if fingerprint is None:
+                # The run has no task instances.
+                continue
+            if (line := summary_cache.get(dag_id, run_id, fingerprint)) is not None:
+                yield line
+                continue
             with create_session(scoped=False) as session:
                 tis = session.execute(
                     select(
@@ -493,6 +560,12 @@ def get_grid_ti_summaries_stream(
                 )
             if summary is None:
                 continue
-            yield GridTISummaries.model_validate(summary).model_dump_json() + "\n"
-
-    return StreamingResponse(content=_generate(), media_type="application/x-ndjson")
+            line = GridTISummaries.model_validate(summary).model_dump_json() + "\n"
+            # The task instances may have changed since the fingerprint was computed, in which case
+            # the fingerprint of the run no longer matches and the summary is built again next time.
+            summary_cache.set(dag_id, run_id, fingerprint, line)
+            yield line
+
+    return StreamingResponse(
+        content=_generate(), media_type="application/x-ndjson", headers=_cache_headers(etag)
+    )
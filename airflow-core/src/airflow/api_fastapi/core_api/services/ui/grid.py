@@ -21,19 +21,104 @@ from collections import Counter
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
 import structlog
+from cachetools import LRUCache
+from sqlalchemy import func, select
 
 from airflow.api_fastapi.common.parameters import state_priority
 from airflow.api_fastapi.core_api.services.ui.task_group import get_task_group_children_getter
+from airflow.configuration import conf
+from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskmap import TaskMap
 from airflow.serialization.definitions.baseoperator import SerializedBaseOperator
 from airflow.serialization.definitions.mappedoperator import SerializedMappedOperator
 from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
 
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    from sqlalchemy.orm import Session
+
 log = structlog.get_logger(logger_name=__name__)
 
+TISummaryFingerprint: TypeAlias = tuple[tuple[str, int, str], ...]
+"""Number of task instances of a Dag run per state, and the last time one of them was updated."""
+
+
+def get_ti_summary_fingerprints(
+    dag_id: str, run_ids: Iterable[str], session: Session
+) -> dict[str, TISummaryFingerprint]:
+    """
+    Return the fingerprint of the task instances of Dag runs, which changes when their summary does.
+
+    The fingerprint of a run counts its task instances per state, which does not depend on the
+    clocks of the components updating them, along with the last time one of them was updated, to
+    account for changes of their dates and Dag versions. It is computed by the database, so it is
+    much cheaper to get than the task instances themselves. Runs without task instances are left out.
+    """
+    rows = session.execute(
+        select(
+            TaskInstance.run_id,
+            TaskInstance.state,
+            func.count(),
+            func.max(TaskInstance.updated_at),
+        )
+        .where(TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(list(run_ids)))
+        .group_by(TaskInstance.run_id, TaskInstance.state)
+    )
+    entries: dict[str, list[tuple[str, int, str]]] = {}
+    for run_id, state, count, updated_at in rows:
+        entries.setdefault(run_id, []).append(
+            (state or "", count, updated_at.isoformat() if updated_at else "")
+        )
+    return {run_id: tuple(sorted(run_entries)) for run_id, run_entries in entries.items()}
+
+
+class GridTISummaryCache:
+    """
+    Serialized TI summaries of Dag runs, kept as long as the task instances of the runs are unchanged.
+
+    Summaries are stored along with the fingerprint of the task instances they were built from
+    (see :func:`get_ti_summary_fingerprints`), and only returned while the fingerprint of their run
+    is the same. Least recently used summaries are evicted first.
+
+    :param maxsize: Number of summaries to keep, or 0 not to keep any.
+    """
+
+    def __init__(self, maxsize: int):
+        self._summaries: LRUCache[tuple[str, str], tuple[TISummaryFingerprint, str]] | None = (
+            LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        )
+        # cachetools caches are not thread-safe, and routes run in a thread pool.
+        self._lock = Lock()
+
+    def get(self, dag_id: str, run_id: str, fingerprint: TISummaryFingerprint) -> str | None:
+        """Return the summary of a Dag run, if it was built from task instances with this fingerprint."""
+        if self._summaries is None:
+            return None
+        with self._lock:
+            entry = self._summaries.get((dag_id, run_id))
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1]
+
+    def set(self, dag_id: str, run_id: str, fingerprint: TISummaryFingerprint, summary: str) -> None:
+        """Store the summary of a Dag run, built from task instances with this fingerprint."""
+        if self._summaries is None:
+            return
+        with self._lock:
+            self._summaries[(dag_id, run_id)] = (fingerprint, summary)
+
+
+@cache
+def get_grid_ti_summary_cache() -> GridTISummaryCache:
+    """Return the cache of TI summaries of the API server, sized by ``[api] grid_ti_summary_cache_size``."""
+    return GridTISummaryCache(max(conf.getint("api", "grid_ti_summary_cache_size", fallback=1024), 0))
+
 
 @dataclass
 class GridNodeAgg:
@@ -1211,7 +1211,7 @@ def validate_inlets_and_outlets(
 
     if not ti.task:
         dr = ti.dag_run
-        dag = dag_bag.get_dag_for_run(dag_run=dr, session=session)
+        dag = dag_bag.get_dag_for_run(dag_run=dr, session=session, lazy=True)
         if dag:
             with contextlib.suppress(TaskNotFound):
                 ti.task = dag.get_task(ti.task_id)
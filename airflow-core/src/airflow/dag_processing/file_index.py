@@ -0,0 +1,187 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Incrementally updated index of the Dag files of a bundle."""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from airflow.configuration import conf
+from airflow.utils.file import might_contain_dag
+
+log = logging.getLogger(__name__)
+
+
+class _FileSignature(NamedTuple):
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> _FileSignature:
+        return cls(st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@dataclass
+class _IndexEntry:
+    signature: _FileSignature
+    is_dag_file: bool
+    is_zip: bool
+    zipped_dag_paths: list[str] | None = None
+
+
+@dataclass
+class FileIndexScan:
+    """Result of scanning a bundle with a :class:`BundleFileIndex`."""
+
+    dag_files: list[str] = field(default_factory=list)
+    """Absolute paths of all files that might contain Dags."""
+    changed: list[str] = field(default_factory=list)
+    """Dag files that were already indexed and were modified since the previous scan."""
+    added: list[str] = field(default_factory=list)
+    """Dag files that were not indexed as Dag files before."""
+    removed: list[str] = field(default_factory=list)
+    """Dag files that were indexed before and are gone or no longer Dag files."""
+
+
+class BundleFileIndex:
+    """
+    Index of the files of a bundle, updated incrementally every time the bundle is scanned.
+
+    The bundle directory still has to be walked to find new and removed files, but only
+    files whose modification time, size or inode changed since the previous scan are
+    opened to check whether they might contain Dags, and the Dag files inside ZIP
+    archives are only listed again when the archive changed. On network storage, reading
+    every file is what makes scanning large bundles slow.
+
+    :param safe_mode: whether to use a heuristic to determine whether a file contains Dags,
+        see ``[core] dag_discovery_safe_mode``
+    """
+
+    def __init__(self, safe_mode: bool | None = None) -> None:
+        if safe_mode is None:
+            safe_mode = conf.getboolean("core", "DAG_DISCOVERY_SAFE_MODE", fallback=True)
+        self.safe_mode = safe_mode
+        self._entries: dict[str, _IndexEntry] = {}
+        self._scanned = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scan(self, directory: str | os.PathLike[str]) -> FileIndexScan:
+        """
+        Scan ``directory`` for Dag files, reusing what is known about unchanged files.
+
+        Changed files are only reported once the index has been populated by a first scan.
+        """
+        from airflow._shared.module_loading.file_discovery import find_path_from_directory
+
+        directory = os.fspath(directory)
+        # Like ``list_py_file_paths``, a bundle that is a single file is always a Dag file.
+        single_file = os.path.isfile(directory)
+        if single_file:
+            paths = [directory]
+        elif os.path.isdir(directory):
+            ignore_file_syntax = conf.get_mandatory_value("core", "DAG_IGNORE_FILE_SYNTAX", fallback="glob")
+            paths = find_path_from_directory(directory, ".airflowignore", ignore_file_syntax)
+        else:
+            paths = []
+
+        result = FileIndexScan()
+        entries: dict[str, _IndexEntry] = {}
+        for path in map(os.fspath, paths):
+            try:
+                st = os.stat(path)
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                signature = _FileSignature.from_stat(st)
+                previous = self._entries.get(path)
+                if previous is not None and previous.signature == signature:
+                    entry = previous
+                else:
+                    entry = self._examine(path, signature, force_dag_file=single_file)
+                entries[path] = entry
+            except Exception:
+                log.exception("Error while examining %s", path)
+                continue
+
+            if not entry.is_dag_file:
+                continue
+            result.dag_files.append(path)
+            if previous is None or not previous.is_dag_file:
+                result.added.append(path)
+            elif entry is not previous and self._scanned:
+                result.changed.append(path)
+
+        result.removed = [
+            path
+            for path, entry in self._entries.items()
+            if entry.is_dag_file and not (path in entries and entries[path].is_dag_file)
+        ]
+        self._entries = entries
+        self._scanned = True
+        return result
+
+    def _examine(self, path: str, signature: _FileSignature, *, force_dag_file: bool) -> _IndexEntry:
+        is_zip = not path.endswith(".py") and zipfile.is_zipfile(path)
+        is_dag_file = force_dag_file or (
+            (path.endswith(".py") or is_zip) and might_contain_dag(path, self.safe_mode)
+        )
+        return _IndexEntry(signature=signature, is_dag_file=is_dag_file, is_zip=is_zip)
+
+    def is_zip(self, path: str) -> bool | None:
+        """Whether the indexed file at ``path`` is a ZIP archive, or None if it is not indexed."""
+        entry = self._entries.get(path)
+        return entry.is_zip if entry is not None else None
+
+    def signature(self, path: str) -> _FileSignature | None:
+        """
+        Return the modification time, size and inode of the indexed file at ``path``, as of the latest scan.
+
+        Return None if the file is not indexed.
+        """
+        entry = self._entries.get(path)
+        return entry.signature if entry is not None else None
+
+    def zipped_dag_paths(self, path: str) -> list[str]:
+        """
+        Return the absolute paths of the files that might contain Dags inside the indexed ZIP archive.
+
+        The archive is only opened the first time this is called after it changed.
+        """
+        entry = self._entries[path]
+        if entry.zipped_dag_paths is None:
+            entry.zipped_dag_paths = list(find_zipped_dags(path))
+        return entry.zipped_dag_paths
+
+
+def find_zipped_dags(abs_path: str | os.PathLike[str]) -> Iterator[str]:
+    """Yield absolute paths for DAG-like files inside a ZIP archive."""
+    try:
+        with zipfile.ZipFile(abs_path) as z:
+            for info in z.infolist():
+                if might_contain_dag(info.filename, True, z):
+                    yield os.path.join(abs_path, info.filename)
+    except zipfile.BadZipFile:
+        log.exception("There was an error accessing ZIP file %s", abs_path)
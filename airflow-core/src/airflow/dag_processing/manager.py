@@ -42,6 +42,7 @@ import attrs
 import structlog
 from sqlalchemy import select, update
 from sqlalchemy.orm import load_only
+from sqlalchemy.orm.exc import StaleDataError
 from tabulate import tabulate
 from uuid6 import uuid7
 
@@ -53,7 +54,12 @@ from airflow.configuration import conf
 from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.file_index import BundleFileIndex, find_zipped_dags
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    _preload_parsing_modules,
+)
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
@@ -65,8 +71,9 @@ from airflow.models.errors import ParseImportError
 from airflow.observability.metrics import stats_utils
 from airflow.sdk import SecretCache
 from airflow.sdk.log import init_log_file, logging_processors
+from airflow.settings import json
 from airflow.typing_compat import assert_never
-from airflow.utils.file import list_py_file_paths, might_contain_dag
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
 from airflow.utils.process_utils import (
@@ -77,7 +84,7 @@ from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import prohibit_commit, with_row_locks
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from socket import socket
 
     from sqlalchemy.orm import Session
@@ -102,6 +109,14 @@ class BundleState(NamedTuple):
     version: str | None
 
 
+class _UnchangedParseResult(NamedTuple):
+    """A parse result identical to the one last written, whose Dags only need their last parsed time bumped."""
+
+    file_key: tuple[str, str]
+    dag_ids: list[str]
+    parse_duration: float
+
+
 @attrs.define
 class DagFileStat:
     """Information about single processing of one file."""
@@ -110,6 +125,7 @@ class DagFileStat:
     import_errors: int = 0
     last_finish_time: datetime | None = None
     last_duration: float | None = None
+    last_cpu_time: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
 
@@ -223,6 +239,9 @@ class DagFileProcessorManager(LoggingMixin):
     stale_dag_threshold: float = attrs.field(
         factory=_config_int_factory("dag_processor", "stale_dag_threshold")
     )
+    unchanged_parse_result_sync_interval: float = attrs.field(
+        factory=_config_int_factory("dag_processor", "unchanged_parse_result_sync_interval")
+    )
 
     _last_deactivate_stale_dags_time: float = attrs.field(default=0, init=False)
     _last_stale_bundle_cleanup_time: float = attrs.field(default=0, init=False)
@@ -241,9 +260,18 @@ class DagFileProcessorManager(LoggingMixin):
 
     _dag_bundles: list[BaseDagBundle] = attrs.field(factory=list, init=False)
     _bundle_versions: dict[str, str | None] = attrs.field(factory=dict, init=False)
+    _bundle_file_indexes: dict[str, BundleFileIndex] = attrs.field(factory=dict, init=False)
+    _changed_files: dict[str, list[Path]] = attrs.field(factory=dict, init=False)
+    """Files of each bundle modified since the previous scan, as found by the latest scan."""
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
 
+    _parse_result_fingerprints: dict[tuple[str, str], tuple[str, float]] = attrs.field(
+        factory=dict, init=False
+    )
+    """Fingerprint of the parse result last fully written for each file, and when it was written."""
+    _unchanged_parse_results: list[_UnchangedParseResult] = attrs.field(factory=list, init=False)
+
     _parsing_start_time: float | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
 
@@ -321,6 +349,8 @@ class DagFileProcessorManager(LoggingMixin):
         self.log.info("Process each file at most once every %s seconds", self._file_process_interval)
         self.prepare_bundles()
         self._symlink_latest_log_directory()
+        # Every parsing process is forked from this one, so they all start with these imported.
+        _preload_parsing_modules(self.log)
         # To prevent COW in forked process parsing dag file
         gc.freeze()
 
@@ -833,6 +863,19 @@ class DagFileProcessorManager(LoggingMixin):
             }
 
             known_files[bundle.name] = found_files
+            changed_files = [
+                DagFileInfo(rel_path=p, bundle_name=bundle.name, bundle_path=bundle.path)
+                for p in self._changed_files.pop(bundle.name, ())
+            ]
+            if changed_files:
+                self.log.info(
+                    "Adding %d changed files of bundle %s to the front of the queue",
+                    len(changed_files),
+                    bundle.name,
+                )
+                self._add_files_to_queue(
+                    [f for f in changed_files if f not in self._processors], mode="front"
+                )
 
             self.deactivate_deleted_dags(bundle_name=bundle.name, present=found_files)
             self.clear_orphaned_import_errors(
@@ -846,11 +889,27 @@ class DagFileProcessorManager(LoggingMixin):
             self._add_new_files_to_queue(known_files=known_files)
 
     def _find_files_in_bundle(self, bundle: BaseDagBundle) -> list[Path]:
-        """Get relative paths for dag files from bundle dir."""
+        """
+        Get relative paths for dag files from bundle dir.
+
+        Files are looked up in the bundle's file index, so only files that changed since
+        the previous scan are read. The files that changed are kept in ``_changed_files``.
+        """
         # Build up a list of Python files that could contain DAGs
         self.log.info("Searching for files in %s at %s", bundle.name, bundle.path)
-        rel_paths = [Path(x).relative_to(bundle.path) for x in list_py_file_paths(bundle.path)]
-        self.log.info("Found %s files for bundle %s", len(rel_paths), bundle.name)
+        if (index := self._bundle_file_indexes.get(bundle.name)) is None:
+            index = self._bundle_file_indexes[bundle.name] = BundleFileIndex()
+        scan = index.scan(bundle.path)
+        rel_paths = [Path(x).relative_to(bundle.path) for x in scan.dag_files]
+        self._changed_files[bundle.name] = [Path(x).relative_to(bundle.path) for x in scan.changed]
+        self.log.info(
+            "Found %s files for bundle %s (%s added, %s changed, %s removed)",
+            len(rel_paths),
+            bundle.name,
+            len(scan.added),
+            len(scan.changed),
+            len(scan.removed),
+        )
 
         return rel_paths
 
@@ -862,28 +921,26 @@ class DagFileProcessorManager(LoggingMixin):
         For ZIP archives this includes DAG-like inner paths such as
         ``archive.zip/dag.py``.
         """
-
-        def find_zipped_dags(abs_path: os.PathLike) -> Iterator[str]:
-            """Yield absolute paths for DAG-like files inside a ZIP archive."""
-            try:
-                with zipfile.ZipFile(abs_path) as z:
-                    for info in z.infolist():
-                        if might_contain_dag(info.filename, True, z):
-                            yield os.path.join(abs_path, info.filename)
-            except zipfile.BadZipFile:
-                self.log.exception("There was an error accessing ZIP file %s", abs_path)
-
         observed_filelocs: set[str] = set()
         for info in present:
             abs_path = str(info.absolute_path)
-            if abs_path.endswith(".py") or not zipfile.is_zipfile(abs_path):
-                observed_filelocs.add(str(info.rel_path))
+            # Files found by scanning the bundle are in its index, which caches the DAG-like
+            # files inside ZIP archives until the archive changes.
+            index = self._bundle_file_indexes.get(info.bundle_name)
+            indexed_as_zip = index.is_zip(abs_path) if index is not None else None
+            zipped_dags: Iterable[str]
+            if index is not None and indexed_as_zip:
+                zipped_dags = index.zipped_dag_paths(abs_path)
+            elif indexed_as_zip is None and not abs_path.endswith(".py") and zipfile.is_zipfile(abs_path):
+                zipped_dags = find_zipped_dags(abs_path=info.absolute_path)
             else:
-                if TYPE_CHECKING:
-                    assert info.bundle_path
-                for abs_sub_path in find_zipped_dags(abs_path=info.absolute_path):
-                    rel_sub_path = Path(abs_sub_path).relative_to(info.bundle_path)
-                    observed_filelocs.add(str(rel_sub_path))
+                observed_filelocs.add(str(info.rel_path))
+                continue
+            if TYPE_CHECKING:
+                assert info.bundle_path
+            for abs_sub_path in zipped_dags:
+                rel_sub_path = Path(abs_sub_path).relative_to(info.bundle_path)
+                observed_filelocs.add(str(rel_sub_path))
 
         return observed_filelocs
 
@@ -945,6 +1002,8 @@ class DagFileProcessorManager(LoggingMixin):
         # running for in seconds.
         # Last Runtime: If the process ran before, how long did it take to
         # finish in seconds
+        # Last CPU Time: CPU time the process parsing the file spent in the
+        # previous run, in seconds.
         # Last Run: When the file finished processing in the previous run.
         # Last # of DB Queries: The number of queries performed to the
         # Airflow database during last parsing of the file.
@@ -956,6 +1015,7 @@ class DagFileProcessorManager(LoggingMixin):
             "# DAGs",
             "# Errors",
             "Last Duration",
+            "Last CPU Time",
             "Last Run At",
         ]
 
@@ -987,6 +1047,7 @@ class DagFileProcessorManager(LoggingMixin):
                         num_dags,
                         num_errors,
                         stat.last_duration,
+                        stat.last_cpu_time,
                         last_run,
                     )
                 )
@@ -1003,6 +1064,7 @@ class DagFileProcessorManager(LoggingMixin):
             num_dags,
             num_errors,
             last_runtime,
+            last_cpu_time,
             last_run,
         ) in rows:
             formatted_rows.append(
@@ -1014,6 +1076,7 @@ class DagFileProcessorManager(LoggingMixin):
                     num_dags,
                     num_errors,
                     f"{last_runtime:.2f}s" if last_runtime else None,
+                    f"{last_cpu_time:.2f}s" if last_cpu_time is not None else None,
                     last_run.strftime("%Y-%m-%dT%H:%M:%S") if last_run else None,
                 )
             )
@@ -1051,6 +1114,11 @@ class DagFileProcessorManager(LoggingMixin):
         self.terminate_orphan_processes(present=files_set)
         self.remove_orphaned_file_stats(present=files_set)
 
+        present_keys = {(file.bundle_name, str(file.rel_path)) for file in files_set}
+        self._parse_result_fingerprints = {
+            key: value for key, value in self._parse_result_fingerprints.items() if key in present_keys
+        }
+
     def purge_removed_files_from_queue(self, present: set[DagFileInfo]):
         """Remove from queue any files no longer observed locally."""
         present_keys = {file.presence_key for file in present}
@@ -1145,6 +1213,7 @@ class DagFileProcessorManager(LoggingMixin):
                     import_errors=current_stat.import_errors,
                     last_finish_time=finish_time,
                     last_duration=run_duration,
+                    last_cpu_time=proc.parsing_result.cpu_time,
                     run_count=current_stat.run_count + 1,
                     last_num_of_db_queries=current_stat.last_num_of_db_queries,
                 )
@@ -1162,7 +1231,39 @@ class DagFileProcessorManager(LoggingMixin):
         relative_fileloc: str | None,
         session: Session,
     ) -> None:
-        """Persist parsed DAG data to the metadata database."""
+        """
+        Persist parsed DAG data to the metadata database.
+
+        If the file and everything its parse produced are identical to what was last written for
+        it, less than ``unchanged_parse_result_sync_interval`` seconds ago, nothing is written here.
+        Only the last parsed time of its Dags is bumped later, for all such files at once, by
+        :meth:`_update_unchanged_parse_results`.
+        """
+        fingerprint: str | None = None
+        if relative_fileloc is not None and self.unchanged_parse_result_sync_interval > 0:
+            file_key = (bundle_name, relative_fileloc)
+            index = self._bundle_file_indexes.get(bundle_name)
+            signature = index.signature(parsing_result.fileloc) if index is not None else None
+            if signature is not None:
+                fingerprint = _parse_result_fingerprint(bundle_version, signature, parsing_result)
+            # Forget the previous fingerprint first, so a failed write is never taken as the last one.
+            previous = self._parse_result_fingerprints.pop(file_key, None)
+            if (
+                fingerprint is not None
+                and previous is not None
+                and previous[0] == fingerprint
+                and time.monotonic() - previous[1] < self.unchanged_parse_result_sync_interval
+            ):
+                self._parse_result_fingerprints[file_key] = previous
+                self._unchanged_parse_results.append(
+                    _UnchangedParseResult(
+                        file_key=file_key,
+                        dag_ids=[dag.dag_id for dag in parsing_result.serialized_dags],
+                        parse_duration=run_duration,
+                    )
+                )
+                return
+
         import_errors: dict[tuple[str, str], str] = {}
         if parsing_result.import_errors:
             import_errors = {
@@ -1190,6 +1291,46 @@ class DagFileProcessorManager(LoggingMixin):
             session=session,
             files_parsed=files_parsed,
         )
+        if fingerprint is not None and relative_fileloc is not None:
+            self._parse_result_fingerprints[(bundle_name, relative_fileloc)] = (fingerprint, time.monotonic())
+
+    @provide_session
+    def _update_unchanged_parse_results(self, *, session: Session = NEW_SESSION) -> None:
+        """Bump the last parsed time of the Dags of all files whose parse result was unchanged."""
+        unchanged, self._unchanged_parse_results = self._unchanged_parse_results, []
+        now = timezone.utcnow()
+        params = [
+            {
+                "dag_id": dag_id,
+                "is_stale": False,
+                "last_parsed_time": now,
+                "last_parse_duration": result.parse_duration,
+            }
+            for result in unchanged
+            for dag_id in result.dag_ids
+        ]
+        if not params:
+            return
+        self.log.debug("Parse results of %d files unchanged, only updating their Dags", len(unchanged))
+        try:
+            # ORM bulk UPDATE by primary key, sent as a single executemany.
+            session.execute(update(DagModel).execution_options(synchronize_session=False), params)
+            session.commit()
+        except StaleDataError:
+            # Some Dags were deleted from the database since their file was last fully written.
+            self.log.warning(
+                "Dags of files with unchanged parse results are missing, they will be fully written again"
+            )
+        except Exception:
+            self.log.exception(
+                "Failed to update the Dags of files with unchanged parse results, "
+                "they will be fully written again"
+            )
+        else:
+            return
+        session.rollback()
+        for result in unchanged:
+            self._parse_result_fingerprints.pop(result.file_key, None)
 
     def _collect_results(self):
         finished = []
@@ -1204,6 +1345,9 @@ class DagFileProcessorManager(LoggingMixin):
             processor = self._processors.pop(file)
             processor.logger_filehandle.close()
 
+        if self._unchanged_parse_results:
+            self._update_unchanged_parse_results()
+
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
 
@@ -1554,6 +1698,28 @@ def emit_metrics(*, parse_time: float, dag_file_stats: Sequence[DagFileStat]):
     stats.gauge("dag_processing.import_errors", sum(stat.import_errors for stat in dag_file_stats))
 
 
+def _parse_result_fingerprint(
+    bundle_version: str | None, file_signature: Sequence[int], parsing_result: DagFileParsingResult
+) -> str:
+    """
+    Hash the file that was parsed together with everything its parse produced.
+
+    Parse results with the same fingerprint write exactly the same rows to the metadata database,
+    apart from the last parsed time of the Dags. The Dag source code is stored too, so the file is
+    identified by its modification time, size and inode as recorded by the bundle's file index,
+    rather than by reading it again. Dags are compared by the hash of their serialized data.
+    """
+    outputs = {
+        "bundle_version": bundle_version,
+        "fileloc": parsing_result.fileloc,
+        "file_signature": list(file_signature),
+        "dags": [dag.hash for dag in parsing_result.serialized_dags],
+        "import_errors": parsing_result.import_errors,
+        "warnings": parsing_result.warnings,
+    }
+    return md5(json.dumps(outputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
 def process_parse_results(
     run_duration: float,
     finish_time: datetime,
@@ -1582,6 +1748,7 @@ def process_parse_results(
         stat = DagFileStat(
             last_finish_time=finish_time,
             last_duration=run_duration,
+            last_cpu_time=parsing_result.cpu_time if parsing_result is not None else None,
             run_count=run_count + 1,
         )
 
@@ -1596,6 +1763,12 @@ def process_parse_results(
             stat.last_duration,
             tags={"bundle_name": normalized_bundle, "file_name": file_name},
         )
+        if stat.last_cpu_time is not None:
+            stats.timing(
+                "dag_processing.last_cpu_time",
+                stat.last_cpu_time,
+                tags={"bundle_name": normalized_bundle, "file_name": file_name},
+            )
 
     if parsing_result is None:
         # No DAGs were parsed - this happens for callback-only processing
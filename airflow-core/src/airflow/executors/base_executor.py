@@ -222,6 +222,8 @@ class BaseExecutor(LoggingMixin):
         self.event_buffer: dict[WorkloadKey, EventBufferValueType] = {}
         self._task_event_logs: deque[Log] = deque()
         self.conf = ExecutorConf(team_name)
+        self.event_buffer_size: int = self.conf.getint("core", "executor_event_buffer_size", fallback=0)
+        self._event_buffer_full_after_sync = False
 
         if self.parallelism <= 0:
             raise ValueError("parallelism is set to 0 or lower")
@@ -330,6 +332,17 @@ class BaseExecutor(LoggingMixin):
         Executors should override this to perform gather statuses.
         """
 
+    @property
+    def event_buffer_full(self) -> bool:
+        """
+        Whether the event buffer holds ``[core] executor_event_buffer_size`` events or more.
+
+        While the buffer is full, the executor does not start new workloads, and executors reading
+        events from their workers should leave them with the workers until the scheduler has
+        processed the buffered ones.
+        """
+        return 0 < self.event_buffer_size <= len(self.event_buffer)
+
     def heartbeat(self) -> None:
         """Heartbeat sent to trigger new jobs."""
         open_slots = self.parallelism - len(self.running)
@@ -338,12 +351,22 @@ class BaseExecutor(LoggingMixin):
         num_queued_workloads = len(self.queued_tasks) + len(self.queued_callbacks)
 
         self._emit_metrics(open_slots, num_running_workloads, num_queued_workloads)
-        self.trigger_tasks(open_slots)
+        tags = {"executor_class_name": self.__class__.__name__}
+        if self._event_buffer_full_after_sync or self.event_buffer_full:
+            self.log.info("Event buffer is full, not starting new workloads")
+            stats.incr("executor.event_buffer_full", tags=tags)
+        else:
+            self.trigger_tasks(open_slots)
 
         # Calling child class sync method
         self.log.debug("Calling the %s sync method", self.__class__)
         self.sync()
 
+        # Events are added to the buffer by sync, and the scheduler drains it after the heartbeat,
+        # so whether sync filled it is kept for the next heartbeat.
+        stats.gauge("executor.event_buffer_size", len(self.event_buffer), tags=tags)
+        self._event_buffer_full_after_sync = self.event_buffer_full
+
     def _get_metric_name(self, metric_base_name: str) -> str:
         return (
             f"{metric_base_name}.{self.__class__.__name__}"
@@ -26,16 +26,22 @@ LocalExecutor.
 from __future__ import annotations
 
 import ctypes
+import importlib
 import multiprocessing
 import multiprocessing.sharedctypes
 import os
 import sys
+from collections import deque
 from multiprocessing import Queue, SimpleQueue
 from typing import TYPE_CHECKING
 
+import msgspec
 import structlog
 
 from airflow.executors.base_executor import BaseExecutor, get_execution_api_server_url
+from airflow.executors.workloads.types import state_class_for_key
+from airflow.models.taskinstancekey import TaskInstanceKey
+from airflow.utils.shared_memory_ring_buffer import SharedMemoryRingBuffer
 
 # add logger to parameter of setproctitle to support logging
 if sys.platform == "darwin":
@@ -49,6 +55,15 @@ if TYPE_CHECKING:
     from airflow.executors.workloads import ExecutorWorkload
     from airflow.executors.workloads.types import WorkloadResultType
 
+RESULT_BUFFER_SIZE = 1024 * 1024
+"""Size, in bytes, of the shared-memory buffer results are exchanged through in high-throughput mode."""
+
+PRE_IMPORT_MODULES = (
+    "airflow.sdk.execution_time.supervisor",
+    "airflow.sdk.execution_time.task_runner",
+)
+"""Modules imported before the workers are forked in high-throughput mode, so no task imports them."""
+
 
 def _get_executor_process_title_prefix(team_name: str | None) -> str:
     """
@@ -60,10 +75,44 @@ def _get_executor_process_title_prefix(team_name: str | None) -> str:
     return f"airflow worker -- LocalExecutor{team_suffix}:"
 
 
+class _SharedMemoryResultQueue:
+    """
+    Queue of workload results exchanged as msgpack messages through shared memory.
+
+    It replaces the result queue in high-throughput mode. Workers only send the key and the state of
+    their workloads through it, not the exception a workload failed with, which is already logged by
+    the worker. The executor reads every result its workers sent since its previous read at once.
+    """
+
+    def __init__(self, size: int):
+        self._buffer = SharedMemoryRingBuffer(size)
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder()
+        self._unread: deque[bytes] = deque()
+
+    def put(self, result: WorkloadResultType) -> None:
+        key, state, _ = result
+        self._buffer.put(self._encoder.encode((key, state)))
+
+    def get(self) -> WorkloadResultType:
+        if not self._unread:
+            self._unread.extend(self._buffer.get_all())
+        key, state = self._decoder.decode(self._unread.popleft())
+        if isinstance(key, list):
+            key = TaskInstanceKey(*key)
+        return key, state_class_for_key(key)(state), None
+
+    def empty(self) -> bool:
+        return not self._unread and self._buffer.empty()
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
 def _run_worker(
     logger_name: str,
     input: SimpleQueue[ExecutorWorkload | None],
-    output: Queue[WorkloadResultType],
+    output: Queue[WorkloadResultType] | _SharedMemoryResultQueue,
     unread_messages: multiprocessing.sharedctypes.Synchronized[int],
     team_conf,
 ):
@@ -117,6 +166,10 @@ class LocalExecutor(BaseExecutor):
 
     It uses the multiprocessing Python library and queues to parallelize the execution of tasks.
 
+    In high-throughput mode, enabled with ``[core] local_executor_high_throughput`` when processes are
+    started with ``fork``, the task execution modules are imported before the workers are forked, and
+    the workers send their results back through shared memory instead of a pipe.
+
     :param parallelism: how many parallel processes are run in the executor, must be > 0
     """
 
@@ -128,7 +181,7 @@ class LocalExecutor(BaseExecutor):
     supports_callbacks: bool = True
 
     activity_queue: SimpleQueue[ExecutorWorkload | None]
-    result_queue: SimpleQueue[WorkloadResultType]
+    result_queue: SimpleQueue[WorkloadResultType] | _SharedMemoryResultQueue
     workers: dict[int, multiprocessing.Process]
     _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
 
@@ -145,13 +198,25 @@ class LocalExecutor(BaseExecutor):
 
             self.conf = conf
 
+        self.high_throughput = self.conf.getboolean("core", "local_executor_high_throughput", fallback=False)
+        if self.high_throughput and not self.is_mp_using_fork:
+            self.log.warning(
+                "The high-throughput mode of the LocalExecutor needs the fork start method of multiprocessing, "
+                "not %s; it is disabled",
+                multiprocessing.get_start_method(),
+            )
+            self.high_throughput = False
+
     def start(self) -> None:
         """Start the executor."""
         # We delay opening these queues until the start method mostly for unit tests. ExecutorLoader caches
         # instances, so each test reusues the same instance! (i.e. test 1 runs, closes the queues, then test 2
         # comes back and gets the same LocalExecutor instance, so we have to open new here.)
         self.activity_queue = SimpleQueue()
-        self.result_queue = SimpleQueue()
+        if self.high_throughput:
+            self.result_queue = _SharedMemoryResultQueue(RESULT_BUFFER_SIZE)
+        else:
+            self.result_queue = SimpleQueue()
         self.workers = {}
 
         # Mypy sees this value as `SynchronizedBase[c_uint]`, but that isn't the right runtime type behaviour
@@ -221,10 +286,17 @@ class LocalExecutor(BaseExecutor):
         unfreeze is called to ensure there is no impact on gc operations
         in the original running process.
 
+        In high-throughput mode, the modules running the tasks are imported first, so that the workers
+        share them and the process every task runs in does not import them again.
+
         Ref: https://docs.python.org/3/library/gc.html#gc.freeze
         """
         import gc
 
+        if self.high_throughput:
+            for module in PRE_IMPORT_MODULES:
+                importlib.import_module(module)
+
         gc.freeze()
         try:
             for _ in range(spawn_number):
@@ -237,8 +309,10 @@ class LocalExecutor(BaseExecutor):
         self._read_results()
         self._check_workers()
 
-    def _read_results(self):
-        while not self.result_queue.empty():
+    def _read_results(self, *, respect_event_buffer_size: bool = True):
+        # Results left in the queue while the event buffer is full are read once the scheduler has
+        # processed the buffered events.
+        while not self.result_queue.empty() and not (respect_event_buffer_size and self.event_buffer_full):
             key, state, exc = self.result_queue.get()
 
             self.change_state(key, state)
@@ -259,12 +333,14 @@ class LocalExecutor(BaseExecutor):
                 self.activity_queue.put(None)
 
         for proc in self.workers.values():
-            if proc.is_alive():
-                proc.join()
+            while proc.is_alive():
+                # Keep reading results, so that no worker waits forever for room to send its own.
+                self._read_results(respect_event_buffer_size=False)
+                proc.join(timeout=0.1)
             proc.close()
 
         # Process any extra results before closing
-        self._read_results()
+        self._read_results(respect_event_buffer_size=False)
 
         self.activity_queue.close()
         self.result_queue.close()
@@ -26,7 +26,7 @@ import signal
 import sys
 import time
 from collections import Counter, defaultdict, deque
-from collections.abc import Callable, Collection, Iterable, Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
 from contextlib import ExitStack
 from datetime import date, datetime, timedelta
 from functools import lru_cache, partial
@@ -100,11 +100,14 @@ from airflow.models.team import Team
 from airflow.models.trigger import TRIGGER_FAIL_REPR, Trigger, TriggerFailureReason
 from airflow.observability.metrics import stats_utils
 from airflow.serialization.definitions.assets import SerializedAssetUniqueKey
+from airflow.serialization.definitions.dag import bulk_create_dagruns
 from airflow.serialization.definitions.notset import NOTSET
 from airflow.ti_deps.dependencies_states import ACTIVE_STATES, EXECUTION_STATES
 from airflow.timetables.simple import AssetTriggeredTimetable
+from airflow.utils.consistent_hash import ConsistentHashRing
 from airflow.utils.event_scheduler import EventScheduler
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.phase_profiler import PhaseProfiler
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
@@ -121,16 +124,17 @@ if TYPE_CHECKING:
     from types import FrameType
 
     from pendulum.datetime import DateTime
-    from sqlalchemy.engine import CursorResult
+    from sqlalchemy.engine import CursorResult, Row
     from sqlalchemy.orm import Session
     from sqlalchemy.orm.interfaces import LoaderOption
     from sqlalchemy.sql.selectable import Subquery
 
     from airflow._shared.logging.types import Logger
-    from airflow.executors.base_executor import BaseExecutor
+    from airflow.executors.base_executor import BaseExecutor, EventBufferValueType
     from airflow.executors.executor_utils import ExecutorName
-    from airflow.executors.workloads.types import SchedulerWorkload
+    from airflow.executors.workloads.types import SchedulerWorkload, WorkloadKey
     from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.timetables.base import DagRunInfo
     from airflow.utils.sqlalchemy import CommitProhibitorGuard
 
 TI = TaskInstance
@@ -216,23 +220,202 @@ class ConcurrencyMap:
         self.task_dagrun_concurrency_map: Counter[tuple[str, str, str]] = Counter()
 
     def load(self, session: Session) -> None:
-        self.dag_run_active_tasks_map.clear()
-        self.task_concurrency_map.clear()
-        self.task_dagrun_concurrency_map.clear()
+        self._clear()
         query = session.execute(
             select(TI.dag_id, TI.task_id, TI.run_id, TI.state, func.count("*"))
             .where(TI.state.in_(ACTIVE_STATES))
             .group_by(TI.dag_id, TI.task_id, TI.run_id, TI.state)
         )
         for dag_id, task_id, run_id, state, count in query:
-            # Always count towards task-level concurrency (max_active_tis_per_dag /
-            # max_active_tis_per_dagrun), including DEFERRED.
-            self.task_concurrency_map[(dag_id, task_id)] += count
-            self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += count
-            # Only count non-deferred states towards DAG-run active tasks
-            # (max_active_tasks / worker slot accounting).
-            if state != TaskInstanceState.DEFERRED:
-                self.dag_run_active_tasks_map[dag_id, run_id] += count
+            self._add(dag_id, task_id, run_id, state, count)
+
+    def track_queued(self, ti: TI) -> None:
+        """Account for a task instance the scheduler has just moved to the queued state."""
+        self._add(ti.dag_id, ti.task_id, ti.run_id, TaskInstanceState.QUEUED, 1)
+
+    def track_state(self, ti: TI) -> None:
+        """Account for a state change of a task instance observed outside the critical section."""
+        self.track_key_state(ti.key.primary, ti.state)
+
+    def track_key_state(self, key: tuple[str, str, str, int], state: TaskInstanceState | None) -> None:
+        """Account for a state change of the task instance with the given primary key."""
+
+    def _clear(self) -> None:
+        self.dag_run_active_tasks_map.clear()
+        self.task_concurrency_map.clear()
+        self.task_dagrun_concurrency_map.clear()
+
+    def _add(self, dag_id: str, task_id: str, run_id: str, state: str | None, count: int) -> None:
+        # Always count towards task-level concurrency (max_active_tis_per_dag /
+        # max_active_tis_per_dagrun), including DEFERRED.
+        self.task_concurrency_map[(dag_id, task_id)] += count
+        self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += count
+        # Only count non-deferred states towards DAG-run active tasks
+        # (max_active_tasks / worker slot accounting).
+        if state != TaskInstanceState.DEFERRED:
+            self.dag_run_active_tasks_map[dag_id, run_id] += count
+
+
+class IncrementalConcurrencyMap(ConcurrencyMap):
+    """
+    Concurrency map kept in scheduler memory across scheduling loops.
+
+    Instead of aggregating every active task instance on each loop, the map is seeded from the
+    database once and then kept up to date from the state changes the scheduler makes itself
+    (queueing task instances) and the ones it learns about from executor events. It is
+    reconciled against the database every ``reconcile_interval`` seconds, which also bounds how
+    long changes made elsewhere (other schedulers, the triggerer, the API) can go unnoticed.
+
+    :param reconcile_interval: How often (in seconds) the map is rebuilt from the database.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        self._ti_states: dict[tuple[str, str, str, int], TaskInstanceState] = {}
+        self._last_reconciled_at: float | None = None
+
+    def load(self, session: Session) -> None:
+        if (
+            self._last_reconciled_at is not None
+            and time.monotonic() - self._last_reconciled_at < self.reconcile_interval
+        ):
+            return
+        self.reconcile(session=session)
+
+    def reconcile(self, session: Session) -> int:
+        """
+        Rebuild the map from the database and report how far the in-memory state had drifted.
+
+        :return: Number of task instances whose tracked state differed from the database.
+        """
+        rows = session.execute(
+            select(TI.dag_id, TI.task_id, TI.run_id, TI.map_index, TI.state).where(
+                TI.state.in_(ACTIVE_STATES)
+            )
+        )
+        ti_states = {
+            (dag_id, task_id, run_id, map_index): state for dag_id, task_id, run_id, map_index, state in rows
+        }
+
+        drift = 0
+        if self._last_reconciled_at is not None:
+            drift = sum(1 for key, state in ti_states.items() if self._ti_states.get(key) != state)
+            drift += sum(1 for key in self._ti_states if key not in ti_states)
+            stats.gauge("scheduler.concurrency_map.drift", drift)
+        stats.gauge("scheduler.concurrency_map.size", len(ti_states))
+
+        self._clear()
+        self._ti_states = ti_states
+        for (dag_id, task_id, run_id, _), state in ti_states.items():
+            self._add(dag_id, task_id, run_id, state, 1)
+        self._last_reconciled_at = time.monotonic()
+        return drift
+
+    def track_queued(self, ti: TI) -> None:
+        self._set_state(ti.key.primary, TaskInstanceState.QUEUED)
+
+    def track_key_state(self, key: tuple[str, str, str, int], state: TaskInstanceState | None) -> None:
+        self._set_state(key, state)
+
+    def _set_state(self, key: tuple[str, str, str, int], state: TaskInstanceState | None) -> None:
+        dag_id, task_id, run_id, _ = key
+        if (old_state := self._ti_states.pop(key, None)) is not None:
+            self._add(dag_id, task_id, run_id, old_state, -1)
+            # Drop entries that reached zero so the map only grows with the number of active TIs
+            for counter, counter_key in (
+                (self.task_concurrency_map, (dag_id, task_id)),
+                (self.task_dagrun_concurrency_map, (dag_id, run_id, task_id)),
+                (self.dag_run_active_tasks_map, (dag_id, run_id)),
+            ):
+                if counter[counter_key] <= 0:
+                    counter.pop(counter_key, None)
+        if state in ACTIVE_STATES:
+            self._ti_states[key] = state
+            self._add(dag_id, task_id, run_id, state, 1)
+
+
+class DagRunShard(LoggingMixin):
+    """
+    Slice of Dags a scheduler owns when Dag run sharding is enabled.
+
+    Dag ids are distributed across all live schedulers with a consistent hash ring of their
+    job ids, so each scheduler only creates, examines and queues task instances for its own Dags
+    instead of competing with the other schedulers for the same rows. Live schedulers are read
+    from the job table on every refresh: when a scheduler stops heartbeating for longer than
+    ``health_check_threshold`` seconds its Dags are spread over the remaining schedulers, and a
+    new scheduler takes its share over as soon as it heartbeats.
+
+    The Dag ids a scheduler owns are only reloaded when the ring changes, when the number of
+    active Dags changes, or after ``health_check_threshold`` seconds, which catches Dags being
+    paused and unpaused at the same time.
+
+    Ownership only narrows what a scheduler looks at. Dag runs are still selected with row
+    locks and pool slots are still reserved under the pool row locks of the critical section,
+    so two schedulers briefly disagreeing on the ring while it rebalances cannot double-schedule
+    work or oversubscribe a pool shared by Dags of different shards.
+
+    :param health_check_threshold: Seconds since its last heartbeat after which a scheduler
+        is no longer considered alive.
+    """
+
+    def __init__(self, health_check_threshold: float):
+        super().__init__()
+        self.job_id: int | None = None
+        self.health_check_threshold = health_check_threshold
+        self.ring: ConsistentHashRing[int] | None = None
+        self.dag_ids: list[str] = []
+        self._active_dag_count: int | None = None
+        self._dag_ids_loaded_at: float | None = None
+
+    def refresh(self, job_id: int | None, session: Session) -> bool:
+        """
+        Recompute the ring from live schedulers and the Dag ids this scheduler owns.
+
+        :param job_id: Id of the job of this scheduler.
+        :return: Whether the set of live schedulers changed since the last refresh.
+        """
+        self.job_id = job_id
+        live_job_ids = set(
+            session.scalars(
+                select(Job.id).where(
+                    Job.job_type == SchedulerJobRunner.job_type,
+                    Job.state == JobState.RUNNING,
+                    Job.latest_heartbeat
+                    >= timezone.utcnow() - timedelta(seconds=self.health_check_threshold),
+                )
+            )
+        )
+        if self.job_id is not None:
+            # Always own a share, even if our own heartbeat is late.
+            live_job_ids.add(self.job_id)
+        rebalanced = self.ring is None or self.ring.nodes != live_job_ids
+        if rebalanced:
+            self.ring = ConsistentHashRing(live_job_ids)
+            self.log.info("Dag run shard ring rebalanced across schedulers %s", sorted(live_job_ids))
+            stats.incr("scheduler.dag_run_shard.rebalances")
+
+        is_active = (DagModel.is_paused == expression.false(), DagModel.is_stale == expression.false())
+        active_dag_count = session.scalar(select(func.count(DagModel.dag_id)).where(*is_active))
+        if (
+            rebalanced
+            or active_dag_count != self._active_dag_count
+            or self._dag_ids_loaded_at is None
+            or time.monotonic() - self._dag_ids_loaded_at >= self.health_check_threshold
+        ):
+            active_dag_ids = session.scalars(select(DagModel.dag_id).where(*is_active))
+            self.dag_ids = [dag_id for dag_id in active_dag_ids if self.owns(dag_id)]
+            self._active_dag_count = active_dag_count
+            self._dag_ids_loaded_at = time.monotonic()
+        stats.gauge("scheduler.dag_run_shard.schedulers", len(live_job_ids))
+        stats.gauge("scheduler.dag_run_shard.dags", len(self.dag_ids))
+        return rebalanced
+
+    def owns(self, dag_id: str) -> bool:
+        """Whether the Dag belongs to this scheduler's shard."""
+        if not self.ring:
+            return True
+        return self.ring.get_node(dag_id) == self.job_id
 
 
 def _is_parent_process() -> bool:
@@ -311,7 +494,23 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         )
         self._scheduler_use_job_schedule = conf.getboolean("scheduler", "use_job_schedule", fallback=True)
         self._parallelism = conf.getint("core", "parallelism")
+        concurrency_map_reconcile_interval = conf.getfloat("scheduler", "concurrency_map_reconcile_interval")
+        self._concurrency_map: IncrementalConcurrencyMap | None = (
+            IncrementalConcurrencyMap(reconcile_interval=concurrency_map_reconcile_interval)
+            if concurrency_map_reconcile_interval > 0
+            else None
+        )
         self._multi_team = conf.getboolean("core", "multi_team")
+        self._batch_schedule_dag_runs = conf.getboolean("scheduler", "batch_schedule_dag_runs")
+        self._bulk_process_executor_events = conf.getboolean("scheduler", "bulk_process_executor_events")
+        self._dag_run_shard: DagRunShard | None = (
+            DagRunShard(health_check_threshold=conf.getfloat("scheduler", "scheduler_health_check_threshold"))
+            if conf.getboolean("scheduler", "shard_dag_runs")
+            else None
+        )
+        self._loop_profiler = PhaseProfiler(
+            "scheduler.loop_phase", enabled=conf.getboolean("scheduler", "profile_loop_phases")
+        )
 
         self.executors: list[BaseExecutor] = executors if executors else ExecutorLoader.init_executors()
         self.executor: BaseExecutor = self.executors[0]
@@ -483,6 +682,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             executor.debug_dump()
             self.log.info("-" * 80)
 
+        if self._loop_profiler.enabled:
+            self.log.info("Time spent in the scheduler loop phases\n%s", self._loop_profiler.dump())
+            self.log.info("-" * 80)
+
         id2name = {th.ident: th.name for th in threading.enumerate()}
         for threadId, stack in sys._current_frames().items():
             self.log.info("Stack Trace for Scheduler Job Runner on thread: %s", id2name[threadId])
@@ -544,7 +747,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
+        # When the scheduler keeps an incremental map, this only hits the DB when it is due for reconciling.
+        concurrency_map = self._concurrency_map or ConcurrencyMap()
         concurrency_map.load(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
@@ -610,6 +814,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     tuple_(TI.dag_id, TI.run_id, TI.task_id).not_in(starved_tasks_task_dagrun_concurrency)
                 )
 
+            if self._dag_run_shard:
+                query = query.where(TI.dag_id.in_(self._dag_run_shard.dag_ids))
+
             # Create a subquery with row numbers partitioned by dag_id and run_id.
             # Different dags can have the same run_id but
             # the dag_id combined with the run_id uniquely identify a run.
@@ -877,11 +1084,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.track_queued(task_instance)
 
                 pool_stats["open"] = open_slots
 
@@ -1086,18 +1289,22 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.debug("max_tis query size is less than or equal to zero. No query will be performed!")
             return 0
 
-        queued_tis = self._executable_task_instances_to_queued(max_tis, session=session)
+        with self._loop_profiler.phase("executable_task_instances_to_queued"):
+            queued_tis = self._executable_task_instances_to_queued(max_tis, session=session)
 
-        # Sort queued TIs to their respective executor
-        executor_to_queued_tis = self._executor_to_workloads(queued_tis, session)
-        for executor, queued_tis_per_executor in executor_to_queued_tis.items():
-            self.log.info(
-                "Trying to enqueue tasks: %s for executor: %s",
-                queued_tis_per_executor,
-                executor,
-            )
+        with self._loop_profiler.phase("enqueue_task_instances"):
+            # Sort queued TIs to their respective executor
+            executor_to_queued_tis = self._executor_to_workloads(queued_tis, session)
+            for executor, queued_tis_per_executor in executor_to_queued_tis.items():
+                self.log.info(
+                    "Trying to enqueue tasks: %s for executor: %s",
+                    queued_tis_per_executor,
+                    executor,
+                )
 
-            self._enqueue_task_instances_with_queued_state(queued_tis_per_executor, executor, session=session)
+                self._enqueue_task_instances_with_queued_state(
+                    queued_tis_per_executor, executor, session=session
+                )
 
         return len(queued_tis)
 
@@ -1195,11 +1402,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             job_id=self.job.id,
             scheduler_dag_bag=self.scheduler_dag_bag,
             session=session,
+            concurrency_map=self._concurrency_map,
+            bulk=self._bulk_process_executor_events,
         )
 
     @classmethod
     def process_executor_events(
-        cls, executor: BaseExecutor, job_id: int | None, scheduler_dag_bag: DBDagBag, session: Session
+        cls,
+        executor: BaseExecutor,
+        job_id: int | None,
+        scheduler_dag_bag: DBDagBag,
+        session: Session,
+        concurrency_map: ConcurrencyMap | None = None,
+        bulk: bool = False,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1220,6 +1435,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param job_id: The scheduler job ID, used to detect task requeuing by other schedulers
         :param scheduler_dag_bag: Serialized DAG bag for retrieving task definitions
         :param session: Database session for task instance updates
+        :param concurrency_map: Scheduler-resident concurrency map to keep in sync with the
+            task instance states observed while processing the events
+        :param bulk: Whether to process the events of task instances needing no failure handling with
+            set-based statements, and only load the other task instances in full
 
         :return: Number of events processed from the executor event buffer
 
@@ -1287,6 +1506,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().error("Callback %s failed: %s", callback_id, callback.output)
             session.add(callback)
 
+        if bulk and tis_with_right_state:
+            tis_with_right_state = cls._process_task_events_in_bulk(
+                executor=executor,
+                keys=tis_with_right_state,
+                try_numbers=ti_primary_key_to_try_number_map,
+                event_buffer=event_buffer,
+                job_id=job_id,
+                session=session,
+                concurrency_map=concurrency_map,
+            )
+
         # Return if no finished tasks
         if not tis_with_right_state:
             return len(event_buffer)
@@ -1308,7 +1538,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # row lock this entire set of taskinstances to make sure the scheduler doesn't fail when we have
         # multi-schedulers
         locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
-        tis: Iterator[TI] = session.scalars(locked_query)
+        tis: Sequence[TI] = session.scalars(locked_query).all()
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -1330,37 +1560,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().info("Setting external_executor_id for %s to %s", ti, info)
                 continue
 
-            msg = (
-                "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, ti_id=%s, "
-                "run_start_date=%s, run_end_date=%s, "
-                "run_duration=%s, state=%s, executor=%s, executor_state=%s, try_number=%s, max_tries=%s, "
-                "pool=%s, queue=%s, priority_weight=%d, operator=%s, queued_dttm=%s, scheduled_dttm=%s,"
-                "queued_by_job_id=%s, pid=%s"
-            )
-            cls.logger().info(
-                msg,
-                ti.dag_id,
-                ti.task_id,
-                ti.run_id,
-                ti.map_index,
-                ti.id,
-                ti.start_date,
-                ti.end_date,
-                ti.duration,
-                ti.state,
-                executor,
-                state,
-                try_number,
-                ti.max_tries,
-                ti.pool,
-                ti.queue,
-                ti.priority_weight,
-                ti.operator,
-                ti.queued_dttm,
-                ti.scheduled_dttm,
-                ti.queued_by_job_id,
-                ti.pid,
-            )
+            cls._log_task_instance_finished(ti, executor, state, try_number)
 
             # There are two scenarios why the same TI with the same try_number is queued
             # after executor is finished with it:
@@ -1501,8 +1701,129 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Update task state - emails are handled by DAG processor now
                 ti.handle_failure(error=msg, session=session)
 
+        if concurrency_map is not None:
+            for ti in tis:
+                concurrency_map.track_state(ti)
+
         return len(event_buffer)
 
+    @classmethod
+    def _log_task_instance_finished(
+        cls, ti: TI | Row, executor: BaseExecutor, state: TaskInstanceState, try_number: int
+    ) -> None:
+        cls.logger().info(
+            "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, ti_id=%s, "
+            "run_start_date=%s, run_end_date=%s, "
+            "run_duration=%s, state=%s, executor=%s, executor_state=%s, try_number=%s, max_tries=%s, "
+            "pool=%s, queue=%s, priority_weight=%d, operator=%s, queued_dttm=%s, scheduled_dttm=%s,"
+            "queued_by_job_id=%s, pid=%s",
+            ti.dag_id,
+            ti.task_id,
+            ti.run_id,
+            ti.map_index,
+            ti.id,
+            ti.start_date,
+            ti.end_date,
+            ti.duration,
+            ti.state,
+            executor,
+            state,
+            try_number,
+            ti.max_tries,
+            ti.pool,
+            ti.queue,
+            ti.priority_weight,
+            ti.operator,
+            ti.queued_dttm,
+            ti.scheduled_dttm,
+            ti.queued_by_job_id,
+            ti.pid,
+        )
+
+    @classmethod
+    def _process_task_events_in_bulk(
+        cls,
+        executor: BaseExecutor,
+        keys: list[TaskInstanceKey],
+        try_numbers: dict[tuple[str, str, str, int], int],
+        event_buffer: dict[WorkloadKey, EventBufferValueType],
+        job_id: int | None,
+        session: Session,
+        concurrency_map: ConcurrencyMap | None,
+    ) -> list[TaskInstanceKey]:
+        """
+        Process the executor events of task instances needing no failure handling with set-based statements.
+
+        Only the columns telling whether a task instance needs failure handling are loaded. The external
+        executor ids reported by queued and running events are written with a single bulk UPDATE, and
+        events about task instances that are no longer queued or running are only logged. The processed
+        events are removed from ``event_buffer``.
+
+        :return: The keys of the events still to process with the full task instances.
+        """
+        query = select(
+            TI.id,
+            TI.dag_id,
+            TI.task_id,
+            TI.run_id,
+            TI.map_index,
+            TI.try_number,
+            TI.state,
+            TI.queued_by_job_id,
+            TI.start_date,
+            TI.end_date,
+            TI.duration,
+            TI.max_tries,
+            TI.pool,
+            TI.queue,
+            TI.priority_weight,
+            TI.operator,
+            TI.queued_dttm,
+            TI.scheduled_dttm,
+            TI.pid,
+        ).where(TI.filter_for_tis(keys))
+        rows = session.execute(with_row_locks(query, of=TI, session=session, skip_locked=True)).all()
+
+        external_executor_ids: list[dict[str, Any]] = []
+        remaining: list[TaskInstanceKey] = []
+        for row in rows:
+            primary_key = (row.dag_id, row.task_id, row.run_id, row.map_index)
+            try_number = try_numbers[primary_key]
+            buffer_key = TaskInstanceKey(row.dag_id, row.task_id, row.run_id, try_number, row.map_index)
+            state, info = event_buffer[buffer_key]
+            if state in (TaskInstanceState.QUEUED, TaskInstanceState.RUNNING):
+                external_executor_ids.append({"id": row.id, "external_executor_id": info})
+                cls.logger().info("Setting external_executor_id for %s to %s", buffer_key, info)
+            elif row.try_number == try_number and row.state in (
+                TaskInstanceState.SCHEDULED,
+                TaskInstanceState.QUEUED,
+                TaskInstanceState.RUNNING,
+                TaskInstanceState.RESTARTING,
+            ):
+                # The task instance may have been killed externally, or requeued
+                remaining.append(buffer_key)
+                continue
+            else:
+                if row.try_number != try_number:
+                    cls.logger().warning(
+                        "TI try_number mismatch: db_try_number=%d event_try_number=%d "
+                        "ti=%s state=%s job_id=%s. "
+                        "Another scheduler may have already modified this TI.",
+                        row.try_number,
+                        try_number,
+                        buffer_key,
+                        row.state,
+                        job_id,
+                    )
+                cls._log_task_instance_finished(row, executor, state, try_number)
+            del event_buffer[buffer_key]
+            if concurrency_map is not None:
+                concurrency_map.track_key_state(primary_key, row.state)
+
+        if external_executor_ids:
+            session.execute(update(TI), external_executor_ids)
+        return remaining
+
     def _execute(self) -> int | None:
         import os
 
@@ -1532,6 +1853,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
             )
 
+            if settings.engine is not None:
+                self._loop_profiler.attach(settings.engine)
             self._run_scheduler_loop()
 
             if settings.Session is not None:
@@ -1540,6 +1863,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.exception("Exception when executing SchedulerJob._run_scheduler_loop")
             raise
         finally:
+            self._loop_profiler.detach()
             for executor in self.executors:
                 try:
                     executor.end()
@@ -1600,57 +1924,59 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Check on start up, then every configured interval
         self.adopt_or_reset_orphaned_tasks()
 
+        profiler = self._loop_profiler
+
         timers.call_regular_interval(
             conf.getfloat("scheduler", "orphaned_tasks_check_interval", fallback=300.0),
-            self.adopt_or_reset_orphaned_tasks,
+            profiler.wrap(self.adopt_or_reset_orphaned_tasks),
         )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "trigger_timeout_check_interval", fallback=15.0),
-            self.check_trigger_timeouts,
+            profiler.wrap(self.check_trigger_timeouts),
         )
 
         timers.call_regular_interval(
             30,
-            self._mark_backfills_complete,
+            profiler.wrap(self._mark_backfills_complete),
         )
 
         if self._is_metrics_enabled() or self._is_tracing_enabled():
             timers.call_regular_interval(
                 conf.getfloat("scheduler", "pool_metrics_interval", fallback=5.0),
-                self._emit_pool_metrics,
+                profiler.wrap(self._emit_pool_metrics),
             )
 
         if self._is_metrics_enabled():
             timers.call_regular_interval(
                 conf.getfloat("scheduler", "ti_metrics_interval", fallback=30.0),
-                self._emit_ti_metrics,
+                profiler.wrap(self._emit_ti_metrics),
             )
 
             timers.call_regular_interval(
                 conf.getfloat("scheduler", "dagrun_metrics_interval", fallback=30.0),
-                self._emit_running_dags_metric,
+                profiler.wrap(self._emit_running_dags_metric),
             )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "task_instance_heartbeat_timeout_detection_interval", fallback=10.0),
-            self._find_and_purge_task_instances_without_heartbeats,
+            profiler.wrap(self._find_and_purge_task_instances_without_heartbeats),
         )
 
-        timers.call_regular_interval(60.0, self._update_dag_run_state_for_paused_dags)
+        timers.call_regular_interval(60.0, profiler.wrap(self._update_dag_run_state_for_paused_dags))
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "task_queued_timeout_check_interval"),
-            self._handle_tasks_stuck_in_queued,
+            profiler.wrap(self._handle_tasks_stuck_in_queued),
         )
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "parsing_cleanup_interval"),
-            self._update_asset_orphanage,
+            profiler.wrap(self._update_asset_orphanage),
         )
         timers.call_regular_interval(
             conf.getfloat("scheduler", "parsing_cleanup_interval"),
-            self._remove_unreferenced_triggers,
+            profiler.wrap(self._remove_unreferenced_triggers),
         )
 
         if any(x.is_local for x in self.executors):
@@ -1662,14 +1988,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             if check_interval > 0:
                 timers.call_regular_interval(
                     delay=check_interval,
-                    action=bundle_cleanup_mgr.remove_stale_bundle_versions,
+                    action=profiler.wrap(bundle_cleanup_mgr.remove_stale_bundle_versions),
                 )
 
         idle_count = 0
 
         for loop_count in itertools.count(start=1):
-            with stats.timer("scheduler.scheduler_loop_duration") as timer:
-                with create_session() as session:
+            with stats.timer("scheduler.scheduler_loop_duration") as timer, profiler.phase("scheduler_loop"):
+                with profiler.phase("do_scheduling"), create_session() as session:
                     # This will schedule for as many executors as possible.
                     num_queued_tis = self._do_scheduling(session)
                     # Don't keep any objects alive -- we've possibly just looked at 500+ ORM objects!
@@ -1679,13 +2005,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # either a no-op, or they will check-in on currently running tasks and send out new
                 # events to be processed below.
                 for executor in self.executors:
-                    with stats.timer(
-                        "scheduler.executor_heartbeat_duration",
-                        tags={"executor": type(executor).__name__},
+                    with (
+                        stats.timer(
+                            "scheduler.executor_heartbeat_duration",
+                            tags={"executor": type(executor).__name__},
+                        ),
+                        profiler.phase("executor_heartbeat"),
                     ):
                         executor.heartbeat()
 
-                with create_session() as session:
+                with profiler.phase("process_executor_events"), create_session() as session:
                     num_finished_events = 0
                     for executor in self.executors:
                         num_finished_events += self._process_executor_events(
@@ -1694,12 +2023,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 for executor in self.executors:
                     try:
-                        with create_session() as session:
+                        with profiler.phase("process_task_event_logs"), create_session() as session:
                             self._process_task_event_logs(executor._task_event_logs, session)
                     except Exception:
                         self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with profiler.phase("handle_deadlines"), create_session() as session:
                     # Lock expired, unhandled deadlines with FOR UPDATE SKIP LOCKED so
                     # concurrent HA scheduler replicas don't both process the same row
                     # and create duplicate callbacks.
@@ -1721,15 +2050,18 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                         deadline.handle_miss(session)
 
                     # Route ExecutorCallback workloads to executors (similar to task routing)
-                    self._enqueue_executor_callbacks(session)
+                    with profiler.phase("enqueue_executor_callbacks"):
+                        self._enqueue_executor_callbacks(session)
 
                 # Heartbeat the scheduler periodically
-                perform_heartbeat(
-                    job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
-                )
+                with profiler.phase("job_heartbeat"):
+                    perform_heartbeat(
+                        job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
+                    )
 
                 # Run any pending timed events
-                next_event = timers.run(blocking=False)
+                with profiler.phase("timers"):
+                    next_event = timers.run(blocking=False)
                 self.log.debug("Next timed event is in %f", next_event)
 
             self.log.debug("Ran scheduling loop in %.2f ms", timer.duration)
@@ -1786,32 +2118,44 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         :return: Number of TIs enqueued in this iteration
         """
+        profiler = self._loop_profiler
+        if self._dag_run_shard:
+            with profiler.phase("refresh_dag_run_shard"):
+                self._dag_run_shard.refresh(self.job.id, session=session)
+
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if self._scheduler_use_job_schedule:
-                self._create_dagruns_for_dags(guard, session)
+                with profiler.phase("create_dagruns_for_dags"):
+                    self._create_dagruns_for_dags(guard, session)
 
-            self._start_queued_dagruns(session)
-            guard.commit()
+            with profiler.phase("start_queued_dagruns"):
+                self._start_queued_dagruns(session)
+                guard.commit()
 
             # Bulk fetch the currently active dag runs for the dags we are
             # examining, rather than making one query per DagRun
-            dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
+            with profiler.phase("get_running_dag_runs_to_examine"):
+                dag_runs = DagRun.get_running_dag_runs_to_examine(
+                    session=session, dag_ids=self._dag_run_shard.dag_ids if self._dag_run_shard else None
+                )
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+            with profiler.phase("schedule_all_dag_runs"):
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
         cached_get_dag: Callable[[DagRun], SerializedDAG | None] = lru_cache()(
             partial(self.scheduler_dag_bag.get_dag_for_run, session=session)
         )
-        for dag_run, callback_to_run in callback_tuples:
-            dag = cached_get_dag(dag_run)
-            if dag:
-                # Sending callbacks to the database, so it must be done outside of prohibit_commit.
-                self._send_dag_callbacks_to_processor(dag, callback_to_run)
-            else:
-                self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
+        with profiler.phase("send_dag_callbacks"):
+            for dag_run, callback_to_run in callback_tuples:
+                dag = cached_get_dag(dag_run)
+                if dag:
+                    # Sending callbacks to the database, so it must be done outside of prohibit_commit.
+                    self._send_dag_callbacks_to_processor(dag, callback_to_run)
+                else:
+                    self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
 
         with prohibit_commit(session) as guard:
             # Without this, the session has an invalid view of the DB
@@ -1830,7 +2174,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.start()
 
                     # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+                    with profiler.phase("critical_section"):
+                        num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
 
                     # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
                     # metric, way down
@@ -1859,6 +2204,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             if TYPE_CHECKING:
                 assert apdr.target_dag_id
 
+            if self._dag_run_shard and not self._dag_run_shard.owns(apdr.target_dag_id):
+                continue
+
             if not (dag := self._get_current_dag(dag_id=apdr.target_dag_id, session=session)):
                 self.log.error("Dag '%s' not found in serialized_dag table", apdr.target_dag_id)
                 continue
@@ -1919,7 +2267,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
         partition_dag_ids: set[str] = self._create_dagruns_for_partitioned_asset_dags(session)
 
-        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(session)
+        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(
+            session, dag_ids=self._dag_run_shard.dag_ids if self._dag_run_shard else None
+        )
         all_dags_needing_dag_runs = set(query.all())
         asset_triggered_dags = [d for d in all_dags_needing_dag_runs if d.dag_id in triggered_date_by_dag]
         non_asset_dags = {
@@ -1929,7 +2279,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # filter asset partition triggered Dags
             if d.dag_id not in partition_dag_ids
         }
-        self._create_dag_runs(non_asset_dags, session)
+        self._create_dag_runs(non_asset_dags, session, guard=guard)
         if asset_triggered_dags:
             self._create_dag_runs_asset_triggered(
                 dag_models=[d for d in asset_triggered_dags if d.dag_id not in partition_dag_ids],
@@ -1971,8 +2321,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         for b in backfills:
             b.completed_at = now
 
-    def _create_dag_runs(self, dag_models: Collection[DagModel], session: Session) -> None:
+    def _create_dag_runs(
+        self,
+        dag_models: Collection[DagModel],
+        session: Session,
+        *,
+        guard: CommitProhibitorGuard | None = None,
+    ) -> None:
         """Create a DAG run and update the dag_model to control if/when the next DAGRun should be created."""
+        begin_nested = guard.begin_nested if guard is not None else session.begin_nested
         # Bulk Fetch DagRuns with dag_id and logical_date same
         # as DagModel.dag_id and DagModel.next_dagrun
         # This list is used to verify if the DagRun already exist so that we don't attempt to create
@@ -2007,6 +2364,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             )
         )
 
+        new_runs: list[tuple[DagModel, SerializedDAG, str, DagRunInfo]] = []
         for dag_model in dag_models:
             if dag_model.exceeds_max_non_backfill:
                 self.log.warning(
@@ -2072,49 +2430,85 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 next_info = serdag.timetable.next_run_info_from_dag_model(dag_model=dag_model)
                 if TYPE_CHECKING:
                     assert next_info is not None
-                data_interval = next_info.data_interval
-                logical_date = next_info.logical_date
-                partition_key = next_info.partition_key
-                run_after = next_info.run_after
-                created_run = serdag.create_dagrun(
-                    run_id=serdag.timetable.generate_run_id(
-                        run_type=DagRunType.SCHEDULED,
-                        run_after=run_after,
-                        data_interval=data_interval,
-                        partition_key=partition_key,
-                    ),
-                    logical_date=logical_date,
-                    data_interval=data_interval,
-                    run_after=run_after,
+                run_id = serdag.timetable.generate_run_id(
                     run_type=DagRunType.SCHEDULED,
-                    triggered_by=DagRunTriggeredByType.TIMETABLE,
-                    state=DagRunState.QUEUED,
-                    creating_job_id=self.job.id,
-                    session=session,
-                    partition_key=partition_key,
-                    partition_date=next_info.partition_date,
+                    run_after=next_info.run_after,
+                    data_interval=next_info.data_interval,
+                    partition_key=next_info.partition_key,
                 )
-                active_runs_of_dags[dag_model.dag_id] += 1
-                dag_model.calculate_dagrun_date_fields(dag=serdag, last_automated_run=created_run)
-                self._set_exceeds_max_active_runs(
-                    dag_model=dag_model,
-                    session=session,
-                    active_non_backfill_runs=active_runs_of_dags[dag_model.dag_id],
+                serdag.validate_new_dagrun(
+                    run_id=run_id,
+                    run_type=DagRunType.SCHEDULED,
+                    logical_date=next_info.logical_date,
+                    data_interval=next_info.data_interval,
+                    conf=None,
                 )
-
-            # Exceptions like ValueError, ParamValidationError, etc. are raised by
-            # DagModel.create_dagrun() when dag is misconfigured. The scheduler should not
-            # crash due to misconfigured dags. We should log any exception encountered
-            # and continue to the next serdag.
+            # Exceptions like ValueError, ParamValidationError, etc. are raised when the
+            # dag is misconfigured. The scheduler should not crash due to misconfigured dags.
+            # We should log any exception encountered and continue to the next serdag.
             except Exception:
                 self.log.exception("Failed creating DagRun", dag_id=dag_model.dag_id)
-                # todo: if you get a database error here, continuing does not work because
-                #  session needs rollback. you need either to make smaller transactions and
-                #  commit after every dag run or use savepoints.
-                #  https://github.com/apache/airflow/issues/59120
+                continue
+            new_runs.append((dag_model, serdag, run_id, next_info))
 
-            # TODO[HA]: Should we do a session.flush() so we don't have to keep lots of state/object in
-            #  memory for larger dags? or expunge_all()
+        if not new_runs:
+            return
+        # Insert the runs of all dags and their task instances in bulk rather than one
+        # run at a time, which matters with many dags scheduled at a high frequency.
+        # This is done in a savepoint so that, if it fails, the runs can still be created
+        # one by one and a single dag failing does not prevent the others from running.
+        created: list[tuple[DagModel, SerializedDAG, DagRun]]
+        try:
+            with begin_nested():
+                created_runs = bulk_create_dagruns(
+                    [(serdag, run_id, next_info) for _, serdag, run_id, next_info in new_runs],
+                    run_type=DagRunType.SCHEDULED,
+                    triggered_by=DagRunTriggeredByType.TIMETABLE,
+                    state=DagRunState.QUEUED,
+                    creating_job_id=self.job.id,
+                    session=session,
+                )
+            created = [
+                (dag_model, serdag, created_run)
+                for (dag_model, serdag, _, _), created_run in zip(new_runs, created_runs)
+            ]
+        except Exception:
+            self.log.exception(
+                "Failed creating DagRuns in bulk, creating them one by one",
+                dag_ids=[dag_model.dag_id for dag_model, *_ in new_runs],
+            )
+            created = []
+            for dag_model, serdag, run_id, next_info in new_runs:
+                try:
+                    with begin_nested():
+                        created_run = serdag.create_dagrun(
+                            run_id=run_id,
+                            logical_date=next_info.logical_date,
+                            data_interval=next_info.data_interval,
+                            run_after=next_info.run_after,
+                            run_type=DagRunType.SCHEDULED,
+                            triggered_by=DagRunTriggeredByType.TIMETABLE,
+                            state=DagRunState.QUEUED,
+                            creating_job_id=self.job.id,
+                            session=session,
+                            partition_key=next_info.partition_key,
+                            partition_date=next_info.partition_date,
+                        )
+                except Exception:
+                    self.log.exception("Failed creating DagRun", dag_id=dag_model.dag_id)
+                    continue
+                created.append((dag_model, serdag, created_run))
+
+        # The dag models are updated in memory, their next dagrun fields are written
+        # together with the next flush.
+        for dag_model, serdag, created_run in created:
+            active_runs_of_dags[dag_model.dag_id] += 1
+            dag_model.calculate_dagrun_date_fields(dag=serdag, last_automated_run=created_run)
+            self._set_exceeds_max_active_runs(
+                dag_model=dag_model,
+                session=session,
+                active_non_backfill_runs=active_runs_of_dags[dag_model.dag_id],
+            )
 
     def _create_dag_runs_asset_triggered(
         self,
@@ -2262,7 +2656,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
     def _start_queued_dagruns(self, session: Session) -> None:
         """Find DagRuns in queued state and decide moving them to running state."""
-        dag_runs: Collection[DagRun] = list(DagRun.get_queued_dag_runs_to_set_running(session))
+        dag_runs: Collection[DagRun] = list(
+            DagRun.get_queued_dag_runs_to_set_running(
+                session, dag_ids=self._dag_run_shard.dag_ids if self._dag_run_shard else None
+            )
+        )
 
         # Lock backfills to prevent race conditions with concurrent schedulers
         locked_backfills = self._lock_backfills(dag_runs, session)
@@ -2351,6 +2749,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         session: Session,
     ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
         """Make scheduling decisions for all `dag_runs`."""
+        if self._batch_schedule_dag_runs:
+            return self._schedule_all_dag_runs_in_batch(guard, dag_runs, session)
+
         callback_tuples = []
         for run in dag_runs:
             try:
@@ -2363,6 +2764,67 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         guard.commit()
         return callback_tuples
 
+    def _schedule_all_dag_runs_in_batch(
+        self,
+        guard: CommitProhibitorGuard,
+        dag_runs: Iterable[DagRun],
+        session: Session,
+    ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
+        """
+        Make scheduling decisions for all `dag_runs`, sharing the DB round-trips between them.
+
+        The task instances of every dag run that needs its tasks evaluated are fetched with one
+        query, and the resulting schedulable task instances are updated with one UPDATE per
+        target state, rather than once per dag run.
+        """
+        callback_tuples: list[tuple[DagRun, DagCallbackRequest | None]] = []
+        runs_to_evaluate: list[DagRun] = []
+        dag_runs = list(dag_runs)
+        dag_ids = {run.dag_id for run in dag_runs}
+        # The dag models and latest dag versions are looked up once for all dag runs. Loading
+        # the dag models puts them in the identity map of the session, where they are found later.
+        session.scalars(select(DM).where(DM.dag_id.in_(dag_ids))).all()
+        latest_dag_versions = DagVersion.get_latest_versions(dag_ids, session=session)
+        for run in dag_runs:
+            try:
+                should_evaluate, callback = self._prepare_dag_run_for_scheduling(
+                    run, session=session, latest_dag_versions=latest_dag_versions
+                )
+            except DBAPIError:
+                raise  # let @retry_db_transaction handle DB errors
+            except Exception:
+                self.log.exception("Error scheduling DAG run %s of %s", run.run_id, run.dag_id)
+                continue
+            if should_evaluate:
+                runs_to_evaluate.append(run)
+            else:
+                callback_tuples.append((run, callback))
+
+        tis_by_run = DagRun.fetch_task_instances_for_dag_runs(runs_to_evaluate, session=session)
+        schedulable_tis: list[TI] = []
+        for run in runs_to_evaluate:
+            try:
+                run_schedulable_tis, callback = self._update_dag_run_state(
+                    run, session=session, tis=tis_by_run[(run.dag_id, run.run_id)]
+                )
+            except DBAPIError:
+                raise  # let @retry_db_transaction handle DB errors
+            except Exception:
+                self.log.exception("Error scheduling DAG run %s of %s", run.run_id, run.dag_id)
+                continue
+            schedulable_tis.extend(run_schedulable_tis)
+            callback_tuples.append((run, callback))
+
+        if schedulable_tis:
+            DagRun.bulk_schedule_tis(
+                schedulable_tis,
+                session=session,
+                max_tis_per_query=self.job.max_tis_per_query,
+                scheduled_by_job_id=self.job.id,
+            )
+        guard.commit()
+        return callback_tuples
+
     def _schedule_dag_run(
         self,
         dag_run: DagRun,
@@ -2374,17 +2836,50 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param dag_run: The DagRun to schedule
         :return: Callback that needs to be executed
         """
+        should_evaluate, callback = self._prepare_dag_run_for_scheduling(dag_run, session=session)
+        if not should_evaluate:
+            return callback
+
+        schedulable_tis, callback_to_run = self._update_dag_run_state(dag_run, session=session)
+
+        # This will do one query per dag run. We "could" build up a complex
+        # query to update all the TIs across all the logical dates and dag
+        # IDs in a single query, but it turns out that can be _very very slow_
+        # see #11147/commit ee90807ac for more details
+        dag_run.schedule_tis(schedulable_tis, session, max_tis_per_query=self.job.max_tis_per_query)
+
+        return callback_to_run
+
+    def _prepare_dag_run_for_scheduling(
+        self,
+        dag_run: DagRun,
+        session: Session,
+        latest_dag_versions: Mapping[str, DagVersion] | None = None,
+    ) -> tuple[bool, DagCallbackRequest | None]:
+        """
+        Run the checks on a dag run that have to happen before its task instances are evaluated.
+
+        This fails timed-out dag runs and verifies the integrity of dag runs whose DAG changed.
+
+        :param dag_run: The DagRun to schedule
+        :param latest_dag_versions: The latest version of dags, by dag id, if they were already
+            looked up
+        :return: Whether the task instances of the dag run should be evaluated, and the callback
+            that needs to be executed if the dag run should not be
+        """
         callback: DagCallbackRequest | None = None
 
-        dag = dag_run.dag = self.scheduler_dag_bag.get_dag_for_run(dag_run=dag_run, session=session)
+        dag = dag_run.dag = self.scheduler_dag_bag.get_dag_for_run(
+            dag_run=dag_run, session=session, latest_dag_versions=latest_dag_versions
+        )
         dag_model = DM.get_dagmodel(dag_run.dag_id, session)
         if not dag_model:
             self.log.error("Couldn't find DAG model %s in database!", dag_run.dag_id)
-            return callback
+            return False, callback
 
         if not dag:
             self.log.error("Couldn't find DAG %s in DAG bag!", dag_run.dag_id)
-            return callback
+            return False, callback
 
         if (
             dag_run.start_date
@@ -2445,34 +2940,48 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     duration,
                     tags={"dag_id": dag_run.dag_id},
                 )
-            return callback_to_execute
+            return False, callback_to_execute
 
         if dag_run.logical_date and dag_run.logical_date > timezone.utcnow():
             self.log.error("Logical date is in future: %s", dag_run.logical_date)
-            return callback
+            return False, callback
 
         if not dag_run.bundle_version and not self._verify_integrity_if_dag_changed(
-            dag_run=dag_run, session=session
+            dag_run=dag_run, session=session, latest_dag_versions=latest_dag_versions
         ):
             self.log.warning("The DAG disappeared before verifying integrity: %s. Skipping.", dag_run.dag_id)
-            return callback
+            return False, callback
 
         dag_run.scheduled_by_job_id = self.job.id
+        return True, callback
+
+    def _update_dag_run_state(
+        self,
+        dag_run: DagRun,
+        session: Session,
+        tis: list[TI] | None = None,
+    ) -> tuple[list[TI], DagCallbackRequest | None]:
+        """
+        Evaluate the task instances of a dag run that passed :meth:`_prepare_dag_run_for_scheduling`.
 
+        :param dag_run: The DagRun to schedule
+        :param tis: All task instances of the dag run, if they were already fetched
+        :return: The task instances that can be scheduled, and the callback that needs to be executed
+        """
         # TODO[HA]: Rename update_state -> schedule_dag_run, ?? something else?
-        schedulable_tis, callback_to_run = dag_run.update_state(session=session, execute_callbacks=False)
+        schedulable_tis, callback_to_run = dag_run.update_state(
+            session=session, execute_callbacks=False, tis=tis
+        )
 
         if dag_run.state in State.finished_dr_states and dag_run.run_type in (
             DagRunType.SCHEDULED,
             DagRunType.MANUAL,
             DagRunType.ASSET_TRIGGERED,
         ):
-            self._set_exceeds_max_active_runs(dag_model=dag_model, session=session)
+            # Checked to exist in _prepare_dag_run_for_scheduling; this is an identity map lookup.
+            if dag_model := DM.get_dagmodel(dag_run.dag_id, session):
+                self._set_exceeds_max_active_runs(dag_model=dag_model, session=session)
 
-        # This will do one query per dag run. We "could" build up a complex
-        # query to update all the TIs across all the logical dates and dag
-        # IDs in a single query, but it turns out that can be _very very slow_
-        # see #11147/commit ee90807ac for more details
         if schedulable_tis and self.log.isEnabledFor(logging.DEBUG):
             self.log.debug(
                 "Scheduling TIs for dag_run=%s/%s (scheduler job_id=%s): %s",
@@ -2484,17 +2993,23 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     for ti in schedulable_tis
                 ],
             )
-        dag_run.schedule_tis(schedulable_tis, session, max_tis_per_query=self.job.max_tis_per_query)
+        return schedulable_tis, callback_to_run
 
-        return callback_to_run
-
-    def _verify_integrity_if_dag_changed(self, dag_run: DagRun, session: Session) -> bool:
+    def _verify_integrity_if_dag_changed(
+        self,
+        dag_run: DagRun,
+        session: Session,
+        latest_dag_versions: Mapping[str, DagVersion] | None = None,
+    ) -> bool:
         """
         Only run DagRun.verify integrity if Serialized DAG has changed since it is slow.
 
         Return True if we determine that DAG still exists.
         """
-        latest_dag_version = DagVersion.get_latest_version(dag_run.dag_id, session=session)
+        if latest_dag_versions is not None:
+            latest_dag_version = latest_dag_versions.get(dag_run.dag_id)
+        else:
+            latest_dag_version = DagVersion.get_latest_version(dag_run.dag_id, session=session)
         if latest_dag_version is None:
             return False
         if TYPE_CHECKING:
@@ -2504,7 +3019,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.debug("DAG %s not changed structure, skipping dagrun.verify_integrity", dag_run.dag_id)
             return True
         # Refresh the DAG
-        dag_run.dag = self.scheduler_dag_bag.get_dag_for_run(dag_run=dag_run, session=session)
+        dag_run.dag = self.scheduler_dag_bag.get_dag_for_run(
+            dag_run=dag_run, session=session, latest_dag_versions=latest_dag_versions
+        )
         if not dag_run.dag:
             return False
         # Bulk update dag_version_id for unfinished TIs instead of loading all TIs into memory.
@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import functools
+import heapq
 import logging
 import math
 import os
@@ -27,9 +29,10 @@ import sys
 import threading
 import time
 from collections import deque
-from collections.abc import Callable, Generator, Iterable, Iterator
+from collections.abc import Callable, Coroutine, Generator, Iterable, Iterator
 from contextlib import contextmanager, suppress
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from socket import socket
 from traceback import format_exception
 from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, TextIO, TypedDict
@@ -38,6 +41,7 @@ from uuid import uuid4
 import anyio
 import attrs
 import greenback
+import greenlet
 import structlog
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
@@ -48,6 +52,7 @@ from structlog.contextvars import bind_contextvars as bind_log_contextvars
 
 from airflow._shared.module_loading import import_string
 from airflow._shared.observability.metrics import stats
+from airflow._shared.observability.metrics.stats import normalize_name_for_stats
 from airflow._shared.timezones import timezone
 from airflow.configuration import conf
 from airflow.executors import workloads
@@ -121,6 +126,12 @@ _USER_ACTION_CANCEL_MSG = "__airflow_user_action__"
 
 _ON_CANCEL_TIMEOUT: int = conf.getint("triggerer", "on_kill_timeout", fallback=30)
 
+# Number of triggers using the most CPU time that the TriggerRunner reports to its supervisor
+_TOP_TRIGGERS_REPORTED = 10
+
+# Upper bounds, in seconds, of the event loop lag histogram buckets shown in the debug dump
+_LOOP_LAG_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+
 
 def _make_trigger_span(
     ti: TaskInstanceDTO | None, trigger_id: int, name: str
@@ -185,6 +196,7 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         """Register signals that stop child processes."""
         signal.signal(signal.SIGINT, self._exit_gracefully)
         signal.signal(signal.SIGTERM, self._exit_gracefully)
+        signal.signal(signal.SIGUSR2, self._debug_dump)
 
     @classmethod
     @provide_session
@@ -216,6 +228,11 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
                 self.trigger_runner.kill(signal.SIGKILL)
             sys.exit(os.EX_SOFTWARE)
 
+    def _debug_dump(self, signum, frame) -> None:
+        self.log.info("%s\n%s received, printing debug\n%s", "-" * 80, signal.Signals(signum).name, "-" * 80)
+        if self.trigger_runner:
+            self.trigger_runner.debug_dump()
+
     def _execute(self) -> int | None:
         self.log.info("Starting the triggerer")
         self.register_signals()
@@ -230,6 +247,7 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
                 capacity=self.capacity,
                 logger=log,
                 queues=self.queues,
+                runner_processes=conf.getint("triggerer", "runner_processes", fallback=1),
             )
 
             # Run the main DB comms loop in this process
@@ -258,6 +276,28 @@ class messages:
 
         type: Literal["StartTriggerer"] = "StartTriggerer"
 
+    class TriggerRunTime(BaseModel):
+        """Wall clock and CPU time, in seconds, the event loop spent running trigger steps."""
+
+        wall_time: float = 0.0
+        cpu_time: float = 0.0
+        steps: int = 0
+
+    class TopTrigger(TriggerRunTime):
+        """Time spent running a single trigger since it started."""
+
+        trigger_id: int
+        name: str
+        classpath: str
+
+    class TriggerRuntimeStats(BaseModel):
+        """Event loop instrumentation collected by the TriggerRunner since its previous report."""
+
+        # Seconds the event loop was late waking up the block watchdog
+        loop_lag: list[float] = []
+        run_times: dict[str, messages.TriggerRunTime] = {}
+        top_triggers: list[messages.TopTrigger] = []
+
     class TriggerStateChanges(BaseModel):
         """
         Report state change about triggers back to the TriggerRunnerSupervisor.
@@ -275,6 +315,7 @@ class messages:
         # Format of list[str] is the exc traceback format
         failures: list[tuple[int, list[str] | None]] | None = None
         finished: list[int] | None = None
+        runtime_stats: messages.TriggerRuntimeStats | None = None
 
     class TriggerStateSync(BaseModel):
         type: Literal["TriggerStateSync"] = "TriggerStateSync"
@@ -420,6 +461,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
     runner_health_check_threshold = conf.getfloat("triggerer", "runner_health_check_threshold")
+    job_heartbeat_sec = conf.getfloat("triggerer", "job_heartbeat_sec")
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -432,6 +474,9 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     _last_runner_comms: float = attrs.field(init=False, default=math.inf)
     _runner_comms_silence_logged: bool = attrs.field(init=False, default=False)
 
+    # When triggers were last loaded from the database, see run_once
+    _last_poll: float = attrs.field(init=False, default=-math.inf)
+
     decoder: ClassVar[TypeAdapter[ToTriggerSupervisor]] = TypeAdapter(ToTriggerSupervisor)
 
     # Maps trigger IDs that we think are running in the sub process
@@ -453,9 +498,36 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # Event loop instrumentation reported by the TriggerRunner. The lag samples and run times not
+    # emitted as metrics yet, then the totals since the start and latest top triggers for the debug dump.
+    # The lag is emitted aggregated, once per heartbeat interval, see emit_metrics.
+    _pending_loop_lag: list[float] = attrs.field(factory=list, init=False)
+    _last_loop_lag_emit: float = attrs.field(factory=time.monotonic, init=False)
+    _pending_run_times: dict[str, _RunTime] = attrs.field(factory=dict, init=False)
+    _loop_lag_histogram: list[int] = attrs.field(factory=lambda: [0] * len(_LOOP_LAG_BUCKETS), init=False)
+    _run_times: dict[str, _RunTime] = attrs.field(factory=dict, init=False)
+    _top_triggers: list[messages.TopTrigger] = attrs.field(factory=list, init=False)
+
+    # Supervisors of the additional TriggerRunner subprocesses started with ``[triggerer] runner_processes``.
+    # Triggers are sharded across all the runners by id. This supervisor loads the triggers, and handles the
+    # events and heartbeats for all of them.
+    shards: list[TriggerRunnerSupervisor] = attrs.field(factory=list, init=False)
+
+    @property
+    def runners(self) -> list[TriggerRunnerSupervisor]:
+        """This supervisor followed by the supervisors of the additional runner subprocesses."""
+        return [self, *self.shards]
+
     def is_alive(self) -> bool:
         # Set by `_service_subprocess` in the loop
-        return self._exit_code is None
+        return self._exit_code is None and all(
+            shard._check_subprocess_exit() is None for shard in self.shards
+        )
+
+    def kill(self, *args, **kwargs) -> None:
+        for shard in self.shards:
+            shard.kill(*args, **kwargs)
+        super().kill(*args, **kwargs)
 
     @classmethod
     def start(  # type: ignore[override]
@@ -463,13 +535,24 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         *,
         job: Job | None = None,
         logger=None,
+        runner_processes: int = 1,
         **kwargs,
     ):
         proc_id = job.id if job is not None else uuid4()
-        proc = super().start(id=proc_id, job=job, target=cls.run_in_process, logger=logger, **kwargs)
+        # All the runners share a selector, so servicing it handles the messages of every runner
+        selector = selectors.DefaultSelector()
+        proc = super().start(
+            id=proc_id, job=job, target=cls.run_in_process, logger=logger, selector=selector, **kwargs
+        )
 
         msg = messages.StartTriggerer()
         proc.send_msg(msg, request_id=0)
+        for _ in range(1, runner_processes):
+            shard = super().start(
+                id=proc_id, job=job, target=cls.run_in_process, logger=logger, selector=selector, **kwargs
+            )
+            shard.send_msg(msg, request_id=0)
+            proc.shards.append(shard)
         return proc
 
     @functools.cached_property
@@ -504,6 +587,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         self._last_runner_comms = time.monotonic()
 
         if isinstance(msg, messages.TriggerStateChanges):
+            if msg.runtime_stats:
+                self.record_runtime_stats(msg.runtime_stats)
             if msg.events:
                 self.events.extend(msg.events)
             if msg.failures:
@@ -645,14 +730,21 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def run_once(self) -> None:
         """Perform a single iteration of the run loop."""
-        self.load_triggers()
-
-        # Wait for up to 1 second for activity
-        self._service_subprocess(1)
-
-        self.handle_events()
-        self.handle_failed_triggers()
-        self.clean_unused()
+        # The runners report events as soon as triggers fire them, so this loop can run many times a
+        # second. Only poll the database for trigger assignments once per second.
+        poll = (now := time.monotonic()) - self._last_poll >= 1
+        if poll:
+            self._last_poll = now
+            self.load_triggers()
+
+        # Wait for activity, up to the next poll
+        self._service_subprocess(self._last_poll + 1 - time.monotonic())
+
+        for runner in self.runners:
+            runner.handle_events()
+            runner.handle_failed_triggers()
+        if poll:
+            self.clean_unused()
         self.heartbeat()
 
         self.emit_metrics()
@@ -663,7 +755,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.heartbeat() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
-        elapsed = time.monotonic() - self._last_runner_comms
+        elapsed = time.monotonic() - min(runner._last_runner_comms for runner in self.runners)
         if self.runner_health_check_threshold > 0 and elapsed > self.runner_health_check_threshold:
             if not self._runner_comms_silence_logged:
                 log.error(
@@ -752,19 +844,91 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def emit_metrics(self):
         tags = self.metric_tags()
+        running_triggers = sum(len(runner.running_triggers) for runner in self.runners)
         stats.gauge(
             "triggers.running",
-            len(self.running_triggers),
+            running_triggers,
             tags=tags,
         )
 
-        capacity_left = self.capacity - len(self.running_triggers)
+        capacity_left = self.capacity - running_triggers
         stats.gauge(
             "triggerer.capacity_left",
             capacity_left,
             tags=tags,
         )
 
+        # The lag is sampled ten times a second, so only its max and average over the heartbeat interval
+        # are emitted, once per interval
+        if (now := time.monotonic()) - self._last_loop_lag_emit >= self.job_heartbeat_sec:
+            self._last_loop_lag_emit = now
+            loop_lag = [lag for runner in self.runners for lag in runner._pending_loop_lag]
+            if loop_lag:
+                stats.timing("triggerer.event_loop_lag.max", timedelta(seconds=max(loop_lag)), tags=tags)
+                stats.timing(
+                    "triggerer.event_loop_lag.avg",
+                    timedelta(seconds=sum(loop_lag) / len(loop_lag)),
+                    tags=tags,
+                )
+            for runner in self.runners:
+                runner._pending_loop_lag.clear()
+
+        for runner in self.runners:
+            for classpath, run_time in runner._pending_run_times.items():
+                classpath_tags = {**tags, "classpath": normalize_name_for_stats(classpath)}
+                stats.timing(
+                    "triggers.run_wall_time", timedelta(seconds=run_time.wall_time), tags=classpath_tags
+                )
+                stats.timing(
+                    "triggers.run_cpu_time", timedelta(seconds=run_time.cpu_time), tags=classpath_tags
+                )
+            runner._pending_run_times.clear()
+
+    def record_runtime_stats(self, runtime_stats: messages.TriggerRuntimeStats) -> None:
+        """Record the event loop instrumentation reported by the TriggerRunner."""
+        self._pending_loop_lag.extend(runtime_stats.loop_lag)
+        for lag in runtime_stats.loop_lag:
+            self._loop_lag_histogram[bisect.bisect_left(_LOOP_LAG_BUCKETS, lag)] += 1
+        for classpath, reported in runtime_stats.run_times.items():
+            for run_times in (self._pending_run_times, self._run_times):
+                run_time = run_times.setdefault(classpath, _RunTime())
+                run_time.wall_time += reported.wall_time
+                run_time.cpu_time += reported.cpu_time
+                run_time.steps += reported.steps
+        self._top_triggers = runtime_stats.top_triggers
+
+    def debug_dump(self) -> None:
+        """Log the event loop lag and the time spent running triggers, per classpath and for the top triggers."""
+        for index, runner in enumerate(self.runners):
+            log.info(
+                "Event loop lag histogram",
+                runner=index,
+                buckets={
+                    f"<={bound}s": count
+                    for bound, count in zip(_LOOP_LAG_BUCKETS, runner._loop_lag_histogram)
+                },
+            )
+            for classpath, run_time in sorted(runner._run_times.items(), key=lambda item: -item[1].cpu_time):
+                log.info(
+                    "Trigger classpath run time",
+                    runner=index,
+                    classpath=classpath,
+                    wall_time=round(run_time.wall_time, 3),
+                    cpu_time=round(run_time.cpu_time, 3),
+                    steps=run_time.steps,
+                )
+            for top_trigger in runner._top_triggers:
+                log.info(
+                    "Trigger run time",
+                    runner=index,
+                    trigger_id=top_trigger.trigger_id,
+                    name=top_trigger.name,
+                    classpath=top_trigger.classpath,
+                    wall_time=round(top_trigger.wall_time, 3),
+                    cpu_time=round(top_trigger.cpu_time, 3),
+                    steps=top_trigger.steps,
+                )
+
     def _create_workload(
         self,
         trigger: Trigger,
@@ -890,8 +1054,18 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         Works out the differences - ones to add, and ones to remove - then
         adds them to the dequeues so the subprocess can actually mutate the running
-        trigger set.
+        trigger set. With several runner subprocesses, each runner is handed the triggers whose
+        id modulo the number of runners is its index.
         """
+        if self.shards:
+            runners = self.runners
+            runner_trigger_ids: list[set[int]] = [set() for _ in runners]
+            for trigger_id in requested_trigger_ids:
+                runner_trigger_ids[trigger_id % len(runners)].add(trigger_id)
+            for shard, shard_trigger_ids in zip(self.shards, runner_trigger_ids[1:]):
+                shard.update_triggers(shard_trigger_ids)
+            requested_trigger_ids = runner_trigger_ids[0]
+
         known_trigger_ids = self.running_triggers.union(
             (x[0] for x in self.events),
             self.cancelling_triggers,
@@ -971,6 +1145,107 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         TriggerRunner().run()
 
 
+@dataclass(slots=True)
+class _RunTime:
+    """Accumulated time the event loop spent running trigger steps."""
+
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    steps: int = 0
+
+
+class _StepClock:
+    """Wall clock and thread CPU time of a trigger step, which can be paused."""
+
+    __slots__ = ("cpu_start", "cpu_time", "wall_start", "wall_time")
+
+    def __init__(self) -> None:
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.resume()
+
+    def resume(self) -> None:
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+
+    def pause(self) -> None:
+        self.wall_time += time.perf_counter() - self.wall_start
+        self.cpu_time += time.thread_time() - self.cpu_start
+
+
+# The clocks of the trigger steps running, by the greenlet they run in. A trigger step is suspended without
+# returning when the trigger calls greenback.await_(), which switches to the greenlet of the event loop so
+# that other triggers run in the meantime. Its clock is paused until the step's greenlet is switched back to.
+_step_clocks: dict[greenlet.greenlet, _StepClock] = {}
+_step_clock_tracer = threading.local()
+
+
+def _trace_greenlet_switch(event: str, args: tuple[greenlet.greenlet, greenlet.greenlet]) -> None:
+    if event in ("switch", "throw"):
+        origin, target = args
+        if (clock := _step_clocks.get(origin)) is not None:
+            clock.pause()
+        if (clock := _step_clocks.get(target)) is not None:
+            clock.resume()
+    if _step_clock_tracer.previous is not None:
+        _step_clock_tracer.previous(event, args)
+
+
+def _install_step_clock_tracer() -> None:
+    """Install the greenlet tracer pausing the clocks of suspended trigger steps, once per thread."""
+    if not getattr(_step_clock_tracer, "installed", False):
+        _step_clock_tracer.previous = greenlet.settrace(_trace_greenlet_switch)
+        _step_clock_tracer.installed = True
+
+
+class _TimedCoroutine(Coroutine):
+    """
+    Wrap a coroutine to measure how long each of its steps keeps the event loop busy.
+
+    The event loop runs a task by calling ``send`` or ``throw`` on its coroutine, which
+    returns once the coroutine awaits something that is not ready. Timing these calls
+    measures how long the trigger prevented every other trigger from running, including
+    any blocking code it runs. CPU time is that of the event loop thread. The time a step
+    spends suspended in ``greenback.await_()``, while other triggers run, is not counted.
+    """
+
+    __slots__ = ("_coro", "_run_times")
+
+    def __init__(self, coro: Coroutine, *run_times: _RunTime) -> None:
+        self._coro = coro
+        self._run_times = run_times
+        _install_step_clock_tracer()
+
+    def _step(self, method: Callable, *args):
+        current = greenlet.getcurrent()
+        outer_clock = _step_clocks.get(current)
+        clock = _step_clocks[current] = _StepClock()
+        try:
+            return method(*args)
+        finally:
+            clock.pause()
+            if outer_clock is None:
+                del _step_clocks[current]
+            else:
+                _step_clocks[current] = outer_clock
+            for run_time in self._run_times:
+                run_time.wall_time += clock.wall_time
+                run_time.cpu_time += clock.cpu_time
+                run_time.steps += 1
+
+    def send(self, value):
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args):
+        return self._step(self._coro.throw, *args)
+
+    def close(self):
+        self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
@@ -1093,7 +1368,8 @@ class TriggerRunner:
 
     # Should-we-stop flag
     stop: bool = False
-    _stop_event: anyio.Event | None = None
+    # Set to wake the main loop up early, when a trigger fired an event or exited, or stop is requested
+    _wakeup_event: asyncio.Event | None = None
 
     # TODO: connect this to the parent process
     log: FilteringBoundLogger = structlog.get_logger()
@@ -1109,21 +1385,32 @@ class TriggerRunner:
         self.events = deque()
         self.failed_triggers = deque()
         self.job_id = None
-        self._stop_event = None
+        self._wakeup_event = None
         self.blocked_main_thread_warning_threshold = conf.getfloat(
             "triggerer", "blocked_main_thread_warning_threshold"
         )
+        self.min_state_sync_interval = conf.getfloat("triggerer", "min_state_sync_interval")
+        # Event loop instrumentation, reported to the supervisor with every state sync
+        self._loop_lag: list[float] = []
+        self._classpath_run_times: dict[str, _RunTime] = {}
+        self._trigger_run_times: dict[int, tuple[str, _RunTime]] = {}
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals gracefully."""
         self.stop = True
-        if self._stop_event is not None:
-            self._stop_event.set()
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        """Wake the main loop up so that it syncs state with the supervisor without waiting for the next poll."""
+        if self._wakeup_event is not None:
+            self._wakeup_event.set()
 
     def run(self):
         """Sync entrypoint - just run arun in an async loop."""
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
+        # The debug dump is printed by the supervisor, from the stats we report to it
+        signal.signal(signal.SIGUSR2, signal.SIG_IGN)
         asyncio.run(self.arun())
 
     async def arun(self):
@@ -1136,7 +1423,7 @@ class TriggerRunner:
         await self.init_comms()
 
         watchdog = asyncio.create_task(self.block_watchdog())
-        stop_event = self._stop_event = anyio.Event()
+        self._wakeup_event = asyncio.Event()
 
         last_status = time.monotonic()
         try:
@@ -1150,15 +1437,13 @@ class TriggerRunner:
                     raise RuntimeError("Supervisor connection lost")
 
                 # Run core logic
-
+                last_sync = time.monotonic()
                 finished_ids = await self.cleanup_finished_triggers()
                 # This also loads the triggers we need to create or cancel
                 await self.sync_state_to_supervisor(finished_ids)
                 await self.create_triggers()
                 await self.cancel_triggers()
-                # Sleep for a bit, or exit early if stop is requested.
-                with anyio.move_on_after(1):
-                    await stop_event.wait()
+                await self.wait_for_wakeup(last_sync)
                 # Every minute, log status
                 if (now := time.monotonic()) - last_status >= 60:
                     watchers = len([trigger for trigger in self.triggers.values() if trigger["is_watcher"]])
@@ -1180,6 +1465,27 @@ class TriggerRunner:
         # Wait for supporting tasks to complete
         await watchdog
 
+    async def wait_for_wakeup(self, last_sync: float) -> None:
+        """
+        Wait until the state should be synced with the supervisor again.
+
+        Sleep for up to a second, or until a trigger fired an event or exited, or stop is requested. The
+        state is not synced more often than every ``[triggerer] min_state_sync_interval`` seconds though,
+        so that a burst of events is sent in a single batch rather than cleaning up the finished triggers
+        and syncing with the supervisor for every one of them.
+
+        :param last_sync: The ``time.monotonic()`` at which the state was last synced
+        """
+        if TYPE_CHECKING:
+            assert self._wakeup_event is not None
+        with anyio.move_on_after(1):
+            await self._wakeup_event.wait()
+        if not self.stop and (debounce := last_sync + self.min_state_sync_interval - time.monotonic()) > 0:
+            await asyncio.sleep(debounce)
+        self._wakeup_event.clear()
+        # Let the other triggers that are ready run first, so their events join this batch
+        await asyncio.sleep(0)
+
     async def init_comms(self):
         """
         Set up the communications pipe between this process and the supervisor.
@@ -1279,11 +1585,20 @@ class TriggerRunner:
             trigger_instance.triggerer_job_id = self.job_id
             trigger_instance.timeout_after = workload.timeout_after
 
-            self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
+            run_time = _RunTime()
+            self._trigger_run_times[trigger_id] = (workload.classpath, run_time)
+            classpath_run_time = self._classpath_run_times.setdefault(workload.classpath, _RunTime())
+            task = asyncio.create_task(
+                _TimedCoroutine(
                     self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
-                    name=trigger_name,
+                    run_time,
+                    classpath_run_time,
                 ),
+                name=trigger_name,
+            )
+            task.add_done_callback(lambda _: self.wakeup())
+            self.triggers[trigger_id] = {
+                "task": task,
                 "is_watcher": isinstance(trigger_instance, BaseEventTrigger),
                 "name": trigger_name,
                 "events": 0,
@@ -1315,6 +1630,7 @@ class TriggerRunner:
         for trigger_id, details in list(self.triggers.items()):
             if details["task"].done():
                 finished_ids.append(trigger_id)
+                self._trigger_run_times.pop(trigger_id, None)
                 # Check to see if it exited for good reasons
                 saved_exc = None
                 try:
@@ -1350,7 +1666,9 @@ class TriggerRunner:
                     # TODO: better formatting of the exception?
                     self.failed_triggers.append((trigger_id, saved_exc))
                 del self.triggers[trigger_id]
-            await asyncio.sleep(0)
+                # Only yield after handling a finished trigger: checking the others is cheap, and this
+                # runs whenever a trigger fires, so yielding for all of them would add up.
+                await asyncio.sleep(0)
         return finished_ids
 
     def process_trigger_events(self, finished_ids: list[int]) -> messages.TriggerStateChanges:
@@ -1371,8 +1689,41 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=finished_ids if finished_ids else None,
             failures=failures_to_send if failures_to_send else None,
+            runtime_stats=self.collect_runtime_stats(),
         )
 
+    def collect_runtime_stats(self) -> messages.TriggerRuntimeStats:
+        """
+        Collect the event loop instrumentation since the previous call.
+
+        Run times per trigger classpath cover the time since the previous call, while the
+        triggers using the most CPU time are ranked by the time spent since they started.
+        """
+        loop_lag, self._loop_lag = self._loop_lag, []
+        run_times: dict[str, messages.TriggerRunTime] = {}
+        for classpath, run_time in self._classpath_run_times.items():
+            if run_time.steps:
+                run_times[classpath] = messages.TriggerRunTime(
+                    wall_time=run_time.wall_time, cpu_time=run_time.cpu_time, steps=run_time.steps
+                )
+                run_time.wall_time = run_time.cpu_time = 0.0
+                run_time.steps = 0
+        top_triggers = [
+            messages.TopTrigger(
+                trigger_id=trigger_id,
+                name=self.triggers[trigger_id]["name"],
+                classpath=classpath,
+                wall_time=run_time.wall_time,
+                cpu_time=run_time.cpu_time,
+                steps=run_time.steps,
+            )
+            for trigger_id, (classpath, run_time) in heapq.nlargest(
+                _TOP_TRIGGERS_REPORTED, self._trigger_run_times.items(), key=lambda item: item[1][1].cpu_time
+            )
+            if trigger_id in self.triggers
+        ]
+        return messages.TriggerRuntimeStats(loop_lag=loop_lag, run_times=run_times, top_triggers=top_triggers)
+
     def sanitize_trigger_events(self, msg: messages.TriggerStateChanges) -> messages.TriggerStateChanges:
         req_encoder = _new_encoder()
         events_to_send: list[tuple[int, DiscrimatedTriggerEvent]] = []
@@ -1395,6 +1746,7 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=msg.finished,
             failures=msg.failures,
+            runtime_stats=msg.runtime_stats,
         )
 
     async def sync_state_to_supervisor(self, finished_ids: list[int]) -> None:
@@ -1434,8 +1786,9 @@ class TriggerRunner:
         there are badly-written triggers taking longer than that and blocking
         the event loop.
 
-        Unfortunately, we can't tell what trigger is blocking things, but
-        we can at least detect the top-level problem.
+        How late the loop wakes it up is also recorded as the event loop lag. The
+        triggers keeping the loop busy are found by timing every step they run, see
+        :meth:`collect_runtime_stats`.
         """
         while not self.stop:
             last_run = time.monotonic()
@@ -1443,6 +1796,7 @@ class TriggerRunner:
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            self._loop_lag.append(max(time_elapsed - 0.1, 0.0))
             if time_elapsed > self.blocked_main_thread_warning_threshold:
                 await self.log.ainfo(
                     "Triggerer's async thread was blocked for %.2f seconds, "
@@ -1489,6 +1843,7 @@ class TriggerRunner:
                     )
                     self.triggers[trigger_id]["events"] += 1
                     self.events.append((trigger_id, event))
+                    self.wakeup()
                 span.set_status(Status(StatusCode.OK))
             except asyncio.CancelledError as e:
                 # A trigger can be cancelled for two reasons:
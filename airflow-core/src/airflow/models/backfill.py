@@ -511,6 +511,58 @@ def _create_backfill_dag_run_partitioned(
     )
 
 
+def _create_backfill_dag_runs_in_bulk(
+    *,
+    dag: SerializedDAG,
+    br: Backfill,
+    new_runs: list[tuple[int, DagRunInfo]],
+    session: Session,
+) -> bool:
+    """
+    Create the backfill Dag runs that do not exist yet in bulk.
+
+    Returns False, without creating anything, if one of the runs was created concurrently
+    since the existing runs were looked up; the runs must then be created one by one.
+    """
+    from airflow.models.dagrun import DagRun
+
+    runs = {
+        DagRun.generate_run_id(
+            run_type=DagRunType.BACKFILL_JOB, logical_date=info.logical_date, run_after=info.run_after
+        ): info
+        for _, info in new_runs
+    }
+    try:
+        with session.begin_nested():
+            dag_runs = dag.create_dagruns(
+                runs,
+                conf=br.dag_run_conf,
+                run_type=DagRunType.BACKFILL_JOB,
+                triggered_by=DagRunTriggeredByType.BACKFILL,
+                triggering_user_name=br.triggering_user_name,
+                state=DagRunState.QUEUED,
+                start_date=timezone.utcnow(),
+                backfill_id=br.id,
+                session=session,
+            )
+    except IntegrityError:
+        log.info("Backfill Dag runs were created concurrently; creating them one by one.", backfill_id=br.id)
+        return False
+    session.add_all(
+        BackfillDagRun(
+            backfill_id=br.id,
+            dag_run_id=dr.id,
+            sort_ordinal=backfill_sort_ordinal,
+            logical_date=info.logical_date,
+            partition_key=info.partition_key,
+        )
+        for dr, (backfill_sort_ordinal, info) in zip(dag_runs, new_runs)
+    )
+    for _, info in new_runs:
+        log.info("Created backfill Dag run.", dag_id=dag.dag_id, backfill_id=br.id, info=info)
+    return True
+
+
 def _get_info_list(
     *,
     from_date: datetime,
@@ -707,11 +759,33 @@ def _create_runs_non_partitioned(
     run_on_latest_version: bool,
     session: Session,
 ) -> None:
+    from airflow.models.dagrun import DagRun
+
     for info in dagrun_info_list:
         if info.partition_key or not info.logical_date:
             raise RuntimeError("Expected all Dag run infos to have logical date and no partition key.")
 
-    for backfill_sort_ordinal, info in enumerate(dagrun_info_list, start=1):
+    logical_dates = [info.logical_date for info in dagrun_info_list]
+    existing_logical_dates = set(
+        session.scalars(
+            select(DagRun.logical_date).where(
+                DagRun.dag_id == dag.dag_id,
+                DagRun.logical_date.between(min(logical_dates), max(logical_dates)),
+            )
+        )
+    )
+    # Runs that do not exist yet are created in bulk, runs that do exist may have to be
+    # cleared and are handled one at a time.
+    pending = list(enumerate(dagrun_info_list, start=1))
+    new_runs = [
+        (ordinal, info) for ordinal, info in pending if info.logical_date not in existing_logical_dates
+    ]
+    if new_runs and _create_backfill_dag_runs_in_bulk(dag=dag, br=br, new_runs=new_runs, session=session):
+        pending = [
+            (ordinal, info) for ordinal, info in pending if info.logical_date in existing_logical_dates
+        ]
+
+    for backfill_sort_ordinal, info in pending:
         _create_backfill_dag_run_non_partitioned(
             dag=dag,
             info=info,
@@ -625,7 +625,9 @@ class DagModel(Base):
         return any_deactivated
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Any, dict[str, datetime]]:
+    def dags_needing_dagruns(
+        cls, session: Session, dag_ids: Collection[str] | None = None
+    ) -> tuple[Any, dict[str, datetime]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
@@ -637,6 +639,7 @@ class DagModel(Base):
         ``SerializedDagModel`` row are omitted from ``triggered_date_by_dag`` until serialization exists;
         ADRQs are **not** deleted here so the scheduler can re-evaluate on a later run.
 
+        :param dag_ids: if given, only consider these Dags
         :meta private:
         """
         from airflow.models.serialized_dag import SerializedDagModel
@@ -748,6 +751,8 @@ class DagModel(Base):
             .order_by(cls.next_dagrun_create_after)
             .limit(cls.NUM_DAGS_PER_DAGRUN_QUERY)
         )
+        if dag_ids is not None:
+            query = query.where(cls.dag_id.in_(dag_ids))
 
         return (
             session.scalars(with_row_locks(query, of=cls, session=session, skip_locked=True)),
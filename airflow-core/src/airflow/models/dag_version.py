@@ -24,7 +24,7 @@ from uuid import UUID
 
 import sqlalchemy as sa
 import uuid6
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint, select
+from sqlalchemy import ForeignKey, Integer, UniqueConstraint, and_, func, select
 from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship
 
 from airflow._shared.timezones import timezone
@@ -34,6 +34,8 @@ from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import Select
 
@@ -197,6 +199,30 @@ class DagVersion(Base):
             )
         )
 
+    @classmethod
+    def get_latest_versions(cls, dag_ids: Iterable[str], *, session: Session) -> dict[str, DagVersion]:
+        """
+        Get the latest version of each of the given DAGs with a single query.
+
+        :param dag_ids: The DAG IDs.
+        :param session: The database session.
+        :return: The latest version of every DAG that has one, by DAG ID.
+        """
+        latest = (
+            select(cls.dag_id, func.max(cls.created_at).label("created_at"))
+            .where(cls.dag_id.in_(dag_ids))
+            .group_by(cls.dag_id)
+            .subquery()
+        )
+        return {
+            dag_version.dag_id: dag_version
+            for dag_version in session.scalars(
+                select(cls).join(
+                    latest, and_(cls.dag_id == latest.c.dag_id, cls.created_at == latest.c.created_at)
+                )
+            )
+        }
+
     @classmethod
     @provide_session
     def get_version(
@@ -18,13 +18,14 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import MutableMapping
+import time
+from collections.abc import Callable, Mapping, MutableMapping
 from contextlib import nullcontext
 from threading import RLock
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from cachetools import LRUCache, TTLCache
+from cachetools import Cache, LRUCache, TTLCache
 from sqlalchemy import String, select
 from sqlalchemy.orm import Mapped, joinedload, mapped_column
 
@@ -42,6 +43,58 @@ if TYPE_CHECKING:
     from airflow.serialization.definitions.dag import SerializedDAG
 
 
+def _estimate_dag_size(dag: SerializedDAG) -> int:
+    """Estimate the memory held by a deserialized Dag, in number of tasks."""
+    return 1 + len(dag.task_dict)
+
+
+class _DagCacheMixin(Cache):
+    """
+    Eviction hooks shared by the bounded DBDagBag caches.
+
+    On top of the size bound of the underlying cache, the number of entries is capped at
+    ``max_entries``, ``on_evict`` is called for every entry evicted to make room, and
+    ``on_expire`` for every entry removed because its time-to-live expired.
+    """
+
+    max_entries: int | None = None
+    on_evict: Callable[[UUID | str, SerializedDAG], None] | None = None
+    on_expire: Callable[[UUID | str, SerializedDAG], Any] | None = None
+
+    def __setitem__(self, key: UUID | str, value: SerializedDAG) -> None:
+        super().__setitem__(key, value)
+        if self.max_entries is not None:
+            while len(self) > self.max_entries:
+                self.popitem()
+
+    def popitem(self) -> tuple[UUID | str, SerializedDAG]:
+        key, dag = super().popitem()
+        if self.on_evict is not None:
+            self.on_evict(key, dag)
+        return key, dag
+
+    def clear(self) -> None:
+        # Clearing is neither eviction nor expiry; don't report every entry to the hooks.
+        on_evict, on_expire, self.on_evict, self.on_expire = self.on_evict, self.on_expire, None, None
+        try:
+            super().clear()
+        finally:
+            self.on_evict, self.on_expire = on_evict, on_expire
+
+
+class _DagLRUCache(_DagCacheMixin, LRUCache):
+    pass
+
+
+class _DagTTLCache(_DagCacheMixin, TTLCache):
+    def expire(self, time=None) -> list[tuple[UUID | str, SerializedDAG]]:
+        expired = super().expire(time)
+        if self.on_expire is not None:
+            for key, dag in expired:
+                self.on_expire(key, dag)
+        return expired
+
+
 class DBDagBag:
     """
     Internal class for retrieving dags from the database.
@@ -50,14 +103,23 @@ class DBDagBag:
     The scheduler uses this without caching, while the API server can
     enable caching via configuration.
 
+    A bounded cache never drops the Dag versions used by running Dag runs: they are
+    kept aside when evicted or expired, so they are not deserialized again for every
+    request while the cache churns through other versions. They are only looked up in the
+    database when caching a Dag evicts another one, at most every
+    ``PINNED_VERSIONS_REFRESH_INTERVAL`` seconds.
+
     :meta private:
     """
 
+    PINNED_VERSIONS_REFRESH_INTERVAL = 60.0
+
     def __init__(
         self,
         load_op_links: bool = True,
         cache_size: int | None = None,
         cache_ttl: int | None = None,
+        cache_max_tasks: int | None = None,
     ) -> None:
         """
         Initialize DBDagBag.
@@ -65,17 +127,32 @@ class DBDagBag:
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
         :param cache_size: Size of LRU cache. If None or 0, uses unbounded dict (no eviction).
         :param cache_ttl: Time-to-live for cache entries in seconds. If None or 0, no TTL (LRU only).
+        :param cache_max_tasks: Additionally bound the LRU cache by the estimated size of the cached
+            Dags, counted in tasks. If None or 0, only the number of cached Dags is bounded.
         """
         self.load_op_links = load_op_links
         self._dags: MutableMapping[UUID | str, SerializedDAG] = {}
         self._use_cache = False
+        self._pinned_version_ids: set[UUID | str] = set()
+        self._pinned_dags: dict[UUID | str, SerializedDAG] = {}
+        self._pinned_refreshed_at: float | None = None
 
         # Initialize bounded cache if cache_size is provided and > 0
         if cache_size and cache_size > 0:
+            cache: _DagLRUCache | _DagTTLCache
+            if cache_max_tasks and cache_max_tasks > 0:
+                maxsize, getsizeof = cache_max_tasks, _estimate_dag_size
+            else:
+                maxsize, getsizeof = cache_size, None
             if cache_ttl and cache_ttl > 0:
-                self._dags = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+                cache = _DagTTLCache(maxsize=maxsize, ttl=cache_ttl, getsizeof=getsizeof)
             else:
-                self._dags = LRUCache(maxsize=cache_size)
+                cache = _DagLRUCache(maxsize=maxsize, getsizeof=getsizeof)
+            if getsizeof is not None:
+                cache.max_entries = cache_size
+            cache.on_evict = self._on_evict
+            cache.on_expire = self._keep_pinned
+            self._dags = cache
             self._use_cache = True
 
         # Lock required for bounded caches: cachetools caches are NOT thread-safe
@@ -83,23 +160,109 @@ class DBDagBag:
         # nullcontext for unbounded dict avoids lock overhead in the scheduler path.
         self._lock: RLock | nullcontext = RLock() if self._use_cache else nullcontext()
 
-    def _read_dag(self, serdag: SerializedDagModel) -> SerializedDAG | None:
-        """Read and optionally cache a SerializedDAG from a SerializedDagModel."""
+    def _keep_pinned(self, version_id: UUID | str, dag: SerializedDAG) -> bool:
+        # Called with the lock held, from within the cache.
+        if version_id in self._pinned_version_ids:
+            self._pinned_dags[version_id] = dag
+            return True
+        return False
+
+    def _on_evict(self, version_id: UUID | str, dag: SerializedDAG) -> None:
+        if not self._keep_pinned(version_id, dag):
+            stats.incr("api_server.dag_bag.cache_eviction")
+
+    @staticmethod
+    def _running_dag_version_ids(session: Session) -> set[UUID]:
+        """Return the ids of the Dag versions running Dag runs use, as resolved by ``get_dag_for_run``."""
+        from airflow.models.dagrun import DagRun
+        from airflow.utils.state import DagRunState
+
+        running = session.execute(
+            select(DagRun.dag_id, DagRun.bundle_version, DagRun.created_dag_version_id)
+            .where(DagRun.state == DagRunState.RUNNING)
+            .distinct()
+        ).all()
+        # Dag runs without a bundle version run the latest version of their Dag
+        latest_dag_versions = DagVersion.get_latest_versions(
+            {dag_id for dag_id, bundle_version, _ in running if not bundle_version}, session=session
+        )
+        version_ids = set()
+        for dag_id, bundle_version, created_dag_version_id in running:
+            if not bundle_version and (dag_version := latest_dag_versions.get(dag_id)):
+                version_ids.add(dag_version.id)
+            elif created_dag_version_id is not None:
+                version_ids.add(created_dag_version_id)
+        return version_ids
+
+    def _refresh_pinned_versions(self, session: Session) -> None:
+        """Pin the Dag versions of running Dag runs, at most every ``PINNED_VERSIONS_REFRESH_INTERVAL``."""
+        now = time.monotonic()
+        if (
+            self._pinned_refreshed_at is not None
+            and now - self._pinned_refreshed_at < self.PINNED_VERSIONS_REFRESH_INTERVAL
+        ):
+            return
+        self._pinned_refreshed_at = now
+        version_ids: set[UUID | str] = set(self._running_dag_version_ids(session))
+        with self._lock:
+            self._pinned_version_ids = version_ids
+            self._pinned_dags = {k: v for k, v in self._pinned_dags.items() if k in version_ids}
+            pinned_size = len(self._pinned_dags)
+        stats.gauge("api_server.dag_bag.pinned_size", pinned_size)
+
+    def _cached_dag(self, version_id: UUID | str) -> SerializedDAG | None:
+        # Must be called with the lock held.
+        if (dag := self._dags.get(version_id)) is None and isinstance(self._dags, _DagTTLCache):
+            # An expired Dag is only handed to on_expire, which keeps it if it is pinned, once
+            # the expired entries are removed.
+            self._dags.expire()
+        return dag or self._pinned_dags.get(version_id)
+
+    def _evicts_to_cache(self, version_id: UUID | str, dag: SerializedDAG) -> bool:
+        # Must be called with the lock held.
+        cache = self._dags
+        if not isinstance(cache, (_DagLRUCache, _DagTTLCache)):
+            return False
+        if version_id in cache:
+            # Replacing an entry makes no room for a new one
+            return False
+        if cache.max_entries is not None and len(cache) >= cache.max_entries:
+            return True
+        return cache.currsize + cache.getsizeof(dag) > cache.maxsize
+
+    def _read_dag(self, serdag: SerializedDagModel, session: Session | None = None) -> SerializedDAG | None:
+        """
+        Read and optionally cache a SerializedDAG from a SerializedDagModel.
+
+        :param session: If given, used to refresh the pinned Dag versions when caching the Dag
+            evicts another one.
+        """
         serdag.load_op_links = self.load_op_links
         dag = serdag.dag
         if not dag:
             return None
+        if session is not None and self._use_cache:
+            with self._lock:
+                evicts = self._evicts_to_cache(serdag.dag_version_id, dag)
+            if evicts:
+                self._refresh_pinned_versions(session)
         with self._lock:
-            self._dags[serdag.dag_version_id] = dag
+            try:
+                self._dags[serdag.dag_version_id] = dag
+            except ValueError:
+                # Larger than the whole cache: serve it without caching it.
+                return dag
             cache_size = len(self._dags)
         if self._use_cache:
             stats.gauge("api_server.dag_bag.cache_size", cache_size, rate=0.1)
         return dag
 
-    def _get_dag(self, version_id: UUID | str, session: Session) -> SerializedDAG | None:
+    def _get_dag(
+        self, version_id: UUID | str, session: Session, *, lazy: bool = False
+    ) -> SerializedDAG | None:
         # Check cache first
         with self._lock:
-            dag = self._dags.get(version_id)
+            dag = self._cached_dag(version_id)
 
         if dag:
             if self._use_cache:
@@ -111,21 +274,36 @@ class DBDagBag:
             return None
         if not (serdag := dag_version.serialized_dag):
             return None
+        if lazy:
+            return self._read_lazy_dag(serdag)
 
         # Double-checked locking: another thread may have cached it while we queried DB.
         # Only emit the miss metric after confirming no other thread cached it, to avoid
         # counting a single lookup as both a miss and a hit.
         if self._use_cache:
             with self._lock:
-                if dag := self._dags.get(version_id):
+                if dag := self._cached_dag(version_id):
                     stats.incr("api_server.dag_bag.cache_hit")
                     return dag
             stats.incr("api_server.dag_bag.cache_miss")
-        return self._read_dag(serdag)
+        return self._read_dag(serdag, session)
+
+    def _read_lazy_dag(self, serdag: SerializedDagModel) -> SerializedDAG:
+        """Read a SerializedDAG deserializing its tasks on first access, without caching it."""
+        serdag.load_op_links = self.load_op_links
+        return serdag.lazy_dag
+
+    def get_dag(
+        self, version_id: UUID | str, session: Session, *, lazy: bool = False
+    ) -> SerializedDAG | None:
+        """
+        Get a dag by its version id, using cache if enabled.
 
-    def get_dag(self, version_id: UUID | str, session: Session) -> SerializedDAG | None:
-        """Get a dag by its version id, using cache if enabled."""
-        return self._get_dag(version_id=version_id, session=session)
+        :param lazy: On a cache miss, return a dag that only deserializes its tasks
+            when they are first looked up, and do not cache it. Only use this to look
+            up a few tasks by id, see ``DagSerialization.deserialize_dag``.
+        """
+        return self._get_dag(version_id=version_id, session=session, lazy=lazy)
 
     def get_serialized_dag_model(self, version_id: UUID | str, session: Session) -> SerializedDagModel | None:
         """
@@ -148,8 +326,9 @@ class DBDagBag:
         :return: Number of entries cleared from the DAG cache.
         """
         with self._lock:
-            count = len(self._dags)
+            count = len(self._dags) + len(self._pinned_dags)
             self._dags.clear()
+            self._pinned_dags.clear()
 
         if self._use_cache:
             stats.incr("api_server.dag_bag.cache_clear")
@@ -157,16 +336,41 @@ class DBDagBag:
         return count
 
     @staticmethod
-    def _version_from_dag_run(dag_run: DagRun, *, session: Session) -> UUID | None:
+    def _version_from_dag_run(
+        dag_run: DagRun,
+        *,
+        session: Session,
+        latest_dag_versions: Mapping[str, DagVersion] | None = None,
+    ) -> UUID | None:
         if not dag_run.bundle_version:
-            if dag_version := DagVersion.get_latest_version(dag_id=dag_run.dag_id, session=session):
+            if latest_dag_versions is not None:
+                dag_version = latest_dag_versions.get(dag_run.dag_id)
+            else:
+                dag_version = DagVersion.get_latest_version(dag_id=dag_run.dag_id, session=session)
+            if dag_version:
                 return dag_version.id
 
         return dag_run.created_dag_version_id
 
-    def get_dag_for_run(self, dag_run: DagRun, session: Session) -> SerializedDAG | None:
-        if version_id := self._version_from_dag_run(dag_run=dag_run, session=session):
-            return self._get_dag(version_id=version_id, session=session)
+    def get_dag_for_run(
+        self,
+        dag_run: DagRun,
+        session: Session,
+        *,
+        lazy: bool = False,
+        latest_dag_versions: Mapping[str, DagVersion] | None = None,
+    ) -> SerializedDAG | None:
+        """
+        Get the dag of a dag run, in the version the dag run runs.
+
+        :param lazy: See :meth:`get_dag`.
+        :param latest_dag_versions: The latest version of dags, by dag id, if they were already
+            looked up. The latest version of the dag is queried otherwise, when it is needed.
+        """
+        if version_id := self._version_from_dag_run(
+            dag_run=dag_run, session=session, latest_dag_versions=latest_dag_versions
+        ):
+            return self._get_dag(version_id=version_id, session=session, lazy=lazy)
         return None
 
     def iter_all_latest_version_dags(self, *, session: Session) -> Generator[SerializedDAG, None, None]:
@@ -183,13 +387,24 @@ class DBDagBag:
             if dag := sdm.dag:
                 yield dag
 
-    def get_latest_version_of_dag(self, dag_id: str, *, session: Session) -> SerializedDAG | None:
-        """Get the latest version of a dag by its id."""
+    def get_latest_version_of_dag(
+        self, dag_id: str, *, session: Session, lazy: bool = False
+    ) -> SerializedDAG | None:
+        """
+        Get the latest version of a dag by its id.
+
+        :param lazy: Unless the dag is cached, return a dag that only deserializes its
+            tasks when they are first looked up, and do not cache it.
+        """
         from airflow.models.serialized_dag import SerializedDagModel
 
         if not (serdag := SerializedDagModel.get(dag_id, session=session)):
             return None
-        return self._read_dag(serdag)
+        if lazy:
+            with self._lock:
+                dag = self._cached_dag(serdag.dag_version_id)
+            return dag or self._read_lazy_dag(serdag)
+        return self._read_dag(serdag, session)
 
 
 def generate_md5_hash(context):
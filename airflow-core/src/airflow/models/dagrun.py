@@ -22,7 +22,7 @@ import logging
 import os
 import re
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast, overload
 from uuid import UUID
@@ -49,6 +49,7 @@ from sqlalchemy import (
     not_,
     or_,
     text,
+    tuple_,
     update,
 )
 from sqlalchemy.dialects import postgresql
@@ -104,6 +105,7 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
     from sqlalchemy.sql.elements import Case, ColumnElement
 
+    from airflow._shared.logging.types import Logger
     from airflow.api_fastapi.execution_api.datamodels.taskinstance import DagRun as DRDataModel
     from airflow.models.dag_version import DagVersion
     from airflow.models.taskinstancekey import TaskInstanceKey
@@ -615,7 +617,9 @@ class DagRun(Base, LoggingMixin):
 
     @classmethod
     @retry_db_transaction
-    def get_running_dag_runs_to_examine(cls, session: Session) -> ScalarResult[DagRun]:
+    def get_running_dag_runs_to_examine(
+        cls, session: Session, dag_ids: Collection[str] | None = None
+    ) -> ScalarResult[DagRun]:
         """
         Return the next DagRuns that the scheduler should attempt to schedule.
 
@@ -623,6 +627,7 @@ class DagRun(Base, LoggingMixin):
         query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
         the transaction is committed it will be unlocked.
 
+        :param dag_ids: if given, only consider DagRuns of these Dags
         :meta private:
         """
         from airflow.models.backfill import BackfillDagRun
@@ -647,13 +652,17 @@ class DagRun(Base, LoggingMixin):
         )
 
         query = query.where(DagRun.run_after <= func.now())
+        if dag_ids is not None:
+            query = query.where(cls.dag_id.in_(dag_ids))
 
         result = session.scalars(with_row_locks(query, of=cls, session=session, skip_locked=True)).unique()
         return result
 
     @classmethod
     @retry_db_transaction
-    def get_queued_dag_runs_to_set_running(cls, session: Session) -> ScalarResult[DagRun]:
+    def get_queued_dag_runs_to_set_running(
+        cls, session: Session, dag_ids: Collection[str] | None = None
+    ) -> ScalarResult[DagRun]:
         """
         Return the next queued DagRuns that the scheduler should attempt to schedule.
 
@@ -661,6 +670,7 @@ class DagRun(Base, LoggingMixin):
         query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
         the transaction is committed it will be unlocked.
 
+        :param dag_ids: if given, only consider DagRuns of these Dags
         :meta private:
         """
         from airflow.models.backfill import Backfill, BackfillDagRun
@@ -733,6 +743,8 @@ class DagRun(Base, LoggingMixin):
         )
 
         query = query.where(DagRun.run_after <= func.now())
+        if dag_ids is not None:
+            query = query.where(cls.dag_id.in_(dag_ids))
 
         return session.scalars(with_row_locks(query, of=cls, session=session, skip_locked=True))
 
@@ -860,6 +872,37 @@ class DagRun(Base, LoggingMixin):
             tis = tis.where(TI.task_id.in_(task_ids))
         return list(session.scalars(tis).all())
 
+    @staticmethod
+    def fetch_task_instances_for_dag_runs(
+        dag_runs: Iterable[DagRun], session: Session
+    ) -> dict[tuple[str, str], list[TI]]:
+        """
+        Return the task instances of several dag runs, fetched with a single query.
+
+        Each dag run's list matches what :meth:`get_task_instances` would return for it without a
+        state filter, so it can be handed to :meth:`update_state` instead of querying run by run.
+
+        :return: Mapping of ``(dag_id, run_id)`` to the task instances of that dag run
+        """
+        task_ids_by_run: dict[tuple[str, str], list[str] | None] = {
+            (dag_run.dag_id, dag_run.run_id): DagRun._get_partial_task_ids(dag_run.dag)
+            for dag_run in dag_runs
+        }
+        tis_by_run: dict[tuple[str, str], list[TI]] = {key: [] for key in task_ids_by_run}
+        if not tis_by_run:
+            return tis_by_run
+        query = (
+            select(TI)
+            .options(joinedload(TI.dag_run))
+            .where(tuple_(TI.dag_id, TI.run_id).in_(list(tis_by_run)))
+            .order_by(TI.dag_id, TI.run_id, TI.task_id, TI.map_index)
+        )
+        for ti in session.scalars(query):
+            task_ids = task_ids_by_run[(ti.dag_id, ti.run_id)]
+            if task_ids is None or ti.task_id in task_ids:
+                tis_by_run[(ti.dag_id, ti.run_id)].append(ti)
+        return tis_by_run
+
     def _check_last_n_dagruns_failed(self, dag_id, max_consecutive_failed_dag_runs, session):
         """Check if last N dags failed."""
         dag_runs = session.scalars(
@@ -1086,7 +1129,10 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def update_state(
-        self, session: Session = NEW_SESSION, execute_callbacks: bool = True
+        self,
+        session: Session = NEW_SESSION,
+        execute_callbacks: bool = True,
+        tis: list[TI] | None = None,
     ) -> tuple[list[TI], DagCallbackRequest | None]:
         """
         Determine the overall state of the DagRun based on the state of its TaskInstances.
@@ -1094,6 +1140,8 @@ class DagRun(Base, LoggingMixin):
         :param session: Sqlalchemy ORM Session
         :param execute_callbacks: Should dag callbacks (success/failure, SLA etc.) be invoked
             directly (default: true) or recorded as a pending request in the ``returned_callback`` property
+        :param tis: All task instances of this dag run, if already fetched (see
+            :meth:`fetch_task_instances_for_dag_runs`). They are queried when not given.
         :return: Tuple containing tis that can be scheduled in the current loop & `returned_callback` that
             needs to be executed
         """
@@ -1131,7 +1179,7 @@ class DagRun(Base, LoggingMixin):
             tags=self.stats_tags,
         ):
             dag = self.get_dag()
-            info = self.task_instance_scheduling_decisions(session)
+            info = self.task_instance_scheduling_decisions(session, tis=tis)
 
             tis = info.tis
             schedulable_tis = info.schedulable_tis
@@ -1278,8 +1326,11 @@ class DagRun(Base, LoggingMixin):
         return schedulable_tis, callback
 
     @provide_session
-    def task_instance_scheduling_decisions(self, session: Session = NEW_SESSION) -> TISchedulingDecision:
-        tis = self.get_task_instances(session=session, state=State.task_states)
+    def task_instance_scheduling_decisions(
+        self, session: Session = NEW_SESSION, tis: list[TI] | None = None
+    ) -> TISchedulingDecision:
+        if tis is None:
+            tis = self.get_task_instances(session=session, state=State.task_states)
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
         def _filter_tis_and_exclude_removed(dag: SerializedDAG, tis: list[TI]) -> Iterable[TI]:
@@ -1503,6 +1554,8 @@ class DagRun(Base, LoggingMixin):
                 if new_tis is not None:
                     additional_tis.extend(new_tis)
                     expansion_happened = True
+                    # Expansion creates tis the cached upstream counts do not know about.
+                    dep_context.upstream_state_matrix = None
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
@@ -1513,6 +1566,9 @@ class DagRun(Base, LoggingMixin):
                         )
                     )
                     revised_map_index_task_ids.add(schedulable.task.task_id)
+                    if schedulable.task.get_needs_expansion():
+                        # Revising may have created tis or marked some as removed.
+                        dep_context.upstream_state_matrix = None
 
                 # _revise_map_indexes_if_mapped might mark the current task as REMOVED
                 # after calculating mapped task length, so we need to re-check
@@ -1639,17 +1695,6 @@ class DagRun(Base, LoggingMixin):
             dag, task_instance_mutation_hook, session=session
         )
 
-        def task_filter(task: Operator) -> bool:
-            return task.task_id not in task_ids and (
-                self.run_type == DagRunType.BACKFILL_JOB
-                or (
-                    task.start_date is None
-                    or self.logical_date is None
-                    or task.start_date <= self.logical_date
-                )
-                and (task.end_date is None or self.logical_date is None or self.logical_date <= task.end_date)
-            )
-
         created_counts: dict[str, int] = defaultdict(int)
         task_creator = self._get_task_creator(
             created_counts, task_instance_mutation_hook, hook_is_noop, dag_version_id
@@ -1657,12 +1702,67 @@ class DagRun(Base, LoggingMixin):
 
         # Create the missing tasks, including mapped tasks
         tis_to_create = self._create_tasks(
-            (task for task in dag.task_dict.values() if task_filter(task)),
+            self._missing_tasks(dag, task_ids),
             task_creator,
             session=session,
         )
         self._create_task_instances(self.dag_id, tis_to_create, created_counts, hook_is_noop, session=session)
 
+    @classmethod
+    def create_new_task_instances(cls, dag_runs: Iterable[DagRun], *, session: Session) -> None:
+        """
+        Create the task instances of newly created Dag runs with a single bulk insert.
+
+        This is what :meth:`verify_integrity` does for every run, without looking for
+        existing task instances first, so it must only be used for runs that were just
+        flushed. The Dag and the created Dag version of every run must be set.
+
+        :param dag_runs: the new Dag runs
+        :param session: Sqlalchemy ORM Session
+        """
+        from airflow.settings import task_instance_mutation_hook
+
+        hook_is_noop: Literal[True, False] = getattr(task_instance_mutation_hook, "is_noop", False)
+
+        tis_to_create: list[dict[str, Any] | TI] = []
+        created_counts_by_run: list[tuple[DagRun, dict[str, int]]] = []
+        for dag_run in dag_runs:
+            created_counts: dict[str, int] = defaultdict(int)
+            task_creator = dag_run._get_task_creator(
+                created_counts, task_instance_mutation_hook, hook_is_noop, dag_run.created_dag_version_id
+            )
+            tis_to_create.extend(
+                dag_run._create_tasks(
+                    dag_run._missing_tasks(dag_run.get_dag(), set()), task_creator, session=session
+                )
+            )
+            created_counts_by_run.append((dag_run, created_counts))
+
+        if hook_is_noop:
+            session.bulk_insert_mappings(TI.__mapper__, tis_to_create)
+        else:
+            session.bulk_save_objects(tis_to_create)
+        for dag_run, created_counts in created_counts_by_run:
+            for task_type, count in created_counts.items():
+                stats.incr(
+                    "task_instance_created",
+                    count,
+                    tags={**dag_run.stats_tags, "task_type": task_type},
+                )
+        session.flush()
+
+    def _missing_tasks(self, dag: SerializedDAG, task_ids: set[str]) -> Iterator[Operator]:
+        """Return the tasks of the Dag that should have a task instance in this run but do not."""
+        for task in dag.task_dict.values():
+            if task.task_id in task_ids:
+                continue
+            if self.run_type == DagRunType.BACKFILL_JOB or self.logical_date is None:
+                yield task
+            elif (task.start_date is None or task.start_date <= self.logical_date) and (
+                task.end_date is None or self.logical_date <= task.end_date
+            ):
+                yield task
+
     def _check_for_removed_or_restored_tasks(
         self, dag: SerializedDAG, ti_mutation_hook, *, session: Session
     ) -> set[str]:
@@ -1984,13 +2084,54 @@ class DagRun(Base, LoggingMixin):
         All the TIs should belong to this DagRun, but this code is in the hot-path, this is not checked -- it
         is the caller's responsibility to call this function only with TIs from a single dag run.
         """
+        return DagRun._schedule_tis(
+            schedulable_tis,
+            session=session,
+            max_tis_per_query=max_tis_per_query,
+            scheduled_by_job_id=self.scheduled_by_job_id,
+            log=self.log,
+        )
+
+    @classmethod
+    def bulk_schedule_tis(
+        cls,
+        schedulable_tis: Iterable[TI],
+        *,
+        session: Session,
+        max_tis_per_query: int | None = None,
+        scheduled_by_job_id: int | None = None,
+    ) -> int:
+        """
+        Set the given task instances, which may belong to many dag runs, in to the scheduled state.
+
+        This behaves like :meth:`schedule_tis`, but lets the scheduler issue one UPDATE per target
+        state (chunked by ``max_tis_per_query``) for all the dag runs examined in a scheduling loop,
+        instead of one set of UPDATEs per dag run.
+        """
+        return cls._schedule_tis(
+            schedulable_tis,
+            session=session,
+            max_tis_per_query=max_tis_per_query,
+            scheduled_by_job_id=scheduled_by_job_id,
+            log=cls.logger(),
+        )
+
+    @staticmethod
+    def _schedule_tis(
+        schedulable_tis: Iterable[TI],
+        *,
+        session: Session,
+        max_tis_per_query: int | None,
+        scheduled_by_job_id: int | None,
+        log: Logger,
+    ) -> int:
         # Get list of TI IDs that do not need to executed, these are
         # tasks using EmptyOperator and without on_execute_callback / on_success_callback
         empty_ti_ids: list[UUID] = []
         schedulable_ti_ids: list[UUID] = []
         reschedule_ti_ids: set[UUID] = set()
-        debug_try_number_check = self.log.isEnabledFor(logging.DEBUG)
-        expected_try_number_by_ti_id: dict[UUID, tuple[int, int, str | None]] = {}
+        debug_try_number_check = log.isEnabledFor(logging.DEBUG)
+        expected_try_number_by_ti_id: dict[UUID, tuple[int, int, str | None, str, str]] = {}
         for ti in schedulable_tis:
             if not ti.is_schedulable:
                 empty_ti_ids.append(ti.id)
@@ -2010,6 +2151,8 @@ class DagRun(Base, LoggingMixin):
                         else ti.try_number + 1,
                         ti.try_number,
                         ti.state,
+                        ti.dag_id,
+                        ti.run_id,
                     )
 
         count = 0
@@ -2062,18 +2205,20 @@ class DagRun(Base, LoggingMixin):
                         db_row = rows_by_ti_id.get(ti_id)
                         if db_row is None:
                             continue
-                        expected_try_number, pre_update_try_number, pre_update_state = expected
+                        expected_try_number, pre_update_try_number, pre_update_state, dag_id, run_id = (
+                            expected
+                        )
                         db_try_number, db_state = db_row
                         if db_try_number != expected_try_number:
-                            self.log.warning(
+                            log.warning(
                                 "schedule_tis: try_number mismatch after scheduling for ti_id=%s "
                                 "dag_run=%s/%s scheduler_job_id=%s "
                                 "pre_state=%s pre_try_number=%d expected_try_number=%d "
                                 "db_state=%s db_try_number=%d",
                                 ti_id,
-                                self.dag_id,
-                                self.run_id,
-                                self.scheduled_by_job_id,
+                                dag_id,
+                                run_id,
+                                scheduled_by_job_id,
                                 pre_update_state,
                                 pre_update_try_number,
                                 expected_try_number,
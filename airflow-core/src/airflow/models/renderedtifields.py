@@ -184,10 +184,10 @@ class RenderedTaskInstanceFields(TaskInstanceDependencies):
         from airflow._shared.secrets_masker import redact
 
         if self.k8s_pod_yaml:
-            self.k8s_pod_yaml = redact(self.k8s_pod_yaml)
+            self.k8s_pod_yaml = redact(self.k8s_pod_yaml, copy_on_write=True)
 
         for field, rendered in self.rendered_fields.items():
-            self.rendered_fields[field] = redact(rendered, field)
+            self.rendered_fields[field] = redact(rendered, field, copy_on_write=True)
 
     @classmethod
     @provide_session
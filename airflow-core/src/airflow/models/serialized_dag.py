@@ -26,6 +26,7 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 from uuid import UUID
 
+import msgspec
 import uuid6
 from sqlalchemy import JSON, ForeignKey, LargeBinary, String, Uuid, exists, select, tuple_, update
 from sqlalchemy.dialects.postgresql import JSONB
@@ -34,6 +35,7 @@ from sqlalchemy.sql.expression import func, literal
 
 from airflow._shared.timezones import timezone
 from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
 from airflow.models.asset import (
     AssetAliasModel,
     AssetModel,
@@ -57,7 +59,6 @@ from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
-    from sqlalchemy.orm.attributes import InstrumentedAttribute
     from sqlalchemy.sql.elements import ColumnElement
 
     from airflow.serialization.definitions.dag import SerializedDAG
@@ -68,6 +69,48 @@ log = logging.getLogger(__name__)
 
 # If set to True, serialized DAGs is compressed before writing to DB,
 _COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
+# Either "json" or "msgpack", the encoding used for newly written serialized DAGs.
+_SERIALIZED_DAG_STORAGE_FORMAT = conf.get("core", "serialized_dag_storage_format", fallback="json")
+_SERIALIZED_DAG_STORAGE_FORMATS = ("json", "msgpack")
+
+# Serialized DAGs stored in a binary encoding go to the ``data_compressed`` column like
+# compressed JSON, prefixed with a header telling them apart: the magic bytes, the
+# version of the encoding, and the codec of the payload. A zlib stream never starts
+# with a NUL byte, so rows written before the binary encoding existed are unambiguous.
+_BINARY_DATA_MAGIC = b"\x00ADG"
+_BINARY_DATA_VERSION = 1
+_BINARY_DATA_HEADER_LEN = len(_BINARY_DATA_MAGIC) + 2
+_BINARY_CODEC_NONE = 0
+_BINARY_CODEC_ZLIB = 1
+
+_msgpack_encoder = msgspec.msgpack.Encoder(order="sorted")
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def _encode_binary_data(data: dict, *, compress: bool) -> bytes:
+    """Encode serialized DAG data as msgpack, prefixed with the binary data header."""
+    # Keys are turned into strings so the data decodes exactly as it would from JSON.
+    payload = _msgpack_encoder.encode(msgspec.to_builtins(data, str_keys=True))
+    if compress:
+        codec, payload = _BINARY_CODEC_ZLIB, zlib.compress(payload)
+    else:
+        codec = _BINARY_CODEC_NONE
+    return _BINARY_DATA_MAGIC + bytes((_BINARY_DATA_VERSION, codec)) + payload
+
+
+def _decode_stored_data(stored: bytes) -> Any:
+    """Decode the ``data_compressed`` column, either binary encoded or zlib compressed JSON."""
+    if not stored.startswith(_BINARY_DATA_MAGIC):
+        return json.loads(zlib.decompress(stored))
+    version, codec = stored[len(_BINARY_DATA_MAGIC) : _BINARY_DATA_HEADER_LEN]
+    if version != _BINARY_DATA_VERSION:
+        raise ValueError(f"Unsupported serialized DAG binary encoding version {version}")
+    payload = memoryview(stored)[_BINARY_DATA_HEADER_LEN:]
+    if codec == _BINARY_CODEC_ZLIB:
+        return _msgpack_decoder.decode(zlib.decompress(payload))
+    if codec == _BINARY_CODEC_NONE:
+        return _msgpack_decoder.decode(payload)
+    raise ValueError(f"Unsupported serialized DAG binary encoding codec {codec}")
 
 
 class DagWriteMetadata(NamedTuple):
@@ -348,10 +391,17 @@ class SerializedDagModel(Base):
         dag_data = dag.data
         self.dag_hash = SerializedDagModel.hash(dag_data)
 
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
-
-        if _COMPRESS_SERIALIZED_DAGS:
+        if _SERIALIZED_DAG_STORAGE_FORMAT not in _SERIALIZED_DAG_STORAGE_FORMATS:
+            raise AirflowConfigException(
+                f"Invalid value {_SERIALIZED_DAG_STORAGE_FORMAT!r} for [core] serialized_dag_storage_format, "
+                f"expected one of: {', '.join(_SERIALIZED_DAG_STORAGE_FORMATS)}"
+            )
+        if _SERIALIZED_DAG_STORAGE_FORMAT == "msgpack":
+            self._data = None
+            self._data_compressed = _encode_binary_data(dag_data, compress=_COMPRESS_SERIALIZED_DAGS)
+        elif _COMPRESS_SERIALIZED_DAGS:
+            # partially ordered json data
+            dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
             self._data = None
             self._data_compressed = zlib.compress(dag_data_json)
         else:
@@ -378,6 +428,36 @@ class SerializedDagModel(Base):
         data_json = json.dumps(data_, sort_keys=True).encode("utf-8")
         return md5(data_json).hexdigest()
 
+    @classmethod
+    def reencode_binary_data_as_json(cls, session: Session) -> int:
+        """
+        Re-encode the serialized DAGs stored in the binary encoding as compressed JSON.
+
+        Airflow versions without the binary encoding read ``data_compressed`` as zlib
+        compressed JSON, so this has to run before the DB is downgraded to them.
+
+        :param session: ORM Session
+        :return: number of serialized DAGs re-encoded
+        """
+        rows = session.execute(
+            select(cls.id, cls._data_compressed)
+            .where(cls._data_compressed.is_not(None))
+            .execution_options(yield_per=100)
+        )
+        reencoded = [
+            {
+                "id": id_,
+                "data": zlib.compress(
+                    json.dumps(_decode_stored_data(stored), sort_keys=True).encode("utf-8")
+                ),
+            }
+            for id_, stored in rows
+            if stored.startswith(_BINARY_DATA_MAGIC)
+        ]
+        for row in reencoded:
+            session.execute(update(cls).where(cls.id == row["id"]).values(_data_compressed=row["data"]))
+        return len(reencoded)
+
     @classmethod
     def _sort_serialized_dag_dict(cls, serialized_dag: Any):
         """Recursively sort json_dict and its nested dictionaries and lists."""
@@ -842,7 +922,7 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = _decode_stored_data(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
@@ -851,6 +931,19 @@ class SerializedDagModel(Base):
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
+        return self._deserialize_dag(lazy=False)
+
+    @property
+    def lazy_dag(self) -> SerializedDAG:
+        """
+        The DAG deserialized from the ``data`` column, deserializing tasks on first access.
+
+        Only use this when looking up a few tasks by id; getting all the DAG's tasks
+        deserializes them all at once.
+        """
+        return self._deserialize_dag(lazy=True)
+
+    def _deserialize_dag(self, *, lazy: bool) -> SerializedDAG:
         DagSerialization._load_operator_extra_links = self.load_op_links
         if isinstance(self.data, dict):
             data = self.data
@@ -858,7 +951,7 @@ class SerializedDagModel(Base):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return DagSerialization.from_dict(data)
+        return DagSerialization.from_dict(data, lazy=lazy)
 
     @classmethod
     @provide_session
@@ -898,34 +991,35 @@ class SerializedDagModel(Base):
 
         :param session: ORM Session
         """
+        # Rows are stored in whichever encoding they were written with, so the dependencies are
+        # extracted from the JSON column by the DB and decoded in Python from the other one.
         load_json: Callable
-        data_col_to_select: ColumnElement[Any] | InstrumentedAttribute[bytes | None]
-        if _COMPRESS_SERIALIZED_DAGS is False:
-            dialect = get_dialect_name(session)
-            if dialect in ["sqlite", "mysql"]:
-                data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
-
-                def load_json(deps_data):
-                    return json.loads(deps_data) if deps_data else []
-            elif dialect == "postgresql":
-                # Use #> operator which works for both JSON and JSONB types
-                # Returns the JSON sub-object at the specified path
-                data_col_to_select = cls._data.op("#>")(literal('{"dag","dag_dependencies"}'))
-                load_json = lambda x: x
-            else:
-                data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
-                load_json = lambda x: x
-        else:
-            data_col_to_select = cls._data_compressed
+        data_col_to_select: ColumnElement[Any]
+        dialect = get_dialect_name(session)
+        if dialect in ["sqlite", "mysql"]:
+            data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
 
             def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+                return json.loads(deps_data) if deps_data else []
+        elif dialect == "postgresql":
+            # Use #> operator which works for both JSON and JSONB types
+            # Returns the JSON sub-object at the specified path
+            data_col_to_select = cls._data.op("#>")(literal('{"dag","dag_dependencies"}'))
+            load_json = lambda x: x
+        else:
+            data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
+            load_json = lambda x: x
+
+        def load_deps(deps_data, compressed_data):
+            if compressed_data:
+                return _decode_stored_data(compressed_data)["dag"]["dag_dependencies"]
+            return load_json(deps_data)
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
         )
         query = session.execute(
-            select(cls.dag_id, data_col_to_select)
+            select(cls.dag_id, data_col_to_select, cls._data_compressed)
             .join(
                 latest_sdag_subquery,
                 (cls.dag_id == latest_sdag_subquery.c.dag_id)
@@ -934,7 +1028,10 @@ class SerializedDagModel(Base):
             .join(cls.dag_model)
             .where(~DagModel.is_stale)
         )
-        dag_depdendencies = [(str(dag_id), load_json(deps_data)) for dag_id, deps_data in query]
+        dag_depdendencies = [
+            (str(dag_id), load_deps(deps_data, compressed_data))
+            for dag_id, deps_data, compressed_data in query
+        ]
         resolver = _DagDependenciesResolver(dag_id_dependencies=dag_depdendencies, session=session)
         dag_depdendencies_by_dag = resolver.resolve()
         return dag_depdendencies_by_dag
@@ -37,6 +37,7 @@ from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
 from airflow.serialization.enums import stringify_encoding_keys as _stringify_encoding_keys
 from airflow.triggers.base import BaseTaskEndEvent
+from airflow.utils.consistent_hash import ConsistentHashRing
 from airflow.utils.retries import run_with_db_retries
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name, with_row_locks
@@ -115,6 +116,8 @@ class Trigger(Base):
     callback = relationship("Callback", back_populates="trigger", uselist=False)
 
     max_trigger_to_select_per_loop = conf.getint("triggerer", "max_trigger_to_select_per_loop", fallback=50)
+    partition_triggers = conf.getboolean("triggerer", "partition_triggers", fallback=False)
+    queues_enabled = conf.getboolean("triggerer", "queues_enabled", fallback=False)
 
     def __init__(
         self,
@@ -356,8 +359,15 @@ class Trigger(Base):
         Takes a triggerer_id, the capacity for that triggerer, the Triggerer job heartrate
         health check threshold, and the queues and assigns unassigned triggers until that
         capacity is reached, or there are no more unassigned triggers.
+
+        With ``[triggerer] partition_triggers`` enabled, triggers are assigned by
+        :meth:`assign_partitioned` instead, unless ``[triggerer] queues_enabled`` is set:
+        the queues other triggerers serve are not known, so a trigger could be owned by a
+        triggerer that never runs it.
         """
-        from airflow.jobs.job import Job  # To avoid circular import
+        if cls.partition_triggers and not cls.queues_enabled:
+            cls.assign_partitioned(triggerer_id, capacity, health_check_threshold, session=session)
+            return
 
         count = session.scalar(select(func.count(cls.id)).filter(cls.triggerer_id == triggerer_id))
         capacity -= count
@@ -370,11 +380,7 @@ class Trigger(Base):
             )
             return
 
-        alive_triggerer_ids = select(Job.id).where(
-            Job.end_date.is_(None),
-            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-            Job.job_type == "TriggererJob",
-        )
+        alive_triggerer_ids = cls._alive_triggerer_ids_query(health_check_threshold)
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -395,24 +401,120 @@ class Trigger(Base):
         session.commit()
 
     @classmethod
-    def get_sorted_triggers(
+    @provide_session
+    def assign_partitioned(
         cls,
+        triggerer_id: int,
         capacity: int,
-        alive_triggerer_ids: list[int] | Select,
-        queues: set[str] | None,
-        session: Session,
-    ):
+        health_check_threshold: float,
+        session: Session = NEW_SESSION,
+    ) -> None:
         """
-        Get sorted triggers based on capacity and alive triggerer ids.
-
-        :param capacity: The capacity of the triggerer.
-        :param alive_triggerer_ids: The alive triggerer ids as a list or a select query.
-        :param queues: The optional set of trigger queues to filter triggers by.
-        :param session: The database session.
+        Assign triggers to the alive triggerers by consistent hashing of the trigger ids.
+
+        Every trigger is owned by one alive triggerer, and each triggerer claims the
+        unassigned triggers it owns up to its capacity in a single loop, without the
+        ``[triggerer] max_trigger_to_select_per_loop`` limit. Triggers owned by a triggerer
+        that is at capacity spill over to triggerers with room left, at most
+        ``max_trigger_to_select_per_loop`` per loop like in the default mode. A triggerer
+        also hands back, at most ``max_trigger_to_select_per_loop`` per loop, the triggers
+        it runs that are owned by another triggerer with room left, so triggers move over
+        to a triggerer that joins or recovers.
+
+        The capacity of the other triggerers is not stored, so they are assumed to have
+        the same capacity as this one. Trigger queues are not supported, only the triggers
+        without a queue are assigned.
         """
-        from airflow.models.callback import Callback  # to avoid circular import: Callback -> Trigger
+        alive_triggerer_ids = set(session.scalars(cls._alive_triggerer_ids_query(health_check_threshold)))
+        alive_triggerer_ids.add(triggerer_id)
+        ring = ConsistentHashRing(alive_triggerer_ids)
+        loads: dict[int, int] = dict(
+            session.execute(
+                select(cls.triggerer_id, func.count(cls.id))
+                .where(cls.triggerer_id.in_(alive_triggerer_ids))
+                .group_by(cls.triggerer_id)
+            ).all()
+        )
+        room = {tid: capacity - loads.get(tid, 0) for tid in alive_triggerer_ids}
+
+        handed_back = []
+        for trigger_id in cls.ids_for_triggerer(triggerer_id, session=session):
+            owner = ring.get_node(str(trigger_id))
+            if owner != triggerer_id and room[owner] > 0:
+                handed_back.append(trigger_id)
+                room[owner] -= 1
+                if len(handed_back) >= cls.max_trigger_to_select_per_loop:
+                    break
+        if handed_back:
+            log.info("Triggerer %s is handing back %d triggers", triggerer_id, len(handed_back))
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(handed_back), cls.triggerer_id == triggerer_id)
+                .values(triggerer_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            room[triggerer_id] += len(handed_back)
 
-        result: list[Row[Any]] = []
+        if room[triggerer_id] <= 0:
+            log.info(
+                "Triggerer %s has reached the maximum capacity triggers assigned (%d). Not assigning any more triggers",
+                triggerer_id,
+                capacity - room[triggerer_id],
+            )
+            session.commit()
+            return
+
+        claimed: list[int] = []
+        spilled = 0
+        # The triggers handed back count against the room of their owner, don't take them back.
+        not_claimable = set(handed_back)
+        for query in cls._unassigned_trigger_queries(list(alive_triggerer_ids), queues=None):
+            if len(claimed) >= room[triggerer_id]:
+                break
+            # Only about one in ``len(ring)`` candidates is owned by this triggerer.
+            limit = (room[triggerer_id] - len(claimed)) * len(ring)
+            locked_query = with_row_locks(query.limit(limit), session, of=cls, skip_locked=True)
+            for trigger_id in session.scalars(locked_query):
+                if trigger_id in not_claimable:
+                    continue
+                owner = ring.get_node(str(trigger_id))
+                if owner == triggerer_id:
+                    claimed.append(trigger_id)
+                elif room[owner] <= 0 and spilled < cls.max_trigger_to_select_per_loop:
+                    claimed.append(trigger_id)
+                    spilled += 1
+                if len(claimed) >= room[triggerer_id]:
+                    break
+
+        if claimed:
+            # Skip the triggers another triggerer claimed since they were selected.
+            session.execute(
+                update(cls)
+                .where(
+                    cls.id.in_(claimed),
+                    or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)),
+                )
+                .values(triggerer_id=triggerer_id)
+                .execution_options(synchronize_session=False)
+            )
+        session.commit()
+
+    @classmethod
+    def _alive_triggerer_ids_query(cls, health_check_threshold: float) -> Select:
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        return select(Job.id).where(
+            Job.end_date.is_(None),
+            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+            Job.job_type == "TriggererJob",
+        )
+
+    @classmethod
+    def _unassigned_trigger_queries(
+        cls, alive_triggerer_ids: list[int] | Select, queues: set[str] | None
+    ) -> list[Select]:
+        """Return the queries selecting the ids of unassigned triggers, in the order to assign them."""
+        from airflow.models.callback import Callback  # to avoid circular import: Callback -> Trigger
 
         # Add triggers associated to callbacks first, then tasks, then assets
         # It prioritizes callbacks, then DAGs over event driven scheduling which is fair
@@ -436,8 +538,33 @@ class Trigger(Base):
             .order_by(cls.created_date),
         ]
 
+        # Filter by queues if the triggerer explicitly was called with `--queues`, otherwise, filter out
+        # Triggers which have an explicit `queue` value since there may be other triggerer hosts explicitly
+        # assigned to that queue.
+        if queues:
+            return [query.filter(cls.queue.in_(queues)) for query in queries]
+        return [query.filter(cls.queue.is_(None)) for query in queries]
+
+    @classmethod
+    def get_sorted_triggers(
+        cls,
+        capacity: int,
+        alive_triggerer_ids: list[int] | Select,
+        queues: set[str] | None,
+        session: Session,
+    ):
+        """
+        Get sorted triggers based on capacity and alive triggerer ids.
+
+        :param capacity: The capacity of the triggerer.
+        :param alive_triggerer_ids: The alive triggerer ids as a list or a select query.
+        :param queues: The optional set of trigger queues to filter triggers by.
+        :param session: The database session.
+        """
+        result: list[Row[Any]] = []
+
         # Process each query while avoiding unnecessary queries when capacity is reached
-        for query in queries:
+        for filtered_query in cls._unassigned_trigger_queries(alive_triggerer_ids, queues):
             remaining_capacity = capacity - len(result)
             if remaining_capacity <= 0:
                 break
@@ -446,14 +573,6 @@ class Trigger(Base):
             # picking up too many triggers and starving other triggerers for HA setup.
             remaining_capacity = min(remaining_capacity, cls.max_trigger_to_select_per_loop)
 
-            # Filter by queues if the triggerer explicitly was called with `--queues`, otherwise, filter out
-            # Triggers which have an explicit `queue` value since there may be other triggerer hosts explicitly
-            # assigned to that queue.
-            if queues:
-                filtered_query = query.filter(cls.queue.in_(queues))
-            else:
-                filtered_query = query.filter(cls.queue.is_(None))
-
             locked_query = with_row_locks(filtered_query.limit(remaining_capacity), session, skip_locked=True)
             result.extend(session.execute(locked_query).all())
 
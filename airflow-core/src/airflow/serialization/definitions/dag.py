@@ -52,7 +52,7 @@ from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
     import datetime
-    from collections.abc import Collection, Iterable, Sequence
+    from collections.abc import Collection, Iterable, Mapping, Sequence
     from typing import Any, Literal
 
     from pendulum.tz.timezone import FixedTimezone, Timezone
@@ -529,8 +529,6 @@ class SerializedDAG:
 
         :meta private:
         """
-        from airflow.models.dagrun import RUN_ID_REGEX
-
         log.info(
             "creating dag run",
             run_after=run_after,
@@ -539,9 +537,6 @@ class SerializedDAG:
             partition_key=partition_key,
         )
         logical_date = coerce_datetime(logical_date)
-        # For manual runs where logical_date is None, ensure no data_interval is set.
-        if logical_date is None and data_interval is not None:
-            raise ValueError("data_interval must be None when logical_date is None")
 
         if data_interval and not isinstance(data_interval, DataInterval):
             data_interval = DataInterval(*map(coerce_datetime, data_interval))
@@ -553,6 +548,108 @@ class SerializedDAG:
         else:
             raise ValueError(f"run_type should be a DagRunType, not {type(run_type)}")
 
+        self.validate_new_dagrun(
+            run_id=run_id,
+            run_type=run_type,
+            logical_date=logical_date,
+            data_interval=data_interval,
+            conf=conf,
+        )
+        orm_dagrun = _create_orm_dagrun(
+            dag=self,
+            run_id=run_id,
+            logical_date=logical_date,
+            data_interval=data_interval,
+            run_after=coerce_datetime(run_after),
+            start_date=coerce_datetime(start_date),
+            conf=conf,
+            state=state,
+            run_type=run_type,
+            creating_job_id=creating_job_id,
+            backfill_id=backfill_id,
+            triggered_by=triggered_by,
+            triggering_user_name=triggering_user_name,
+            partition_key=partition_key,
+            partition_date=partition_date,
+            note=note,
+            session=session,
+        )
+
+        if self.deadline:
+            self._process_dagrun_deadline_alerts(orm_dagrun, session)
+
+        return orm_dagrun
+
+    def create_dagruns(
+        self,
+        runs: Mapping[str, DagRunInfo],
+        *,
+        conf: dict | None = None,
+        run_type: DagRunType,
+        triggered_by: DagRunTriggeredByType,
+        triggering_user_name: str | None = None,
+        state: DagRunState,
+        start_date: datetime.datetime | None = None,
+        creating_job_id: int | None = None,
+        backfill_id: NonNegativeInt | None = None,
+        session: Session,
+    ) -> list[DagRun]:
+        """
+        Create many runs for this DAG at once.
+
+        Like calling :meth:`create_dagrun` for every run, but the runs and all their task
+        instances are inserted in bulk, which is much faster for long backfills.
+
+        :param runs: the runs to create, as a mapping of run ID to the run's information
+        :param conf: Dict containing configuration/parameters to pass to every run
+        :return: The created DAG runs, in the order of ``runs``.
+
+        :meta private:
+        """
+        for run_id, info in runs.items():
+            self.validate_new_dagrun(
+                run_id=run_id,
+                run_type=run_type,
+                logical_date=info.logical_date,
+                data_interval=info.data_interval,
+                conf=conf,
+            )
+        return bulk_create_dagruns(
+            [(self, run_id, info) for run_id, info in runs.items()],
+            conf=conf,
+            run_type=run_type,
+            triggered_by=triggered_by,
+            triggering_user_name=triggering_user_name,
+            state=state,
+            start_date=start_date,
+            creating_job_id=creating_job_id,
+            backfill_id=backfill_id,
+            session=session,
+        )
+
+    def validate_new_dagrun(
+        self,
+        *,
+        run_id: str,
+        run_type: DagRunType,
+        logical_date: datetime.datetime | None,
+        data_interval: DataInterval | None,
+        conf: dict | None,
+    ) -> None:
+        """
+        Check that a run with these arguments can be created for this DAG.
+
+        :raises ValueError: if the run ID or the data interval are invalid
+        :raises ParamValidationError: if the DAG's params are not valid with ``conf``
+
+        :meta private:
+        """
+        from airflow.models.dagrun import RUN_ID_REGEX
+
+        # For manual runs where logical_date is None, ensure no data_interval is set.
+        if logical_date is None and data_interval is not None:
+            raise ValueError("data_interval must be None when logical_date is None")
+
         if not isinstance(run_id, str):
             raise ValueError(f"`run_id` should be a str, not {type(run_id)}")
 
@@ -580,30 +677,6 @@ class SerializedDAG:
         # todo: AIP-78 add verification that if run type is backfill then we have a backfill id
         copied_params = self.params.deep_merge(conf)
         copied_params.validate()
-        orm_dagrun = _create_orm_dagrun(
-            dag=self,
-            run_id=run_id,
-            logical_date=logical_date,
-            data_interval=data_interval,
-            run_after=coerce_datetime(run_after),
-            start_date=coerce_datetime(start_date),
-            conf=conf,
-            state=state,
-            run_type=run_type,
-            creating_job_id=creating_job_id,
-            backfill_id=backfill_id,
-            triggered_by=triggered_by,
-            triggering_user_name=triggering_user_name,
-            partition_key=partition_key,
-            partition_date=partition_date,
-            note=note,
-            session=session,
-        )
-
-        if self.deadline:
-            self._process_dagrun_deadline_alerts(orm_dagrun, session)
-
-        return orm_dagrun
 
     def _process_dagrun_deadline_alerts(
         self,
@@ -1330,3 +1403,91 @@ def _create_orm_dagrun(
     # state is None at the moment of creation
     run.verify_integrity(session=session, dag_version_id=dag_version.id)
     return run
+
+
+def bulk_create_dagruns(
+    runs: Sequence[tuple[SerializedDAG, str, DagRunInfo]],
+    *,
+    conf: dict | None = None,
+    run_type: DagRunType,
+    triggered_by: DagRunTriggeredByType,
+    triggering_user_name: str | None = None,
+    state: DagRunState,
+    start_date: datetime.datetime | None = None,
+    creating_job_id: int | None = None,
+    backfill_id: NonNegativeInt | None = None,
+    session: Session,
+) -> list[DagRun]:
+    """
+    Create runs of one or more DAGs and all their task instances with bulk inserts.
+
+    The latest DAG versions, bundle versions and log template are looked up once for all
+    runs, the runs are inserted with a single flush, and the task instances of all runs
+    with a single bulk insert. The runs must have been checked with
+    :meth:`SerializedDAG.validate_new_dagrun` first.
+
+    :param runs: the DAG, run ID and run information of every run to create
+    :return: The created DAG runs, in the order of ``runs``.
+    """
+    if not runs:
+        return []
+    dags = {dag.dag_id: dag for dag, _, _ in runs}
+    versioned_dag_ids = [dag_id for dag_id, dag in dags.items() if not dag.disable_bundle_versioning]
+    bundle_versions: dict[str, str | None] = {}
+    if versioned_dag_ids:
+        bundle_versions = dict(
+            session.execute(
+                select(DagModel.dag_id, DagModel.bundle_version).where(DagModel.dag_id.in_(versioned_dag_ids))
+            ).all()
+        )
+    dag_versions = DagVersion.get_latest_versions(dags, session=session)
+    if missing := dags.keys() - dag_versions.keys():
+        raise AirflowException(
+            f"Cannot create DagRun for DAGs {sorted(missing)} because they are not serialized"
+        )
+    max_log_template_id = session.scalar(select(func.max(LogTemplate.__table__.c.id)))
+    log_template_id = int(max_log_template_id) if max_log_template_id is not None else 0
+
+    dag_runs = []
+    for dag, run_id, info in runs:
+        log.info(
+            "creating dag run",
+            dag_id=dag.dag_id,
+            run_after=info.run_after,
+            run_id=run_id,
+            logical_date=info.logical_date,
+            partition_key=info.partition_key,
+        )
+        dag_run = DagRun(
+            dag_id=dag.dag_id,
+            run_id=run_id,
+            logical_date=info.logical_date,
+            start_date=coerce_datetime(start_date),
+            run_after=info.run_after,
+            conf=conf,
+            state=state,
+            run_type=run_type,
+            creating_job_id=creating_job_id,
+            data_interval=info.data_interval,
+            triggered_by=triggered_by,
+            triggering_user_name=triggering_user_name,
+            backfill_id=backfill_id,
+            bundle_version=bundle_versions.get(dag.dag_id),
+            partition_key=info.partition_key,
+            partition_date=info.partition_date,
+        )
+        dag_run.log_template_id = log_template_id
+        dag_run.created_dag_version = dag_versions[dag.dag_id]
+        dag_run.consumed_asset_events = []
+        dag_runs.append(dag_run)
+    session.add_all(dag_runs)
+    session.flush()
+
+    for dag_run, (dag, _, _) in zip(dag_runs, runs):
+        dag_run.dag = dag
+    DagRun.create_new_task_instances(dag_runs, session=session)
+
+    for dag_run, (dag, _, _) in zip(dag_runs, runs):
+        if dag.deadline:
+            dag._process_dagrun_deadline_alerts(dag_run, session)
+    return dag_runs
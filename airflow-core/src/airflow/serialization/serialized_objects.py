@@ -111,6 +111,7 @@ from airflow.utils.code_utils import get_python_source
 from airflow.utils.db import LazySelectSequence
 
 if TYPE_CHECKING:
+    from collections.abc import ItemsView, Iterator, KeysView, ValuesView
     from inspect import Parameter
 
     from kubernetes.client import models as k8s  # noqa: TC004
@@ -1071,6 +1072,8 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         op: SerializedOperator,
         encoded_op: dict[str, Any],
         client_defaults: dict[str, Any] | None = None,
+        *,
+        load_operator_extra_links: bool | None = None,
     ) -> None:
         """
         Populate operator attributes with serialized values.
@@ -1080,6 +1083,8 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         done in ``set_task_dag_references`` instead, which is called after the
         DAG is hydrated.
         """
+        if load_operator_extra_links is None:
+            load_operator_extra_links = cls._load_operator_extra_links
         # Apply defaults by merging them into encoded_op BEFORE main deserialization
         encoded_op = cls._apply_defaults_to_encoded_op(encoded_op, client_defaults)
 
@@ -1089,7 +1094,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         op_extra_links_from_plugin = {}
 
         # We don't want to load Extra Operator links in Scheduler
-        if cls._load_operator_extra_links:
+        if load_operator_extra_links:
             from airflow import plugins_manager
 
             for ope in plugins_manager.get_operator_extra_links():
@@ -1120,7 +1125,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if k in encoded_op.get("template_fields", []):
                 pass  # Template fields are handled separately
             elif k == "_operator_extra_links":
-                if cls._load_operator_extra_links:
+                if load_operator_extra_links:
                     op_predefined_extra_links = cls._deserialize_operator_extra_links(v)
 
                     # If OperatorLinks with the same name exists, Links via Plugin have higher precedence
@@ -1222,6 +1227,14 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         ``populate_operator``. This function further fixes object references
         that were not possible before the task's containing DAG is hydrated.
         """
+        OperatorSerialization._set_task_dag_attributes(task, dag)
+
+        for task_id in task.downstream_task_ids:
+            # Bypass set_upstream etc here - it does more than we want
+            dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
+
+    @staticmethod
+    def _set_task_dag_attributes(task: SerializedOperator | MappedOperator, dag: SerializedDAG) -> None:
         task.dag = dag
 
         for date_attr in ("start_date", "end_date"):
@@ -1233,10 +1246,6 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
-        for task_id in task.downstream_task_ids:
-            # Bypass set_upstream etc here - it does more than we want
-            dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
-
     @classmethod
     def get_operator_const_fields(cls) -> set[str]:
         """Get the set of operator fields that are marked as const in the JSON schema."""
@@ -1274,8 +1283,15 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         cls,
         encoded_op: dict[str, Any],
         client_defaults: dict[str, Any] | None = None,
+        *,
+        load_operator_extra_links: bool | None = None,
     ) -> SerializedOperator:
-        """Deserializes an operator from a JSON object."""
+        """
+        Deserializes an operator from a JSON object.
+
+        :param load_operator_extra_links: Whether to load the extra links of the operator,
+            ``_load_operator_extra_links`` of the class if not given.
+        """
         op: SerializedOperator
         if encoded_op.get("_is_mapped", False):
             from airflow.serialization.definitions.mappedoperator import SerializedMappedOperator
@@ -1314,7 +1330,9 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         else:
             op = SerializedBaseOperator(task_id=encoded_op["task_id"])
 
-        cls.populate_operator(op, encoded_op, client_defaults)
+        cls.populate_operator(
+            op, encoded_op, client_defaults, load_operator_extra_links=load_operator_extra_links
+        )
 
         return op
 
@@ -1669,6 +1687,101 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         return result
 
 
+class _LazyTaskDict(dict):
+    """
+    Task mapping of a lazily deserialized Dag.
+
+    Only the stored JSON of the tasks is kept when the Dag is deserialized, and a task
+    is turned into an operator the first time it is looked up. Membership tests, the
+    task ids and the graph structure in :attr:`downstream_task_ids` and
+    :attr:`upstream_task_ids` don't need any task to be loaded, while getting the values
+    or items of the mapping loads all the tasks first, like :meth:`materialize`.
+    """
+
+    def __init__(
+        self,
+        dag: SerializedDAG,
+        encoded_tasks: Iterable[dict[str, Any]],
+        client_defaults: dict[str, Any] | None,
+        load_operator_extra_links: bool,
+    ) -> None:
+        super().__init__()
+        self._dag = dag
+        self._client_defaults = client_defaults
+        self._load_operator_extra_links = load_operator_extra_links
+        self._encoded_tasks: dict[str, dict[str, Any]] = {}
+        self.downstream_task_ids: dict[str, frozenset[str]] = {}
+        upstream_task_ids: dict[str, set[str]] = {}
+        for encoded in encoded_tasks:
+            task_id = encoded["task_id"]
+            downstream = encoded.get("downstream_task_ids", encoded.get("_downstream_task_ids")) or ()
+            self._encoded_tasks[task_id] = encoded
+            self.downstream_task_ids[task_id] = frozenset(downstream)
+            for downstream_id in downstream:
+                upstream_task_ids.setdefault(downstream_id, set()).add(task_id)
+        self.upstream_task_ids: dict[str, frozenset[str]] = {
+            task_id: frozenset(upstream_task_ids.get(task_id, ())) for task_id in self._encoded_tasks
+        }
+        # Task group and child label of every task not materialized yet, filled in
+        # while deserializing the task group hierarchy.
+        self._pending_groups: dict[str, tuple[SerializedTaskGroup, str]] = {}
+
+    def __missing__(self, task_id: str) -> SerializedOperator:
+        if (encoded := self._encoded_tasks.get(task_id)) is None:
+            raise KeyError(task_id)
+        task = OperatorSerialization.deserialize_operator(
+            encoded, self._client_defaults, load_operator_extra_links=self._load_operator_extra_links
+        )
+        # Store the task before dereferencing its expand input, which may look up other tasks.
+        self[task_id] = task
+        if (pending := self._pending_groups.pop(task_id, None)) is not None:
+            group, label = pending
+            task.task_group = weakref.proxy(group)
+            group.children[label] = task
+        task.upstream_task_ids.update(self.upstream_task_ids[task_id])
+        OperatorSerialization._set_task_dag_attributes(task, self._dag)
+        return task
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._encoded_tasks
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encoded_tasks)
+
+    def __len__(self) -> int:
+        return len(self._encoded_tasks)
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        return self._encoded_tasks.keys()
+
+    def values(self) -> ValuesView[SerializedOperator]:  # type: ignore[override]
+        return self._all_tasks().values()
+
+    def items(self) -> ItemsView[str, SerializedOperator]:  # type: ignore[override]
+        return self._all_tasks().items()
+
+    def _all_tasks(self) -> dict[str, SerializedOperator]:
+        self.materialize()
+        # In the order of the serialized Dag, like a Dag deserialized eagerly.
+        return {task_id: dict.__getitem__(self, task_id) for task_id in self._encoded_tasks}
+
+    def get(self, task_id: str, default: Any = None) -> Any:
+        if task_id in self._encoded_tasks:
+            return self[task_id]
+        return default
+
+    def add_pending(self, task_id: str, group: SerializedTaskGroup, label: str) -> None:
+        self._pending_groups[task_id] = (group, label)
+
+    def materialize(self) -> None:
+        """Deserialize all tasks not looked up yet."""
+        if dict.__len__(self) == len(self._encoded_tasks):
+            return
+        for task_id in self._encoded_tasks:
+            if not dict.__contains__(self, task_id):
+                self.__missing__(task_id)
+
+
 class DagSerialization(BaseSerialization):
     """Logic to encode a ``DAG`` object and decode the data into ``SerializedDAG``."""
 
@@ -1752,9 +1865,20 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def deserialize_dag(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls,
+        encoded_dag: dict[str, Any],
+        client_defaults: dict[str, Any] | None = None,
+        *,
+        lazy: bool = False,
     ) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param lazy: Only deserialize tasks when they are first looked up in the
+            DAG's ``task_dict``. Getting all the tasks of a lazily deserialized DAG
+            deserializes them all at once, so this is meant for callers that only need
+            a few tasks by their id.
+        """
         if "dag_id" not in encoded_dag:
             raise DeserializationError(
                 message="Encoded dag object has no dag_id key. "
@@ -1764,7 +1888,7 @@ class DagSerialization(BaseSerialization):
         dag_id = encoded_dag["dag_id"]
 
         try:
-            return cls._deserialize_dag_internal(encoded_dag, client_defaults)
+            return cls._deserialize_dag_internal(encoded_dag, client_defaults, lazy=lazy)
         except (TimetableNotRegistered, DeserializationError):
             # Let specific errors bubble up unchanged
             raise
@@ -1774,7 +1898,7 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def _deserialize_dag_internal(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None, *, lazy: bool = False
     ) -> SerializedDAG:
         """Handle the main Dag deserialization logic."""
         dag = SerializedDAG(dag_id=encoded_dag["dag_id"])
@@ -1787,6 +1911,14 @@ class DagSerialization(BaseSerialization):
             v = v_in  # surpass PLW2901
             if k == "_downstream_task_ids":
                 v = set(v)
+            elif k == "tasks" and lazy:
+                k = "task_dict"
+                v = _LazyTaskDict(
+                    dag,
+                    (obj[Encoding.VAR] for obj in v if obj.get(Encoding.TYPE) == DAT.OP),
+                    client_defaults,
+                    cls._load_operator_extra_links,
+                )
             elif k == "tasks":
                 OperatorSerialization._load_operator_extra_links = cls._load_operator_extra_links
                 tasks = {}
@@ -1847,6 +1979,8 @@ class DagSerialization(BaseSerialization):
                 tooltip="",
             )
             object.__setattr__(dag, "task_group", tg)
+            if isinstance(dag.task_dict, _LazyTaskDict):
+                dag.task_dict.materialize()
             for task in dag.tasks:
                 tg.add(task)
 
@@ -1862,8 +1996,9 @@ class DagSerialization(BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for t in dag.task_dict.values():
-            OperatorSerialization.set_task_dag_references(t, dag)
+        if not lazy:
+            for t in dag.task_dict.values():
+                OperatorSerialization.set_task_dag_references(t, dag)
 
         return dag
 
@@ -2064,8 +2199,12 @@ class DagSerialization(BaseSerialization):
         ser_obj["__version"] = 3
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(cls, serialized_obj: dict, *, lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param lazy: Only deserialize operators on first access, see :meth:`deserialize_dag`.
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver not in (1, 2, 3):
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
@@ -2078,7 +2217,7 @@ class DagSerialization(BaseSerialization):
         client_defaults = serialized_obj.get("client_defaults", {})
 
         # Pass client_defaults directly to deserialize_dag
-        return cls.deserialize_dag(serialized_obj["dag"], client_defaults)
+        return cls.deserialize_dag(serialized_obj["dag"], client_defaults, lazy=lazy)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -2147,14 +2286,26 @@ class TaskGroupSerialization(BaseSerialization):
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
-            label: (
-                set_ref(task_dict[val])
-                if _type == DAT.OP
-                else cls.deserialize_task_group(val, group, task_dict, dag=dag)
-            )
-            for label, (_type, val) in sorted(encoded_group["children"].items())
-        }
+        if isinstance(task_dict, _LazyTaskDict):
+            # Leave tasks that are not deserialized yet out, they are added to the
+            # group when they are first looked up.
+            group.children = {}
+            for label, (_type, val) in sorted(encoded_group["children"].items()):
+                if _type != DAT.OP:
+                    group.children[label] = cls.deserialize_task_group(val, group, task_dict, dag=dag)
+                elif dict.__contains__(task_dict, val):
+                    group.children[label] = set_ref(task_dict[val])
+                else:
+                    task_dict.add_pending(val, group, label)
+        else:
+            group.children = {
+                label: (
+                    set_ref(task_dict[val])
+                    if _type == DAT.OP
+                    else cls.deserialize_task_group(val, group, task_dict, dag=dag)
+                )
+                for label, (_type, val) in sorted(encoded_group["children"].items())
+            }
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
 
     from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
+    from airflow.ti_deps.deps.trigger_rule_dep import _UpstreamStateMatrix
 
 
 @attr.define
@@ -85,6 +86,9 @@ class DepContext:
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    upstream_state_matrix: _UpstreamStateMatrix | None = None
+    """Finished TI states of the run indexed by task and map index, built once for all TIs evaluated"""
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
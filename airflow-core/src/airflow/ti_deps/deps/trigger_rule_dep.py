@@ -17,13 +17,13 @@
 # under the License.
 from __future__ import annotations
 
-import collections.abc
 import functools
-from collections import Counter
-from collections.abc import Iterator, KeysView, Mapping, Sequence
+import itertools
+from collections import Counter, defaultdict
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, NamedTuple
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import select
 
 from airflow.models.taskinstance import PAST_DEPENDS_MET
 from airflow.task.trigger_rule import TriggerRule as TR
@@ -31,16 +31,15 @@ from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Row
     from sqlalchemy.orm import Session
-    from sqlalchemy.sql import ColumnElement
 
     from airflow.models.taskinstance import TaskInstance
     from airflow.serialization.definitions.mappedoperator import Operator
     from airflow.serialization.definitions.taskgroup import SerializedMappedTaskGroup
     from airflow.ti_deps.dep_context import DepContext
     from airflow.ti_deps.deps.base_ti_dep import TIDepStatus
-    from airflow.typing_compat import Unpack
+
+    RelevantMapIndexes = Callable[[str], "int | range | None"]
 
 
 class _UpstreamTIStates(NamedTuple):
@@ -79,6 +78,16 @@ class _UpstreamTIStates(NamedTuple):
             counter.update(curr_state)
             if ti.task.is_setup:
                 setup_counter.update(curr_state)
+        return cls.from_counters(counter, setup_counter)
+
+    @classmethod
+    def from_counters(cls, counter: Mapping[str, int], setup_counter: Mapping[str, int]) -> _UpstreamTIStates:
+        """
+        Build the states from per-state counts of finished upstreams.
+
+        :param counter: number of finished upstream tis in each state
+        :param setup_counter: same as ``counter``, restricted to setup tasks
+        """
         return _UpstreamTIStates(
             success=counter.get(TaskInstanceState.SUCCESS, 0),
             skipped=counter.get(TaskInstanceState.SKIPPED, 0),
@@ -91,6 +100,138 @@ class _UpstreamTIStates(NamedTuple):
         )
 
 
+def _iter_relevant_map_indexes(entries: Collection[int], relevant: int | range) -> Iterator[int]:
+    """
+    Yield the map indexes in ``entries`` that are relevant to the current ti.
+
+    A map index is relevant if it is negative (the upstream is not expanded) or
+    if it matches ``relevant``. Whichever of ``entries`` and ``relevant`` is
+    smaller is walked, so a ti depending on one map index of a wide mapped
+    upstream does not scan all of that upstream's tis.
+    """
+    if isinstance(relevant, int):
+        candidates: Iterable[int] = {-1, relevant}
+    elif len(relevant) < len(entries):
+        candidates = itertools.chain((-1,), relevant)
+    else:
+        yield from (map_index for map_index in entries if map_index < 0 or map_index in relevant)
+        return
+    yield from (map_index for map_index in candidates if map_index in entries)
+
+
+class _UpstreamStateMatrix:
+    """
+    Finished task instance states of a dag run, indexed by task_id and map_index.
+
+    The matrix is built once from the dependency context's finished tis and
+    shared by every ti evaluated with that context, so trigger rules are answered
+    from per-task counters instead of walking all finished tis of the run for
+    each ti. Expected upstream ti counts, needed when an upstream is mapped, are
+    also loaded once per matrix rather than queried for each ti.
+
+    :param dag_id: the dag id of the run
+    :param run_id: the run id of the run
+    :param finished_tis: all the finished tis of the run
+    """
+
+    def __init__(self, dag_id: str, run_id: str, finished_tis: list[TaskInstance]) -> None:
+        self.dag_id = dag_id
+        self.run_id = run_id
+        self._finished_tis = finished_tis
+        self._finished_count = len(finished_tis)
+        self._states: dict[str, dict[int, str]] = defaultdict(dict)
+        self._counts: dict[str, Counter[str]] = defaultdict(Counter)
+        self._setup_task_ids: set[str] = set()
+        self._expanded_task_ids: set[str] = set()
+        self._map_indexes: dict[str, set[int]] | None = None
+        self._expanded_ti_task_ids: set[str] = set()
+        for ti in finished_tis:
+            if TYPE_CHECKING:
+                assert ti.task
+                assert ti.state
+            self._states[ti.task_id][ti.map_index] = ti.state
+            self._counts[ti.task_id][ti.state] += 1
+            if ti.task.is_setup:
+                self._setup_task_ids.add(ti.task_id)
+            if ti.map_index >= 0:
+                self._expanded_task_ids.add(ti.task_id)
+
+    def is_built_from(self, ti: TaskInstance, finished_tis: list[TaskInstance]) -> bool:
+        """Whether this matrix still reflects ``finished_tis`` of ``ti``'s dag run."""
+        return (
+            self._finished_tis is finished_tis
+            and self._finished_count == len(finished_tis)
+            and self.dag_id == ti.dag_id
+            and self.run_id == ti.run_id
+        )
+
+    def upstream_states(
+        self, task_ids: Iterable[str], relevant_map_indexes: RelevantMapIndexes
+    ) -> _UpstreamTIStates:
+        """
+        Calculate the states of the finished relevant tis of ``task_ids``.
+
+        :param task_ids: the upstream task ids to consider
+        :param relevant_map_indexes: returns the map indexes of an upstream
+            relevant to the current ti, *None* meaning all of them
+        """
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for task_id in task_ids:
+            if task_id not in self._states:
+                continue
+            # Non-expanded tis are always relevant, so only expanded upstreams need a closer look.
+            relevant = relevant_map_indexes(task_id) if task_id in self._expanded_task_ids else None
+            if relevant is None:
+                task_counter = self._counts[task_id]
+            else:
+                states = self._states[task_id]
+                task_counter = Counter(
+                    states[map_index] for map_index in _iter_relevant_map_indexes(states, relevant)
+                )
+            counter.update(task_counter)
+            if task_id in self._setup_task_ids:
+                setup_counter.update(task_counter)
+        return _UpstreamTIStates.from_counters(counter, setup_counter)
+
+    def ti_counts(
+        self, task_ids: Iterable[str], relevant_map_indexes: RelevantMapIndexes, *, session: Session
+    ) -> dict[str, int]:
+        """
+        Count the relevant tis of ``task_ids`` in the run, whatever their state.
+
+        The task_id and map_index of every ti in the run are loaded with a single
+        query the first time this is called.
+
+        :param task_ids: the upstream task ids to consider
+        :param relevant_map_indexes: returns the map indexes of an upstream
+            relevant to the current ti, *None* meaning all of them
+        :param session: Database session
+        """
+        from airflow.models.taskinstance import TaskInstance
+
+        if self._map_indexes is None:
+            self._map_indexes = defaultdict(set)
+            for task_id, map_index in session.execute(
+                select(TaskInstance.task_id, TaskInstance.map_index).where(
+                    TaskInstance.dag_id == self.dag_id, TaskInstance.run_id == self.run_id
+                )
+            ):
+                self._map_indexes[task_id].add(map_index)
+                if map_index >= 0:
+                    self._expanded_ti_task_ids.add(task_id)
+        counts: dict[str, int] = {}
+        for task_id in task_ids:
+            if not (map_indexes := self._map_indexes.get(task_id)):
+                continue
+            relevant = relevant_map_indexes(task_id) if task_id in self._expanded_ti_task_ids else None
+            if relevant is None:
+                counts[task_id] = len(map_indexes)
+            else:
+                counts[task_id] = sum(1 for _ in _iter_relevant_map_indexes(map_indexes, relevant))
+        return counts
+
+
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
 
@@ -116,6 +257,23 @@ class TriggerRuleDep(BaseTIDep):
             return
         yield from self._evaluate_trigger_rule(ti=ti, dep_context=dep_context, session=session)
 
+    @staticmethod
+    def _get_upstream_state_matrix(
+        *, ti: TaskInstance, dep_context: DepContext, session: Session
+    ) -> _UpstreamStateMatrix:
+        """
+        Get the upstream state matrix of ``ti``'s dag run, building it if needed.
+
+        The matrix is cached on the dependency context so that all tis evaluated
+        with the same context share it; it is rebuilt if the finished tis change.
+        """
+        finished_tis = dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
+        matrix = dep_context.upstream_state_matrix
+        if matrix is None or not matrix.is_built_from(ti, finished_tis):
+            matrix = _UpstreamStateMatrix(ti.dag_id, ti.run_id, finished_tis)
+            dep_context.upstream_state_matrix = matrix
+        return matrix
+
     def _evaluate_trigger_rule(
         self,
         *,
@@ -132,7 +290,6 @@ class TriggerRuleDep(BaseTIDep):
         """
         from airflow.exceptions import NotMapped
         from airflow.models.expandinput import NotFullyPopulated
-        from airflow.models.taskinstance import TaskInstance
         from airflow.serialization.definitions.mappedoperator import is_mapped
 
         task = ti.task
@@ -192,68 +349,20 @@ class TriggerRuleDep(BaseTIDep):
                 session=session,
             )
 
-        def _is_relevant_upstream(upstream: TaskInstance, relevant_ids: set[str] | KeysView[str]) -> bool:
+        def _relevant_map_indexes(upstream_id: str) -> int | range | None:
             """
-            Whether a task instance is a "relevant upstream" of the current task.
+            Get the map indexes of the given upstream the current ti depends on.
 
-            This will return false if upstream.task_id is not in relevant_ids,
-            or if both of the following are true:
-                1. upstream.task_id in relevant_ids is True
-                2. ti is in a mapped task group and upstream has a map index
-                  that ti does not depend on.
+            *None* means all tis of the upstream are dependencies; tis that are
+            not expanded are always dependencies.
             """
-            # Not actually an upstream task.
-            if upstream.task_id not in relevant_ids:
-                return False
             # The current task is not in a mapped task group. All tis from an
             # upstream task are relevant.
             if task.get_closest_mapped_task_group() is None:
-                return True
-            # The upstream ti is not expanded. The upstream may be mapped or
-            # not, but the ti is relevant either way.
-            if upstream.map_index < 0:
-                return True
-            # Now we need to perform fine-grained check on whether this specific
-            # upstream ti's map index is relevant.
-            relevant = _get_relevant_upstream_map_indexes(upstream_id=upstream.task_id)
-            if relevant is None:
-                return True
-            if relevant == upstream.map_index:
-                return True
-            if isinstance(relevant, collections.abc.Container) and upstream.map_index in relevant:
-                return True
-            return False
-
-        def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnElement]:
-            # Optimization: If the current task is not in a mapped task group,
-            # it depends on all upstream task instances.
-            from airflow.models.taskinstance import TaskInstance
+                return None
+            return _get_relevant_upstream_map_indexes(upstream_id=upstream_id)
 
-            if task.get_closest_mapped_task_group() is None:
-                yield TaskInstance.task_id.in_(relevant_tasks.keys())
-                return
-            # Otherwise we need to figure out which map indexes are depended on
-            # for each upstream by the current task instance.
-            for upstream_id in relevant_tasks:
-                map_indexes = _get_relevant_upstream_map_indexes(upstream_id)
-                if map_indexes is None:  # All tis of this upstream are dependencies.
-                    yield TaskInstance.task_id == upstream_id
-                    continue
-                # At this point we know we want to depend on only selected tis
-                # of this upstream task. Since the upstream may not have been
-                # expanded at this point, we also depend on the non-expanded ti
-                # to ensure at least one ti is included for the task.
-                yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index < 0)
-                if isinstance(map_indexes, range) and map_indexes.step == 1:
-                    yield and_(
-                        TaskInstance.task_id == upstream_id,
-                        TaskInstance.map_index >= map_indexes.start,
-                        TaskInstance.map_index < map_indexes.stop,
-                    )
-                elif isinstance(map_indexes, collections.abc.Container):
-                    yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index.in_(map_indexes))
-                else:
-                    yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
+        upstream_matrix = self._get_upstream_state_matrix(ti=ti, dep_context=dep_context, session=session)
 
         def _evaluate_setup_constraint(
             *, relevant_setups: Mapping[str, Operator]
@@ -267,12 +376,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = upstream_matrix.upstream_states(indirect_setups, _relevant_map_indexes)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -286,13 +390,10 @@ class TriggerRuleDep(BaseTIDep):
             if not any(t.get_needs_expansion() for t in indirect_setups.values()):
                 upstream = len(indirect_setups)
             else:
-                task_id_counts = session.execute(
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=indirect_setups)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
+                task_id_counts = upstream_matrix.ti_counts(
+                    indirect_setups, _relevant_map_indexes, session=session
+                )
+                upstream = sum(task_id_counts.values())
 
             new_state = None
             changed = False
@@ -350,12 +451,7 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = upstream_matrix.upstream_states(task.upstream_task_ids, _relevant_map_indexes)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -372,15 +468,11 @@ class TriggerRuleDep(BaseTIDep):
                 upstream = len(upstream_tasks)
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
-                # The below type annotation is acceptable on SQLA2.1, but not on 2.0
-                task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=upstream_tasks)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
-                upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
+                task_id_counts = upstream_matrix.ti_counts(
+                    upstream_tasks, _relevant_map_indexes, session=session
+                )
+                upstream = sum(task_id_counts.values())
+                upstream_setup = sum(c for t, c in task_id_counts.items() if upstream_tasks[t].is_setup)
 
             upstream_done = done >= upstream
 
@@ -642,22 +734,13 @@ class TriggerRuleDep(BaseTIDep):
 
             in_scope_tasks = {tid: task.dag.get_task(tid) for tid in in_scope_ids}
 
-            done = sum(
-                1
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=in_scope_ids)
-            )
+            done = upstream_matrix.upstream_states(in_scope_ids, _relevant_map_indexes).done
 
             if not any(t.get_needs_expansion() for t in in_scope_tasks.values()):
                 expected = len(in_scope_tasks)
             else:
-                expected = (
-                    session.scalar(
-                        select(func.count(TaskInstance.task_id))
-                        .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                        .where(or_(*_iter_upstream_conditions(relevant_tasks=in_scope_tasks)))
-                    )
-                    or 0
+                expected = sum(
+                    upstream_matrix.ti_counts(in_scope_tasks, _relevant_map_indexes, session=session).values()
                 )
 
             if done < expected:
@@ -1199,20 +1199,24 @@ export const ensureUseTaskInstanceServiceGetMappedTaskInstanceTryDetailsData = (
 * @param data.fullContent
 * @param data.mapIndex
 * @param data.token
+* @param data.tailLines Only return this many log lines, the last ones.
+* @param data.levels Only return the log lines of these levels. Can be set multiple times.
 * @param data.accept
 * @returns TaskInstancesLogResponse Successful Response
 * @throws ApiError
 */
-export const ensureUseTaskInstanceServiceGetLogData = (queryClient: QueryClient, { accept, dagId, dagRunId, fullContent, mapIndex, taskId, token, tryNumber }: {
+export const ensureUseTaskInstanceServiceGetLogData = (queryClient: QueryClient, { accept, dagId, dagRunId, fullContent, levels, mapIndex, tailLines, taskId, token, tryNumber }: {
   accept?: "application/json" | "*/*" | "application/x-ndjson";
   dagId: string;
   dagRunId: string;
   fullContent?: boolean;
+  levels?: string[];
   mapIndex?: number;
+  tailLines?: number;
   taskId: string;
   token?: string;
   tryNumber: number;
-}) => queryClient.ensureQueryData({ queryKey: Common.UseTaskInstanceServiceGetLogKeyFn({ accept, dagId, dagRunId, fullContent, mapIndex, taskId, token, tryNumber }), queryFn: () => TaskInstanceService.getLog({ accept, dagId, dagRunId, fullContent, mapIndex, taskId, token, tryNumber }) });
+}) => queryClient.ensureQueryData({ queryKey: Common.UseTaskInstanceServiceGetLogKeyFn({ accept, dagId, dagRunId, fullContent, levels, mapIndex, tailLines, taskId, token, tryNumber }), queryFn: () => TaskInstanceService.getLog({ accept, dagId, dagRunId, fullContent, levels, mapIndex, tailLines, taskId, token, tryNumber }) });
 /**
 * Get External Log Url
 * Get external log URL for a specific task instance.
@@ -1880,6 +1884,8 @@ export const ensureUseGridServiceGetDagStructureData = (queryClient: QueryClient
 /**
 * Get Grid Runs
 * Get info about a run for the grid.
+*
+* The response has an ETag; it is not sent again to clients which already have it.
 * @param data The data for the request.
 * @param data.dagId
 * @param data.offset
@@ -1923,6 +1929,12 @@ export const ensureUseGridServiceGetGridRunsData = (queryClient: QueryClient, {
 * The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
 * (keyed by ``dag_version_id``), which avoids repeated deserialization across
 * runs of the same version *and* across requests.
+*
+* The task instances of the runs are only read when they changed since their
+* summary was last built: a fingerprint of the task instances of every run,
+* computed by the database, tells which summaries can be served from the
+* app-wide ``GridTISummaryCache``. The fingerprints are also the ETag of the
+* response, which is not sent again to clients which already have it.
 * @param data The data for the request.
 * @param data.dagId
 * @param data.runIds
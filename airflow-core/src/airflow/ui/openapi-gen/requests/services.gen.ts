@@ -2905,6 +2905,8 @@ export class TaskInstanceService {
      * @param data.fullContent
      * @param data.mapIndex
      * @param data.token
+     * @param data.tailLines Only return this many log lines, the last ones.
+     * @param data.levels Only return the log lines of these levels. Can be set multiple times.
      * @param data.accept
      * @returns TaskInstancesLogResponse Successful Response
      * @throws ApiError
@@ -2925,7 +2927,9 @@ export class TaskInstanceService {
             query: {
                 full_content: data.fullContent,
                 map_index: data.mapIndex,
-                token: data.token
+                token: data.token,
+                tail_lines: data.tailLines,
+                levels: data.levels
             },
             errors: {
                 401: 'Unauthorized',
@@ -4458,6 +4462,8 @@ export class GridService {
     /**
      * Get Grid Runs
      * Get info about a run for the grid.
+     *
+     * The response has an ETag; it is not sent again to clients which already have it.
      * @param data The data for the request.
      * @param data.dagId
      * @param data.offset
@@ -4515,6 +4521,12 @@ export class GridService {
      * The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
      * (keyed by ``dag_version_id``), which avoids repeated deserialization across
      * runs of the same version *and* across requests.
+     *
+     * The task instances of the runs are only read when they changed since their
+     * summary was last built: a fingerprint of the task instances of every run,
+     * computed by the database, tells which summaries can be served from the
+     * app-wide ``GridTISummaryCache``. The fingerprints are also the ETag of the
+     * response, which is not sent again to clients which already have it.
      * @param data The data for the request.
      * @param data.dagId
      * @param data.runIds
@@ -3533,7 +3533,15 @@ export type GetLogData = {
     dagId: string;
     dagRunId: string;
     fullContent?: boolean;
+    /**
+     * Only return the log lines of these levels. Can be set multiple times.
+     */
+    levels?: Array<(string)> | null;
     mapIndex?: number;
+    /**
+     * Only return this many log lines, the last ones.
+     */
+    tailLines?: number | null;
     taskId: string;
     token?: string | null;
     tryNumber: number;
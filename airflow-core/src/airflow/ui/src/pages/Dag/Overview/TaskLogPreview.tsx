@@ -46,8 +46,8 @@ export const TaskLogPreview = ({
   } = useLogs(
     {
       dagId: taskInstance.dag_id,
-      limit: 100,
-      logLevelFilters: ["error", "critical"],
+      levels: ["error", "critical"],
+      tailLines: 100,
       taskInstance,
       tryNumber: taskInstance.try_number,
     },
@@ -42,11 +42,14 @@ export type ParsedLogEntry = {
 type Props = {
   accept?: "*/*" | "application/json" | "application/x-ndjson";
   dagId: string;
-  limit?: number;
+  // Only fetch the log lines of these levels
+  levels?: Array<string>;
   logLevelFilters?: Array<string>;
   showSource?: boolean;
   showTimestamp?: boolean;
   sourceFilters?: Array<string>;
+  // Only fetch this many log lines, the last ones
+  tailLines?: number;
   taskInstance?: TaskInstanceResponse;
   tryNumber?: number;
 };
@@ -209,32 +212,16 @@ const parseLogs = ({
   };
 };
 
-// Log truncation is performed in the frontend because the backend
-// does not support yet pagination / limits on logs reading endpoint
-const truncateData = (data: TaskInstancesLogResponse | undefined, limit?: number) => {
-  if (!data?.content || limit === undefined || limit <= 0) {
-    return data;
-  }
-
-  const streamingContent = parseStreamingLogContent(data);
-  const truncatedContent =
-    streamingContent.length > limit ? streamingContent.slice(-limit) : streamingContent;
-
-  return {
-    ...data,
-    content: truncatedContent,
-  };
-};
-
 export const useLogs = (
   {
     accept = "application/x-ndjson",
     dagId,
-    limit,
+    levels,
     logLevelFilters,
     showSource,
     showTimestamp,
     sourceFilters,
+    tailLines,
     taskInstance,
     tryNumber = 1,
   }: Props,
@@ -248,7 +235,9 @@ export const useLogs = (
       accept,
       dagId,
       dagRunId: taskInstance?.dag_run_id ?? "",
+      levels,
       mapIndex: taskInstance?.map_index ?? -1,
+      tailLines,
       taskId: taskInstance?.task_id ?? "",
       tryNumber,
     },
@@ -265,7 +254,7 @@ export const useLogs = (
   );
 
   const parsedData = parseLogs({
-    data: parseStreamingLogContent(truncateData(data, limit)),
+    data: parseStreamingLogContent(data),
     logLevelFilters,
     showSource,
     showTimestamp,
@@ -0,0 +1,79 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import bisect
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+from airflow.utils.hashlib_wrapper import md5
+
+NodeT = TypeVar("NodeT", bound=Hashable)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class ConsistentHashRing(Generic[NodeT]):
+    """
+    Assign string keys to a set of nodes so that few keys move when nodes come and go.
+
+    Every node is placed on the ring at ``replicas`` pseudo-random points, and a key
+    belongs to the node owning the first point at or after the key's own hash. When a
+    node leaves, only the keys it owned are redistributed, spread across the
+    remaining nodes; when a node joins, it only takes keys over from the others.
+
+    The placement only depends on the string representation of the nodes, so
+    separate processes building a ring from the same nodes agree on all assignments.
+
+    :param nodes: the nodes to distribute keys to
+    :param replicas: number of points each node is placed at on the ring; more
+        points give a more even distribution at the cost of a larger ring
+    """
+
+    def __init__(self, nodes: Iterable[NodeT], replicas: int = 64) -> None:
+        if replicas < 1:
+            raise ValueError(f"replicas must be a positive integer, got {replicas}")
+        self.replicas = replicas
+        self.nodes: frozenset[NodeT] = frozenset(nodes)
+        points = sorted(
+            (_hash(f"{node}-{replica}"), str(node), node)
+            for node in self.nodes
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _, _ in points]
+        self._owners = [node for _, _, node in points]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(nodes={sorted(map(str, self.nodes))}, replicas={self.replicas})"
+
+    def get_node(self, key: str) -> NodeT:
+        """
+        Get the node owning ``key``.
+
+        :param key: the key to look up
+        :raises LookupError: if the ring has no nodes
+        """
+        if not self._hashes:
+            raise LookupError("Cannot look up a key in an empty ring")
+        index = bisect.bisect_left(self._hashes, _hash(key))
+        return self._owners[index % len(self._owners)]
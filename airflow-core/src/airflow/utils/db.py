@@ -1410,16 +1410,34 @@ def downgrade(*, to_revision, from_revision=None, show_sql_only=False, session:
     ):
         if show_sql_only:
             log.warning("Generating sql scripts for manual migration.")
+            log.warning(
+                "Serialized DAGs stored as msgpack are only re-encoded as JSON when Airflow applies "
+                "the downgrade, not by the generated sql."
+            )
             if not from_revision:
                 from_revision = _get_current_revision(work_session)
             revision_range = f"{from_revision}:{to_revision}"
             _offline_migration(command.downgrade, config=config, revision=revision_range)
         else:
+            _reencode_serialized_dags_as_json(session=work_session)
             dialect_label = " (MySQL)" if get_dialect_name(work_session) == "mysql" else ""
             log.info("Applying downgrade migrations to Airflow database%s.", dialect_label)
             command.downgrade(config, revision=to_revision, sql=show_sql_only)
 
 
+def _reencode_serialized_dags_as_json(*, session: Session) -> None:
+    """
+    Re-encode serialized DAGs stored as msgpack as compressed JSON, which prior versions can read.
+
+    :param session: sqlalchemy session for connection to airflow metadata database
+    """
+    from airflow.models.serialized_dag import SerializedDagModel
+
+    if count := SerializedDagModel.reencode_binary_data_as_json(session=session):
+        log.info("Re-encoded %s serialized DAGs from msgpack to JSON before downgrading.", count)
+    session.commit()
+
+
 def _get_fab_migration_version(*, session: Session) -> str | None:
     """
     Get the current FAB migration version from the database.
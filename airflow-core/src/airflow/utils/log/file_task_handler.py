@@ -23,11 +23,13 @@ import heapq
 import io
 import logging
 import os
-from collections.abc import Callable, Generator, Iterator
+from collections import deque
+from collections.abc import Callable, Collection, Generator, Iterator
 from contextlib import suppress
 from datetime import datetime
 from enum import Enum
 from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
 from types import GeneratorType
 from typing import IO, TYPE_CHECKING, TypedDict, cast
@@ -40,6 +42,7 @@ from typing_extensions import NotRequired
 from airflow.configuration import conf
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.utils.helpers import parse_template_string, render_template
+from airflow.utils.log.log_index import LOG_INDEX_SUFFIX, LogIndex
 from airflow.utils.log.log_stream_accumulator import LogStreamAccumulator
 from airflow.utils.log.logging_mixin import SetContextPropagate
 from airflow.utils.log.non_caching_file_handler import NonCachingRotatingFileHandler
@@ -71,7 +74,7 @@ SORT_KEY_OFFSET = 10000000
 Assuming 50 characters per line, an offset of 10,000,000 can represent approximately 500 MB of file data, which is sufficient for use as a constant.
 """
 HEAP_DUMP_SIZE = 5000
-HALF_HEAP_DUMP_SIZE = HEAP_DUMP_SIZE // 2
+"""Number of log records kept in memory while counting the records of a log which is still written."""
 
 StructuredLogStream: TypeAlias = Generator["StructuredLogMessage", None, None]
 """Structured log stream, containing structured log messages."""
@@ -121,8 +124,7 @@ class StructuredLogMessage(BaseModel):
     timestamp: datetime | None = None
     event: str
 
-    # Collisions of sort_key may occur due to duplicated messages. If this happens, the heap will use the second element,
-    # which is the StructuredLogMessage for comparison. Therefore, we need to define a comparator for it.
+    # Log messages can be sorted by their timestamp, messages without one being sorted first.
     def __lt__(self, other: StructuredLogMessage) -> bool:
         return self.sort_key < other.sort_key
 
@@ -303,97 +305,55 @@ def _is_sort_key_with_default_timestamp(sort_key: int) -> bool:
     return timestamp_part == DEFAULT_SORT_TIMESTAMP
 
 
-def _add_log_from_parsed_log_streams_to_heap(
-    heap: list[tuple[int, StructuredLogMessage]],
-    parsed_log_streams: dict[int, ParsedLogStream],
-) -> None:
-    """
-    Add one log record from each parsed log stream to the heap, and will remove empty log stream from the dict after iterating.
-
-    :param heap: heap to store log records
-    :param parsed_log_streams: dict of parsed log streams
-    """
-    # We intend to initialize the list lazily, as in most cases we don't need to remove any log streams.
-    # This reduces memory overhead, since this function is called repeatedly until all log streams are empty.
-    log_stream_to_remove: list[int] | None = None
-    for idx, log_stream in parsed_log_streams.items():
-        record: ParsedLog | None = next(log_stream, None)
-        if record is None:
-            if log_stream_to_remove is None:
-                log_stream_to_remove = []
-            log_stream_to_remove.append(idx)
-            continue
-        timestamp, line_num, line = record
+def _sort_keyed_log_stream(
+    log_stream: RawLogStream,
+) -> Generator[tuple[int, StructuredLogMessage], None, None]:
+    """Parse a str log stream into its log records, along with their sort keys."""
+    for timestamp, line_num, line in _log_stream_to_parsed_log_stream(log_stream):
         # take int as sort key to avoid overhead of memory usage
-        heapq.heappush(heap, (_create_sort_key(timestamp, line_num), line))
-    # remove empty log stream from the dict
-    if log_stream_to_remove is not None:
-        for idx in log_stream_to_remove:
-            del parsed_log_streams[idx]
-
-
-def _flush_logs_out_of_heap(
-    heap: list[tuple[int, StructuredLogMessage]],
-    flush_size: int,
-    last_log_container: list[StructuredLogMessage | None],
-) -> Generator[StructuredLogMessage, None, None]:
-    """
-    Flush logs out of the heap, deduplicating them based on the last log.
-
-    :param heap: heap to flush logs from
-    :param flush_size: number of logs to flush
-    :param last_log_container: a container to store the last log, to avoid duplicate logs
-    :return: a generator that yields deduplicated logs
-    """
-    last_log = last_log_container[0]
-    for _ in range(flush_size):
-        sort_key, line = heapq.heappop(heap)
-        if line != last_log or _is_sort_key_with_default_timestamp(sort_key):  # dedupe
-            yield line
-        last_log = line
-    # update the last log container with the last log
-    last_log_container[0] = last_log
+        yield _create_sort_key(timestamp, line_num), line
 
 
 def _interleave_logs(*log_streams: RawLogStream) -> StructuredLogStream:
     """
-    Merge parsed log streams using K-way merge.
-
-    By yielding HALF_CHUNK_SIZE records when heap size exceeds CHUNK_SIZE, we can reduce the chance of messing up the global order.
-    Since there are multiple log streams, we can't guarantee that the records are in global order.
+    Merge log streams using K-way merge.
 
-    e.g.
+    The merge is lazy: only the next record of each log stream is held at any time, so the memory used
+    does not depend on the size of the logs, and the first records are yielded before the whole logs
+    are read. Records are yielded in the order of their sort key; records with the same sort key are
+    yielded in the order of the log streams they come from. Each log stream is expected to be in order
+    already, which log files are, as they are written as the records are emitted.
 
-    log_stream1: ----------
-    log_stream2:   ----
-    log_stream3:     --------
+    Consecutive duplicated records are only yielded once, unless they have no timestamp, since the same
+    logs can be read from several sources, e.g. from a local file and from the logs server.
 
-    The first record of log_stream3 is later than the fourth record of log_stream1 !
-    :param parsed_log_streams: parsed log streams
+    :param log_streams: log streams to merge
     :return: interleaved log stream
     """
-    # don't need to push whole tuple into heap, which increases too much overhead
-    # push only sort_key and line into heap
-    heap: list[tuple[int, StructuredLogMessage]] = []
-    # to allow removing empty streams while iterating, also turn the str stream into parsed log stream
-    parsed_log_streams: dict[int, ParsedLogStream] = {
-        idx: _log_stream_to_parsed_log_stream(log_stream) for idx, log_stream in enumerate(log_streams)
-    }
+    last_log: StructuredLogMessage | None = None
+    for sort_key, line in heapq.merge(*map(_sort_keyed_log_stream, log_streams), key=itemgetter(0)):
+        if line != last_log or _is_sort_key_with_default_timestamp(sort_key):  # dedupe
+            yield line
+        last_log = line
 
-    # keep adding records from logs until all logs are empty
-    last_log_container: list[StructuredLogMessage | None] = [None]
-    while parsed_log_streams:
-        _add_log_from_parsed_log_streams_to_heap(heap, parsed_log_streams)
 
-        # yield HALF_HEAP_DUMP_SIZE records when heap size exceeds HEAP_DUMP_SIZE
-        if len(heap) >= HEAP_DUMP_SIZE:
-            yield from _flush_logs_out_of_heap(heap, HALF_HEAP_DUMP_SIZE, last_log_container)
+def _read_to_end_of_log(
+    out_stream: LogHandlerOutputStream, log_pos: int, metadata: LogMetadata
+) -> StructuredLogStream:
+    """
+    Yield the records of a log stream after the first ``log_pos`` ones, without holding them.
 
-    # yield remaining records
-    yield from _flush_logs_out_of_heap(heap, len(heap), last_log_container)
-    # free memory
-    del heap
-    del parsed_log_streams
+    Once the stream is exhausted, the number of records it had is stored as ``log_pos`` in ``metadata``.
+
+    :param out_stream: log stream to read
+    :param log_pos: number of records at the start of the stream to skip
+    :param metadata: metadata returned with the stream, updated once it is exhausted
+    """
+    total_lines = 0
+    for total_lines, line in enumerate(out_stream, start=1):
+        if total_lines > log_pos:
+            yield line
+    metadata["log_pos"] = total_lines
 
 
 def _is_logs_stream_like(log) -> bool:
@@ -602,7 +562,9 @@ class FileTaskHandler(logging.Handler):
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
-                 log_pos: (absolute) Char position to which the log is retrieved
+                 log_pos: (absolute) Char position to which the log is retrieved.
+                          At the end of the log, it is only set once the log
+                          stream has been read, as it is not read in advance.
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
@@ -679,6 +641,14 @@ class FileTaskHandler(logging.Handler):
             TaskInstanceState.DEFERRED,
         )
 
+        if end_of_log:
+            # No more logs will be read after these, so there is no need to know how many records there
+            # are before returning them: they are streamed, and counted as they are read.
+            out_metadata: LogMetadata = {"end_of_log": True}
+            if metadata and "log_pos" in metadata:
+                return _read_to_end_of_log(out_stream, metadata["log_pos"], out_metadata), out_metadata
+            return chain(header, _read_to_end_of_log(out_stream, 0, out_metadata)), out_metadata
+
         with LogStreamAccumulator(out_stream, HEAP_DUMP_SIZE) as stream_accumulator:
             log_pos = stream_accumulator.total_lines
             out_stream = stream_accumulator.stream
@@ -859,22 +829,18 @@ class FileTaskHandler(logging.Handler):
 
         return full_path
 
-    def _read_from_local(
-        self,
-        worker_log_path: Path,
-    ) -> StreamingLogResponse:
-        sources: LogSourceInfo = []
-        log_streams: list[RawLogStream] = []
+    def _get_local_log_paths(self, worker_log_path: Path) -> list[tuple[Path, str]]:
+        """Return the local log files of a try, with their resolved paths, leaving out their indexes."""
         # The glob below can match symlinks as well as regular files, so
-        # resolve each hit and only open the ones that stay inside the base
+        # resolve each hit and only keep the ones that stay inside the base
         # log folder. Canonicalising ``self.local_base`` once up front makes
         # the containment check compare two already-resolved paths.
         base_log_folder = os.path.realpath(self.local_base)
         paths = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
-        if not paths:
-            return sources, log_streams
-
+        log_paths = []
         for path in paths:
+            if path.name.endswith(LOG_INDEX_SUFFIX):
+                continue
             resolved_path = os.path.realpath(path)
             try:
                 if os.path.commonpath([base_log_folder, resolved_path]) != base_log_folder:
@@ -884,9 +850,18 @@ class FileTaskHandler(logging.Handler):
                 # paths have nothing in common (e.g. different drives on
                 # Windows); treat that as "not contained" and skip the file.
                 continue
+            log_paths.append((path, resolved_path))
+        return log_paths
 
+    def _read_from_local(
+        self,
+        worker_log_path: Path,
+    ) -> StreamingLogResponse:
+        sources: LogSourceInfo = []
+        log_streams: list[RawLogStream] = []
+        for path, resolved_path in self._get_local_log_paths(worker_log_path):
             # Open the resolved path so the file we read is the same one we
-            # just validated above. Append to ``sources`` only after a
+            # just validated. Append to ``sources`` only after a
             # successful ``open`` so ``sources`` and ``log_streams`` stay
             # aligned.
             try:
@@ -897,6 +872,42 @@ class FileTaskHandler(logging.Handler):
             log_streams.append(log_stream)
         return sources, log_streams
 
+    def read_local_log_lines(
+        self,
+        ti: TaskInstance | TaskInstanceHistory,
+        try_number: int,
+        *,
+        tail_lines: int | None = None,
+        levels: Collection[str] | None = None,
+    ) -> StructuredLogStream | None:
+        """
+        Read the last lines of the local logs of a try, or only their lines of some levels.
+
+        The local log files are indexed as they are read (see :class:`~airflow.utils.log.log_index.LogIndex`),
+        so that only the parts of them which can contain the lines asked for are read and parsed.
+
+        :param ti: task instance record
+        :param try_number: try_number to read the logs of
+        :param tail_lines: only return this many lines, the last ones
+        :param levels: only return the lines of these levels, in lower case
+        :return: the selected lines, or None if there are no local logs for the try, for example when
+            they are only stored remotely
+        """
+        worker_log_full_path = Path(self.local_base, self._render_filename(ti, try_number))
+        log_paths = self._get_local_log_paths(worker_log_full_path)
+        if not log_paths:
+            return None
+        lines_per_block = conf.getint("logging", "task_log_index_block_lines", fallback=1000)
+        out_stream = _interleave_logs(
+            *(
+                LogIndex(resolved_path, lines_per_block).read_lines(tail=tail_lines, levels=levels)
+                for _, resolved_path in log_paths
+            )
+        )
+        if tail_lines is not None:
+            return (log for log in deque(out_stream, maxlen=tail_lines))
+        return out_stream
+
     def _read_from_logs_server(
         self,
         ti: TaskInstance | TaskInstanceHistory,
@@ -0,0 +1,236 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Index the lines of local task log files, to read some of them without reading the whole file."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from collections.abc import Collection, Iterator
+from pathlib import Path
+from typing import IO, NamedTuple
+
+import msgspec
+
+logger = logging.getLogger(__name__)
+
+LOG_INDEX_SUFFIX = ".index"
+"""Suffix added to the name of a log file to get the name of its index."""
+READ_SIZE = 1024 * 1024
+
+
+class _LogLine(msgspec.Struct):
+    level: str | None = None
+
+
+def _line_level(line: bytes) -> str | None:
+    """Return the level of a JSON log line, in lower case, or None if it has none."""
+    try:
+        level = msgspec.json.decode(line, type=_LogLine).level
+    except msgspec.DecodeError:
+        return None
+    return level.lower() if level else None
+
+
+class LogBlock(NamedTuple):
+    """Consecutive lines of a log file, as described by one entry of its index."""
+
+    line: int
+    """Number of the first line of the block, starting from 0."""
+    offset: int
+    """Position of the first byte of the block in the file."""
+    end: int
+    """Position of the byte following the block in the file."""
+    levels: frozenset[str]
+    """Levels of the lines of the block, in lower case."""
+
+
+class LogIndex:
+    """
+    Index of the blocks of lines of a log file, stored next to it.
+
+    Every ``lines_per_block`` complete lines of the log file make a block, whose position in the file
+    and the levels of its lines are appended to the index as a JSON line. Log files only ever grow, so
+    the index is brought up to date by reading the lines written since its last block. The lines after
+    the last block are read every time, without being indexed.
+
+    Reading the last lines of the file, or only the lines of some levels, then only reads the blocks
+    that can contain them. If the index cannot be written next to the log file, for example because
+    the log folder is read-only, it is only kept in memory.
+
+    :param path: Path of the log file.
+    :param lines_per_block: Number of lines of a block, or 0 not to index the file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], lines_per_block: int = 1000):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + LOG_INDEX_SUFFIX)
+        self.lines_per_block = lines_per_block
+        self.blocks: list[LogBlock] = []
+        self._loaded = False
+        self._persist = True
+
+    def update(self) -> None:
+        """Add the blocks completed since the last update to the index."""
+        if self.lines_per_block <= 0:
+            return
+        if not self._loaded:
+            self.blocks = self._load()
+            self._loaded = True
+        if self.blocks and self.blocks[-1].end > self.path.stat().st_size:
+            # The log file has been replaced with a shorter one.
+            self._reset()
+
+        line, offset = self._indexed_end()
+        new_blocks = []
+        with open(self.path, "rb") as log_file:
+            log_file.seek(offset)
+            count = 0
+            levels: set[str] = set()
+            position = offset
+            for raw_line in log_file:
+                if not raw_line.endswith(b"\n"):
+                    # The line is still being written.
+                    break
+                position += len(raw_line)
+                count += 1
+                if level := _line_level(raw_line):
+                    levels.add(level)
+                if count == self.lines_per_block:
+                    new_blocks.append(LogBlock(line, offset, position, frozenset(levels)))
+                    line += count
+                    offset = position
+                    count = 0
+                    levels = set()
+        if new_blocks:
+            self.blocks.extend(new_blocks)
+            self._save(new_blocks)
+
+    def read_lines(self, *, tail: int | None = None, levels: Collection[str] | None = None) -> Iterator[str]:
+        """
+        Read lines of the log file, oldest first, without their line breaks.
+
+        The index is updated first. Empty lines and the last line, if it is not complete yet, are not
+        returned.
+
+        :param tail: Only return this many lines, the last ones.
+        :param levels: Only return the lines of these levels, in lower case. Lines without a level,
+            like lines which are not JSON, are then not returned.
+        """
+        self.update()
+        level_set = frozenset(levels) if levels else None
+        start = self.blocks[-1].end if self.blocks else 0
+        blocks = [block for block in self.blocks if level_set is None or block.levels & level_set]
+        with open(self.path, "rb") as log_file:
+            if tail is None:
+                for block in blocks:
+                    yield from self._read(log_file, block.offset, block.end, level_set)
+                yield from self._read(log_file, start, None, level_set)
+                return
+
+            selected: deque[str] = deque(self._read(log_file, start, None, level_set), maxlen=tail)
+            for block in reversed(blocks):
+                if len(selected) >= tail:
+                    break
+                lines = list(self._read(log_file, block.offset, block.end, level_set))
+                selected.extendleft(reversed(lines[max(0, len(lines) - tail + len(selected)) :]))
+        yield from selected
+
+    @staticmethod
+    def _read(
+        log_file: IO[bytes], start: int, end: int | None, levels: frozenset[str] | None
+    ) -> Iterator[str]:
+        log_file.seek(start)
+        remaining = None if end is None else end - start
+        buffer = b""
+        while remaining is None or remaining > 0:
+            chunk = log_file.read(READ_SIZE if remaining is None else min(READ_SIZE, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            # Whatever follows the last line break is either read with the next chunk, or a line still
+            # being written.
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                if line and (levels is None or _line_level(line) in levels):
+                    yield line.decode("utf-8", errors="replace")
+
+    def _indexed_end(self) -> tuple[int, int]:
+        """Return the number of the first line and the position of the first byte not indexed yet."""
+        if not self.blocks:
+            return 0, 0
+        last = self.blocks[-1]
+        return last.line + self.lines_per_block, last.end
+
+    def _load(self) -> list[LogBlock]:
+        try:
+            with open(self.index_path, "rb") as index_file:
+                entries = [msgspec.json.decode(entry) for entry in index_file if entry.strip()]
+        except FileNotFoundError:
+            return []
+        except (OSError, msgspec.DecodeError):
+            logger.warning("Could not read the index of %s, it will be rebuilt", self.path, exc_info=True)
+            self._reset()
+            return []
+
+        blocks: list[LogBlock] = []
+        for entry in entries:
+            try:
+                block = LogBlock(entry["line"], entry["offset"], entry["end"], frozenset(entry["levels"]))
+            except (KeyError, TypeError):
+                break
+            expected = (blocks[-1].line + self.lines_per_block, blocks[-1].end) if blocks else (0, 0)
+            if (block.line, block.offset) != expected:
+                break
+            blocks.append(block)
+        else:
+            return blocks
+        # The index was written with another number of lines per block, or by two processes at once.
+        logger.debug("The index of %s is inconsistent, it will be rebuilt", self.path)
+        self._reset()
+        return []
+
+    def _save(self, blocks: list[LogBlock]) -> None:
+        if not self._persist:
+            return
+        try:
+            with open(self.index_path, "ab") as index_file:
+                index_file.writelines(
+                    msgspec.json.encode(
+                        {
+                            "line": block.line,
+                            "offset": block.offset,
+                            "end": block.end,
+                            "levels": sorted(block.levels),
+                        }
+                    )
+                    + b"\n"
+                    for block in blocks
+                )
+        except OSError:
+            logger.debug("Could not write the index of %s, keeping it in memory", self.path, exc_info=True)
+            self._persist = False
+
+    def _reset(self) -> None:
+        self.blocks = []
+        try:
+            self.index_path.unlink(missing_ok=True)
+        except OSError:
+            self._persist = False
@@ -19,7 +19,8 @@ from __future__ import annotations
 import logging
 import os
 import time
-from collections.abc import Generator, Iterator
+from collections import deque
+from collections.abc import Collection, Generator, Iterator
 from datetime import datetime, timezone
 from functools import cached_property
 from typing import TYPE_CHECKING
@@ -103,13 +104,21 @@ class TaskLogReader:
         ti: TaskInstance | TaskInstanceHistory,
         try_number: int | None,
         metadata: LogMetadata,
+        *,
+        tail_lines: int | None = None,
+        levels: Collection[str] | None = None,
     ) -> Iterator[str]:
         """
         Continuously read log to the end.
 
+        When ``tail_lines`` or ``levels`` is given, only the lines selected by them are read, once,
+        and ``metadata`` is left unchanged.
+
         :param ti: The Task Instance
         :param try_number: the task try number
         :param metadata: A dictionary containing information about how to read the task log
+        :param tail_lines: Only read this many lines, the last ones
+        :param levels: Only read the lines of these levels
         """
         if try_number is None:
             try_number = ti.try_number
@@ -120,6 +129,11 @@ class TaskLogReader:
                 yield f"{msg.model_dump_json()}\n"
             return
 
+        if tail_lines is not None or levels:
+            selected = self.read_log_lines(ti, try_number, tail_lines=tail_lines, levels=levels)
+            yield from (f"{log.model_dump_json()}\n" for log in selected)
+            return
+
         for key in ("end_of_log", "max_offset", "offset", "log_pos"):
             # https://mypy.readthedocs.io/en/stable/typed_dict.html#supported-operations
             metadata.pop(key, None)  # type: ignore[misc]
@@ -151,6 +165,41 @@ class TaskLogReader:
                 metadata.update(out_metadata)
                 return
 
+    def read_log_lines(
+        self,
+        ti: TaskInstance | TaskInstanceHistory,
+        try_number: int,
+        *,
+        tail_lines: int | None = None,
+        levels: Collection[str] | None = None,
+    ) -> Iterator[StructuredLogMessage]:
+        """
+        Read the last lines of the logs of a try, or only their lines of some levels, once.
+
+        :param ti: The Task Instance
+        :param try_number: the task try number
+        :param tail_lines: Only read this many lines, the last ones
+        :param levels: Only read the lines of these levels
+        """
+        if try_number == 0:
+            return self.get_no_log_state_message(ti)
+
+        level_set = {level.lower() for level in levels} if levels else None
+        if isinstance(self.log_handler, FileTaskHandler):
+            local_logs = self.log_handler.read_local_log_lines(
+                ti, try_number, tail_lines=tail_lines, levels=level_set
+            )
+            if local_logs is not None:
+                return local_logs
+
+        # The logs are not stored locally, so they have to be read whole to select lines from them.
+        logs, _ = self.read_log_chunks(ti, try_number, {})  # type: ignore[typeddict-item]
+        if level_set:
+            logs = (log for log in logs if str(getattr(log, "level", "")).lower() in level_set)
+        if tail_lines is not None:
+            logs = iter(deque(logs, maxlen=tail_lines))
+        return logs
+
     @cached_property
     def log_handler(self):
         """Get the log handler which is configured to read logs."""
@@ -0,0 +1,216 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Time the nested phases of a loop together with the SQL queries each phase runs."""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from sqlalchemy import event
+
+from airflow._shared.observability.metrics import stats
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from sqlalchemy.engine import Engine
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+SQL_FRAME = "[sql]"
+"""Name of the frame that the time spent in SQL queries is reported under in collapsed stacks."""
+
+
+@dataclass
+class PhaseStats:
+    """Totals of all the calls of a phase, reached through the same stack of enclosing phases."""
+
+    calls: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+    """Time not spent in nested phases or in SQL queries."""
+    queries: int = 0
+    query_time: float = 0.0
+
+
+class _Frame:
+    __slots__ = ("child_time", "path", "queries", "query_time", "start")
+
+    def __init__(self, path: tuple[str, ...]):
+        self.path = path
+        self.start = time.perf_counter()
+        self.child_time = 0.0
+        self.queries = 0
+        self.query_time = 0.0
+
+
+class _Phase:
+    __slots__ = ("name", "profiler")
+
+    def __init__(self, profiler: PhaseProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.profiler._enter(self.name)
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler._exit()
+
+
+class PhaseProfiler:
+    """
+    Time the phases of a loop, the phases nested in them, and the SQL queries each of them runs.
+
+    A phase is timed with ``with profiler.phase("name"):``. Every call emits the
+    ``<metric_prefix>.duration`` and ``<metric_prefix>.query_duration`` timers and the
+    ``<metric_prefix>.queries`` counter, tagged with the name of the phase. The profiler also
+    keeps totals for every stack of phases since it was created, which :meth:`dump` formats as
+    a table and as collapsed stacks that flame graph tools such as ``flamegraph.pl`` or
+    speedscope read.
+
+    SQL queries are only counted once :meth:`attach` has been called with the engine running
+    them, and only those run from the thread that entered the outermost phase. A disabled
+    profiler does nothing.
+
+    :param metric_prefix: Prefix of the emitted metrics.
+    :param enabled: Whether to time anything at all.
+    """
+
+    def __init__(self, metric_prefix: str, *, enabled: bool = True):
+        self.metric_prefix = metric_prefix
+        self.enabled = enabled
+        self.stats: dict[tuple[str, ...], PhaseStats] = {}
+        self._stack: list[_Frame] = []
+        self._thread_id: int | None = None
+        self._query_start: float | None = None
+        self._engine: Engine | None = None
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing the given phase."""
+        if not self.enabled:
+            return nullcontext()
+        return _Phase(self, name)
+
+    def wrap(self, func: T, name: str | None = None) -> T:
+        """Return ``func`` timed as a phase, named ``name`` or after the function."""
+        if not self.enabled:
+            return func
+        phase_name = name or func.__name__.lstrip("_")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Phase(self, phase_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    def attach(self, engine: Engine) -> None:
+        """Count the SQL queries run on ``engine`` towards the current phase."""
+        if not self.enabled or self._engine is not None:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = engine
+
+    def detach(self) -> None:
+        """Stop counting the SQL queries of the engine given to :meth:`attach`."""
+        if self._engine is None:
+            return
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = None
+
+    def _enter(self, name: str) -> None:
+        if self._stack:
+            path = (*self._stack[-1].path, name)
+        else:
+            path = (name,)
+            self._thread_id = threading.get_ident()
+        self._stack.append(_Frame(path))
+
+    def _exit(self) -> None:
+        frame = self._stack.pop()
+        duration = time.perf_counter() - frame.start
+        if self._stack:
+            self._stack[-1].child_time += duration
+        phase_stats = self.stats.get(frame.path)
+        if phase_stats is None:
+            phase_stats = self.stats[frame.path] = PhaseStats()
+        phase_stats.calls += 1
+        phase_stats.total_time += duration
+        phase_stats.self_time += duration - frame.child_time - frame.query_time
+        phase_stats.queries += frame.queries
+        phase_stats.query_time += frame.query_time
+
+        tags = {"phase": frame.path[-1]}
+        stats.timing(f"{self.metric_prefix}.duration", timedelta(seconds=duration), tags=tags)
+        if frame.queries:
+            stats.incr(f"{self.metric_prefix}.queries", frame.queries, tags=tags)
+            stats.timing(
+                f"{self.metric_prefix}.query_duration", timedelta(seconds=frame.query_time), tags=tags
+            )
+
+    def _before_cursor_execute(self, *args) -> None:
+        if self._stack and threading.get_ident() == self._thread_id:
+            self._query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, *args) -> None:
+        if self._query_start is None or threading.get_ident() != self._thread_id:
+            return
+        duration = time.perf_counter() - self._query_start
+        self._query_start = None
+        if self._stack:
+            frame = self._stack[-1]
+            frame.queries += 1
+            frame.query_time += duration
+
+    def collapsed_stacks(self) -> list[str]:
+        """
+        Return the time spent in every stack of phases, in microseconds, as collapsed stacks.
+
+        The time of the SQL queries of a phase is reported under a nested ``[sql]`` frame.
+        """
+        lines = []
+        for path, phase_stats in sorted(self.stats.items()):
+            stack = ";".join(path)
+            if (self_us := round(phase_stats.self_time * 1_000_000)) > 0:
+                lines.append(f"{stack} {self_us}")
+            if (query_us := round(phase_stats.query_time * 1_000_000)) > 0:
+                lines.append(f"{stack};{SQL_FRAME} {query_us}")
+        return lines
+
+    def dump(self) -> str:
+        """Return the totals of every stack of phases as a table, followed by collapsed stacks."""
+        rows = [
+            f"{'phase':<60}{'calls':>8}{'total s':>10}{'mean ms':>10}{'self s':>10}{'queries':>9}{'sql s':>9}"
+        ]
+        for path, s in sorted(self.stats.items()):
+            name = "  " * (len(path) - 1) + path[-1]
+            rows.append(
+                f"{name:<60}{s.calls:>8}{s.total_time:>10.2f}{s.total_time / s.calls * 1000:>10.1f}"
+                f"{s.self_time:>10.2f}{s.queries:>9}{s.query_time:>9.2f}"
+            )
+        return "\n".join([*rows, "", "Collapsed stacks (microseconds):", *self.collapsed_stacks()])
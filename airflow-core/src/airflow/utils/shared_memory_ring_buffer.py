@@ -0,0 +1,126 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Exchange messages between forked processes through a ring buffer in shared memory."""
+
+from __future__ import annotations
+
+import ctypes
+import multiprocessing
+import os
+import queue
+import struct
+from multiprocessing.shared_memory import SharedMemory
+
+_HEADER = struct.Struct("<I")
+_HEAD = 0
+_TAIL = 1
+
+
+class SharedMemoryRingBuffer:
+    """
+    Multi-producer, single-consumer queue of byte strings stored in a ring buffer in shared memory.
+
+    Every message is written to the buffer once, prefixed with its length, and read back from it by
+    the consumer without being pickled or sent through a pipe. Producers take a lock to append a
+    message, and wait while the buffer is too full to hold it. The consumer takes the lock only
+    twice to read all the messages appended since its previous read, however many there are.
+
+    The buffer is shared with the processes forked after it has been created. It cannot be sent to
+    processes started with the ``spawn`` or ``forkserver`` start methods.
+
+    :param size: Size of the buffer, in bytes.
+    """
+
+    def __init__(self, size: int):
+        if size <= _HEADER.size:
+            raise ValueError(f"The size of the buffer must be larger than {_HEADER.size} bytes")
+        self.size = size
+        self._shm = SharedMemory(create=True, size=size)
+        self._owner_pid = os.getpid()
+        # Positions of the next byte to read and to write. They only grow, the offsets in the buffer
+        # are the positions modulo its size.
+        self._positions = multiprocessing.RawArray(ctypes.c_uint64, 2)
+        self._not_full = multiprocessing.Condition(multiprocessing.Lock())
+
+    def put(self, data: bytes, timeout: float | None = None) -> None:
+        """
+        Append a message to the buffer, waiting for the consumer to make room for it if needed.
+
+        :param data: The message.
+        :param timeout: Maximum number of seconds to wait for room, or None to wait forever.
+        :raises queue.Full: If there is still no room for the message after ``timeout`` seconds.
+        """
+        needed = _HEADER.size + len(data)
+        if needed > self.size:
+            raise ValueError(f"A message of {len(data)} bytes does not fit in a buffer of {self.size} bytes")
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: self._free_space() >= needed, timeout):
+                raise queue.Full
+            tail = self._positions[_TAIL]
+            self._write(tail, _HEADER.pack(len(data)))
+            self._write(tail + _HEADER.size, data)
+            self._positions[_TAIL] = tail + needed
+
+    def get_all(self) -> list[bytes]:
+        """Remove all the messages from the buffer and return them, oldest first, without waiting."""
+        with self._not_full:
+            head, tail = self._positions[_HEAD], self._positions[_TAIL]
+        if head == tail:
+            return []
+        # Producers never write to the part of the buffer between the two positions, so it can be read
+        # without holding the lock.
+        messages = []
+        position = head
+        while position < tail:
+            (length,) = _HEADER.unpack(self._read(position, _HEADER.size))
+            position += _HEADER.size
+            messages.append(self._read(position, length))
+            position += length
+        with self._not_full:
+            self._positions[_HEAD] = tail
+            self._not_full.notify_all()
+        return messages
+
+    def empty(self) -> bool:
+        with self._not_full:
+            return self._positions[_HEAD] == self._positions[_TAIL]
+
+    def close(self) -> None:
+        """Release the shared memory; it is freed once the process that created the buffer closes it."""
+        self._shm.close()
+        if os.getpid() == self._owner_pid:
+            self._shm.unlink()
+
+    def _free_space(self) -> int:
+        return self.size - (self._positions[_TAIL] - self._positions[_HEAD])
+
+    def _write(self, position: int, data: bytes) -> None:
+        offset = position % self.size
+        first = min(len(data), self.size - offset)
+        buf = self._shm.buf
+        buf[offset : offset + first] = data[:first]
+        if first < len(data):
+            buf[: len(data) - first] = data[first:]
+
+    def _read(self, position: int, length: int) -> bytes:
+        offset = position % self.size
+        first = min(length, self.size - offset)
+        buf = self._shm.buf
+        if first == length:
+            return bytes(buf[offset : offset + length])
+        return bytes(buf[offset:]) + bytes(buf[: length - first])
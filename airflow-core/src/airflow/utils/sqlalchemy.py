@@ -21,6 +21,7 @@ import contextlib
 import copy
 import datetime
 import logging
+import weakref
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
@@ -40,7 +41,7 @@ if TYPE_CHECKING:
 
     from kubernetes.client.models.v1_pod import V1Pod
     from sqlalchemy.exc import OperationalError
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import Session, SessionTransaction
     from sqlalchemy.sql import Select
     from sqlalchemy.sql.elements import ColumnElement
     from sqlalchemy.types import TypeEngine
@@ -420,8 +421,14 @@ class CommitProhibitorGuard:
 
     def __init__(self, session: Session):
         self.session = session
+        self._savepoints: weakref.WeakSet[SessionTransaction] = weakref.WeakSet()
 
     def _validate_commit(self, _):
+        # Releasing a savepoint opened by the guard neither ends the transaction nor releases its
+        # locks. A commit of the whole session releases its savepoints first, and is caught here
+        # once it gets to the outer transaction.
+        if self.session.get_nested_transaction() in self._savepoints:
+            return
         if self.expected_commit:
             self.expected_commit = False
             return
@@ -443,6 +450,16 @@ class CommitProhibitorGuard:
         self.expected_commit = True
         self.session.commit()
 
+    def begin_nested(self) -> SessionTransaction:
+        """
+        Begin a savepoint on the session.
+
+        This is the required way to use savepoints when the guard is in scope
+        """
+        savepoint = self.session.begin_nested()
+        self._savepoints.add(savepoint)
+        return savepoint
+
 
 def prohibit_commit(session):
     """
@@ -110,3 +110,18 @@ class TestCreateDagBag:
         dag_bag = create_dag_bag()
         assert dag_bag._use_cache is expected_use_cache
         assert isinstance(dag_bag._dags, expected_dags_type)
+
+    @mock.patch("airflow.api_fastapi.common.dagbag.conf")
+    def test_create_dag_bag_bounded_by_tasks(self, mock_conf):
+        from airflow.api_fastapi.common.dagbag import create_dag_bag
+
+        mock_conf.getint.side_effect = lambda section, key, fallback: {
+            "dag_cache_size": 64,
+            "dag_cache_ttl": 0,
+            "dag_cache_max_tasks": 1000,
+        }.get(key, fallback)
+
+        dag_bag = create_dag_bag()
+        assert isinstance(dag_bag._dags, LRUCache)
+        assert dag_bag._dags.maxsize == 1000
+        assert dag_bag._dags.max_entries == 64
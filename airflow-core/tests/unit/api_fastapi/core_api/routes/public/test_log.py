@@ -335,6 +335,50 @@ class TestTaskInstancesLog:
             assert "3rd line" in response.content.decode("utf-8")
             assert "should never be read" not in response.content.decode("utf-8")
 
+    @pytest.mark.parametrize(
+        ("params", "expected_events"),
+        [
+            pytest.param({"tail_lines": 2}, ["line 8", "line 9"], id="tail"),
+            pytest.param({"levels": ["error"]}, ["line 4", "line 9"], id="levels"),
+            pytest.param({"tail_lines": 1, "levels": ["error", "critical"]}, ["line 9"], id="both"),
+        ],
+    )
+    @pytest.mark.parametrize("accept", ["application/json", "application/x-ndjson"])
+    def test_get_logs_selected_lines(self, params, expected_events, accept):
+        log_path = (
+            self.log_dir / f"dag_id={self.DAG_ID}" / f"run_id={self.RUN_ID}" / f"task_id={self.TASK_ID}"
+        ) / "attempt=1.log"
+        with log_path.open("w") as f:
+            for i in range(10):
+                level = "error" if i % 5 == 4 else "info"
+                f.write(
+                    json.dumps({"timestamp": f"2020-06-10T20:00:0{i}Z", "level": level, "event": f"line {i}"})
+                    + "\n"
+                )
+
+        response = self.client.get(
+            f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+            params=params,
+            headers={"Accept": accept},
+        )
+
+        assert response.status_code == 200
+        if accept == "application/json":
+            assert response.json()["continuation_token"] is None
+            content = response.json()["content"]
+        else:
+            assert "Airflow-Continuation-Token" not in response.headers
+            content = [json.loads(line) for line in response.text.splitlines()]
+        assert [log["event"] for log in content] == expected_events
+
+    def test_get_logs_with_invalid_tail_lines(self):
+        response = self.client.get(
+            f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+            params={"tail_lines": 0},
+            headers={"Accept": "application/json"},
+        )
+        assert response.status_code == 422
+
     @pytest.mark.parametrize("try_number", [1, 2])
     @mock.patch("airflow.api_fastapi.core_api.routes.public.log.TaskLogReader")
     def test_get_logs_for_handler_without_read_method(self, mock_log_reader, try_number):
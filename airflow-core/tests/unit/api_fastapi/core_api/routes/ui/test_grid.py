@@ -23,11 +23,13 @@ from operator import attrgetter
 
 import pendulum
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from airflow._shared.timezones import timezone
+from airflow.api_fastapi.core_api.services.ui.grid import get_grid_ti_summary_cache
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DBDagBag
+from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
@@ -374,6 +376,8 @@ def setup(dag_maker, session=None):
 def _clean():
     clear_db_runs()
     clear_db_assets()
+    # Time is frozen, so task instances of different tests can have the same fingerprint.
+    get_grid_ti_summary_cache.cache_clear()
     yield
     clear_db_runs()
     clear_db_assets()
@@ -566,7 +570,8 @@ class TestGetGridDataEndpoint:
         ]
 
         # Also verify that TI summaries include a leaf entry for the removed task
-        with assert_queries_count(4):
+        # 2 auth queries + 1 fingerprint query + 1 TI query + 1 serdag query.
+        with assert_queries_count(5):
             ti_resp = test_client.get(f"/grid/ti_summaries/{DAG_ID_3}?run_ids=run_3")
         assert ti_resp.status_code == 200
         [ti_payload] = self._parse_ndjson(ti_resp)
@@ -720,7 +725,8 @@ class TestGetGridDataEndpoint:
         run_id = "run_4-1"
         session.commit()
 
-        with assert_queries_count(4):
+        # 2 auth queries + 1 fingerprint query + 1 TI query + 1 serdag query.
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID_4}?run_ids={run_id}")
         assert response.status_code == 200
         [actual] = self._parse_ndjson(response)
@@ -820,7 +826,8 @@ class TestGetGridDataEndpoint:
         run_id = "run_2"
         session.commit()
 
-        with assert_queries_count(4):
+        # 2 auth queries + 1 fingerprint query + 1 TI query + 1 serdag query.
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}?run_ids={run_id}")
         assert response.status_code == 200
         [data] = self._parse_ndjson(response)
@@ -1187,9 +1194,95 @@ class TestGetGridDataEndpoint:
         session.commit()
 
         run_ids = ["run_1", "run_2"]
-        # 2 auth queries + 1 serdag query shared across both runs
-        # + 1 TI query per run = 5 total (not 1 serdag per run which would be 6+).
-        with assert_queries_count(5):
+        # 2 auth queries + 1 fingerprint query + 1 serdag query shared across both runs
+        # + 1 TI query per run = 6 total (not 1 serdag per run which would be 7+).
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
         assert response.status_code == 200
         assert len(self._parse_ndjson(response)) == len(run_ids)
+
+    def test_grid_ti_summaries_stream_served_from_cache(self, session, test_client):
+        """Summaries of runs whose task instances did not change are not built again."""
+        session.commit()
+
+        run_ids = ["run_1", "run_2"]
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        # 2 auth queries + 1 fingerprint query, the task instances are not read.
+        with assert_queries_count(3):
+            second = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        assert second.status_code == 200
+        assert second.text == first.text
+
+        ti = session.scalar(
+            select(TaskInstance).where(
+                TaskInstance.dag_id == DAG_ID, TaskInstance.run_id == "run_1", TaskInstance.task_id == TASK_ID
+            )
+        )
+        ti.state = TaskInstanceState.FAILED
+        session.commit()
+
+        # 2 auth queries + 1 fingerprint query + 1 TI query for run_1 only.
+        with assert_queries_count(4):
+            third = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        summaries = {summary["run_id"]: summary for summary in self._parse_ndjson(third)}
+        states = {ti["task_id"]: ti["state"] for ti in summaries["run_1"]["task_instances"]}
+        assert states[ti.task_id] == TaskInstanceState.FAILED
+        assert summaries["run_2"] == {s["run_id"]: s for s in self._parse_ndjson(first)}["run_2"]
+
+    def test_grid_ti_summaries_stream_not_modified(self, session, test_client):
+        session.commit()
+
+        params = {"run_ids": ["run_1", "run_2"]}
+        response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params=params)
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "no-cache"
+
+        with assert_queries_count(3):
+            response = test_client.get(
+                f"/grid/ti_summaries/{DAG_ID}", params=params, headers={"If-None-Match": etag}
+            )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        # Another selection of runs has another ETag.
+        response = test_client.get(
+            f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": ["run_1"]}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        ti = session.scalar(
+            select(TaskInstance).where(TaskInstance.dag_id == DAG_ID, TaskInstance.run_id == "run_2").limit(1)
+        )
+        ti.state = TaskInstanceState.UP_FOR_RETRY
+        session.commit()
+
+        response = test_client.get(
+            f"/grid/ti_summaries/{DAG_ID}", params=params, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert len(self._parse_ndjson(response)) == 2
+
+    def test_get_grid_runs_not_modified(self, session, test_client):
+        session.commit()
+
+        response = test_client.get(f"/grid/runs/{DAG_ID}")
+        etag = response.headers["ETag"]
+
+        response = test_client.get(f"/grid/runs/{DAG_ID}", headers={"If-None-Match": f'"other", {etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        session.execute(
+            update(DagRun)
+            .where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_1")
+            .values(state=DagRunState.FAILED)
+        )
+        session.commit()
+
+        response = test_client.get(f"/grid/runs/{DAG_ID}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["state"] == DagRunState.FAILED
@@ -0,0 +1,140 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import zipfile
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.file_index import BundleFileIndex
+
+DAG_CONTENT = "from airflow.sdk import DAG\n"
+
+
+def _touch(path, content, mtime_ns=None):
+    path.write_text(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestBundleFileIndex:
+    @pytest.fixture
+    def bundle(self, tmp_path):
+        _touch(tmp_path / "dag_a.py", DAG_CONTENT, 1_000_000_000)
+        _touch(tmp_path / "dag_b.py", DAG_CONTENT, 1_000_000_000)
+        _touch(tmp_path / "not_a_dag.py", "print('hello')\n", 1_000_000_000)
+        _touch(tmp_path / "README.md", DAG_CONTENT, 1_000_000_000)
+        return tmp_path
+
+    def test_first_scan_reports_all_dag_files_as_added(self, bundle):
+        index = BundleFileIndex(safe_mode=True)
+        scan = index.scan(bundle)
+
+        expected = sorted(str(bundle / name) for name in ("dag_a.py", "dag_b.py"))
+        assert sorted(scan.dag_files) == expected
+        assert sorted(scan.added) == expected
+        assert scan.changed == []
+        assert scan.removed == []
+
+    def test_rescan_reports_changes(self, bundle):
+        index = BundleFileIndex(safe_mode=True)
+        index.scan(bundle)
+
+        _touch(bundle / "dag_a.py", DAG_CONTENT + "# changed\n", 2_000_000_000)
+        (bundle / "dag_b.py").unlink()
+        _touch(bundle / "dag_c.py", DAG_CONTENT)
+        scan = index.scan(bundle)
+
+        assert sorted(scan.dag_files) == [str(bundle / "dag_a.py"), str(bundle / "dag_c.py")]
+        assert scan.changed == [str(bundle / "dag_a.py")]
+        assert scan.added == [str(bundle / "dag_c.py")]
+        assert scan.removed == [str(bundle / "dag_b.py")]
+
+    def test_file_that_no_longer_looks_like_a_dag_is_removed(self, bundle):
+        index = BundleFileIndex(safe_mode=True)
+        index.scan(bundle)
+
+        _touch(bundle / "dag_a.py", "print('hello')\n", 2_000_000_000)
+        scan = index.scan(bundle)
+
+        assert scan.dag_files == [str(bundle / "dag_b.py")]
+        assert scan.removed == [str(bundle / "dag_a.py")]
+
+    def test_unchanged_files_are_not_read_again(self, bundle):
+        index = BundleFileIndex(safe_mode=True)
+        index.scan(bundle)
+
+        with mock.patch("airflow.dag_processing.file_index.might_contain_dag") as might_contain_dag:
+            scan = index.scan(bundle)
+
+        might_contain_dag.assert_not_called()
+        assert len(scan.dag_files) == 2
+        assert scan.added == scan.changed == scan.removed == []
+
+    def test_signature_is_updated_by_scans(self, bundle):
+        index = BundleFileIndex(safe_mode=True)
+        assert index.signature(str(bundle / "dag_a.py")) is None
+
+        index.scan(bundle)
+        signature = index.signature(str(bundle / "dag_a.py"))
+        assert signature.mtime_ns == 1_000_000_000
+        assert signature.size == len(DAG_CONTENT)
+
+        _touch(bundle / "dag_a.py", DAG_CONTENT + "# changed\n", 2_000_000_000)
+        assert index.signature(str(bundle / "dag_a.py")) == signature
+        index.scan(bundle)
+        assert index.signature(str(bundle / "dag_a.py")).mtime_ns == 2_000_000_000
+
+    def test_airflowignore_is_respected(self, bundle):
+        (bundle / ".airflowignore").write_text("dag_b.py\n")
+        scan = BundleFileIndex(safe_mode=True).scan(bundle)
+        assert scan.dag_files == [str(bundle / "dag_a.py")]
+
+    def test_single_file_bundle(self, tmp_path):
+        path = tmp_path / "not_a_dag.py"
+        path.write_text("print('hello')\n")
+        scan = BundleFileIndex(safe_mode=True).scan(path)
+        assert scan.dag_files == [str(path)]
+
+    def test_zipped_dag_paths_are_cached_until_archive_changes(self, tmp_path):
+        zip_path = tmp_path / "dags.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("dag_in_zip.py", DAG_CONTENT)
+            zf.writestr("helper.py", "print('hello')\n")
+        index = BundleFileIndex(safe_mode=True)
+        assert index.scan(tmp_path).dag_files == [str(zip_path)]
+        assert index.is_zip(str(zip_path)) is True
+        assert index.is_zip(str(tmp_path / "unknown.py")) is None
+
+        with mock.patch(
+            "airflow.dag_processing.file_index.find_zipped_dags", return_value=iter(["cached"])
+        ) as find_zipped_dags:
+            assert index.zipped_dag_paths(str(zip_path)) == ["cached"]
+            assert index.zipped_dag_paths(str(zip_path)) == ["cached"]
+        find_zipped_dags.assert_called_once()
+
+        with zipfile.ZipFile(zip_path, "a") as zf:
+            zf.writestr("other_dag.py", DAG_CONTENT)
+        os.utime(zip_path, ns=(2_000_000_000, 2_000_000_000))
+        index.scan(tmp_path)
+        assert sorted(index.zipped_dag_paths(str(zip_path))) == [
+            os.path.join(zip_path, "dag_in_zip.py"),
+            os.path.join(zip_path, "other_dag.py"),
+        ]
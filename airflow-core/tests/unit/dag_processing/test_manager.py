@@ -39,6 +39,7 @@ import msgspec
 import pytest
 import time_machine
 from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
 from uuid6 import uuid7
 
 from airflow._shared.timezones import timezone
@@ -46,11 +47,13 @@ from airflow.callbacks.callback_requests import DagCallbackRequest
 from airflow.dag_processing.bundles.base import BaseDagBundle
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.dagbag import DagBag
+from airflow.dag_processing.file_index import BundleFileIndex
 from airflow.dag_processing.manager import (
     BundleState,
     DagFileInfo,
     DagFileProcessorManager,
     DagFileStat,
+    _UnchangedParseResult,
 )
 from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
 from airflow.models import DagModel, DbCallbackRequest
@@ -60,6 +63,8 @@ from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagcode import DagCode
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.team import Team
+from airflow.sdk import DAG
+from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.utils.net import get_hostname
 from airflow.utils.session import create_session
 
@@ -1238,6 +1243,141 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file_b].run_count == 2
         assert len(manager._processors) == 0
 
+    def _persist_twice(self, manager, path, *, change_file=False, index=True):
+        parsing_result = DagFileParsingResult(
+            fileloc=str(path),
+            serialized_dags=[LazyDeserializedDAG.from_dag(DAG("unchanged_dag", schedule=None))],
+        )
+        if index:
+            manager._bundle_file_indexes["testing"] = BundleFileIndex(safe_mode=True)
+        with mock.patch("airflow.dag_processing.manager.update_dag_parsing_results_in_db") as mock_update:
+            for _ in range(2):
+                if index:
+                    manager._bundle_file_indexes["testing"].scan(path.parent)
+                manager.persist_parsing_result(
+                    bundle_name="testing",
+                    bundle_version=None,
+                    parsing_result=parsing_result,
+                    run_duration=1.0,
+                    relative_fileloc=path.name,
+                    session=mock.MagicMock(),
+                )
+                if change_file:
+                    path.write_text(path.read_text() + "# changed\n")
+        return mock_update
+
+    @conf_vars({("dag_processor", "unchanged_parse_result_sync_interval"): "600"})
+    def test_persist_parsing_result_does_not_read_file(self, tmp_path):
+        path = tmp_path / "unchanged.py"
+        path.write_text("from airflow.sdk import DAG\n")
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._bundle_file_indexes["testing"] = BundleFileIndex(safe_mode=True)
+        manager._bundle_file_indexes["testing"].scan(tmp_path)
+
+        with mock.patch("builtins.open", side_effect=AssertionError("file was read")):
+            mock_update = self._persist_twice(manager, path, index=False)
+
+        mock_update.assert_called_once()
+        assert len(manager._unchanged_parse_results) == 1
+
+    @conf_vars({("dag_processor", "unchanged_parse_result_sync_interval"): "600"})
+    def test_persist_parsing_result_always_writes_files_not_indexed(self, tmp_path):
+        path = tmp_path / "unchanged.py"
+        path.write_text("from airflow.sdk import DAG\n")
+        manager = DagFileProcessorManager(max_runs=1)
+
+        mock_update = self._persist_twice(manager, path, index=False)
+
+        assert mock_update.call_count == 2
+        assert manager._unchanged_parse_results == []
+
+    @conf_vars({("dag_processor", "unchanged_parse_result_sync_interval"): "600"})
+    def test_persist_parsing_result_skips_unchanged_result(self, tmp_path):
+        path = tmp_path / "unchanged.py"
+        path.write_text("from airflow.sdk import DAG\n")
+        manager = DagFileProcessorManager(max_runs=1)
+
+        mock_update = self._persist_twice(manager, path)
+
+        mock_update.assert_called_once()
+        assert [(r.file_key, r.dag_ids) for r in manager._unchanged_parse_results] == [
+            (("testing", "unchanged.py"), ["unchanged_dag"])
+        ]
+
+    @conf_vars({("dag_processor", "unchanged_parse_result_sync_interval"): "600"})
+    def test_persist_parsing_result_writes_result_when_file_changed(self, tmp_path):
+        path = tmp_path / "changed.py"
+        path.write_text("from airflow.sdk import DAG\n")
+        manager = DagFileProcessorManager(max_runs=1)
+
+        mock_update = self._persist_twice(manager, path, change_file=True)
+
+        assert mock_update.call_count == 2
+        assert manager._unchanged_parse_results == []
+
+    @conf_vars({("dag_processor", "unchanged_parse_result_sync_interval"): "0"})
+    def test_persist_parsing_result_always_writes_when_sync_interval_is_zero(self, tmp_path):
+        path = tmp_path / "unchanged.py"
+        path.write_text("from airflow.sdk import DAG\n")
+        manager = DagFileProcessorManager(max_runs=1)
+
+        mock_update = self._persist_twice(manager, path)
+
+        assert mock_update.call_count == 2
+        assert manager._unchanged_parse_results == []
+
+    @pytest.mark.usefixtures("testing_dag_bundle")
+    def test_update_unchanged_parse_results(self, session):
+        last_parsed_time = timezone.utcnow() - timedelta(hours=1)
+        session.add(
+            DagModel(
+                dag_id="unchanged_dag",
+                bundle_name="testing",
+                relative_fileloc="unchanged.py",
+                last_parsed_time=last_parsed_time,
+                is_stale=False,
+            )
+        )
+        session.commit()
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parse_result_fingerprints[("testing", "unchanged.py")] = ("fingerprint", time.monotonic())
+        manager._parse_result_fingerprints[("testing", "deleted.py")] = ("fingerprint", time.monotonic())
+        manager._unchanged_parse_results = [
+            _UnchangedParseResult(("testing", "unchanged.py"), ["unchanged_dag"], 2.0),
+        ]
+
+        manager._update_unchanged_parse_results()
+
+        dag_model = session.scalar(select(DagModel).where(DagModel.dag_id == "unchanged_dag"))
+        session.refresh(dag_model)
+        assert dag_model.last_parsed_time > last_parsed_time
+        assert dag_model.last_parse_duration == 2.0
+        assert manager._unchanged_parse_results == []
+
+        # Dags deleted from the database make their files be fully written again
+        manager._unchanged_parse_results = [
+            _UnchangedParseResult(("testing", "deleted.py"), ["deleted_dag"], 2.0),
+        ]
+        manager._update_unchanged_parse_results()
+        assert ("testing", "deleted.py") not in manager._parse_result_fingerprints
+        assert ("testing", "unchanged.py") in manager._parse_result_fingerprints
+
+    def test_update_unchanged_parse_results_failure_forgets_fingerprints(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parse_result_fingerprints[("testing", "unchanged.py")] = ("fingerprint", time.monotonic())
+        manager._parse_result_fingerprints[("testing", "other.py")] = ("fingerprint", time.monotonic())
+        manager._unchanged_parse_results = [
+            _UnchangedParseResult(("testing", "unchanged.py"), ["unchanged_dag"], 2.0),
+        ]
+        session = mock.MagicMock()
+        session.execute.side_effect = OperationalError("UPDATE dag", {}, Exception("database is locked"))
+
+        manager._update_unchanged_parse_results(session=session)
+
+        session.rollback.assert_called_once()
+        assert manager._unchanged_parse_results == []
+        assert list(manager._parse_result_fingerprints) == [("testing", "other.py")]
+
     @pytest.mark.usefixtures("testing_dag_bundle")
     @pytest.mark.parametrize(
         ("callbacks", "path", "expected_body"),
@@ -1358,6 +1498,13 @@ class TestDagFileProcessorManager:
             last_runtime,
             tags={"bundle_name": bundle_name, "file_name": dag_filename[:-3]},
         )
+        last_cpu_time = manager._file_stats[file_info].last_cpu_time
+        assert last_cpu_time > 0
+        statsd_timing_mock.assert_any_call(
+            "dag_processing.last_cpu_time",
+            last_cpu_time,
+            tags={"bundle_name": bundle_name, "file_name": dag_filename[:-3]},
+        )
 
     @pytest.mark.usefixtures("testing_dag_bundle")
     def test_refresh_dags_dir_doesnt_delete_zipped_dags(
@@ -2599,6 +2746,36 @@ class TestDagFileProcessorManager:
         mock_update.assert_called_once_with("mock_bundle", last_refreshed=mock.ANY, version=None)
         assert manager._bundle_versions["mock_bundle"] is None
 
+    def test_find_files_in_bundle_records_changed_files(self, tmp_path):
+        """Files modified between two scans of a bundle are recorded as changed."""
+        manager = DagFileProcessorManager(max_runs=1)
+        bundle = self._make_refresh_bundle()
+        bundle.path = tmp_path
+        (tmp_path / "dag_a.py").write_text("from airflow.sdk import DAG\n")
+        (tmp_path / "dag_b.py").write_text("from airflow.sdk import DAG\n")
+
+        assert sorted(manager._find_files_in_bundle(bundle)) == [Path("dag_a.py"), Path("dag_b.py")]
+        assert manager._changed_files["mock_bundle"] == []
+
+        (tmp_path / "dag_a.py").write_text("from airflow.sdk import DAG\n# changed\n")
+        os.utime(tmp_path / "dag_a.py", ns=(1, 1))
+        assert sorted(manager._find_files_in_bundle(bundle)) == [Path("dag_a.py"), Path("dag_b.py")]
+        assert manager._changed_files["mock_bundle"] == [Path("dag_a.py")]
+
+    def test_refresh_dag_bundles_queues_changed_files_at_front(self):
+        """Files changed since the previous scan are queued to be parsed first."""
+        manager = DagFileProcessorManager(max_runs=1)
+        bundle = self._make_refresh_bundle()
+        other = DagFileInfo(rel_path=Path("other.py"), bundle_name="mock_bundle", bundle_path=bundle.path)
+        manager._file_queue = deque([other])
+        manager._changed_files["mock_bundle"] = [Path("changed.py")]
+
+        self._refresh_with_mocked_state(manager, bundle, BundleState(last_refreshed=None, version=None))
+
+        changed = DagFileInfo(rel_path=Path("changed.py"), bundle_name="mock_bundle", bundle_path=bundle.path)
+        assert list(manager._file_queue) == [changed, other]
+        assert "mock_bundle" not in manager._changed_files
+
     def test_refresh_dag_bundles_versioned_version_changed_calls_update_bundle_state(self):
         """Versioned bundle with new version: update_bundle_state called with the new version."""
         manager = DagFileProcessorManager(max_runs=1)
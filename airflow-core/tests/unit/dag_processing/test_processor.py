@@ -27,7 +27,7 @@ import uuid
 from collections.abc import Callable
 from socket import socketpair
 from typing import TYPE_CHECKING, BinaryIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import structlog
@@ -63,6 +63,7 @@ from airflow.dag_processing.processor import (
     _execute_task_callbacks,
     _parse_file,
     _pre_import_airflow_modules,
+    _preload_parsing_modules,
 )
 from airflow.models import DagRun
 from airflow.sdk import DAG, BaseOperator
@@ -467,6 +468,27 @@ class TestDagFileProcessor:
 
         assert logger.warning.call_count == 1
 
+    @conf_vars({("dag_processor", "parsing_preload_modules"): "airflow.models, non_existent_module"})
+    def test__preload_parsing_modules(self):
+        logger = MagicMock(spec=logging.Logger)
+        with patch(
+            "airflow.dag_processing.processor.importlib.import_module",
+            side_effect=[None, ModuleNotFoundError()],
+        ) as mock_import:
+            _preload_parsing_modules(logger)
+
+        assert mock_import.call_args_list == [call("airflow.models"), call("non_existent_module")]
+        logger.warning.assert_called_once()
+        assert "non_existent_module" in logger.warning.call_args[0][1]
+
+    @conf_vars({("dag_processor", "parsing_preload_modules"): ""})
+    def test__preload_parsing_modules_when_empty(self):
+        logger = MagicMock(spec=logging.Logger)
+        with patch("airflow.dag_processing.processor.importlib.import_module") as mock_import:
+            _preload_parsing_modules(logger)
+
+        mock_import.assert_not_called()
+
 
 def write_dag_in_a_fn_to_file(fn: Callable[[], None], folder: pathlib.Path) -> pathlib.Path:
     # Create the dag in a fn, and use inspect.getsource to write it to a file so that
@@ -679,11 +701,12 @@ def test_normal_parsing_updates_timestamps():
         finish_time=finish_time,
         run_count=3,
         bundle_name="test-bundle",
-        parsing_result=DagFileParsingResult(fileloc="test.py", serialized_dags=[]),
+        parsing_result=DagFileParsingResult(fileloc="test.py", serialized_dags=[], cpu_time=0.5),
         is_callback_only=False,
     )
 
     assert stat.last_finish_time == finish_time
+    assert stat.last_cpu_time == 0.5
     assert stat.run_count == 4
     assert stat.import_errors == 0
 
@@ -716,6 +739,7 @@ def test_persist_parsing_result_calls_update_db():
     )
 
     manager = MagicMock(spec=DagFileProcessorManager)
+    manager.unchanged_parse_result_sync_interval = 0
     session = MagicMock()
     # Call the real method on the mock instance
     with patch(
@@ -175,6 +175,70 @@ def test_gauge_executor_metrics_single_executor(mock_stats_gauge, mock_trigger_t
     mock_stats_gauge.assert_has_calls(calls)
 
 
+@conf_vars({("core", "executor_event_buffer_size"): "2"})
+@mock.patch("airflow.executors.base_executor.BaseExecutor.sync")
+@mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
+@mock.patch("airflow.executors.base_executor.stats")
+def test_full_event_buffer_stops_new_workloads(mock_stats, mock_trigger_tasks, mock_sync):
+    executor = BaseExecutor()
+    tags = {"executor_class_name": "BaseExecutor"}
+
+    executor.success(TaskInstanceKey("my_dag", "task_1", "run_id", 1))
+    executor.heartbeat()
+    assert not executor.event_buffer_full
+    mock_trigger_tasks.assert_called_once()
+    mock_stats.gauge.assert_any_call("executor.event_buffer_size", 1, tags=tags)
+
+    mock_trigger_tasks.reset_mock()
+    executor.success(TaskInstanceKey("my_dag", "task_2", "run_id", 1))
+    executor.heartbeat()
+    assert executor.event_buffer_full
+    mock_trigger_tasks.assert_not_called()
+    mock_sync.assert_called()
+    mock_stats.incr.assert_called_once_with("executor.event_buffer_full", tags=tags)
+
+    executor.get_event_buffer()
+    assert not executor.event_buffer_full
+
+
+@conf_vars({("core", "executor_event_buffer_size"): "2"})
+@mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
+@mock.patch("airflow.executors.base_executor.stats")
+def test_event_buffer_filled_by_sync_stops_new_workloads(mock_stats, mock_trigger_tasks):
+    executor = BaseExecutor()
+    tags = {"executor_class_name": "BaseExecutor"}
+
+    def sync():
+        for i in range(2):
+            executor.success(TaskInstanceKey("my_dag", f"task_{i}", "run_id", 1))
+
+    with mock.patch.object(executor, "sync", side_effect=sync):
+        executor.heartbeat()
+        mock_trigger_tasks.assert_called_once()
+        mock_stats.gauge.assert_any_call("executor.event_buffer_size", 2, tags=tags)
+
+        # The scheduler processes the events sync buffered before the next heartbeat.
+        assert len(executor.get_event_buffer()) == 2
+        mock_trigger_tasks.reset_mock()
+        executor.heartbeat()
+        mock_trigger_tasks.assert_not_called()
+        mock_stats.incr.assert_called_once_with("executor.event_buffer_full", tags=tags)
+
+        # Once sync no longer fills the buffer, new workloads are started again.
+        executor.get_event_buffer()
+        executor.sync.side_effect = None
+        executor.heartbeat()
+        executor.heartbeat()
+        mock_trigger_tasks.assert_called_once()
+
+
+def test_event_buffer_is_not_bounded_by_default():
+    executor = BaseExecutor()
+    for i in range(100):
+        executor.success(TaskInstanceKey("my_dag", f"task_{i}", "run_id", 1))
+    assert not executor.event_buffer_full
+
+
 @pytest.mark.parametrize(
     ("executor_class", "executor_name"),
     [(LocalExecutor, "LocalExecutor")],
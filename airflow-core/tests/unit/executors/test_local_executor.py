@@ -29,13 +29,14 @@ from uuid6 import uuid7
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
 from airflow.executors.base_executor import BaseExecutor, ExecutorConf, get_execution_api_server_url
-from airflow.executors.local_executor import LocalExecutor
+from airflow.executors.local_executor import LocalExecutor, _SharedMemoryResultQueue
 from airflow.executors.workloads.base import BundleInfo
 from airflow.executors.workloads.callback import CallbackDTO
 from airflow.executors.workloads.task import TaskInstanceDTO
 from airflow.models.callback import CallbackFetchMethod
+from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.settings import Session
-from airflow.utils.state import State
+from airflow.utils.state import CallbackState, State, TaskInstanceState
 
 from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.markers import skip_if_force_lowest_dependencies_marker
@@ -137,8 +138,9 @@ class TestLocalExecutor:
             executor.end()
 
     @skip_non_fork_mp_start
+    @pytest.mark.parametrize("high_throughput", [False, True])
     @mock.patch("airflow.executors.base_executor.BaseExecutor.run_workload")
-    def test_execution(self, mock_run_workload):
+    def test_execution(self, mock_run_workload, high_throughput):
         success_tis = [
             TaskInstanceDTO(
                 id=uuid7(),
@@ -170,7 +172,9 @@ class TestLocalExecutor:
 
         mock_run_workload.side_effect = fake_run_workload
 
-        executor = LocalExecutor(parallelism=2)
+        with conf_vars({("core", "local_executor_high_throughput"): str(high_throughput)}):
+            executor = LocalExecutor(parallelism=2)
+        assert executor.high_throughput is high_throughput
 
         with spy_on(executor._spawn_worker) as spawn_worker:
             executor.start()
@@ -242,6 +246,65 @@ class TestLocalExecutor:
         ]
         mock_stats_gauge.assert_has_calls(calls)
 
+    @conf_vars({("core", "executor_event_buffer_size"): "2"})
+    def test_results_stay_queued_while_event_buffer_is_full(self):
+        executor = LocalExecutor()
+        executor.result_queue = multiprocessing.SimpleQueue()
+        keys = [TaskInstanceKey("dag", f"task_{i}", "run_id", 1) for i in range(3)]
+        for key in keys:
+            executor.result_queue.put((key, State.SUCCESS, None))
+
+        executor._read_results()
+        assert list(executor.get_event_buffer()) == keys[:2]
+
+        executor._read_results()
+        assert list(executor.get_event_buffer()) == keys[2:]
+        executor.result_queue.close()
+
+    @skip_non_fork_mp_start
+    @conf_vars({("core", "local_executor_high_throughput"): "True"})
+    @mock.patch.object(gc, "freeze")
+    @mock.patch("airflow.executors.local_executor.importlib.import_module")
+    def test_high_throughput_mode_pre_imports_before_gc_freeze(self, mock_import_module, mock_freeze):
+        manager = mock.Mock()
+        manager.attach_mock(mock_import_module, "import_module")
+        manager.attach_mock(mock_freeze, "freeze")
+        executor = LocalExecutor(parallelism=1)
+        with mock.patch.object(executor, "_spawn_worker"):
+            executor._spawn_workers_with_gc_freeze(1)
+
+        assert manager.mock_calls == [
+            mock.call.import_module("airflow.sdk.execution_time.supervisor"),
+            mock.call.import_module("airflow.sdk.execution_time.task_runner"),
+            mock.call.freeze(),
+        ]
+
+    @skip_fork_mp_start
+    @conf_vars({("core", "local_executor_high_throughput"): "True"})
+    def test_high_throughput_mode_needs_fork(self):
+        assert not LocalExecutor().high_throughput
+
+    def test_shared_memory_result_queue(self):
+        result_queue = _SharedMemoryResultQueue(1024)
+        ti_key = TaskInstanceKey("dag", "task", "run_id", 2, 3)
+        callback_key = str(uuid7())
+        try:
+            assert result_queue.empty()
+            result_queue.put((ti_key, State.RUNNING, None))
+            result_queue.put((ti_key, State.FAILED, RuntimeError("boom")))
+            result_queue.put((callback_key, CallbackState.SUCCESS, None))
+
+            assert result_queue.get() == (ti_key, State.RUNNING, None)
+            key, state, exc = result_queue.get()
+            assert isinstance(key, TaskInstanceKey)
+            assert state is TaskInstanceState.FAILED
+            assert exc is None
+            assert not result_queue.empty()
+            assert result_queue.get() == (callback_key, CallbackState.SUCCESS, None)
+            assert result_queue.empty()
+        finally:
+            result_queue.close()
+
     @skip_if_force_lowest_dependencies_marker
     @pytest.mark.execution_timeout(30)
     def test_clean_stop_on_signal(self):
@@ -56,7 +56,7 @@ from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.executors.local_executor import LocalExecutor
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import DagRunShard, IncrementalConcurrencyMap, SchedulerJobRunner
 from airflow.models.asset import (
     AssetActive,
     AssetAliasModel,
@@ -436,9 +436,10 @@ class TestSchedulerJob:
         assert idle_runs_val == num_runs, "Scheduler exits when idle run count reaches num_runs"
         assert total_runs_val > idle_runs_val, "Some runs should not be idle"
 
+    @pytest.mark.parametrize("bulk", [False, True])
     @mock.patch("airflow.jobs.scheduler_job_runner.TaskCallbackRequest")
     @mock.patch("airflow._shared.observability.metrics.stats._get_backend")
-    def test_process_executor_events(self, mock_get_backend, mock_task_callback, dag_maker):
+    def test_process_executor_events(self, mock_get_backend, mock_task_callback, dag_maker, bulk):
         mock_stats = mock.MagicMock(spec=StatsLogger)
         mock_get_backend.return_value = mock_stats
         dag_id = "test_process_executor_events"
@@ -456,6 +457,7 @@ class TestSchedulerJob:
         mock_task_callback.return_value = task_callback
         scheduler_job = Job()
         self.job_runner = SchedulerJobRunner(job=scheduler_job, executors=[executor])
+        self.job_runner._bulk_process_executor_events = bulk
         ti1.state = State.QUEUED
         session.merge(ti1)
         session.commit()
@@ -489,8 +491,9 @@ class TestSchedulerJob:
             any_order=True,
         )
 
+    @pytest.mark.parametrize("bulk", [False, True])
     @mock.patch("airflow.jobs.scheduler_job_runner.TaskCallbackRequest", spec=TaskCallbackRequest)
-    def test_process_executor_events_restarting_cleared_task(self, mock_task_callback, dag_maker):
+    def test_process_executor_events_restarting_cleared_task(self, mock_task_callback, dag_maker, bulk):
         """
         Test processing of RESTARTING task instances by scheduler's _process_executor_events.
 
@@ -529,6 +532,7 @@ class TestSchedulerJob:
         mock_task_callback.return_value = task_callback
         scheduler_job = Job()
         job_runner = SchedulerJobRunner(scheduler_job, executors=[executor])
+        job_runner._bulk_process_executor_events = bulk
 
         # Simulate executor reporting task completion (this triggers the bug scenario)
         executor.event_buffer[ti1.key] = State.SUCCESS, None
@@ -747,10 +751,11 @@ class TestSchedulerJob:
         ti1.refresh_from_db()
         assert ti1.state == State.FAILED
 
+    @pytest.mark.parametrize("bulk", [False, True])
     @mock.patch("airflow.jobs.scheduler_job_runner.TaskCallbackRequest")
     @mock.patch("airflow._shared.observability.metrics.stats._get_backend")
     def test_process_executor_events_ti_requeued(
-        self, mock_get_backend, mock_task_callback, dag_maker, caplog
+        self, mock_get_backend, mock_task_callback, dag_maker, caplog, bulk
     ):
         mock_stats = mock.MagicMock(spec=StatsLogger)
         mock_get_backend.return_value = mock_stats
@@ -771,6 +776,7 @@ class TestSchedulerJob:
         session.add(scheduler_job)
         session.flush()
         self.job_runner = SchedulerJobRunner(scheduler_job, executors=[executor])
+        self.job_runner._bulk_process_executor_events = bulk
 
         # ti is queued with another try number - do not fail it
         ti1.state = State.QUEUED
@@ -854,6 +860,56 @@ class TestSchedulerJob:
         mock_task_callback.assert_not_called()
         mock_stats.incr.assert_not_called()
 
+    @mock.patch("airflow._shared.observability.metrics.stats._get_backend")
+    def test_process_executor_events_in_bulk(self, mock_get_backend, dag_maker, session):
+        mock_stats = mock.MagicMock(spec=StatsLogger)
+        mock_get_backend.return_value = mock_stats
+        with dag_maker(dag_id="test_process_executor_events_in_bulk", session=session):
+            EmptyOperator(task_id="running")
+            EmptyOperator(task_id="succeeded")
+            EmptyOperator(task_id="killed")
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        tis["running"].state = State.RUNNING
+        tis["succeeded"].state = State.SUCCESS
+        tis["killed"].state = State.QUEUED
+        session.commit()
+
+        executor = MockExecutor(do_update=False)
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(scheduler_job, executors=[executor])
+        self.job_runner._bulk_process_executor_events = True
+        executor.event_buffer[tis["running"].key] = State.RUNNING, "external_id"
+        executor.event_buffer[tis["succeeded"].key] = State.SUCCESS, None
+        executor.event_buffer[tis["killed"].key] = State.FAILED, None
+        mock_stats.incr.reset_mock()
+
+        process_in_bulk = SchedulerJobRunner._process_task_events_in_bulk
+        remaining = []
+
+        def spy(**kwargs):
+            remaining.extend(process_in_bulk(**kwargs))
+            return remaining
+
+        with mock.patch.object(SchedulerJobRunner, "_process_task_events_in_bulk", side_effect=spy):
+            self.job_runner._process_executor_events(executor=executor, session=session)
+        session.commit()
+
+        # Only the task instance killed externally is left to be processed in full
+        assert remaining == [tis["killed"].key]
+        states = {
+            ti.task_id: (ti.state, ti.external_executor_id) for ti in dr.get_task_instances(session=session)
+        }
+        assert states == {
+            "running": (State.RUNNING, "external_id"),
+            "succeeded": (State.SUCCESS, None),
+            "killed": (State.FAILED, None),
+        }
+        mock_stats.incr.assert_any_call(
+            "scheduler.tasks.killed_externally",
+            tags={"dag_id": dr.dag_id, "task_id": "killed"},
+        )
+
     @pytest.mark.usefixtures("testing_dag_bundle")
     def test_process_executor_events_with_asset_events(self, session, dag_maker):
         """
@@ -1217,6 +1273,33 @@ class TestSchedulerJob:
 
         patch_traceback_extract_stack.assert_called()
 
+    @conf_vars({("scheduler", "profile_loop_phases"): "True"})
+    def test_loop_phases_are_profiled(self, caplog, dag_maker):
+        with dag_maker(dag_id="test_loop_phases_are_profiled"):
+            EmptyOperator(task_id="dummy")
+        dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, num_runs=1, executors=[self.null_exec])
+        run_job(scheduler_job, execute_callable=self.job_runner._execute)
+
+        profiler_stats = self.job_runner._loop_profiler.stats
+        do_scheduling = ("scheduler_loop", "do_scheduling")
+        assert {
+            do_scheduling + ("schedule_all_dag_runs",),
+            do_scheduling + ("critical_section",),
+            ("scheduler_loop", "executor_heartbeat"),
+            ("scheduler_loop", "process_executor_events"),
+        } <= set(profiler_stats)
+        assert profiler_stats[do_scheduling].calls == 1
+        assert profiler_stats[do_scheduling + ("schedule_all_dag_runs",)].queries > 0
+        # Queries are no longer counted once the scheduler has stopped
+        assert self.job_runner._loop_profiler._engine is None
+
+        with caplog.at_level(logging.INFO, logger="airflow.jobs.scheduler_job_runner"):
+            self.job_runner._debug_dump(1, mock.MagicMock())
+        assert "scheduler_loop;do_scheduling;schedule_all_dag_runs;[sql] " in caplog.text
+
     def test_find_executable_task_instances_backfill(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_backfill"
         task_id_1 = "dummy"
@@ -2082,6 +2165,153 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "300"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        """The scheduler-resident concurrency map is updated from queueing and executor events."""
+        with dag_maker(dag_id="incremental_concurrency_map", max_active_tasks=16, session=session):
+            EmptyOperator(task_id="task", max_active_tis_per_dag=1)
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+        assert isinstance(self.job_runner._concurrency_map, IncrementalConcurrencyMap)
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, run_id="run_1", session=session)
+        dr2 = dag_maker.create_dagrun_after(
+            dr1, run_type=DagRunType.SCHEDULED, run_id="run_2", session=session
+        )
+        for dr in (dr1, dr2):
+            for ti in dr.get_task_instances(session=session):
+                ti.state = State.SCHEDULED
+                session.merge(ti)
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.run_id for ti in queued_tis] == ["run_1"]
+
+        # The task finishing in the DB is not visible until the executor reports it or the map is reconciled
+        ti = dr1.get_task_instance("task", session=session)
+        ti.state = State.SUCCESS
+        session.merge(ti)
+        session.flush()
+        assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+
+        executor.event_buffer[ti.key] = State.SUCCESS, None
+        self.job_runner._process_executor_events(executor=executor, session=session)
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.run_id for ti in queued_tis] == ["run_2"]
+
+        session.rollback()
+
+    def test_incremental_concurrency_map_reconcile_reports_drift(self, dag_maker, session):
+        with dag_maker(dag_id="incremental_concurrency_map_drift", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+
+        ti1, ti2 = dag_maker.create_dagrun(session=session).get_task_instances(session=session)
+        ti1.state = State.RUNNING
+        ti2.state = State.DEFERRED
+        session.merge(ti1)
+        session.merge(ti2)
+        session.flush()
+
+        concurrency_map = IncrementalConcurrencyMap(reconcile_interval=300)
+        assert concurrency_map.reconcile(session=session) == 0
+        assert concurrency_map.dag_run_active_tasks_map[(ti1.dag_id, ti1.run_id)] == 1
+        assert concurrency_map.task_concurrency_map[(ti2.dag_id, ti2.task_id)] == 1
+
+        ti1.state = State.SUCCESS
+        session.merge(ti1)
+        session.flush()
+
+        # Not due for reconciliation yet, so the stale count is kept
+        concurrency_map.load(session=session)
+        assert concurrency_map.dag_run_active_tasks_map[(ti1.dag_id, ti1.run_id)] == 1
+
+        assert concurrency_map.reconcile(session=session) == 1
+        assert (ti1.dag_id, ti1.run_id) not in concurrency_map.dag_run_active_tasks_map
+        assert concurrency_map.task_concurrency_map[(ti2.dag_id, ti2.task_id)] == 1
+
+    def test_dag_run_shard_rebalances_on_heartbeat_loss(self, dag_maker, session):
+        dag_ids = [f"dag_run_shard_{i}" for i in range(10)]
+        for dag_id in dag_ids:
+            with dag_maker(dag_id=dag_id, session=session):
+                EmptyOperator(task_id="task")
+        job_1 = Job(job_type=SchedulerJobRunner.job_type, state=State.RUNNING)
+        job_2 = Job(job_type=SchedulerJobRunner.job_type, state=State.RUNNING)
+        session.add_all([job_1, job_2])
+        session.flush()
+
+        shard_1 = DagRunShard(health_check_threshold=30)
+        shard_2 = DagRunShard(health_check_threshold=30)
+        assert shard_1.refresh(job_1.id, session=session)
+        assert shard_2.refresh(job_2.id, session=session)
+        assert shard_1.dag_ids
+        assert shard_2.dag_ids
+        assert sorted(shard_1.dag_ids + shard_2.dag_ids) == sorted(dag_ids)
+
+        # Nothing changed, the ring is kept
+        assert not shard_1.refresh(job_1.id, session=session)
+
+        job_2.latest_heartbeat = timezone.utcnow() - timedelta(seconds=60)
+        session.flush()
+        assert shard_1.refresh(job_1.id, session=session)
+        assert sorted(shard_1.dag_ids) == sorted(dag_ids)
+
+    def test_dag_run_shard_reloads_dag_ids_when_active_dags_change(self, dag_maker, session):
+        for dag_id in ("dag_run_shard_a", "dag_run_shard_b"):
+            with dag_maker(dag_id=dag_id, session=session):
+                EmptyOperator(task_id="task")
+        job = Job(job_type=SchedulerJobRunner.job_type, state=State.RUNNING)
+        session.add(job)
+        session.flush()
+
+        shard = DagRunShard(health_check_threshold=30)
+        shard.refresh(job.id, session=session)
+        assert sorted(shard.dag_ids) == ["dag_run_shard_a", "dag_run_shard_b"]
+
+        # The owned Dag ids are not loaded again while the active Dags are the same
+        with mock.patch.object(session, "scalars", wraps=session.scalars) as mock_scalars:
+            shard.refresh(job.id, session=session)
+        assert mock_scalars.call_count == 1
+
+        session.execute(update(DagModel).where(DagModel.dag_id == "dag_run_shard_a").values(is_paused=True))
+        shard.refresh(job.id, session=session)
+        assert shard.dag_ids == ["dag_run_shard_b"]
+
+        # Pausing and unpausing a Dag at once is caught once health_check_threshold has passed
+        session.execute(
+            update(DagModel)
+            .where(DagModel.dag_id.in_(["dag_run_shard_a", "dag_run_shard_b"]))
+            .values(is_paused=DagModel.dag_id == "dag_run_shard_b")
+        )
+        shard.refresh(job.id, session=session)
+        assert shard.dag_ids == ["dag_run_shard_b"]
+        shard._dag_ids_loaded_at -= 30
+        shard.refresh(job.id, session=session)
+        assert shard.dag_ids == ["dag_run_shard_a"]
+
+    @conf_vars({("scheduler", "shard_dag_runs"): "True"})
+    def test_find_executable_task_instances_dag_run_shard(self, dag_maker, session):
+        """Only task instances of the Dags owned by the scheduler are queued."""
+        for dag_id in ("dag_run_shard_owned", "dag_run_shard_not_owned"):
+            with dag_maker(dag_id=dag_id, session=session):
+                EmptyOperator(task_id="task")
+            dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+            for ti in dr.get_task_instances(session=session):
+                ti.state = State.SCHEDULED
+                session.merge(ti)
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[MockExecutor(do_update=False)])
+        assert self.job_runner._dag_run_shard is not None
+        self.job_runner._dag_run_shard.dag_ids = ["dag_run_shard_owned"]
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.dag_id for ti in queued_tis] == ["dag_run_shard_owned"]
+        assert [dr.dag_id for dr in DagRun.get_running_dag_runs_to_examine(session, dag_ids=[])] == []
+
+        session.rollback()
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag"
@@ -5008,7 +5238,7 @@ class TestSchedulerJob:
         ],
     )
     @patch("airflow.timetables.base.Timetable.next_run_info_from_dag_model")
-    @patch("airflow.serialization.definitions.dag.SerializedDAG.create_dagrun")
+    @patch("airflow.jobs.scheduler_job_runner.bulk_create_dagruns")
     def test_should_use_info_from_timetable(self, mock_create, mock_next, expected, session, dag_maker):
         """We should always update next_dagrun after scheduler creates a new dag run."""
         mock_next.return_value = expected
@@ -5018,13 +5248,7 @@ class TestSchedulerJob:
         scheduler_job = Job()
         self.job_runner = SchedulerJobRunner(job=scheduler_job, executors=[self.null_exec])
         self.job_runner._create_dag_runs(dag_models=[dag_maker.dag_model], session=session)
-        kwargs = mock_create.call_args.kwargs
-        actual = DagRunInfo(
-            run_after=kwargs["run_after"],
-            data_interval=kwargs["data_interval"],
-            partition_key=kwargs["partition_key"],
-            partition_date=None,
-        )
+        [(_, _, actual)] = mock_create.call_args.args[0]
         assert actual == expected
 
     @pytest.mark.parametrize(
@@ -5104,6 +5328,32 @@ class TestSchedulerJob:
         assert dr.start_date is None
         assert dr.creating_job_id == scheduler_job.id
 
+    def test_create_dag_runs_of_several_dags(self, dag_maker, session):
+        """The runs of several dags and their task instances are created together."""
+        dag_models = []
+        for dag_id in ("dag_a", "dag_b", "dag_c"):
+            with dag_maker(dag_id=dag_id, schedule="@daily", catchup=True, session=session):
+                EmptyOperator(task_id="task_1") >> EmptyOperator(task_id="task_2")
+            dag_models.append(dag_maker.dag_model)
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, executors=[self.null_exec])
+        self.job_runner._create_dag_runs(dag_models, session)
+
+        dag_runs = session.scalars(select(DagRun).order_by(DagRun.dag_id)).all()
+        assert [(dr.dag_id, dr.logical_date, dr.state) for dr in dag_runs] == [
+            (dag_id, DEFAULT_DATE, DagRunState.QUEUED) for dag_id in ("dag_a", "dag_b", "dag_c")
+        ]
+        for dr in dag_runs:
+            assert dr.creating_job_id == scheduler_job.id
+            assert dr.created_dag_version_id is not None
+            assert sorted(ti.task_id for ti in dr.get_task_instances(session=session)) == [
+                "task_1",
+                "task_2",
+            ]
+        for dag_model in dag_models:
+            assert dag_model.next_dagrun == DEFAULT_DATE + timedelta(days=1)
+
     @pytest.mark.need_serialized_dag
     def test_create_dag_runs_assets(self, session, dag_maker):
         """
@@ -5573,6 +5823,52 @@ class TestSchedulerJob:
 
             assert mock_schedule.call_count == 1
 
+    @conf_vars({("scheduler", "batch_schedule_dag_runs"): "True"})
+    def test_schedule_all_dag_runs_in_batch(self, dag_maker, session):
+        """
+        Batch mode fetches the TIs of all runs at once and schedules them with shared UPDATEs.
+
+        The latest versions of the dags are looked up once for all runs too.
+        """
+        dag_runs = []
+        for dag_id in ("batch_dag_1", "batch_dag_2"):
+            with dag_maker(dag_id=dag_id, schedule="@once", session=session):
+                BashOperator(task_id="first", bash_command="true") >> BashOperator(
+                    task_id="second", bash_command="true"
+                )
+            dag_runs.append(dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session))
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+
+        from airflow.utils.sqlalchemy import prohibit_commit
+
+        with (
+            mock.patch.object(
+                DagRun, "fetch_task_instances_for_dag_runs", wraps=DagRun.fetch_task_instances_for_dag_runs
+            ) as mock_fetch,
+            mock.patch.object(DagRun, "bulk_schedule_tis", wraps=DagRun.bulk_schedule_tis) as mock_schedule,
+            mock.patch.object(DagRun, "schedule_tis") as mock_schedule_per_run,
+            mock.patch.object(
+                DagVersion, "get_latest_versions", wraps=DagVersion.get_latest_versions
+            ) as mock_latest_versions,
+            mock.patch.object(DagVersion, "get_latest_version") as mock_latest_version,
+            prohibit_commit(session) as guard,
+        ):
+            result = self.job_runner._schedule_all_dag_runs(guard, dag_runs, session=session)
+
+        assert [dag_run for dag_run, _ in result] == dag_runs
+        mock_latest_versions.assert_called_once()
+        mock_latest_version.assert_not_called()
+        mock_fetch.assert_called_once()
+        mock_schedule.assert_called_once()
+        mock_schedule_per_run.assert_not_called()
+        session.expire_all()
+        for dag_run in dag_runs:
+            tis = {ti.task_id: ti.state for ti in dag_run.get_task_instances(session=session)}
+            assert tis == {"first": TaskInstanceState.SCHEDULED, "second": None}
+            assert dag_run.scheduled_by_job_id == self.job_runner.job.id
+
     def test_bulk_write_to_db_external_trigger_dont_skip_scheduled_run(self, dag_maker, testing_dag_bundle):
         """
         Test that externally triggered Dag Runs should not affect (by skipping) next
@@ -7806,10 +8102,10 @@ class TestSchedulerJob:
         self.job_runner._remove_unreferenced_triggers(session=session)
         assert session.scalar(select(func.count()).select_from(Trigger)) == 0
 
-    @patch("airflow.serialization.serialized_objects.SerializedDAG.create_dagrun")
-    def test_misconfigured_dags_doesnt_crash_scheduler(self, mock_create, session, dag_maker, caplog):
+    @patch("airflow.serialization.serialized_objects.SerializedDAG.validate_new_dagrun")
+    def test_misconfigured_dags_doesnt_crash_scheduler(self, mock_validate, session, dag_maker, caplog):
         """Test that if dagrun creation throws an exception, the scheduler doesn't crash"""
-        mock_create.side_effect = [ValueError("something bad")]
+        mock_validate.side_effect = [ValueError("something bad")]
         with dag_maker("testdag1", serialized=True):
             BashOperator(task_id="task", bash_command="echo 1")
 
@@ -7823,6 +8119,39 @@ class TestSchedulerJob:
         job_runner._create_dag_runs([dm1], session)
         assert "Failed creating DagRun" in caplog.text
 
+    def test_failed_task_instance_creation_doesnt_prevent_other_dag_runs(self, session, dag_maker, caplog):
+        """If creating the task instances of one dag fails, the runs of the other dags are still created."""
+        dag_models = []
+        for dag_id in ("dag_a", "dag_bad", "dag_c"):
+            with dag_maker(dag_id=dag_id, schedule="@daily", catchup=True, session=session):
+                EmptyOperator(task_id="task")
+            dag_models.append(dag_maker.dag_model)
+
+        missing_tasks = DagRun._missing_tasks
+
+        def fail_for_bad_dag(dag_run, dag, task_ids):
+            if dag_run.dag_id == "dag_bad":
+                raise ValueError("something bad")
+            return missing_tasks(dag_run, dag, task_ids)
+
+        scheduler_job = Job()
+        job_runner = SchedulerJobRunner(job=scheduler_job, executors=[self.null_exec])
+        with patch.object(DagRun, "_missing_tasks", autospec=True, side_effect=fail_for_bad_dag):
+            job_runner._create_dag_runs(dag_models, session)
+        session.flush()
+
+        assert "Failed creating DagRuns in bulk" in caplog.text
+        assert "Failed creating DagRun" in caplog.text
+        dag_runs = session.scalars(select(DagRun).order_by(DagRun.dag_id)).all()
+        assert [dr.dag_id for dr in dag_runs] == ["dag_a", "dag_c"]
+        for dr in dag_runs:
+            assert [ti.task_id for ti in dr.get_task_instances(session=session)] == ["task"]
+        assert [dag_model.next_dagrun for dag_model in dag_models] == [
+            DEFAULT_DATE + timedelta(days=1),
+            DEFAULT_DATE,
+            DEFAULT_DATE + timedelta(days=1),
+        ]
+
     def test_activate_referenced_assets_no_in_check_inside_query(self, session, testing_dag_bundle):
         dag_id1 = "test_asset_dag1"
         asset1_name = "asset1"
@@ -61,6 +61,8 @@ from airflow.jobs.triggerer_job_runner import (
     TriggerRunner,
     TriggerRunnerSupervisor,
     _make_trigger_span,
+    _RunTime,
+    _TimedCoroutine,
     messages,
 )
 from airflow.models import Connection, DagModel, DagRun, Trigger, Variable
@@ -356,6 +358,75 @@ def test_start_without_job_generates_uuid_id(mocker):
     fake_proc.send_msg.assert_called_once()
 
 
+def test_start_with_several_runner_processes(mocker):
+    """Every runner subprocess gets its own supervisor, all sharing one selector."""
+    from airflow.sdk.execution_time.supervisor import WatchedSubprocess
+
+    procs = [mocker.Mock(shards=[]) for _ in range(3)]
+    calls: list[dict] = []
+
+    @classmethod
+    def fake_super_start(cls, **kwargs):
+        calls.append(kwargs)
+        return procs[len(calls) - 1]
+
+    mocker.patch.object(WatchedSubprocess, "start", fake_super_start)
+
+    proc = TriggerRunnerSupervisor.start(capacity=10, runner_processes=3)
+
+    assert proc is procs[0]
+    assert proc.shards == procs[1:]
+    assert len({id(call["selector"]) for call in calls}) == 1
+    for p in procs:
+        p.send_msg.assert_called_once()
+
+
+def test_update_triggers_shards_trigger_ids(supervisor_builder, mocker):
+    supervisor = supervisor_builder()
+    supervisor.shards = [supervisor_builder(), supervisor_builder()]
+    mocker.patch.object(
+        TriggerRunnerSupervisor,
+        "build_trigger_workloads",
+        side_effect=lambda ids: [
+            workloads.RunTrigger.model_construct(id=i, classpath="", encrypted_kwargs="") for i in ids
+        ],
+    )
+
+    supervisor.update_triggers(set(range(1, 10)))
+
+    assert [{w.id for w in runner.creating_triggers} for runner in supervisor.runners] == [
+        {3, 6, 9},
+        {1, 4, 7},
+        {2, 5, 8},
+    ]
+
+
+def test_supervisor_not_alive_when_a_shard_exited(supervisor_builder):
+    import psutil
+
+    supervisor = supervisor_builder()
+    shard = supervisor_builder()
+    supervisor.shards = [shard]
+    shard._process.wait.side_effect = psutil.TimeoutExpired(0)
+    assert supervisor.is_alive()
+
+    shard._exit_code = -9
+    assert not supervisor.is_alive()
+
+
+def test_heartbeat_skipped_when_a_shard_is_silent(supervisor_builder, mocker):
+    supervisor = supervisor_builder()
+    shard = supervisor_builder()
+    supervisor.shards = [shard]
+    perform_heartbeat_mock = mocker.patch("airflow.jobs.triggerer_job_runner.perform_heartbeat")
+
+    supervisor._last_runner_comms = time.monotonic()
+    shard._last_runner_comms = time.monotonic() - 9999.0
+    supervisor.heartbeat()
+
+    perform_heartbeat_mock.assert_not_called()
+
+
 def test_heartbeat_raises_without_job(jobless_supervisor, mocker):
     """heartbeat() must fail loudly when job is None so missing subclass overrides surface."""
     perform_heartbeat = mocker.patch("airflow.jobs.triggerer_job_runner.perform_heartbeat")
@@ -443,6 +514,85 @@ def test_emit_metrics_uses_metric_tags_override(jobless_supervisor, mocker):
         assert call.kwargs["tags"] == {"hostname": "astro-host", "deployment": "demo"}
 
 
+def test_emit_metrics_emits_reported_runtime_stats(jobless_supervisor, mocker):
+    timing = mocker.patch("airflow.jobs.triggerer_job_runner.stats.timing")
+    mocker.patch("airflow.jobs.triggerer_job_runner.stats.gauge")
+    mocker.patch.object(TriggerRunnerSupervisor, "metric_tags", return_value={"hostname": "host"})
+    runtime_stats = messages.TriggerRuntimeStats(
+        loop_lag=[0.002, 0.7],
+        run_times={"my.Trigger": messages.TriggerRunTime(wall_time=0.5, cpu_time=0.25, steps=3)},
+    )
+
+    jobless_supervisor.record_runtime_stats(runtime_stats)
+    jobless_supervisor.record_runtime_stats(runtime_stats)
+    jobless_supervisor._last_loop_lag_emit -= jobless_supervisor.job_heartbeat_sec
+    jobless_supervisor.emit_metrics()
+
+    assert timing.call_args_list == [
+        mock.call("triggerer.event_loop_lag.max", datetime.timedelta(seconds=0.7), tags={"hostname": "host"}),
+        mock.call(
+            "triggerer.event_loop_lag.avg", datetime.timedelta(seconds=0.351), tags={"hostname": "host"}
+        ),
+        mock.call(
+            "triggers.run_wall_time",
+            datetime.timedelta(seconds=1.0),
+            tags={"hostname": "host", "classpath": "my.Trigger"},
+        ),
+        mock.call(
+            "triggers.run_cpu_time",
+            datetime.timedelta(seconds=0.5),
+            tags={"hostname": "host", "classpath": "my.Trigger"},
+        ),
+    ]
+    # The debug dump keeps the totals
+    assert jobless_supervisor._loop_lag_histogram == [2, 0, 0, 0, 2, 0, 0]
+    assert jobless_supervisor._run_times["my.Trigger"].steps == 6
+
+    timing.reset_mock()
+    jobless_supervisor.emit_metrics()
+    timing.assert_not_called()
+
+
+def test_emit_metrics_aggregates_loop_lag_over_heartbeat_interval(jobless_supervisor, mocker):
+    timing = mocker.patch("airflow.jobs.triggerer_job_runner.stats.timing")
+    mocker.patch("airflow.jobs.triggerer_job_runner.stats.gauge")
+    mocker.patch.object(TriggerRunnerSupervisor, "metric_tags", return_value={"hostname": "host"})
+
+    jobless_supervisor.record_runtime_stats(messages.TriggerRuntimeStats(loop_lag=[0.1, 0.3]))
+    jobless_supervisor.emit_metrics()
+    # Samples reported within the heartbeat interval are kept until it elapses
+    timing.assert_not_called()
+    jobless_supervisor.record_runtime_stats(messages.TriggerRuntimeStats(loop_lag=[0.2]))
+
+    jobless_supervisor._last_loop_lag_emit -= jobless_supervisor.job_heartbeat_sec
+    jobless_supervisor.emit_metrics()
+    assert timing.call_args_list == [
+        mock.call("triggerer.event_loop_lag.max", datetime.timedelta(seconds=0.3), tags={"hostname": "host"}),
+        mock.call("triggerer.event_loop_lag.avg", datetime.timedelta(seconds=0.2), tags={"hostname": "host"}),
+    ]
+    assert jobless_supervisor._pending_loop_lag == []
+
+
+def test_run_once_polls_database_at_most_once_per_second(supervisor_builder, mocker):
+    supervisor = supervisor_builder()
+    load_triggers = mocker.patch.object(TriggerRunnerSupervisor, "load_triggers")
+    clean_unused = mocker.patch.object(TriggerRunnerSupervisor, "clean_unused")
+    mocker.patch.object(TriggerRunnerSupervisor, "heartbeat")
+    mocker.patch.object(TriggerRunnerSupervisor, "emit_metrics")
+    service_subprocess = mocker.patch.object(TriggerRunnerSupervisor, "_service_subprocess")
+
+    supervisor.run_once()
+    supervisor.run_once()
+
+    assert load_triggers.call_count == clean_unused.call_count == 1
+    # Wait for activity no longer than until the next poll
+    assert 0 < service_subprocess.call_args.args[0] <= 1
+
+    supervisor._last_poll -= 1
+    supervisor.run_once()
+    assert load_triggers.call_count == clean_unused.call_count == 2
+
+
 def test_load_triggers_raises_without_job(jobless_supervisor, mocker):
     """load_triggers() must fail loudly when job is None so missing subclass overrides surface."""
     assign_unassigned = mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
@@ -661,6 +811,7 @@ class TestTriggerRunner:
 
         trigger_runner.log.ainfo.assert_not_called()
         mock_stats_incr.assert_not_called()
+        assert trigger_runner._loop_lag == [pytest.approx(0.3)]
 
     @pytest.mark.asyncio
     async def test_block_watchdog_logs_when_threshold_is_exceeded(self) -> None:
@@ -686,6 +837,87 @@ class TestTriggerRunner:
         assert threshold == 0.5
         mock_stats_incr.assert_called_once_with("triggers.blocked_main_thread")
 
+    @pytest.mark.asyncio
+    async def test_timed_coroutine_records_every_step(self) -> None:
+        trigger_run_time, classpath_run_time = _RunTime(), _RunTime()
+
+        async def coro():
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return "done"
+
+        task = asyncio.create_task(_TimedCoroutine(coro(), trigger_run_time, classpath_run_time))
+
+        assert await task == "done"
+        assert trigger_run_time == classpath_run_time
+        assert trigger_run_time.steps == 3
+        assert trigger_run_time.wall_time > 0
+
+    @pytest.mark.asyncio
+    async def test_timed_coroutine_does_not_count_time_suspended_in_greenback(self) -> None:
+        """A trigger suspended in greenback.await_() is not charged for the triggers running meanwhile."""
+        sync_call_run_time, busy_run_time = _RunTime(), _RunTime()
+
+        async def sync_call():
+            await greenback.ensure_portal()
+            # Like a trigger calling a sync SDK method, which awaits the response through the portal
+            greenback.await_(asyncio.sleep(0.5))
+
+        async def busy():
+            for _ in range(5):
+                end = time.thread_time() + 0.06
+                while time.thread_time() < end:
+                    pass
+                await asyncio.sleep(0)
+
+        await asyncio.gather(
+            asyncio.create_task(_TimedCoroutine(sync_call(), sync_call_run_time)),
+            asyncio.create_task(_TimedCoroutine(busy(), busy_run_time)),
+        )
+
+        assert busy_run_time.cpu_time >= 0.3
+        assert sync_call_run_time.wall_time < 0.1
+        assert sync_call_run_time.cpu_time < 0.1
+
+    def test_collect_runtime_stats(self) -> None:
+        trigger_runner = TriggerRunner()
+        trigger_runner._loop_lag = [0.01]
+        trigger_runner._classpath_run_times = {
+            "a.Trigger": _RunTime(wall_time=3.0, cpu_time=2.0, steps=4),
+            "b.Trigger": _RunTime(),
+        }
+        trigger_runner._trigger_run_times = {
+            trigger_id: ("a.Trigger", _RunTime(wall_time=1.0, cpu_time=cpu_time, steps=2))
+            for trigger_id, cpu_time in enumerate([0.5, 1.5, 0.0])
+        }
+        trigger_runner.triggers = {
+            trigger_id: {
+                "task": MagicMock(),
+                "is_watcher": False,
+                "name": f"trigger {trigger_id}",
+                "events": 0,
+            }
+            for trigger_id in range(3)
+        }
+
+        with patch("airflow.jobs.triggerer_job_runner._TOP_TRIGGERS_REPORTED", 2):
+            runtime_stats = trigger_runner.collect_runtime_stats()
+
+        assert runtime_stats.loop_lag == [0.01]
+        assert runtime_stats.run_times == {
+            "a.Trigger": messages.TriggerRunTime(wall_time=3.0, cpu_time=2.0, steps=4)
+        }
+        assert [(t.trigger_id, t.name, t.cpu_time) for t in runtime_stats.top_triggers] == [
+            (1, "trigger 1", 1.5),
+            (0, "trigger 0", 0.5),
+        ]
+
+        # Per classpath run times are reset, the ones of the triggers keep accumulating
+        runtime_stats = trigger_runner.collect_runtime_stats()
+        assert runtime_stats.loop_lag == []
+        assert runtime_stats.run_times == {}
+        assert len(runtime_stats.top_triggers) == 3
+
     def test_run_inline_trigger_canceled(self, session) -> None:
         trigger_runner = TriggerRunner()
         trigger_runner.triggers = {
@@ -1069,6 +1301,50 @@ async def test_trigger_firing():
             info["task"].cancel()
 
 
+@pytest.mark.asyncio
+async def test_trigger_event_wakes_up_runner():
+    """A trigger firing an event wakes the runner loop up instead of waiting for the next poll."""
+    runner = TriggerRunner()
+    runner._wakeup_event = asyncio.Event()
+
+    runner.to_create.append(
+        workloads.RunTrigger.model_construct(
+            id=1,
+            ti=None,
+            classpath=f"{SuccessTrigger.__module__}.{SuccessTrigger.__name__}",
+            encrypted_kwargs='{"__type":"dict", "__var":{}}',
+        ),
+    )
+    await runner.create_triggers()
+    try:
+        await asyncio.wait_for(runner._wakeup_event.wait(), timeout=3)
+        assert list(runner.events) == [(1, TriggerEvent(True))]
+    finally:
+        for info in runner.triggers.values():
+            info["task"].cancel()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_wakeup_debounces_syncs():
+    """A wakeup right after a sync waits for the minimum sync interval, so a burst of events is batched."""
+    runner = TriggerRunner()
+    runner._wakeup_event = asyncio.Event()
+    runner.min_state_sync_interval = 0.2
+
+    last_sync = time.monotonic()
+    runner.wakeup()
+    await runner.wait_for_wakeup(last_sync)
+    assert time.monotonic() - last_sync >= 0.2
+    assert not runner._wakeup_event.is_set()
+
+    # Stopping is not delayed
+    last_sync = time.monotonic()
+    runner.stop = True
+    runner.wakeup()
+    await runner.wait_for_wakeup(last_sync)
+    assert time.monotonic() - last_sync < 0.2
+
+
 @pytest.mark.asyncio
 async def test_trigger_failing():
     """
@@ -20,10 +20,12 @@ from __future__ import annotations
 from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pendulum
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from airflow._shared.timezones import timezone
 from airflow.models import DagModel, DagRun, TaskInstance
@@ -43,6 +45,7 @@ from airflow.models.backfill import (
 )
 from airflow.providers.standard.operators.python import PythonOperator
 from airflow.sdk import Asset
+from airflow.serialization.definitions.dag import SerializedDAG
 from airflow.ti_deps.dep_context import DepContext
 from airflow.timetables.base import DagRunInfo
 from airflow.utils.state import DagRunState, TaskInstanceState
@@ -161,6 +164,38 @@ def test_create_backfill_simple(reverse, existing, dag_maker, session):
     assert all(x.conf == expected_run_conf for x in dag_runs)
 
 
+def test_create_backfill_creates_runs_one_by_one_after_conflict(dag_maker, session):
+    """If a run was created concurrently, bulk creation is given up for creating the runs one by one."""
+    with dag_maker(schedule="@daily") as dag:
+        PythonOperator(task_id="hi", python_callable=print)
+
+    with mock.patch.object(
+        SerializedDAG, "create_dagruns", side_effect=IntegrityError("INSERT", {}, Exception())
+    ) as mock_create_dagruns:
+        b = _create_backfill(
+            dag_id=dag.dag_id,
+            from_date=pendulum.parse("2021-01-01"),
+            to_date=pendulum.parse("2021-01-03"),
+            max_active_runs=2,
+            reverse=False,
+            triggering_user_name="pytest",
+            dag_run_conf=None,
+        )
+    mock_create_dagruns.assert_called_once()
+
+    query = (
+        select(BackfillDagRun.sort_ordinal, DagRun.logical_date, DagRun.state)
+        .join(BackfillDagRun.dag_run)
+        .where(BackfillDagRun.backfill_id == b.id)
+        .order_by(BackfillDagRun.sort_ordinal)
+    )
+    assert [(ordinal, str(date.date()), state) for ordinal, date, state in session.execute(query)] == [
+        (1, "2021-01-01", DagRunState.QUEUED),
+        (2, "2021-01-02", DagRunState.QUEUED),
+        (3, "2021-01-03", DagRunState.QUEUED),
+    ]
+
+
 @pytest.mark.parametrize("run_on_latest_version", [True, False])
 def test_create_backfill_clear_existing_bundle_version(dag_maker, session, run_on_latest_version):
     """
@@ -1508,6 +1508,92 @@ class TestDag:
         )
         assert dr.note == note
 
+    def test_create_dagruns(self, testing_dag_bundle, session):
+        with DAG(dag_id="test_create_dagruns", schedule="@daily", start_date=DEFAULT_DATE) as dag:
+            EmptyOperator(task_id="task")
+            EmptyOperator(task_id="later_task", start_date=DEFAULT_DATE + timedelta(days=1))
+            BashOperator.partial(task_id="mapped_task").expand(bash_command=["echo 1", "echo 2"])
+        scheduler_dag = sync_dag_to_db(dag, session=session)
+        infos = [
+            DagRunInfo.interval(DEFAULT_DATE + timedelta(days=i), DEFAULT_DATE + timedelta(days=i + 1))
+            for i in range(3)
+        ]
+
+        dag_runs = scheduler_dag.create_dagruns(
+            {f"run_{i}": info for i, info in enumerate(infos)},
+            conf={"a": 1},
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.QUEUED,
+            creating_job_id=42,
+            session=session,
+        )
+
+        assert [(dr.run_id, dr.logical_date, dr.data_interval_end) for dr in dag_runs] == [
+            (f"run_{i}", info.logical_date, info.data_interval.end) for i, info in enumerate(infos)
+        ]
+        for dr in dag_runs:
+            assert dr.state == DagRunState.QUEUED
+            assert dr.conf == {"a": 1}
+            assert dr.creating_job_id == 42
+            assert dr.created_dag_version_id is not None
+        tis = session.execute(
+            select(TI.run_id, TI.task_id, TI.map_index, TI.dag_version_id).where(TI.dag_id == dag.dag_id)
+        ).all()
+        assert sorted((run_id, task_id, map_index) for run_id, task_id, map_index, _ in tis) == [
+            ("run_0", "mapped_task", 0),
+            ("run_0", "mapped_task", 1),
+            ("run_0", "task", -1),
+            ("run_1", "later_task", -1),
+            ("run_1", "mapped_task", 0),
+            ("run_1", "mapped_task", 1),
+            ("run_1", "task", -1),
+            ("run_2", "later_task", -1),
+            ("run_2", "mapped_task", 0),
+            ("run_2", "mapped_task", 1),
+            ("run_2", "task", -1),
+        ]
+        assert {dag_version_id for *_, dag_version_id in tis} == {dag_runs[0].created_dag_version_id}
+
+    @pytest.mark.parametrize("num_runs", [1, 10])
+    def test_create_dagruns_query_count(self, num_runs, testing_dag_bundle, session):
+        """The number of queries does not depend on the number of runs created."""
+        with DAG(dag_id="test_create_dagruns_query_count", schedule="@daily", start_date=DEFAULT_DATE) as dag:
+            EmptyOperator(task_id="task_1") >> EmptyOperator(task_id="task_2")
+        scheduler_dag = sync_dag_to_db(dag, session=session)
+        runs = {
+            f"run_{i}": DagRunInfo.interval(
+                DEFAULT_DATE + timedelta(days=i), DEFAULT_DATE + timedelta(days=i + 1)
+            )
+            for i in range(num_runs)
+        }
+
+        with assert_queries_count(6, session=session):
+            scheduler_dag.create_dagruns(
+                runs,
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.QUEUED,
+                session=session,
+            )
+
+    def test_create_dagruns_validates_all_runs_first(self, testing_dag_bundle, session):
+        dag = DAG(dag_id="test_create_dagruns_validates_all_runs_first", schedule=None)
+        scheduler_dag = sync_dag_to_db(dag, session=session)
+
+        with pytest.raises(ValueError, match="must not contain '..'"):
+            scheduler_dag.create_dagruns(
+                {
+                    "valid": DagRunInfo.exact(DEFAULT_DATE),
+                    "in..valid": DagRunInfo.exact(DEFAULT_DATE + timedelta(days=1)),
+                },
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.QUEUED,
+                session=session,
+            )
+        assert session.scalar(select(func.count()).select_from(DagRun)) == 0
+
     @pytest.mark.parametrize("partition_key", [None, "my-key", 123])
     def test_create_dagrun_partition_key(self, partition_key, dag_maker):
         with dag_maker("test_create_dagrun_partition_key"):
@@ -59,6 +59,25 @@ class TestDagVersion:
         assert latest_version.version_number == 2
         assert session.scalar(select(func.count()).where(DagVersion.dag_id == dag.dag_id)) == 2
 
+    def test_get_latest_versions(self, dag_maker, session):
+        with dag_maker("test1") as dag:
+            EmptyOperator(task_id="task1")
+        sync_dag_to_db(dag)
+        dag_maker.create_dagrun()
+        with dag_maker("test1") as dag:
+            EmptyOperator(task_id="task1")
+            EmptyOperator(task_id="task2")
+        sync_dag_to_db(dag)
+        with dag_maker("test2") as dag:
+            EmptyOperator(task_id="task1")
+        sync_dag_to_db(dag)
+
+        latest_versions = DagVersion.get_latest_versions(["test1", "test2", "missing"], session=session)
+        assert {dag_id: version.version_number for dag_id, version in latest_versions.items()} == {
+            "test1": 2,
+            "test2": 1,
+        }
+
     @pytest.mark.need_serialized_dag
     def test_get_version(self, dag_maker, session):
         """The two dags have the same version name and number but different dag ids"""
@@ -24,9 +24,12 @@ import pytest
 import time_machine
 from cachetools import LRUCache, TTLCache
 
-from airflow.models.dagbag import DBDagBag
+from airflow.models.dag_version import DagVersion
+from airflow.models.dagbag import DBDagBag, _DagTTLCache
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils.state import DagRunState
 
 pytestmark = pytest.mark.db_test
 
@@ -92,6 +95,34 @@ class TestDBDagBag:
         assert result == mock_dag
         self.session.get.assert_not_called()
 
+    def test_get_dag_lazy_does_not_cache(self):
+        """It should return a lazily deserialized DAG on a miss without caching it."""
+        mock_dag = MagicMock(spec=SerializedDAG)
+        mock_serdag = MagicMock(spec=SerializedDagModel)
+        mock_serdag.lazy_dag = mock_dag
+        mock_serdag.dag_version_id = "v1"
+        mock_dag_version = MagicMock()
+        mock_dag_version.serialized_dag = mock_serdag
+        self.session.get.return_value = mock_dag_version
+
+        result = self.db_dag_bag.get_dag("v1", session=self.session, lazy=True)
+
+        assert result == mock_dag
+        assert "v1" not in self.db_dag_bag._dags
+        assert mock_serdag.load_op_links is True
+
+    def test_get_latest_version_of_dag_lazy_prefers_cached_dag(self):
+        """It should return the cached DAG instead of deserializing it lazily."""
+        cached_dag = MagicMock(spec=SerializedDAG)
+        self.db_dag_bag._dags["v1"] = cached_dag
+        mock_serdag = MagicMock(spec=SerializedDagModel)
+        mock_serdag.dag_version_id = "v1"
+
+        with patch.object(SerializedDagModel, "get", return_value=mock_serdag):
+            result = self.db_dag_bag.get_latest_version_of_dag("dag_id", session=self.session, lazy=True)
+
+        assert result is cached_dag
+
     def test_get_dag_returns_none_when_not_found(self):
         """It should return None if version_id not found in DB."""
         self.session.get.return_value = None
@@ -303,3 +334,125 @@ class TestDBDagBagCache:
         dag_bag._read_dag(mock_serdag)
 
         mock_stats.gauge.assert_called_with("api_server.dag_bag.cache_size", 1, rate=0.1)
+
+    @staticmethod
+    def _mock_dag(num_tasks: int) -> MagicMock:
+        dag = MagicMock()
+        dag.task_dict = {f"task_{i}": MagicMock() for i in range(num_tasks)}
+        return dag
+
+    def test_cache_bounded_by_estimated_size(self):
+        """Test that cache_max_tasks evicts Dags by their number of tasks, on top of the entry limit."""
+        dag_bag = DBDagBag(cache_size=10, cache_max_tasks=10)
+
+        dag_bag._dags["version_1"] = self._mock_dag(4)
+        dag_bag._dags["version_2"] = self._mock_dag(3)
+        dag_bag._dags["version_3"] = self._mock_dag(4)
+
+        assert "version_1" not in dag_bag._dags
+        assert set(dag_bag._dags) == {"version_2", "version_3"}
+
+        dag_bag = DBDagBag(cache_size=2, cache_max_tasks=100)
+        for i in range(3):
+            dag_bag._dags[f"version_{i}"] = self._mock_dag(1)
+        assert set(dag_bag._dags) == {"version_1", "version_2"}
+
+    def test_dag_larger_than_cache_is_not_cached(self):
+        dag_bag = DBDagBag(cache_size=10, cache_max_tasks=5)
+        mock_sdm = MagicMock()
+        mock_sdm.dag = self._mock_dag(10)
+        mock_sdm.dag_version_id = "big_version"
+
+        assert dag_bag._read_dag(mock_sdm) is mock_sdm.dag
+        assert "big_version" not in dag_bag._dags
+
+    @patch("airflow.models.dagbag.stats")
+    def test_pinned_versions_survive_eviction(self, mock_stats):
+        """Test that versions of running Dag runs are kept when evicted, and others are counted as evicted."""
+        dag_bag = DBDagBag(cache_size=1)
+        mock_session = MagicMock()
+        with patch.object(DBDagBag, "_running_dag_version_ids", return_value={"pinned_version"}):
+            dag_bag._refresh_pinned_versions(mock_session)
+
+        pinned_dag = MagicMock()
+        dag_bag._dags["pinned_version"] = pinned_dag
+        dag_bag._dags["version_1"] = MagicMock()
+        dag_bag._dags["version_2"] = MagicMock()
+
+        assert dag_bag._get_dag("pinned_version", mock_session) is pinned_dag
+        assert mock_stats.incr.call_args_list.count((("api_server.dag_bag.cache_eviction",),)) == 1
+
+        # Refreshing is throttled, and releases versions that are no longer running.
+        with patch.object(DBDagBag, "_running_dag_version_ids", return_value=set()):
+            dag_bag._refresh_pinned_versions(mock_session)
+            assert dag_bag._pinned_dags == {"pinned_version": pinned_dag}
+            dag_bag._pinned_refreshed_at = None
+            dag_bag._refresh_pinned_versions(mock_session)
+        assert dag_bag._pinned_dags == {}
+        mock_stats.gauge.assert_called_with("api_server.dag_bag.pinned_size", 0)
+
+    @patch.object(DBDagBag, "_running_dag_version_ids", return_value=set())
+    def test_pinned_versions_refreshed_only_when_caching_evicts(self, mock_running_dag_version_ids):
+        """Test that running Dag runs are only looked up when caching a Dag evicts another one."""
+        dag_bag = DBDagBag(cache_size=2)
+        mock_session = MagicMock()
+
+        for version in ("version_1", "version_2", "version_2"):
+            mock_sdm = MagicMock()
+            mock_sdm.dag_version_id = version
+            dag_bag._read_dag(mock_sdm, mock_session)
+        # Replacing a cached version evicts nothing
+        mock_running_dag_version_ids.assert_not_called()
+
+        mock_sdm = MagicMock()
+        mock_sdm.dag_version_id = "version_3"
+        dag_bag._read_dag(mock_sdm, mock_session)
+        mock_running_dag_version_ids.assert_called_once_with(mock_session)
+        assert set(dag_bag._dags) == {"version_2", "version_3"}
+
+    @patch("airflow.models.dagbag.stats")
+    def test_pinned_versions_survive_expiry(self, mock_stats):
+        """Test that versions of running Dag runs are kept when their cache entry expires."""
+        dag_bag = DBDagBag(cache_size=10, cache_ttl=1)
+        # Use time.time as the timer so time_machine can advance it.
+        dag_bag._dags = _DagTTLCache(maxsize=10, ttl=1, timer=time.time)
+        dag_bag._dags.on_expire = dag_bag._keep_pinned
+        dag_bag._pinned_version_ids = {"pinned_version"}
+
+        pinned_dag = MagicMock()
+        with time_machine.travel("2025-01-01 00:00:00", tick=False):
+            dag_bag._dags["pinned_version"] = pinned_dag
+            dag_bag._dags["version_1"] = MagicMock()
+
+        with time_machine.travel("2025-01-01 00:00:02", tick=False):
+            assert dag_bag._get_dag("pinned_version", MagicMock()) is pinned_dag
+            assert len(dag_bag._dags) == 0
+        assert dag_bag._pinned_dags == {"pinned_version": pinned_dag}
+        assert ("api_server.dag_bag.cache_eviction",) not in [c.args for c in mock_stats.incr.call_args_list]
+
+    def test_running_dag_version_ids_resolve_latest_version_without_bundle_version(self, dag_maker, session):
+        """Test that Dag runs without a bundle version pin the latest Dag version, which is what they run."""
+        with dag_maker("test_pinned_dag", session=session):
+            EmptyOperator(task_id="task_1")
+        dag_run = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+        with dag_maker("test_pinned_dag", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+        session.flush()
+
+        latest_version = DagVersion.get_latest_version("test_pinned_dag", session=session)
+        assert dag_run.bundle_version is None
+        assert dag_run.created_dag_version_id != latest_version.id
+        assert DBDagBag._running_dag_version_ids(session) == {latest_version.id}
+
+        dag_run.bundle_version = "some_version"
+        session.flush()
+        assert DBDagBag._running_dag_version_ids(session) == {dag_run.created_dag_version_id}
+
+    @patch("airflow.models.dagbag.stats")
+    def test_clear_cache_does_not_count_evictions(self, mock_stats):
+        dag_bag = DBDagBag(cache_size=10)
+        dag_bag._dags["version_1"] = MagicMock()
+
+        assert dag_bag.clear_cache() == 1
+        assert ("api_server.dag_bag.cache_eviction",) not in [c.args for c in mock_stats.incr.call_args_list]
@@ -72,6 +72,7 @@ from airflow.utils.state import DagRunState, State, TaskInstanceState
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
 
 from tests_common.test_utils import db
+from tests_common.test_utils.asserts import assert_queries_count
 from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.dag import sync_dag_to_db
 from tests_common.test_utils.mock_operators import MockOperator
@@ -2166,6 +2167,31 @@ def test_schedule_tis_map_index(dag_maker, session):
     assert ti2.state == TaskInstanceState.SUCCESS
 
 
+def test_bulk_schedule_tis_across_dag_runs(dag_maker, session):
+    dag_runs = []
+    for dag_id in ("bulk_schedule_1", "bulk_schedule_2"):
+        with dag_maker(session=session, dag_id=dag_id):
+            BaseOperator(task_id="task_1")
+            BaseOperator(task_id="task_2")
+        dag_runs.append(dag_maker.create_dagrun(session=session))
+
+    tis_by_run = DagRun.fetch_task_instances_for_dag_runs(dag_runs, session=session)
+    assert {key: [ti.task_id for ti in tis] for key, tis in tis_by_run.items()} == {
+        (dr.dag_id, dr.run_id): ["task_1", "task_2"] for dr in dag_runs
+    }
+
+    schedulable_tis = []
+    for dr in dag_runs:
+        schedulable_tis.extend(dr.update_state(session=session, tis=tis_by_run[(dr.dag_id, dr.run_id)])[0])
+
+    with assert_queries_count(1):
+        assert DagRun.bulk_schedule_tis(schedulable_tis, session=session) == 4
+
+    session.expire_all()
+    for dr in dag_runs:
+        assert {ti.state for ti in dr.get_task_instances(session=session)} == {TaskInstanceState.SCHEDULED}
+
+
 def test_schedule_tis_does_not_increment_try_number_if_ti_already_queued_by_other_scheduler(
     dag_maker, session
 ):
@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import logging
+import zlib
 from datetime import timedelta
 from unittest import mock
 
@@ -29,11 +30,16 @@ from sqlalchemy import delete, func, select, update
 
 import airflow.example_dags as example_dags_module
 from airflow.dag_processing.dagbag import DagBag
+from airflow.exceptions import AirflowConfigException
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetModel
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
 from airflow.models.deadline_alert import DeadlineAlert as DAM
-from airflow.models.serialized_dag import SerializedDagModel as SDM
+from airflow.models.serialized_dag import (
+    SerializedDagModel as SDM,
+    _decode_stored_data,
+    _encode_binary_data,
+)
 from airflow.providers.standard.operators.bash import BashOperator
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
@@ -93,15 +99,26 @@ class TestSerializedDagModel:
     @pytest.fixture(
         autouse=True,
         params=[
-            pytest.param(False, id="raw-serialized_dags"),
-            pytest.param(True, id="compress-serialized_dags"),
+            pytest.param((False, "json"), id="raw-serialized_dags"),
+            pytest.param((True, "json"), id="compress-serialized_dags"),
+            pytest.param((False, "msgpack"), id="msgpack-serialized_dags"),
+            pytest.param((True, "msgpack"), id="compress-msgpack-serialized_dags"),
         ],
     )
     def setup_test_cases(self, request, monkeypatch):
+        compress, storage_format = request.param
         db.clear_db_dags()
         db.clear_db_runs()
         db.clear_db_serialized_dags()
-        with conf_vars({("core", "compress_serialized_dags"): str(request.param)}):
+        # The settings are read when the module is imported.
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", compress)
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", storage_format)
+        with conf_vars(
+            {
+                ("core", "compress_serialized_dags"): str(compress),
+                ("core", "serialized_dag_storage_format"): storage_format,
+            }
+        ):
             yield
         db.clear_db_serialized_dags()
 
@@ -405,6 +422,28 @@ class TestSerializedDagModel:
         dependencies = SDM.get_dag_dependencies(session=session)
         assert dag_id not in dependencies
 
+    @pytest.mark.parametrize(
+        ("written_with", "read_with"),
+        [
+            pytest.param((False, "json"), (True, "msgpack"), id="json-read-as-msgpack"),
+            pytest.param((True, "msgpack"), (False, "json"), id="msgpack-read-as-json"),
+            pytest.param((True, "json"), (False, "json"), id="compressed-read-as-raw"),
+        ],
+    )
+    def test_get_dependencies_after_switching_storage_format(
+        self, session, monkeypatch, written_with, read_with
+    ):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", written_with[0])
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", written_with[1])
+        self._write_example_dags()
+        expected = SDM.get_dag_dependencies(session=session)
+        assert "consumes_asset_decorator" in expected
+
+        # Rows written before the switch are kept in the encoding they were written with.
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", read_with[0])
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", read_with[1])
+        assert SDM.get_dag_dependencies(session=session) == expected
+
     def test_get_dependencies_with_asset_ref(self, dag_maker, session):
         asset_name = "name"
         asset_uri = "test://asset1"
@@ -912,3 +951,83 @@ class TestSerializedDagModel:
 
         # The name must have been updated in the DB.
         assert updated_alert.name == "updated name"
+
+
+class TestSerializedDagStorageEncoding:
+    DATA = {"__version": 3, "dag": {"dag_id": "test", "tasks": [{"task_id": "a", "retries": 1}], "tags": []}}
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_binary_round_trip(self, compress):
+        encoded = _encode_binary_data(self.DATA, compress=compress)
+
+        assert encoded.startswith(b"\x00ADG\x01")
+        assert _decode_stored_data(encoded) == self.DATA
+
+    def test_binary_matches_json_round_trip(self):
+        data = {"dag": {1: ("a", "b"), "params": {"x": None, "y": 1.5}}}
+
+        assert _decode_stored_data(_encode_binary_data(data, compress=False)) == json.loads(json.dumps(data))
+
+    def test_decode_legacy_compressed_json(self):
+        stored = zlib.compress(json.dumps(self.DATA).encode("utf-8"))
+
+        assert _decode_stored_data(stored) == self.DATA
+
+    def test_decode_unknown_version(self):
+        encoded = bytearray(_encode_binary_data(self.DATA, compress=False))
+        encoded[4] = 99
+
+        with pytest.raises(ValueError, match="version 99"):
+            _decode_stored_data(bytes(encoded))
+
+    def test_switching_storage_format_on_write(self, dag_maker, session, monkeypatch):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", False)
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "json")
+        with dag_maker(dag_id="test_storage_format", session=session) as dag:
+            EmptyOperator(task_id="task1")
+        SDM.write_dag(LazyDeserializedDAG.from_dag(dag), bundle_name="test_bundle", session=session)
+        session.commit()
+        assert SDM.get("test_storage_format", session=session)._data is not None
+
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "msgpack")
+        EmptyOperator(task_id="task2", dag=dag)
+        SDM.write_dag(LazyDeserializedDAG.from_dag(dag), bundle_name="test_bundle", session=session)
+        session.commit()
+        session.expunge_all()
+
+        serdag = SDM.get("test_storage_format", session=session)
+        assert serdag._data is None
+        assert serdag._data_compressed.startswith(b"\x00ADG")
+        assert sorted(serdag.dag.task_dict) == ["task1", "task2"]
+
+    def test_reencode_binary_data_as_json(self, dag_maker, session, monkeypatch):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", True)
+        for dag_id, storage_format in (("test_json", "json"), ("test_msgpack", "msgpack")):
+            monkeypatch.setattr(
+                "airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", storage_format
+            )
+            with dag_maker(dag_id=dag_id, session=session) as dag:
+                EmptyOperator(task_id="task1")
+            SDM.write_dag(LazyDeserializedDAG.from_dag(dag), bundle_name="test_bundle", session=session)
+        session.commit()
+        expected = SDM.get("test_msgpack", session=session).data
+        session.expunge_all()
+
+        assert SDM.reencode_binary_data_as_json(session=session) == 1
+        session.commit()
+        session.expunge_all()
+
+        # Stored the way Airflow versions without the binary encoding read it
+        for dag_id in ("test_json", "test_msgpack"):
+            stored = SDM.get(dag_id, session=session)._data_compressed
+            assert json.loads(zlib.decompress(stored))["dag"]["dag_id"] == dag_id
+        assert SDM.get("test_msgpack", session=session).data == expected
+        assert SDM.reencode_binary_data_as_json(session=session) == 0
+
+    def test_invalid_storage_format(self, dag_maker, monkeypatch):
+        with dag_maker(dag_id="test_invalid_storage_format") as dag:
+            EmptyOperator(task_id="task1")
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "yaml")
+
+        with pytest.raises(AirflowConfigException, match="serialized_dag_storage_format"):
+            SDM(LazyDeserializedDAG.from_dag(dag))
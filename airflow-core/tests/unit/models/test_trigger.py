@@ -45,6 +45,7 @@ from airflow.triggers.base import (
     TaskSuccessEvent,
     TriggerEvent,
 )
+from airflow.utils.consistent_hash import ConsistentHashRing
 from airflow.utils.session import create_session
 from airflow.utils.state import State
 
@@ -1018,3 +1019,129 @@ def test_asset_trigger_ordering_and_capacity(session):
 
     # Only the three oldest should be returned, in order
     assert ids == [triggers[0].id, triggers[1].id, triggers[2].id]
+
+
+def _create_asset_triggers(session: Session, count: int, triggerer_id: int | None = None) -> list[Trigger]:
+    triggers = []
+    for i in range(count):
+        trigger = Trigger(classpath="airflow.triggers.testing.AssetTrigger", kwargs={})
+        trigger.triggerer_id = triggerer_id
+        session.add(trigger)
+        session.flush()
+        asset = AssetModel(f"partitioned_asset_{triggerer_id}_{i}")
+        asset.add_trigger(trigger, f"partitioned_asset_watcher_{triggerer_id}_{i}")
+        session.add(asset)
+        triggers.append(trigger)
+    session.commit()
+    return triggers
+
+
+def _triggerer_ids_by_trigger(session: Session) -> dict[int, int | None]:
+    session.expire_all()
+    return dict(session.execute(select(Trigger.id, Trigger.triggerer_id)).all())
+
+
+@pytest.mark.need_serialized_dag
+@patch.object(Trigger, "partition_triggers", True)
+@patch.object(Trigger, "max_trigger_to_select_per_loop", 5)
+def test_assign_partitioned_spreads_triggers_by_hash(session, create_triggerer):
+    time_now = timezone.utcnow()
+    triggerers = [create_triggerer(session, State.RUNNING, latest_heartbeat=time_now) for _ in range(2)]
+    session.commit()
+    triggers = _create_asset_triggers(session, 40)
+    ring = ConsistentHashRing(t.id for t in triggerers)
+
+    for triggerer in triggerers:
+        Trigger.assign_unassigned(triggerer.id, capacity=100, health_check_threshold=30)
+
+    # Every trigger is claimed by its owner in a single loop, regardless of max_trigger_to_select_per_loop.
+    assert _triggerer_ids_by_trigger(session) == {t.id: ring.get_node(str(t.id)) for t in triggers}
+
+
+@pytest.mark.need_serialized_dag
+@patch.object(Trigger, "partition_triggers", True)
+@patch.object(Trigger, "max_trigger_to_select_per_loop", 5)
+def test_assign_partitioned_hands_back_triggers_owned_by_another_triggerer(session, create_triggerer):
+    time_now = timezone.utcnow()
+    busy = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    new = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    triggers = _create_asset_triggers(session, 40, triggerer_id=busy.id)
+    ring = ConsistentHashRing([busy.id, new.id])
+    owned_by_new = {t.id for t in triggers if ring.get_node(str(t.id)) == new.id}
+    assert len(owned_by_new) > 5
+
+    Trigger.assign_unassigned(busy.id, capacity=100, health_check_threshold=30)
+    handed_back = {k for k, v in _triggerer_ids_by_trigger(session).items() if v is None}
+    # At most max_trigger_to_select_per_loop triggers are handed back per loop.
+    assert len(handed_back) == 5
+    assert handed_back <= owned_by_new
+
+    Trigger.assign_unassigned(new.id, capacity=100, health_check_threshold=30)
+    assert {k for k, v in _triggerer_ids_by_trigger(session).items() if v == new.id} == handed_back
+
+
+@pytest.mark.need_serialized_dag
+@patch.object(Trigger, "partition_triggers", True)
+def test_assign_partitioned_does_not_take_back_handed_back_triggers(session, create_triggerer):
+    time_now = timezone.utcnow()
+    busy = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    new = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    ring = ConsistentHashRing([busy.id, new.id])
+    owned_by_new = [
+        t.id
+        for t in _create_asset_triggers(session, 40, triggerer_id=busy.id)
+        if ring.get_node(str(t.id)) == new.id
+    ][:3]
+    session.execute(delete(Trigger).where(Trigger.id.not_in(owned_by_new)))
+    session.commit()
+
+    # Handing back its triggers leaves no room to the other triggerer, which must not make them spill over.
+    Trigger.assign_unassigned(busy.id, capacity=3, health_check_threshold=30)
+
+    assert _triggerer_ids_by_trigger(session) == dict.fromkeys(owned_by_new)
+
+
+@pytest.mark.need_serialized_dag
+@patch.object(Trigger, "partition_triggers", True)
+@patch.object(Trigger, "queues_enabled", True)
+@patch.object(Trigger, "max_trigger_to_select_per_loop", 5)
+def test_assign_partitioned_falls_back_with_queues_enabled(session, create_triggerer):
+    time_now = timezone.utcnow()
+    triggerers = [create_triggerer(session, State.RUNNING, latest_heartbeat=time_now) for _ in range(2)]
+    session.commit()
+    triggers = _create_asset_triggers(session, 10)
+
+    # Triggers are not partitioned, the triggerer picks up max_trigger_to_select_per_loop of them.
+    Trigger.assign_unassigned(triggerers[0].id, capacity=100, health_check_threshold=30)
+
+    assignments = _triggerer_ids_by_trigger(session)
+    assert [assignments[t.id] for t in triggers].count(triggerers[0].id) == 5
+
+
+@pytest.mark.need_serialized_dag
+@patch.object(Trigger, "partition_triggers", True)
+def test_assign_partitioned_spills_over_triggers_of_full_triggerer(session, create_triggerer):
+    time_now = timezone.utcnow()
+    full = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    spare = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    ring = ConsistentHashRing([full.id, spare.id])
+    running = [
+        t
+        for t in _create_asset_triggers(session, 40, triggerer_id=full.id)
+        if ring.get_node(str(t.id)) == full.id
+    ]
+    session.execute(
+        delete(Trigger).where(Trigger.triggerer_id == full.id, Trigger.id.not_in([t.id for t in running]))
+    )
+    session.commit()
+    unassigned = _create_asset_triggers(session, 10)
+
+    Trigger.assign_unassigned(spare.id, capacity=len(running), health_check_threshold=30)
+
+    # The triggerer owning half of the unassigned triggers has no room left, so they all go to the other one.
+    assignments = _triggerer_ids_by_trigger(session)
+    assert {assignments[t.id] for t in unassigned} == {spare.id}
+    assert {assignments[t.id] for t in running} == {full.id}
@@ -4622,6 +4622,101 @@ class TestMappedOperatorSerializationAndClientDefaults:
         assert deserialized_task.partial_kwargs["owner"] == "custom_owner"
 
 
+class TestLazyDagDeserialization:
+    @staticmethod
+    def _make_serialized_dag():
+        with DAG(dag_id="test_lazy_dag", schedule=None, start_date=datetime(2025, 1, 1)) as dag:
+            first = BashOperator(task_id="first", bash_command="echo 1")
+            with TaskGroup("group"):
+                second = BashOperator(task_id="second", bash_command="echo 2")
+                mapped = BashOperator.partial(task_id="mapped").expand(bash_command=XComArg(second))
+            last = BashOperator(task_id="last", bash_command="echo 3")
+            first >> second >> mapped >> last
+        return DagSerialization.to_dict(dag)
+
+    def test_tasks_are_deserialized_on_first_access(self):
+        dag = DagSerialization.from_dict(self._make_serialized_dag(), lazy=True)
+
+        assert dict.keys(dag.task_dict) == set()
+        assert dag.has_task("last")
+        assert not dag.has_task("missing")
+        assert dag.task_dict.get("missing") is None
+        assert dag.task_dict.upstream_task_ids["group.mapped"] == {"group.second"}
+        assert dag.task_dict.downstream_task_ids["group.mapped"] == {"last"}
+
+        last = dag.get_task("last")
+        assert isinstance(last, SerializedBaseOperator)
+        assert last.dag is dag
+        assert last.upstream_task_ids == {"group.mapped"}
+        assert last.start_date == datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+        assert list(dict.keys(dag.task_dict)) == ["last"]
+        assert dag.get_task("last") is last
+
+    def test_task_groups_and_expand_inputs(self):
+        dag = DagSerialization.from_dict(self._make_serialized_dag(), lazy=True)
+
+        assert dag.task_group_dict["group"].children == {}
+        mapped = dag.get_task("group.mapped")
+        assert isinstance(mapped, SerializedMappedOperator)
+        assert mapped.task_group.group_id == "group"
+        # The task referenced by the expand input is loaded along with the mapped task.
+        assert sorted(dict.keys(dag.task_dict)) == ["group.mapped", "group.second"]
+        second = dag.get_task("group.second")
+        assert mapped.expand_input.value["bash_command"].operator is second
+        assert dag.task_group_dict["group"].children == {"group.mapped": mapped, "group.second": second}
+
+    def test_materialize_matches_full_deserialization(self):
+        serialized = self._make_serialized_dag()
+        full = DagSerialization.from_dict(serialized)
+        lazy = DagSerialization.from_dict(serialized, lazy=True)
+        lazy.get_task("group.mapped")
+
+        lazy.task_dict.materialize()
+
+        assert sorted(dict.keys(lazy.task_dict)) == sorted(full.task_dict)
+        for task_id, task in full.task_dict.items():
+            assert lazy.task_dict[task_id].upstream_task_ids == task.upstream_task_ids
+            assert lazy.task_dict[task_id].downstream_task_ids == task.downstream_task_ids
+            assert lazy.task_dict[task_id].task_group.group_id == task.task_group.group_id
+        assert sorted(lazy.task_group_dict["group"].children) == sorted(
+            full.task_group_dict["group"].children
+        )
+
+    def test_iterating_over_all_tasks(self):
+        serialized = self._make_serialized_dag()
+        full = DagSerialization.from_dict(serialized)
+        lazy = DagSerialization.from_dict(serialized, lazy=True)
+        lazy.get_task("last")
+
+        # The task ids don't need the tasks to be loaded
+        assert list(lazy.task_dict) == list(full.task_dict)
+        assert len(lazy.task_dict) == len(full.task_dict)
+        assert lazy.task_ids == full.task_ids
+        assert list(dict.keys(lazy.task_dict)) == ["last"]
+
+        # Getting the tasks loads all of them, in the order of the serialized Dag
+        assert [task.task_id for task in lazy.tasks] == [task.task_id for task in full.tasks]
+        assert [task_id for task_id, _ in lazy.task_dict.items()] == list(full.task_dict)
+        assert sorted(dict.keys(lazy.task_dict)) == sorted(full.task_dict)
+
+    def test_extra_links_flag_is_not_set_on_the_class(self):
+        with DAG(dag_id="test_lazy_links", schedule=None, start_date=datetime(2025, 1, 1)) as dag:
+            BashOperator(task_id="task", bash_command="echo 1")
+        serialized = DagSerialization.to_dict(dag)
+        lazy = DagSerialization.from_dict(serialized, lazy=True)
+
+        with mock.patch.object(OperatorSerialization, "_load_operator_extra_links", True):
+            lazy.task_dict._load_operator_extra_links = False
+            with mock.patch.object(
+                OperatorSerialization,
+                "deserialize_operator",
+                wraps=OperatorSerialization.deserialize_operator,
+            ) as mock_deserialize:
+                lazy.get_task("task")
+            assert OperatorSerialization._load_operator_extra_links is True
+        assert mock_deserialize.call_args.kwargs == {"load_operator_extra_links": False}
+
+
 @pytest.mark.parametrize(
     ("callbacks", "expected_has_flags", "absent_keys"),
     [
@@ -32,8 +32,10 @@ from airflow.sdk import task, task_group
 from airflow.sdk.bases.operator import BaseOperator
 from airflow.task.trigger_rule import TriggerRule
 from airflow.ti_deps.dep_context import DepContext
-from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamTIStates
-from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamStateMatrix, _UpstreamTIStates
+from airflow.utils.state import DagRunState, State, TaskInstanceState
+
+from tests_common.test_utils.asserts import assert_queries_count
 
 pytestmark = pytest.mark.db_test
 
@@ -89,7 +91,7 @@ def get_task_instance(monkeypatch, session, dag_maker):
             skipped_setup=skipped_setup,
             success_setup=success_setup,
         )
-        monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: fake_upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "from_counters", lambda *_: fake_upstream_states)
 
         return ti
 
@@ -1404,6 +1406,41 @@ class TestTriggerRuleDep:
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
+    def test_upstream_state_matrix(self, session, get_mapped_task_dagrun):
+        """Counts only the map indexes relevant to the current ti, and queries expected tis once."""
+        dr, _, _ = get_mapped_task_dagrun()
+        finished_tis = dr.get_task_instances(state=State.finished, session=session)
+        matrix = _UpstreamStateMatrix(dr.dag_id, dr.run_id, finished_tis)
+
+        assert matrix.upstream_states(["do_something"], lambda _: None) == (3, 0, 0, 0, 2, 5, 0, 0)
+        assert matrix.upstream_states(["do_something"], lambda _: 1) == (1, 0, 0, 0, 0, 1, 0, 0)
+        assert matrix.upstream_states(["do_something"], lambda _: range(2, 4)) == (1, 0, 0, 0, 1, 2, 0, 0)
+        assert matrix.upstream_states(["do_something_else"], lambda _: None).done == 0
+
+        with assert_queries_count(1):
+            assert matrix.ti_counts(["do_something"], lambda _: None, session=session) == {"do_something": 5}
+            assert matrix.ti_counts(["do_something"], lambda _: range(3, 10), session=session) == {
+                "do_something": 2
+            }
+
+    def test_upstream_state_matrix_shared_by_dep_context(self, session, get_mapped_task_dagrun):
+        dr, task, _ = get_mapped_task_dagrun()
+        dep_context = DepContext(flag_upstream_failed=False)
+        tis = [
+            ti
+            for ti in dr.get_task_instances(session=session)
+            if ti.task_id == "do_something_else" and ti.map_index < 3
+        ]
+        matrix = None
+        for ti in tis:
+            ti.task = task
+            assert not list(
+                TriggerRuleDep()._evaluate_trigger_rule(ti=ti, dep_context=dep_context, session=session)
+            )
+            matrix = matrix or dep_context.upstream_state_matrix
+        assert matrix is not None
+        assert dep_context.upstream_state_matrix is matrix
+
     @pytest.mark.parametrize(("flag_upstream_failed", "expected_ti_state"), [(True, REMOVED), (False, None)])
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self,
@@ -1432,7 +1469,7 @@ class TestTriggerRuleDep:
             skipped_setup=0,
             success_setup=0,
         )
-        monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "from_counters", lambda *_: upstream_states)
 
         _test_trigger_rule(
             ti=ti,
@@ -1469,7 +1506,7 @@ class TestTriggerRuleDep:
             skipped_setup=0,
             success_setup=0,
         )
-        monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "from_counters", lambda *_: upstream_states)
 
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
@@ -1505,7 +1542,7 @@ class TestTriggerRuleDep:
             skipped_setup=0,
             success_setup=0,
         )
-        monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "from_counters", lambda *_: upstream_states)
 
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
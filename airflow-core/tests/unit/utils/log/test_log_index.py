@@ -0,0 +1,138 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.utils.log.log_index import LogBlock, LogIndex
+
+
+def _log_line(i: int) -> str:
+    level = "error" if i % 10 == 9 else "info"
+    return json.dumps({"timestamp": f"2026-01-01T00:00:{i % 60:02}Z", "level": level, "event": f"line {i}"})
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "attempt=1.log"
+    path.write_text("".join(f"{_log_line(i)}\n" for i in range(25)))
+    return path
+
+
+class TestLogIndex:
+    def test_index_is_written_next_to_the_log(self, log_file):
+        index = LogIndex(log_file, lines_per_block=10)
+        index.update()
+
+        assert [(block.line, block.levels) for block in index.blocks] == [
+            (0, frozenset({"info", "error"})),
+            (10, frozenset({"info", "error"})),
+        ]
+        assert index.blocks[0].offset == 0
+        assert index.blocks[1].offset == index.blocks[0].end
+        assert index.index_path == log_file.with_name("attempt=1.log.index")
+        assert LogIndex(log_file, lines_per_block=10)._load() == index.blocks
+
+    def test_index_is_extended_as_the_log_grows(self, log_file):
+        index = LogIndex(log_file, lines_per_block=10)
+        index.update()
+        with log_file.open("a") as f:
+            f.write("".join(f"{_log_line(i)}\n" for i in range(25, 40)))
+            f.write('{"level": "info", "event": "still being wri')
+
+        reloaded = LogIndex(log_file, lines_per_block=10)
+        reloaded.update()
+
+        assert [block.line for block in reloaded.blocks] == [0, 10, 20, 30]
+        assert len(reloaded.index_path.read_text().splitlines()) == 4
+        assert list(reloaded.read_lines(tail=2)) == [_log_line(38), _log_line(39)]
+
+    @pytest.mark.parametrize("lines_per_block", [0, 4, 10, 100])
+    @pytest.mark.parametrize("tail", [None, 0, 1, 7, 12, 100])
+    @pytest.mark.parametrize("levels", [None, ["error"], ["warning"]])
+    def test_read_lines(self, log_file, lines_per_block, tail, levels):
+        expected = [_log_line(i) for i in range(25)]
+        if levels:
+            expected = [line for line in expected if json.loads(line)["level"] in levels]
+        if tail is not None:
+            expected = expected[len(expected) - tail :] if tail else []
+
+        assert list(LogIndex(log_file, lines_per_block).read_lines(tail=tail, levels=levels)) == expected
+
+    def test_only_blocks_with_the_levels_are_read(self, log_file):
+        index = LogIndex(log_file, lines_per_block=5)
+
+        with mock.patch.object(LogIndex, "_read", wraps=LogIndex._read) as read:
+            lines = list(index.read_lines(levels=["error"]))
+
+        assert lines == [_log_line(9), _log_line(19)]
+        # Blocks 5-9 and 15-19, then the lines after the last block.
+        assert [call.args[1] for call in read.call_args_list] == [
+            index.blocks[1].offset,
+            index.blocks[3].offset,
+            index.blocks[-1].end,
+        ]
+
+    def test_lines_which_are_not_json(self, tmp_path):
+        log_file = tmp_path / "1.log"
+        first_block = "[2026-01-01T00:00:00Z] plain text\n\n"
+        log_file.write_text(first_block + f"{_log_line(9)}\n")
+
+        index = LogIndex(log_file, lines_per_block=2)
+
+        assert list(index.read_lines()) == ["[2026-01-01T00:00:00Z] plain text", _log_line(9)]
+        assert list(index.read_lines(levels=["error"])) == [_log_line(9)]
+        assert index.blocks == [LogBlock(0, 0, len(first_block), frozenset())]
+
+    def test_index_of_a_replaced_log_is_rebuilt(self, log_file):
+        LogIndex(log_file, lines_per_block=10).update()
+        log_file.write_text("".join(f"{_log_line(i)}\n" for i in range(12)))
+
+        index = LogIndex(log_file, lines_per_block=10)
+
+        assert list(index.read_lines(tail=1)) == [_log_line(11)]
+        assert [block.line for block in index.blocks] == [0]
+        assert len(index.index_path.read_text().splitlines()) == 1
+
+    def test_inconsistent_index_is_rebuilt(self, log_file):
+        LogIndex(log_file, lines_per_block=10).update()
+
+        index = LogIndex(log_file, lines_per_block=5)
+        index.update()
+
+        assert [block.line for block in index.blocks] == [0, 5, 10, 15, 20]
+        assert LogIndex(log_file, lines_per_block=5)._load() == index.blocks
+
+    def test_index_kept_in_memory_when_it_cannot_be_written(self, log_file):
+        index = LogIndex(log_file, lines_per_block=10)
+
+        real_open = open
+
+        def open_read_only(file, mode="r", *args, **kwargs):
+            if mode == "ab":
+                raise PermissionError(f"Permission denied: {file}")
+            return real_open(file, mode, *args, **kwargs)
+
+        with mock.patch("builtins.open", open_read_only):
+            assert list(index.read_lines(tail=1)) == [_log_line(24)]
+
+        assert len(index.blocks) == 2
+        assert not index.index_path.exists()
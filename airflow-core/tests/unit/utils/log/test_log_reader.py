@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import copy
+import json
 import os
 import sys
 import tempfile
@@ -178,6 +179,55 @@ class TestLogView:
             '{"timestamp":null,"event":"try_number=3."}\n',
         ]
 
+    @pytest.mark.parametrize(
+        ("tail_lines", "levels", "expected_events"),
+        [
+            (2, None, ["line 8", "line 9"]),
+            (None, ["ERROR"], ["line 4", "line 9"]),
+            (1, ["error"], ["line 9"]),
+        ],
+    )
+    @conf_vars({("logging", "task_log_index_block_lines"): "3"})
+    def test_read_log_stream_selected_lines(self, tail_lines, levels, expected_events):
+        log_path = f"{self.log_dir}/{self.DAG_ID}/{self.TASK_ID}/2017-09-01T00.00.00+00.00/1.log"
+        with open(log_path, "w") as f:
+            for i in range(10):
+                level = "error" if i % 5 == 4 else "info"
+                f.write(
+                    f'{{"timestamp": "2017-09-01T00:00:0{i}Z", "level": "{level}", "event": "line {i}"}}\n'
+                )
+        task_log_reader = TaskLogReader()
+        ti = copy.copy(self.ti)
+        ti.state = TaskInstanceState.SUCCESS
+
+        stream = task_log_reader.read_log_stream(
+            ti=ti, try_number=1, metadata={}, tail_lines=tail_lines, levels=levels
+        )
+
+        assert [json.loads(line)["event"] for line in stream] == expected_events
+        assert os.path.exists(f"{log_path}.index")
+
+    @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read_local_log_lines", return_value=None)
+    def test_read_log_stream_selected_lines_without_local_logs(self, mock_read_local_log_lines):
+        from airflow.utils.log.file_task_handler import StructuredLogMessage
+
+        logs = [
+            StructuredLogMessage(event="first", level="error"),
+            StructuredLogMessage(event="second", level="info"),
+            StructuredLogMessage(event="third", level="error"),
+        ]
+        task_log_reader = TaskLogReader()
+        ti = copy.copy(self.ti)
+        ti.state = TaskInstanceState.SUCCESS
+
+        with mock.patch.object(
+            task_log_reader, "read_log_chunks", return_value=(iter(logs), {"end_of_log": True})
+        ):
+            stream = task_log_reader.read_log_stream(
+                ti=ti, try_number=1, metadata={}, tail_lines=1, levels=["error"]
+            )
+            assert [json.loads(line)["event"] for line in stream] == ["third"]
+
     @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
     def test_read_log_stream_should_support_multiple_chunks(self, mock_read):
         from airflow.utils.log.file_task_handler import StructuredLogMessage
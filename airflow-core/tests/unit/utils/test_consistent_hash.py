@@ -0,0 +1,63 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from airflow.utils.consistent_hash import ConsistentHashRing
+
+KEYS = [f"dag_{i}" for i in range(2000)]
+
+
+class TestConsistentHashRing:
+    def test_assignment_is_deterministic(self):
+        ring = ConsistentHashRing([1, 2, 3])
+        other = ConsistentHashRing([3, 2, 1])
+        assert [ring.get_node(key) for key in KEYS] == [other.get_node(key) for key in KEYS]
+
+    def test_keys_are_spread_across_nodes(self):
+        ring = ConsistentHashRing(range(4))
+        counts = Counter(ring.get_node(key) for key in KEYS)
+        assert set(counts) == {0, 1, 2, 3}
+        assert min(counts.values()) > len(KEYS) / 4 / 2
+
+    def test_only_keys_of_removed_node_move(self):
+        before = ConsistentHashRing([1, 2, 3])
+        after = ConsistentHashRing([1, 3])
+        for key in KEYS:
+            if (owner := before.get_node(key)) != 2:
+                assert after.get_node(key) == owner
+
+    def test_added_node_only_takes_keys_over(self):
+        before = ConsistentHashRing([1, 2])
+        after = ConsistentHashRing([1, 2, 3])
+        moved = [key for key in KEYS if before.get_node(key) != after.get_node(key)]
+        assert moved
+        assert all(after.get_node(key) == 3 for key in moved)
+
+    def test_empty_ring(self):
+        ring: ConsistentHashRing[int] = ConsistentHashRing([])
+        assert len(ring) == 0
+        with pytest.raises(LookupError):
+            ring.get_node("dag")
+
+    def test_invalid_replicas(self):
+        with pytest.raises(ValueError, match="replicas must be a positive integer"):
+            ConsistentHashRing([1], replicas=0)
@@ -361,6 +361,21 @@ class TestDb:
         actual = mock_om.call_args.kwargs["revision"]
         assert actual == "abc"
 
+    def test_downgrade_reencodes_serialized_dags_first(self, mocker):
+        manager = mocker.Mock()
+        manager.attach_mock(
+            mocker.patch(
+                "airflow.models.serialized_dag.SerializedDagModel.reencode_binary_data_as_json",
+                return_value=0,
+            ),
+            "reencode",
+        )
+        manager.attach_mock(mocker.patch("alembic.command.downgrade"), "downgrade")
+
+        downgrade(to_revision="abc")
+
+        assert [call[0] for call in manager.mock_calls] == ["reencode", "downgrade"]
+
     def test_resetdb_logging_level(self):
         unset_logging_level = logging.root.level
         logging.root.setLevel(logging.DEBUG)
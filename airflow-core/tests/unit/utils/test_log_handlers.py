@@ -17,7 +17,6 @@
 # under the License.
 from __future__ import annotations
 
-import heapq
 import io
 import itertools
 import logging
@@ -25,7 +24,6 @@ import os
 from http import HTTPStatus
 from importlib import reload
 from pathlib import Path
-from typing import cast
 from unittest import mock
 from unittest.mock import patch
 
@@ -51,12 +49,9 @@ from airflow.utils.log.file_task_handler import (
     DEFAULT_SORT_DATETIME,
     FileTaskHandler,
     LogType,
-    ParsedLogStream,
     StructuredLogMessage,
-    _add_log_from_parsed_log_streams_to_heap,
     _create_sort_key,
     _fetch_logs_from_service,
-    _flush_logs_out_of_heap,
     _interleave_logs,
     _is_logs_stream_like,
     _is_sort_key_with_default_timestamp,
@@ -504,12 +499,40 @@ class TestFileTaskLogHandler:
         assert extract_events(log_handler_output_stream) == ["line 3"]
         assert metadata == {"end_of_log": True, "log_pos": 3}
 
+    @patch("airflow.utils.log.file_task_handler.FileTaskHandler._read_from_local")
+    def test__read_at_end_of_log_streams_logs(self, mock_read_local, create_task_instance):
+        read_lines: list[str] = []
+
+        def log_stream():
+            for line in ["line 1", "line 2", "line 3"]:
+                read_lines.append(line)
+                yield line
+
+        mock_read_local.return_value = (["the messages"], [log_stream()])
+        ti = create_task_instance(
+            dag_id="dag_for_testing_local_log_read",
+            task_id="task_for_testing_local_log_read",
+            run_type=DagRunType.SCHEDULED,
+            logical_date=DEFAULT_DATE,
+        )
+        fth = FileTaskHandler("")
+
+        log_handler_output_stream, metadata = fth._read(ti=ti, try_number=1)
+
+        # The logs are only read as they are returned, so their position is only known after that.
+        assert read_lines == []
+        assert metadata == {"end_of_log": True}
+        assert extract_events(log_handler_output_stream) == ["line 1", "line 2", "line 3"]
+        assert metadata == {"end_of_log": True, "log_pos": 3}
+
     def test__read_from_local(self, tmp_path):
         """Tests the behavior of method _read_from_local"""
         path1 = tmp_path / "hello1.log"
         path2 = tmp_path / "hello1.log.suffix.log"
         path1.write_text("file1 content\nfile1 content2")
         path2.write_text("file2 content\nfile2 content2")
+        # Indexes of the log files are not logs.
+        (tmp_path / "hello1.log.index").write_text('{"line": 0, "offset": 0, "end": 14, "levels": []}\n')
         fth = FileTaskHandler(str(tmp_path))
         log_source_info, log_streams = fth._read_from_local(path1)
         assert log_source_info == [str(path1), str(path2)]
@@ -1093,7 +1116,7 @@ def test__is_logs_stream_like(log_stream, expected):
     assert _is_logs_stream_like(log_stream) == expected
 
 
-def test__add_log_from_parsed_log_streams_to_heap():
+def test_interleave_logs_is_lazy():
     """
     Test cases:
 
@@ -1102,140 +1125,64 @@ def test__add_log_from_parsed_log_streams_to_heap():
     Source 2:           -- --
     Source 3:        -- -- --
     """
-    heap: list[tuple[int, StructuredLogMessage]] = []
-    input_parsed_log_streams: dict[int, ParsedLogStream] = {
-        0: convert_list_to_stream(
-            mock_parsed_logs_factory("Source 1", pendulum.parse("2022-11-16T00:05:54.270000-08:00"), 1)
-        ),
-        1: convert_list_to_stream(
-            mock_parsed_logs_factory("Source 2", pendulum.parse("2022-11-16T00:05:54.290000-08:00"), 2)
-        ),
-        2: convert_list_to_stream(
-            mock_parsed_logs_factory("Source 3", pendulum.parse("2022-11-16T00:05:54.380000-08:00"), 3)
-        ),
-    }
-
-    # Check that we correctly get the first line of each non-empty log stream
-
-    # First call: should add log records for all log streams
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 3
-    assert len(heap) == 3
-    # Second call: source 1 is empty, should add log records for source 2 and source 3
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 2  # Source 1 should be removed
-    assert len(heap) == 5
-    # Third call: source 1 and source 2 are empty, should add log records for source 3
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 1  # Source 2 should be removed
-    assert len(heap) == 6
-    # Fourth call: source 1, source 2, and source 3 are empty, should not add any log records
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 0  # Source 3 should be removed
-    assert len(heap) == 6
-    # Fifth call: all sources are empty, should not add any log records
-    assert len(input_parsed_log_streams) == 0  # remains empty
-    assert len(heap) == 6  # no change in heap size
-    # Check heap
-    expected_logs: list[str] = [
-        "Source 1 Event 0",
-        "Source 2 Event 0",
+    read_events: list[str] = []
+
+    def log_stream(source: str, start: str, count: int):
+        for timestamp, _, log in mock_parsed_logs_factory(source, pendulum.parse(start), count):
+            read_events.append(log.event)
+            yield f"[{timestamp.isoformat()}] {log.event}"
+
+    interleaved = _interleave_logs(
+        log_stream("Source 1", "2022-11-16T00:05:27", 1),
+        log_stream("Source 2", "2022-11-16T00:05:29", 2),
+        log_stream("Source 3", "2022-11-16T00:05:28", 3),
+    )
+
+    # Only the first record of each log stream is read to yield the first record.
+    assert next(interleaved).event.endswith("Source 1 Event 0")
+    assert read_events == ["Source 1 Event 0", "Source 2 Event 0", "Source 3 Event 0"]
+    assert [log.event.split("] ")[1] for log in interleaved] == [
         "Source 3 Event 0",
-        "Source 2 Event 1",
+        "Source 2 Event 0",
         "Source 3 Event 1",
+        "Source 2 Event 1",
         "Source 3 Event 2",
     ]
-    actual_logs: list[str] = []
-    for _ in range(len(heap)):
-        _, log = heapq.heappop(heap)
-        actual_logs.append(log.event)
-    assert actual_logs == expected_logs
 
 
 @pytest.mark.parametrize(
-    ("heap_setup", "flush_size", "last_log", "expected_events"),
+    ("log_streams", "expected_events"),
     [
         pytest.param(
-            [("msg1", "2023-01-01"), ("msg2", "2023-01-02")],
-            2,
-            None,
+            [["[2023-01-01T00:00:00Z] msg1", "[2023-01-02T00:00:00Z] msg2"]],
             ["msg1", "msg2"],
-            id="exact_size_flush",
+            id="single_stream",
         ),
         pytest.param(
             [
-                ("msg1", "2023-01-01"),
-                ("msg2", "2023-01-02"),
-                ("msg3", "2023-01-03"),
-                ("msg3", "2023-01-03"),
-                ("msg5", "2023-01-05"),
+                ["[2023-01-01T00:00:00Z] msg1", "[2023-01-03T00:00:00Z] msg3"],
+                ["[2023-01-01T00:00:00Z] msg1", "[2023-01-02T00:00:00Z] msg2", "[2023-01-03T00:00:00Z] msg3"],
             ],
-            5,
-            None,
-            ["msg1", "msg2", "msg3", "msg5"],  # msg3 is deduplicated, msg5 has default timestamp
-            id="flush_with_duplicates",
+            ["msg1", "msg2", "msg3"],
+            id="duplicates_across_streams",
         ),
         pytest.param(
-            [("msg1", "2023-01-01"), ("msg1", "2023-01-01"), ("msg2", "2023-01-02")],
-            3,
-            "msg1",
-            ["msg2"],  # The last_log is "msg1", so any duplicates of "msg1" should be skipped
-            id="flush_with_last_log",
+            [["msg1", "msg1", "msg2"], ["msg1"]],
+            ["msg1", "msg1", "msg1", "msg2"],
+            id="duplicates_with_default_timestamp",
         ),
         pytest.param(
-            [("msg1", "DEFAULT"), ("msg1", "DEFAULT"), ("msg2", "DEFAULT")],
-            3,
-            "msg1",
-            [
-                "msg1",
-                "msg1",
-                "msg2",
-            ],  # All messages have default timestamp, so they should be flushed even if last_log is "msg1"
-            id="flush_with_default_timestamp_and_last_log",
-        ),
-        pytest.param(
-            [("msg1", "2023-01-01"), ("msg2", "2023-01-02"), ("msg3", "2023-01-03")],
-            2,
-            None,
-            ["msg1", "msg2"],  # Only the first two messages should be flushed
-            id="flush_size_smaller_than_heap",
+            [["[2023-01-02T00:00:00Z] second"], ["[2023-01-02T00:00:00Z] first", "no timestamp"]],
+            ["second", "first", "no timestamp"],
+            id="same_sort_key_in_stream_order",
         ),
+        pytest.param([[], []], [], id="empty_streams"),
     ],
 )
-def test__flush_logs_out_of_heap(heap_setup, flush_size, last_log, expected_events):
-    """Test the _flush_logs_out_of_heap function with different scenarios."""
-
-    # Create structured log messages from the test setup
-    heap = []
-    messages = {}
-    for i, (event, timestamp_str) in enumerate(heap_setup):
-        if timestamp_str == "DEFAULT":
-            timestamp = DEFAULT_SORT_DATETIME
-        else:
-            timestamp = pendulum.parse(timestamp_str)
-
-        msg = StructuredLogMessage(event=event, timestamp=timestamp)
-        messages[event] = msg
-        heapq.heappush(heap, (_create_sort_key(msg.timestamp, i), msg))
-
-    # Set last_log if specified in the test case
-    last_log_obj = messages.get(last_log) if last_log is not None else None
-    last_log_container = [last_log_obj]
-
-    # Run the function under test
-    result = list(_flush_logs_out_of_heap(heap, flush_size, last_log_container))
-
-    # Verify the results
-    assert len(result) == len(expected_events)
-    assert len(heap) == (len(heap_setup) - flush_size)
-    for i, expected_event in enumerate(expected_events):
-        assert result[i].event == expected_event, f"result = {result}, expected_event = {expected_events}"
-
-    # verify that the last log is updated correctly
-    last_log_obj = last_log_container[0]
-    assert last_log_obj is not None
-    last_log_obj = cast("StructuredLogMessage", last_log_obj)
-    assert last_log_obj.event == expected_events[-1]
+def test_interleave_logs_merge(log_streams, expected_events):
+    logs = _interleave_logs(*(convert_list_to_stream(log_stream) for log_stream in log_streams))
+
+    assert [log.event.split("] ")[-1] for log in logs] == expected_events
 
 
 def test_interleave_interleaves():
@@ -0,0 +1,119 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from airflow.utils.phase_profiler import PhaseProfiler
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+class TestPhaseProfiler:
+    def test_nested_phases(self):
+        profiler = PhaseProfiler("test")
+        for _ in range(2):
+            with profiler.phase("loop"):
+                with profiler.phase("inner"):
+                    pass
+
+        assert set(profiler.stats) == {("loop",), ("loop", "inner")}
+        loop, inner = profiler.stats[("loop",)], profiler.stats[("loop", "inner")]
+        assert loop.calls == inner.calls == 2
+        assert loop.total_time >= inner.total_time
+        assert loop.self_time == pytest.approx(loop.total_time - inner.total_time)
+
+    def test_wrap(self):
+        profiler = PhaseProfiler("test")
+
+        def _check():
+            return 42
+
+        wrapped = profiler.wrap(_check)
+        assert wrapped() == 42
+        assert profiler.stats[("check",)].calls == 1
+
+    def test_disabled(self, engine):
+        profiler = PhaseProfiler("test", enabled=False)
+
+        def check():
+            pass
+
+        assert profiler.wrap(check) is check
+        profiler.attach(engine)
+        with profiler.phase("loop"):
+            pass
+        assert profiler.stats == {}
+        assert profiler._engine is None
+
+    def test_queries_are_counted_towards_the_current_phase(self, engine):
+        profiler = PhaseProfiler("test")
+        profiler.attach(engine)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with profiler.phase("loop"):
+                conn.execute(text("SELECT 1"))
+                with profiler.phase("inner"):
+                    conn.execute(text("SELECT 1"))
+                    conn.execute(text("SELECT 1"))
+            profiler.detach()
+            with profiler.phase("loop"):
+                conn.execute(text("SELECT 1"))
+
+        assert profiler.stats[("loop",)].queries == 1
+        assert profiler.stats[("loop", "inner")].queries == 2
+        assert profiler.stats[("loop", "inner")].query_time > 0
+
+    @mock.patch("airflow.utils.phase_profiler.stats")
+    def test_metrics(self, mock_stats, engine):
+        profiler = PhaseProfiler("test")
+        profiler.attach(engine)
+        with engine.connect() as conn, profiler.phase("loop"):
+            conn.execute(text("SELECT 1"))
+        profiler.detach()
+
+        assert [c.args[0] for c in mock_stats.timing.mock_calls] == ["test.duration", "test.query_duration"]
+        assert all(c.kwargs["tags"] == {"phase": "loop"} for c in mock_stats.timing.mock_calls)
+        mock_stats.incr.assert_called_once_with("test.queries", 1, tags={"phase": "loop"})
+
+    def test_dump(self):
+        profiler = PhaseProfiler("test")
+        with profiler.phase("loop"):
+            with profiler.phase("inner"):
+                pass
+        profiler.stats[("loop",)].self_time = 0.5
+        profiler.stats[("loop", "inner")].self_time = 0.25
+        profiler.stats[("loop", "inner")].query_time = 0.125
+
+        assert profiler.collapsed_stacks() == [
+            "loop 500000",
+            "loop;inner 250000",
+            "loop;inner;[sql] 125000",
+        ]
+        dump = profiler.dump().splitlines()
+        assert dump[1].startswith("loop ")
+        assert dump[2].startswith("  inner ")
+        assert dump[-3:] == profiler.collapsed_stacks()
@@ -0,0 +1,91 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import multiprocessing
+import queue
+
+import pytest
+
+from airflow.utils.shared_memory_ring_buffer import SharedMemoryRingBuffer
+
+
+@pytest.fixture
+def ring_buffer():
+    buffer = SharedMemoryRingBuffer(64)
+    yield buffer
+    buffer.close()
+
+
+def _produce(buffer: SharedMemoryRingBuffer, producer: int, count: int) -> None:
+    for i in range(count):
+        buffer.put(f"{producer}:{i}".encode())
+
+
+class TestSharedMemoryRingBuffer:
+    def test_messages_are_read_in_order(self, ring_buffer):
+        assert ring_buffer.empty()
+        assert ring_buffer.get_all() == []
+
+        ring_buffer.put(b"first")
+        ring_buffer.put(b"")
+        ring_buffer.put(b"third")
+
+        assert not ring_buffer.empty()
+        assert ring_buffer.get_all() == [b"first", b"", b"third"]
+        assert ring_buffer.empty()
+
+    def test_messages_wrap_around_the_end_of_the_buffer(self, ring_buffer):
+        for i in range(20):
+            message = bytes([i]) * 25
+            ring_buffer.put(message)
+            assert ring_buffer.get_all() == [message]
+
+    def test_put_waits_for_room(self, ring_buffer):
+        ring_buffer.put(b"x" * 50)
+        with pytest.raises(queue.Full):
+            ring_buffer.put(b"y" * 20, timeout=0.01)
+
+        ring_buffer.get_all()
+        ring_buffer.put(b"y" * 20, timeout=0.01)
+        assert ring_buffer.get_all() == [b"y" * 20]
+
+    def test_message_larger_than_the_buffer(self, ring_buffer):
+        with pytest.raises(ValueError, match="does not fit"):
+            ring_buffer.put(b"x" * 61)
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork", reason="the buffer is only shared with forked processes"
+    )
+    def test_messages_from_forked_producers(self, ring_buffer):
+        producers = [
+            multiprocessing.Process(target=_produce, args=(ring_buffer, producer, 100))
+            for producer in range(3)
+        ]
+        for process in producers:
+            process.start()
+
+        messages: list[bytes] = []
+        while len(messages) < 300:
+            messages.extend(ring_buffer.get_all())
+        for process in producers:
+            process.join()
+
+        for producer in range(3):
+            sent = [message for message in messages if message.startswith(f"{producer}:".encode())]
+            assert sent == [f"{producer}:{i}".encode() for i in range(100)]
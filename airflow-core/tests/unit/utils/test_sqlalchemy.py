@@ -193,6 +193,29 @@ class TestSqlAlchemyUtils:
             with pytest.raises(RuntimeError, match="UNEXPECTED COMMIT"):
                 self.session.commit()
 
+    def test_prohibit_commit_allows_savepoints(self):
+        with prohibit_commit(self.session) as guard:
+            with guard.begin_nested():
+                self.session.execute(text("SELECT 1"))
+
+            with pytest.raises(RuntimeError, match="UNEXPECTED COMMIT"):
+                self.session.commit()
+            self.session.rollback()
+
+            # Only the savepoints opened through the guard can be released
+            with pytest.raises(RuntimeError, match="UNEXPECTED COMMIT"):
+                with self.session.begin_nested():
+                    self.session.execute(text("SELECT 1"))
+            self.session.rollback()
+
+    def test_prohibit_commit_in_savepoint(self):
+        with prohibit_commit(self.session) as guard:
+            with guard.begin_nested():
+                self.session.execute(text("SELECT 1"))
+                with pytest.raises(RuntimeError, match="UNEXPECTED COMMIT"):
+                    self.session.commit()
+            self.session.rollback()
+
     def test_prohibit_commit_specific_session_only(self):
         """
         Test that "prohibit_commit" applies only to the given session object,
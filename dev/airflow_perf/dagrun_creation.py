@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare creating Dag runs one by one with creating them in bulk.
+
+Writes a Dag with the given number of tasks to the configured metadata database and
+creates the given number of daily runs for it, like a backfill does, once with
+``SerializedDAG.create_dagrun`` for every run and once with ``SerializedDAG.create_dagruns``.
+Everything the benchmark writes is rolled back.
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+
+import rich_click as click
+
+START_DATE = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+BUNDLE_NAME = "perf_dagrun_creation"
+
+
+def create_one_by_one(dag, runs, session):
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    for run_id, info in runs.items():
+        dag.create_dagrun(
+            run_id=run_id,
+            logical_date=info.logical_date,
+            data_interval=info.data_interval,
+            run_after=info.run_after,
+            run_type=DagRunType.BACKFILL_JOB,
+            triggered_by=DagRunTriggeredByType.BACKFILL,
+            state=DagRunState.QUEUED,
+            session=session,
+        )
+
+
+def create_in_bulk(dag, runs, session):
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    dag.create_dagruns(
+        runs,
+        run_type=DagRunType.BACKFILL_JOB,
+        triggered_by=DagRunTriggeredByType.BACKFILL,
+        state=DagRunState.QUEUED,
+        session=session,
+    )
+
+
+@click.command()
+@click.option("--runs", default=2000, help="number of Dag runs to create")
+@click.option("--tasks", default=10, help="number of tasks in the Dag")
+def main(runs, tasks):
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.dagrun import DagRun
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+    from airflow.timetables.base import DagRunInfo
+    from airflow.utils.session import create_session
+    from airflow.utils.types import DagRunType
+
+    dag_id = "perf_dagrun_creation"
+    with DAG(dag_id, schedule="@daily", start_date=START_DATE) as sdk_dag:
+        for i in range(tasks):
+            EmptyOperator(task_id=f"task_{i}")
+
+    data = DagSerialization.to_dict(sdk_dag)
+    dag = DagSerialization.from_dict(data)
+    infos = (
+        DagRunInfo.interval(
+            START_DATE + datetime.timedelta(days=i), START_DATE + datetime.timedelta(days=i + 1)
+        )
+        for i in range(runs)
+    )
+    new_runs = {
+        DagRun.generate_run_id(
+            run_type=DagRunType.BACKFILL_JOB, logical_date=info.logical_date, run_after=info.run_after
+        ): info
+        for info in infos
+    }
+
+    click.echo(f"{runs} runs of a Dag with {tasks} tasks\n")
+    click.echo(f"{'method':<12}{'seconds':>10}{'runs/s':>10}")
+    for name, create in (("one by one", create_one_by_one), ("bulk", create_in_bulk)):
+        with create_session(scoped=False) as session:
+            try:
+                session.merge(DagBundleModel(name=BUNDLE_NAME))
+                session.flush()
+                SerializedDAG.bulk_write_to_db(BUNDLE_NAME, None, [sdk_dag], session=session)
+                SerializedDagModel.write_dag(LazyDeserializedDAG(data=data), BUNDLE_NAME, session=session)
+                session.flush()
+                start = time.perf_counter()
+                create(dag, new_runs, session)
+                session.flush()
+                elapsed = time.perf_counter() - start
+            finally:
+                session.rollback()
+        click.echo(f"{name:<12}{elapsed:>10.2f}{runs / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how many short tasks a LocalExecutor gets through, with and without its high-throughput mode.
+
+Queues the given number of task workloads on a ``LocalExecutor`` and reports the time until the
+executor received the results of all of them, once in the default mode and once with
+``[core] local_executor_high_throughput``. The workers do not run the tasks: by default every
+task is a forked process that imports the task runner and exits, like the process a task runs in
+starts, and with ``--no-fork-tasks`` the workers report success straight away, to only measure
+how fast workloads and results are exchanged. The metadata database is not used.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import rich_click as click
+
+
+def make_workloads(count):
+    from uuid6 import uuid7
+
+    from airflow.executors import workloads
+    from airflow.executors.workloads.base import BundleInfo
+    from airflow.executors.workloads.task import TaskInstanceDTO
+
+    return [
+        workloads.ExecuteTask(
+            ti=TaskInstanceDTO(
+                id=uuid7(),
+                dag_version_id=uuid7(),
+                task_id=f"task_{i}",
+                dag_id="perf_local_executor",
+                run_id="run",
+                try_number=1,
+                pool_slots=1,
+                queue="default",
+                priority_weight=1,
+            ),
+            dag_rel_path="perf_local_executor.py",
+            bundle_info=BundleInfo(name="perf_local_executor"),
+            token="",
+            log_path=None,
+        )
+        for i in range(count)
+    ]
+
+
+def fork_task(workload, **kwargs):
+    pid = os.fork()
+    if pid == 0:
+        try:
+            from airflow.sdk.execution_time import task_runner  # noqa: F401
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    return 0
+
+
+def skip_task(workload, **kwargs):
+    return 0
+
+
+def run(tasks, parallelism, high_throughput, fork_tasks, timeout):
+    from airflow.configuration import conf
+    from airflow.executors.base_executor import BaseExecutor
+    from airflow.executors.local_executor import LocalExecutor
+
+    # The workers are forked from this process, so they run the replaced method.
+    BaseExecutor.run_workload = staticmethod(fork_task if fork_tasks else skip_task)  # type: ignore[method-assign]
+    conf.set("core", "local_executor_high_throughput", str(high_throughput))
+    executor = LocalExecutor(parallelism=parallelism)
+    executor.start()
+    try:
+        pending = make_workloads(tasks)
+        start = time.monotonic()
+        sent = done = 0
+        while done < tasks:
+            if time.monotonic() - start > timeout:
+                raise RuntimeError(f"Only {done} tasks done after {timeout}s")
+            # Like the scheduler, never hand the executor more tasks than it has free workers.
+            batch = pending[sent : sent + parallelism - (sent - done)]
+            if batch:
+                for workload in batch:
+                    executor.queue_workload(workload, session=None)
+                executor._process_workloads(batch)
+                sent += len(batch)
+            executor.sync()
+            done += sum(state == "success" for state, _ in executor.get_event_buffer().values())
+        return time.monotonic() - start
+    finally:
+        executor.end()
+
+
+@click.command()
+@click.option("--tasks", default=5000, help="number of tasks to run")
+@click.option("--parallelism", default=os.cpu_count(), help="number of worker processes")
+@click.option("--fork-tasks/--no-fork-tasks", default=True, help="fork a process for every task")
+@click.option("--timeout", default=600.0, help="seconds to wait for all tasks before giving up")
+def main(tasks, parallelism, fork_tasks, timeout):
+    click.echo(f"{tasks} tasks on {parallelism} workers\n")
+    click.echo(f"{'mode':<18}{'seconds':>10}{'tasks/s':>10}")
+    for name, high_throughput in (("default", False), ("high-throughput", True)):
+        # Every mode runs in a fresh process, so that it does not benefit from what the other imported.
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as pool:
+            elapsed = pool.submit(run, tasks, parallelism, high_throughput, fork_tasks, timeout).result()
+        click.echo(f"{name:<18}{elapsed:>10.2f}{tasks / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
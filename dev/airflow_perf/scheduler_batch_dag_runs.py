@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare making the scheduling decisions of Dag runs one by one with making them in batch.
+
+Writes a Dag with the given number of tasks to the configured metadata database, creates the
+given number of running Dag runs for it, and makes the scheduling decisions of all of them
+once, like a scheduler loop does, with ``[scheduler] batch_schedule_dag_runs`` off and on.
+The tasks either form a chain, so one task per run is scheduled, or are all independent, so
+all of them are.
+
+The saved queries matter most when every query has to go over the network to the metadata
+database, which ``--latency-ms`` simulates by sleeping before every statement. Everything the
+benchmark writes is rolled back.
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+from contextlib import contextmanager
+
+import rich_click as click
+
+START_DATE = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+BUNDLE_NAME = "perf_scheduler_batch_dag_runs"
+DAG_ID = "perf_scheduler_batch_dag_runs"
+
+
+class FlushingGuard:
+    """Stand-in for the scheduler's commit guard, which flushes so everything can be rolled back."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def commit(self):
+        self.session.flush()
+
+
+@contextmanager
+def count_queries(engine, latency):
+    from sqlalchemy import event
+
+    queries = 0
+
+    def before_cursor_execute(*args, **kwargs):
+        nonlocal queries
+        queries += 1
+        if latency:
+            time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield lambda: queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def make_dag(tasks, shape):
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG, chain
+
+    with DAG(DAG_ID, schedule="@daily", start_date=START_DATE) as dag:
+        operators = [EmptyOperator(task_id=f"task_{i}") for i in range(tasks)]
+        if shape == "chain":
+            chain(*operators)
+    return dag
+
+
+def schedule_dag_runs(sdk_dag, runs, batch, latency):
+    from sqlalchemy import select
+
+    from airflow.executors.local_executor import LocalExecutor
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.dagrun import DagRun
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+    from airflow.timetables.base import DagRunInfo
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    data = DagSerialization.to_dict(sdk_dag)
+    dag = DagSerialization.from_dict(data)
+    infos = (
+        DagRunInfo.interval(
+            START_DATE + datetime.timedelta(days=i), START_DATE + datetime.timedelta(days=i + 1)
+        )
+        for i in range(runs)
+    )
+    new_runs = {
+        DagRun.generate_run_id(
+            run_type=DagRunType.MANUAL, logical_date=info.logical_date, run_after=info.run_after
+        ): info
+        for info in infos
+    }
+    with create_session(scoped=False) as session:
+        try:
+            session.merge(DagBundleModel(name=BUNDLE_NAME))
+            session.flush()
+            SerializedDAG.bulk_write_to_db(BUNDLE_NAME, None, [sdk_dag], session=session)
+            SerializedDagModel.write_dag(LazyDeserializedDAG(data=data), BUNDLE_NAME, session=session)
+            session.flush()
+            dag.create_dagruns(
+                new_runs,
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.RUNNING,
+                start_date=datetime.datetime.now(tz=datetime.timezone.utc),
+                session=session,
+            )
+            job = Job()
+            session.add(job)
+            session.flush()
+            runner = SchedulerJobRunner(job=job, executors=[LocalExecutor()])
+            runner._batch_schedule_dag_runs = batch
+            dag_runs = session.scalars(select(DagRun).where(DagRun.dag_id == DAG_ID)).all()
+
+            with count_queries(session.get_bind(), latency) as queries:
+                start = time.perf_counter()
+                runner._schedule_all_dag_runs(FlushingGuard(session), dag_runs, session=session)
+                elapsed = time.perf_counter() - start
+            return queries(), elapsed
+        finally:
+            session.rollback()
+
+
+@click.command()
+@click.option("--runs", default=100, help="number of running Dag runs")
+@click.option("--tasks", default=20, help="number of tasks in the Dag")
+@click.option(
+    "--shape",
+    type=click.Choice(["chain", "parallel"]),
+    default="parallel",
+    help="whether the tasks form a chain or are independent",
+)
+@click.option(
+    "--latency-ms",
+    "latencies",
+    default="0,1,2",
+    help="comma-separated simulated round-trip latencies to the database, in milliseconds",
+)
+@click.option("--repeat", default=3, help="number of times each measurement is repeated")
+def main(runs, tasks, shape, latencies, repeat):
+    sdk_dag = make_dag(tasks, shape)
+
+    click.echo(f"{runs} running Dag runs of a Dag with {tasks} tasks ({shape})\n")
+    click.echo(f"{'latency ms':>10}  {'mode':<10}{'queries':>9}{'best s':>9}")
+    for latency_ms in (float(latency) for latency in latencies.split(",")):
+        for name, batch in (("per run", False), ("batch", True)):
+            results = [schedule_dag_runs(sdk_dag, runs, batch, latency_ms / 1000) for _ in range(repeat)]
+            queries = results[0][0]
+            best = min(elapsed for _, elapsed in results)
+            click.echo(f"{latency_ms:>10g}  {name:<10}{queries:>9}{best:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how long the secrets masker takes to redact a log line, depending on how many secrets it masks.
+
+For every number of secrets, adds that many random secrets to a ``SecretsMasker`` one by one, then
+redacts the same log line many times, and reports the time it took to add all the secrets, to redact
+the line the first time after that, and the mean time to redact it. The same is reported for a single
+regular expression alternating all the secrets, which is how the secrets masker used to match them:
+it used to recompile the expression whenever a secret was added, here it is only compiled when the
+line is first redacted.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import string
+import time
+
+import rich_click as click
+
+LINE = (
+    "[2026-01-01T00:00:00.000+0000] {taskinstance.py:1400} INFO - Marking task as SUCCESS. "
+    "dag_id=example_dag, task_id=extract, run_id=scheduled__2026-01-01T00:00:00+00:00, "
+    "execution_date=20260101T000000"
+)
+
+
+def random_secrets(count, seed):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits
+    return ["".join(rng.choices(alphabet, k=rng.randint(12, 40))) for _ in range(count)]
+
+
+def measure(add, sub, secrets, repeat, line):
+    start = time.perf_counter()
+    for secret in secrets:
+        add(secret)
+    added = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sub("***", line)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sub("***", line)
+    return added, first, (time.perf_counter() - start) / repeat
+
+
+def measure_masker(secrets, repeat, line):
+    from airflow._shared.secrets_masker import SecretsMasker
+
+    masker = SecretsMasker()
+    masker.sensitive_variables_fields = []
+    return measure(masker.add_mask, lambda replacement, text: masker.redact(text), secrets, repeat, line)
+
+
+def measure_alternation(secrets, repeat, line):
+    patterns: set[str] = set()
+    replacer = None
+
+    def add(secret):
+        nonlocal replacer
+        patterns.add(re.escape(secret))
+        replacer = None
+
+    def sub(replacement, text):
+        # Compiled when the line is first redacted, and not after every secret, to keep the benchmark short.
+        nonlocal replacer
+        if replacer is None:
+            replacer = re.compile("|".join(patterns))
+        return replacer.sub(replacement, text)
+
+    return measure(add, sub, secrets, repeat, line)
+
+
+@click.command()
+@click.option(
+    "--secrets", "counts", default="10,1000,10000", help="comma-separated numbers of secrets to mask"
+)
+@click.option("--repeat", default=1000, help="number of times the line is redacted")
+@click.option("--with-secret/--without-secret", default=True, help="include one of the secrets in the line")
+@click.option("--seed", default=0, help="seed of the random secrets")
+def main(counts, repeat, with_secret, seed):
+    click.echo(f"{'secrets':>8}  {'matcher':<12}{'add all ms':>12}{'first line ms':>15}{'per line us':>13}")
+    for count in (int(count) for count in counts.split(",")):
+        secrets = random_secrets(count, seed)
+        line = f"{LINE} password={secrets[count // 2]}" if with_secret else LINE
+        for name, measure_matcher in (
+            ("alternation", measure_alternation),
+            ("masker", measure_masker),
+        ):
+            added, first, per_line = measure_matcher(secrets, repeat, line)
+            click.echo(
+                f"{count:>8}  {name:<12}{added * 1000:>12.1f}{first * 1000:>15.2f}{per_line * 1e6:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the storage encodings of serialized Dags.
+
+Serializes the Dags of a folder (the example Dags by default) and reports, for every
+encoding ``SerializedDagModel`` can store, the total stored size and the time taken
+to encode and decode all of them.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import zlib
+from collections.abc import Callable
+
+import rich_click as click
+
+ENCODINGS = ("json", "json+zlib", "msgpack", "msgpack+zlib")
+
+
+def get_encoders() -> dict[str, tuple[Callable[[dict], bytes], Callable[[bytes], object]]]:
+    from airflow.models.serialized_dag import _decode_stored_data, _encode_binary_data
+    from airflow.settings import json
+
+    def encode_json(data):
+        return json.dumps(data, sort_keys=True).encode("utf-8")
+
+    return {
+        # What the DB driver does for the JSON column.
+        "json": (encode_json, json.loads),
+        "json+zlib": (lambda data: zlib.compress(encode_json(data)), _decode_stored_data),
+        "msgpack": (lambda data: _encode_binary_data(data, compress=False), _decode_stored_data),
+        "msgpack+zlib": (lambda data: _encode_binary_data(data, compress=True), _decode_stored_data),
+    }
+
+
+def timed(func: Callable, items: list, repeat: int) -> float:
+    """Return the median time taken to apply ``func`` to all items, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+@click.command()
+@click.option("--repeat", default=5, help="number of times to run each measurement, the median is reported")
+@click.option("--dag-folder", default=None, help="folder to load Dags from, the example Dags by default")
+def main(repeat, dag_folder):
+    from airflow import example_dags
+    from airflow.dag_processing.dagbag import DagBag
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    dagbag = DagBag(dag_folder or example_dags.__path__[0], include_examples=False)
+    serialized = [DagSerialization.to_dict(dag) for dag in dagbag.dags.values()]
+    num_tasks = sum(len(dag.task_dict) for dag in dagbag.dags.values())
+    click.echo(f"{len(serialized)} Dags, {num_tasks} tasks, median of {repeat} runs\n")
+
+    click.echo(f"{'encoding':<14}{'size (KiB)':>12}{'encode (ms)':>14}{'decode (ms)':>14}")
+    for name, (encode, decode) in get_encoders().items():
+        encoded = [encode(data) for data in serialized]
+        size = sum(len(data) for data in encoded) / 1024
+        encode_time = timed(encode, serialized, repeat) * 1000
+        decode_time = timed(decode, encoded, repeat) * 1000
+        click.echo(f"{name:<14}{size:>12.1f}{encode_time:>14.2f}{decode_time:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure the memory and time it takes to interleave the logs of a task read from several sources.
+
+Generates log streams of JSON lines with increasing timestamps, like the log files of a task read
+locally, from the logs server and from remote storage, and reads them all through the interleaving
+of ``FileTaskHandler``. Reports the peak of memory allocated while reading, the time until the first
+record is read, and the total time. The same is reported for the batched heap the logs used to be
+interleaved with, which read one record of every stream at a time and only yielded records once
+5000 of them were held, and for reading the logs of a finished task through ``FileTaskHandler._read``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import rich_click as click
+
+HEAP_DUMP_SIZE = 5000
+
+
+def log_stream(source, lines, interval):
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(lines):
+        timestamp = start + timedelta(milliseconds=i * interval + source)
+        yield json.dumps(
+            {
+                "timestamp": timestamp.isoformat(),
+                "level": "info",
+                "event": f"Source {source} processed record {i} of the batch",
+                "logger": "airflow.task",
+            }
+        )
+
+
+def batched_heap(*log_streams):
+    from airflow.utils.log.file_task_handler import (
+        _create_sort_key,
+        _is_sort_key_with_default_timestamp,
+        _log_stream_to_parsed_log_stream,
+    )
+
+    heap = []
+    parsed_log_streams = dict(enumerate(map(_log_stream_to_parsed_log_stream, log_streams)))
+    last_log = None
+
+    def flush(size):
+        nonlocal last_log
+        for _ in range(size):
+            sort_key, line = heapq.heappop(heap)
+            if line != last_log or _is_sort_key_with_default_timestamp(sort_key):
+                yield line
+            last_log = line
+
+    while parsed_log_streams:
+        for idx, parsed_log_stream in list(parsed_log_streams.items()):
+            record = next(parsed_log_stream, None)
+            if record is None:
+                del parsed_log_streams[idx]
+                continue
+            timestamp, line_num, line = record
+            heapq.heappush(heap, (_create_sort_key(timestamp, line_num), line))
+        if len(heap) >= HEAP_DUMP_SIZE:
+            yield from flush(HEAP_DUMP_SIZE // 2)
+    yield from flush(len(heap))
+
+
+def lazy_merge(*log_streams):
+    from airflow.utils.log.file_task_handler import _interleave_logs
+
+    return _interleave_logs(*log_streams)
+
+
+def handler_read(*log_streams):
+    from unittest import mock
+
+    from airflow.utils.log.file_task_handler import FileTaskHandler
+    from airflow.utils.state import TaskInstanceState
+
+    handler = FileTaskHandler("")
+    ti = mock.Mock(try_number=1, state=TaskInstanceState.SUCCESS)
+    with (
+        mock.patch.object(handler, "_render_filename", return_value="attempt=1.log"),
+        mock.patch.object(handler, "_read_remote_logs", side_effect=NotImplementedError),
+        mock.patch.object(handler, "_read_from_local", return_value=([], list(log_streams))),
+    ):
+        out_stream, _ = handler._read(ti, 1)
+    return out_stream
+
+
+def measure(interleave, sources, lines, interval):
+    log_streams = [log_stream(source, lines, interval) for source in range(sources)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = interleave(*log_streams)
+    next(records)
+    first = time.perf_counter() - start
+    count = 1 + sum(1 for _ in records)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak, first, elapsed
+
+
+@click.command()
+@click.option("--sources", default=3, help="number of log streams to interleave")
+@click.option("--lines", "counts", default="10000,100000", help="comma-separated numbers of lines per stream")
+@click.option("--interval", default=10, help="milliseconds between the records of a stream")
+def main(sources, counts, interval):
+    # Imported before measuring, so that the memory they take is not counted.
+    import airflow.utils.log.file_task_handler  # noqa: F401
+
+    click.echo(
+        f"{'lines':>8}  {'interleaving':<14}{'records':>10}{'peak MiB':>10}{'first ms':>10}{'total s':>9}"
+    )
+    for lines in (int(count) for count in counts.split(",")):
+        for name, interleave in (
+            ("batched heap", batched_heap),
+            ("lazy merge", lazy_merge),
+            ("handler read", handler_read),
+        ):
+            count, peak, first, elapsed = measure(interleave, sources, lines, interval)
+            click.echo(
+                f"{lines:>8}  {name:<14}{count:>10}{peak / 2**20:>10.2f}{first * 1000:>10.1f}{elapsed:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how fast a triggerer runs a large number of triggers at once.
+
+Hands the triggers of ``airflow.triggers.testing`` to a ``TriggerRunnerSupervisor`` with
+one or more runner subprocesses, see ``[triggerer] runner_processes``, and reports the
+time until the supervisor received an event or a failure for all of them. The metadata
+database is not used: the supervisor is given the triggers directly and only counts the
+events it receives.
+"""
+
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+
+CLASSPATHS = {
+    "success": "airflow.triggers.testing.SuccessTrigger",
+    "failure": "airflow.triggers.testing.FailureTrigger",
+}
+
+
+def make_supervisor_class():
+    from airflow.executors import workloads
+    from airflow.jobs.triggerer_job_runner import TriggerRunnerSupervisor
+
+    class BenchmarkSupervisor(TriggerRunnerSupervisor):
+        """Supervisor running the given triggers without a Job or the metadata database."""
+
+        classpath: str = CLASSPATHS["success"]
+        done: int = 0
+
+        def load_triggers(self) -> None:
+            pass
+
+        def build_trigger_workloads(self, new_trigger_ids: set[int]) -> list[workloads.RunTrigger]:
+            return [
+                workloads.RunTrigger(id=trigger_id, classpath=self.classpath, encrypted_kwargs="{}")
+                for trigger_id in new_trigger_ids
+            ]
+
+        def on_trigger_event(self, trigger_id, event) -> None:
+            BenchmarkSupervisor.done += 1
+
+        def on_trigger_failure(self, trigger_id, exc) -> None:
+            BenchmarkSupervisor.done += 1
+
+        def clean_unused(self) -> None:
+            pass
+
+        def heartbeat(self) -> None:
+            pass
+
+        def metric_tags(self) -> dict[str, str]:
+            return {"hostname": "benchmark"}
+
+    return BenchmarkSupervisor
+
+
+@click.command()
+@click.option("--triggers", default=50_000, help="number of triggers to run at once")
+@click.option(
+    "--runner-processes",
+    default="1,2,4",
+    help="comma-separated numbers of runner subprocesses to compare",
+)
+@click.option(
+    "--trigger", type=click.Choice(list(CLASSPATHS)), default="success", help="testing trigger to run"
+)
+@click.option("--timeout", default=600.0, help="seconds to wait for all triggers before giving up")
+def main(triggers, runner_processes, trigger, timeout):
+    supervisor_class = make_supervisor_class()
+    supervisor_class.classpath = CLASSPATHS[trigger]
+
+    click.echo(f"{triggers} {trigger} triggers\n")
+    click.echo(f"{'runners':>8}{'seconds':>10}{'triggers/s':>12}")
+    for processes in map(int, runner_processes.split(",")):
+        supervisor_class.done = 0
+        supervisor = supervisor_class.start(capacity=triggers, runner_processes=processes)
+        try:
+            start = time.monotonic()
+            supervisor.update_triggers(set(range(1, triggers + 1)))
+            while supervisor_class.done < triggers:
+                if not supervisor.is_alive():
+                    raise click.ClickException("A trigger runner process died")
+                if time.monotonic() - start > timeout:
+                    raise click.ClickException(f"Only {supervisor_class.done} triggers done after {timeout}s")
+                supervisor.run_once()
+            elapsed = time.monotonic() - start
+        finally:
+            supervisor.kill(escalation_delay=10, force=True)
+        click.echo(f"{processes:>8}{elapsed:>10.2f}{triggers / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
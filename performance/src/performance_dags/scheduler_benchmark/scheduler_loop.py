@@ -0,0 +1,307 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the scheduler loop against a synthetic metadata database.
+
+Seeds the configured metadata database (SQLite, Postgres or MySQL) with the Dags, runs and pools
+described by a :class:`~performance_dags.scheduler_benchmark.synthetic_db.MetadataShape`, runs
+the real ``SchedulerJobRunner`` loop with an executor that finishes every task instantly, and
+reports how long each phase of the loop took. Only the scheduler is measured: no task is run and
+no Dag file is parsed.
+
+Run it with::
+
+    python -m performance_dags.scheduler_benchmark.scheduler_loop --dags 50 --tasks 20 --output result.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import logging
+import statistics
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from performance_dags.scheduler_benchmark.synthetic_db import (
+    MetadataShape,
+    TaskLayout,
+    clear_metadata_db,
+    seed_metadata_db,
+)
+from sqlalchemy import func, select, update
+
+from airflow.executors.base_executor import BaseExecutor
+from airflow.executors.executor_utils import ExecutorName
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from airflow.executors import workloads
+    from airflow.models.taskinstancekey import TaskInstanceKey
+
+log = logging.getLogger(__name__)
+
+PHASES = (
+    "_do_scheduling",
+    "_create_dagruns_for_dags",
+    "_start_queued_dagruns",
+    "_schedule_all_dag_runs",
+    "_critical_section_enqueue_task_instances",
+    "_process_executor_events",
+)
+"""Methods of ``SchedulerJobRunner`` that are timed, in the order they run in a loop."""
+
+
+class InstantExecutor(BaseExecutor):
+    """
+    Executor finishing every task as soon as it is queued.
+
+    The task instances are marked successful in the metadata database with a single statement
+    per heartbeat, like a worker reporting back would, and a success event is sent to the
+    scheduler for each of them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = ExecutorName(module_path=f"{__name__}.{type(self).__name__}")
+        self._started: dict[TaskInstanceKey, UUID] = {}
+
+    def _process_workloads(self, workload_items: Sequence[workloads.All]) -> None:
+        for workload in workload_items:
+            key = workload.ti.key
+            del self.queued_tasks[key]
+            self.running.add(key)
+            self._started[key] = workload.ti.id
+
+    def sync(self) -> None:
+        if not self._started:
+            return
+
+        from airflow.models.taskinstance import TaskInstance
+        from airflow.utils.session import create_session
+        from airflow.utils.state import TaskInstanceState
+
+        with create_session() as session:
+            session.execute(
+                update(TaskInstance)
+                .where(TaskInstance.id.in_(list(self._started.values())))
+                .values(state=TaskInstanceState.SUCCESS)
+                .execution_options(synchronize_session=False)
+            )
+        for key in self._started:
+            self.success(key)
+        self._started.clear()
+
+    def end(self) -> None:
+        self.sync()
+
+    def terminate(self) -> None:
+        pass
+
+
+@dataclass
+class PhaseTimings:
+    """Wall-clock durations of every call to the timed phases, in seconds."""
+
+    durations: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+
+    def timed(self, phase: str, method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.durations[phase].append(time.perf_counter() - start)
+
+        return wrapper
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        result = {}
+        for phase, durations in self.durations.items():
+            ordered = sorted(durations)
+            result[phase] = {
+                "calls": len(ordered),
+                "total": sum(ordered),
+                "mean": statistics.fmean(ordered),
+                "p50": ordered[len(ordered) // 2],
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+            }
+        return result
+
+
+def run_scheduler_loop(shape: MetadataShape, *, idle_loops: int = 3, keep: bool = False) -> dict:
+    """
+    Seed the metadata database and run the scheduler until it has nothing left to do.
+
+    The scheduler stops after ``idle_loops`` consecutive loops in which it neither queued a task
+    nor processed an executor event.
+
+    :param shape: Shape of the synthetic metadata database.
+    :param idle_loops: Number of consecutive idle loops after which the scheduler stops.
+    :param keep: Whether to keep the seeded rows in the database afterwards.
+    :return: A JSON-serializable report.
+    """
+    from airflow.jobs.job import Job, run_job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.models import DagRun, TaskInstance
+    from airflow.utils.phase_profiler import PhaseProfiler
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState, TaskInstanceState
+
+    with create_session() as session:
+        dialect = session.get_bind().dialect.name
+        seed_start = time.perf_counter()
+        dag_ids = seed_metadata_db(shape, session=session)
+        seed_duration = time.perf_counter() - seed_start
+
+    executor = InstantExecutor()
+    timings = PhaseTimings()
+    job = Job()
+    job_runner = SchedulerJobRunner(
+        job=job,
+        num_runs=idle_loops,
+        only_idle=True,
+        scheduler_idle_sleep_time=0,
+        executors=[executor],
+    )
+    for phase in PHASES:
+        setattr(job_runner, phase, timings.timed(phase, getattr(job_runner, phase)))
+    executor.heartbeat = timings.timed("executor.heartbeat", executor.heartbeat)  # type: ignore[method-assign]
+    loop_timer = timings.timed("scheduler_loop", job_runner._run_scheduler_loop)
+    job_runner._run_scheduler_loop = loop_timer  # type: ignore[method-assign]
+    # Also collect the built-in phase timings and SQL query counts, whatever the configuration.
+    job_runner._loop_profiler = PhaseProfiler("scheduler.loop_phase")
+
+    start = time.perf_counter()
+    run_job(job=job, execute_callable=job_runner._execute)
+    duration = time.perf_counter() - start
+
+    with create_session() as session:
+        dag_runs = dict(
+            session.execute(
+                select(DagRun.state, func.count()).where(DagRun.dag_id.in_(dag_ids)).group_by(DagRun.state)
+            ).all()
+        )
+        task_instances = dict(
+            session.execute(
+                select(TaskInstance.state, func.count())
+                .where(TaskInstance.dag_id.in_(dag_ids))
+                .group_by(TaskInstance.state)
+            ).all()
+        )
+        if not keep:
+            clear_metadata_db(session)
+
+    loops = len(timings.durations["_do_scheduling"])
+    succeeded = task_instances.get(TaskInstanceState.SUCCESS, 0)
+    return {
+        "shape": shape.as_dict(),
+        "database": dialect,
+        "seed_seconds": seed_duration,
+        "scheduler_seconds": duration,
+        "loops": loops,
+        "dag_runs": {str(state): count for state, count in dag_runs.items()},
+        "task_instances": {str(state): count for state, count in task_instances.items()},
+        "dag_runs_per_second": dag_runs.get(DagRunState.SUCCESS, 0) / duration,
+        "task_instances_per_second": succeeded / duration,
+        "phases": timings.summary(),
+        "loop_phases": {
+            ";".join(path): asdict(phase_stats)
+            for path, phase_stats in job_runner._loop_profiler.stats.items()
+        },
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(
+        f"{report['database']}: {report['loops']} loops in {report['scheduler_seconds']:.2f}s, "
+        f"{report['task_instances_per_second']:.0f} task instances/s, "
+        f"{report['dag_runs_per_second']:.1f} Dag runs/s"
+    )
+    print(f"\n{'phase':<44}{'calls':>7}{'total s':>10}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for phase, stats in report["phases"].items():
+        print(
+            f"{phase:<44}{stats['calls']:>7}{stats['total']:>10.2f}{stats['mean'] * 1000:>10.1f}"
+            f"{stats['p95'] * 1000:>10.1f}{stats['max'] * 1000:>10.1f}"
+        )
+    print(f"\n{'loop phase':<72}{'calls':>7}{'total s':>10}{'queries':>9}{'sql s':>9}")
+    for path, stats in sorted(report["loop_phases"].items()):
+        name = "  " * path.count(";") + path.rpartition(";")[2]
+        print(
+            f"{name:<72}{stats['calls']:>7}{stats['total_time']:>10.2f}"
+            f"{stats['queries']:>9}{stats['query_time']:>9.2f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dags", type=int, default=10, help="Number of Dags.")
+    parser.add_argument("--runs", type=int, default=1, help="Number of queued runs per Dag.")
+    parser.add_argument("--tasks", type=int, default=10, help="Number of tasks per Dag.")
+    parser.add_argument(
+        "--layout",
+        choices=[layout.value for layout in TaskLayout],
+        default=TaskLayout.WIDE.value,
+        help="How the tasks of a Dag depend on each other.",
+    )
+    parser.add_argument("--map-length", type=int, default=10, help="Length of mapped tasks.")
+    parser.add_argument("--pools", type=int, default=0, help="Number of pools to spread the tasks across.")
+    parser.add_argument("--pool-slots", type=int, default=128, help="Number of slots of every pool.")
+    parser.add_argument(
+        "--schedule",
+        default=None,
+        help="Schedule of the Dags, for example @monthly, to also benchmark creating Dag runs.",
+    )
+    parser.add_argument(
+        "--idle-loops",
+        type=int,
+        default=3,
+        help="Number of consecutive idle scheduler loops after which the benchmark stops.",
+    )
+    parser.add_argument("--output", help="File to write the report to, as JSON.")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded rows in the database.")
+    args = parser.parse_args(argv)
+
+    shape = MetadataShape(
+        dags=args.dags,
+        runs_per_dag=args.runs,
+        tasks_per_dag=args.tasks,
+        layout=TaskLayout(args.layout),
+        map_length=args.map_length,
+        pools=args.pools,
+        pool_slots=args.pool_slots,
+        schedule=args.schedule,
+    )
+    report = run_scheduler_loop(shape, idle_loops=args.idle_loops, keep=args.keep)
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Seed the metadata database with synthetic Dags and Dag runs for scheduler benchmarks."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, select, update
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from airflow.sdk import DAG
+
+log = logging.getLogger(__name__)
+
+DAG_ID_PREFIX = "scheduler_benchmark"
+BUNDLE_NAME = "scheduler_benchmark"
+START_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class TaskLayout(Enum):
+    """Define how the tasks of every synthetic Dag depend on each other."""
+
+    WIDE = "wide"
+    """All tasks are independent."""
+    DEEP = "deep"
+    """Every task depends on the previous one."""
+    MAPPED = "mapped"
+    """All tasks are independent and mapped over ``map_length`` values."""
+
+
+@dataclass(frozen=True)
+class MetadataShape:
+    """Shape of the synthetic metadata database."""
+
+    dags: int = 10
+    runs_per_dag: int = 1
+    tasks_per_dag: int = 10
+    layout: TaskLayout = TaskLayout.WIDE
+    map_length: int = 10
+    pools: int = 0
+    """Number of pools the tasks are spread across, or 0 to use the default pool."""
+    pool_slots: int = 128
+    schedule: str | None = None
+    """
+    Schedule of the Dags, or None to only have the pre-created runs.
+
+    With a schedule, the Dags catch up from ``START_DATE`` so the scheduler has runs to create.
+    """
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "layout": self.layout.value}
+
+
+def dag_id(index: int) -> str:
+    return f"{DAG_ID_PREFIX}_{index}"
+
+
+def pool_name(index: int) -> str:
+    return f"{DAG_ID_PREFIX}_pool_{index}"
+
+
+def build_dags(shape: MetadataShape) -> list[DAG]:
+    """Create the synthetic Dags of the given shape."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG, chain
+
+    dags = []
+    for i in range(shape.dags):
+        with DAG(
+            dag_id(i),
+            schedule=shape.schedule,
+            start_date=START_DATE,
+            catchup=shape.schedule is not None,
+            max_active_runs=max(shape.runs_per_dag, 16),
+            max_active_tasks=shape.tasks_per_dag * max(shape.map_length, 1),
+        ) as dag:
+            tasks = []
+            for j in range(shape.tasks_per_dag):
+                kwargs = {"task_id": f"task_{j}"}
+                if shape.pools:
+                    kwargs["pool"] = pool_name(j % shape.pools)
+                if shape.layout is TaskLayout.MAPPED:
+                    task = BashOperator.partial(**kwargs).expand(
+                        bash_command=["true"] * shape.map_length,
+                    )
+                else:
+                    task = BashOperator(bash_command="true", **kwargs)
+                tasks.append(task)
+            if shape.layout is TaskLayout.DEEP:
+                chain(*tasks)
+        dags.append(dag)
+    return dags
+
+
+def clear_metadata_db(session: Session) -> None:
+    """Delete everything a previous benchmark seeded."""
+    from airflow.models import DagModel, DagRun, TaskInstance
+    from airflow.models.pool import Pool
+
+    dag_ids = select(DagModel.dag_id).where(DagModel.dag_id.startswith(f"{DAG_ID_PREFIX}_"))
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id.in_(dag_ids)))
+    session.execute(delete(DagRun).where(DagRun.dag_id.in_(dag_ids)))
+    session.execute(delete(DagModel).where(DagModel.dag_id.in_(dag_ids)))
+    session.execute(delete(Pool).where(Pool.pool.startswith(f"{DAG_ID_PREFIX}_pool_")))
+
+
+def seed_metadata_db(shape: MetadataShape, *, session: Session) -> list[str]:
+    """
+    Write the synthetic Dags of the given shape, their pools and their runs to the metadata database.
+
+    The Dags are written like the Dag processor writes them, and every Dag gets ``runs_per_dag``
+    queued runs. Anything seeded by a previous call is deleted first.
+
+    :return: The IDs of the seeded Dags.
+    """
+    from airflow.dag_processing.dagbag import DagBag, sync_bag_to_db
+    from airflow.models import DagModel
+    from airflow.models.dagbag import DBDagBag
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.pool import Pool
+    from airflow.timetables.base import DagRunInfo
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    clear_metadata_db(session)
+    session.merge(DagBundleModel(name=BUNDLE_NAME))
+    for i in range(shape.pools):
+        session.add(Pool(pool=pool_name(i), slots=shape.pool_slots, include_deferred=False))
+    session.flush()
+
+    dagbag = DagBag(include_examples=False, collect_dags=False)
+    for dag in build_dags(shape):
+        dagbag.bag_dag(dag)
+    sync_bag_to_db(dagbag, BUNDLE_NAME, None, session=session)
+    dag_ids = list(dagbag.dags)
+    session.execute(update(DagModel).where(DagModel.dag_id.in_(dag_ids)).values(is_paused=False))
+
+    # Manual runs without a logical date, so they do not clash with the runs the scheduler
+    # creates for scheduled Dags.
+    info = DagRunInfo(run_after=START_DATE, data_interval=None, partition_date=None, partition_key=None)
+    scheduler_dag_bag = DBDagBag()
+    for dag_id_ in dag_ids:
+        dag = scheduler_dag_bag.get_latest_version_of_dag(dag_id_, session=session)
+        dag.create_dagruns(
+            {f"manual__benchmark_{i}": info for i in range(shape.runs_per_dag)},
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.QUEUED,
+            session=session,
+        )
+    session.flush()
+    log.info(
+        "Seeded %d Dags with %d runs each",
+        len(dag_ids),
+        shape.runs_per_dag,
+    )
+    return dag_ids
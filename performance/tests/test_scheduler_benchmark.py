@@ -0,0 +1,59 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+from performance_dags.scheduler_benchmark.scheduler_loop import PhaseTimings
+from performance_dags.scheduler_benchmark.synthetic_db import (
+    MetadataShape,
+    TaskLayout,
+    build_dags,
+    pool_name,
+)
+
+
+@pytest.mark.parametrize("layout", list(TaskLayout))
+def test_build_dags(layout):
+    dags = build_dags(MetadataShape(dags=3, tasks_per_dag=4, layout=layout, map_length=5))
+
+    assert [dag.dag_id for dag in dags] == [f"scheduler_benchmark_{i}" for i in range(3)]
+    for dag in dags:
+        assert len(dag.tasks) == 4
+        roots = [task.task_id for task in dag.roots]
+        if layout is TaskLayout.DEEP:
+            assert roots == ["task_0"]
+        else:
+            assert len(roots) == 4
+
+
+def test_build_dags_spreads_tasks_across_pools():
+    (dag,) = build_dags(MetadataShape(dags=1, tasks_per_dag=5, pools=2))
+
+    assert [task.pool for task in dag.tasks] == [pool_name(i % 2) for i in range(5)]
+
+
+def test_phase_timings_summary():
+    timings = PhaseTimings()
+    timings.durations["phase"].extend([0.3, 0.1, 0.2])
+
+    summary = timings.summary()["phase"]
+
+    assert summary["calls"] == 3
+    assert summary["total"] == pytest.approx(0.6)
+    assert summary["p50"] == 0.2
+    assert summary["max"] == 0.3
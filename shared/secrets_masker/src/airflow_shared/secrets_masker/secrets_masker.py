@@ -110,10 +110,20 @@ def mask_secret(secret: JsonValue, name: str | None = None) -> None:
 
 
 def redact(
-    value: Redactable, name: str | None = None, max_depth: int | None = None, replacement: str = "***"
+    value: Redactable,
+    name: str | None = None,
+    max_depth: int | None = None,
+    replacement: str = "***",
+    copy_on_write: bool = False,
 ) -> Redacted:
-    """Redact any secrets found in ``value`` with the given replacement."""
-    return _secrets_masker().redact(value, name, max_depth, replacement=replacement)
+    """
+    Redact any secrets found in ``value`` with the given replacement.
+
+    See :meth:`SecretsMasker.redact` for ``copy_on_write``.
+    """
+    return _secrets_masker().redact(
+        value, name, max_depth, replacement=replacement, copy_on_write=copy_on_write
+    )
 
 
 @overload
@@ -186,10 +196,118 @@ def _get_v1_env_var_type_cached() -> type:
         return type("V1EnvVar", (), {})
 
 
+class SecretsMatcher:
+    """
+    Replace every occurrence of any of a set of secrets in strings.
+
+    The secrets are stored in a trie, so adding one only costs its length, and a string is scanned
+    once whatever the number of secrets, trying at every position to walk down the trie. The longest
+    secret starting at the leftmost position is replaced first, and the scan resumes after it.
+
+    A regular expression alternating all the secrets is faster for a handful of them, but compiling
+    it takes longer and matching it gets slower with every secret added, so it is only used while
+    there are at most ``REGEX_MAX_SECRETS`` of them.
+
+    The same strings tend to be redacted over and over, like the messages of log records or the values
+    of rendered template fields, so the result of replacing the secrets in up to ``CACHE_SIZE`` strings
+    no longer than ``CACHE_MAX_LENGTH`` is kept until a secret is added.
+    """
+
+    REGEX_MAX_SECRETS = 64
+    CACHE_SIZE = 1024
+    CACHE_MAX_LENGTH = 4096
+
+    def __init__(self):
+        self._trie: dict[str | None, Any] = {}
+        self._secrets: list[str] = []
+        self._regex: Pattern | None = None
+        self._cache: dict[tuple[str, str], str | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._secrets)
+
+    def add(self, secret: str) -> bool:
+        """Add a secret to replace, returning whether it was not already there."""
+        if not secret:
+            return False
+        node = self._trie
+        for char in secret:
+            node = node.setdefault(char, {})
+        if None in node:
+            return False
+        # The value stored under None marks the end of a secret.
+        node[None] = True
+        self._secrets.append(secret)
+        self._regex = None
+        self._cache.clear()
+        return True
+
+    def sub(self, replacement: str, text: str) -> str:
+        """
+        Return ``text`` with every secret replaced by ``replacement``, taken literally.
+
+        ``text`` itself is returned if it contains no secret.
+        """
+        if len(text) > self.CACHE_MAX_LENGTH:
+            return self._sub(replacement, text)
+        key = (replacement, text)
+        try:
+            result = self._cache[key]
+        except KeyError:
+            result = self._sub(replacement, text)
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            # None stands for no secret, so that the string passed in is returned rather than an equal one.
+            self._cache[key] = None if result is text else result
+            return result
+        return text if result is None else result
+
+    def _sub(self, replacement: str, text: str) -> str:
+        if len(self._secrets) <= self.REGEX_MAX_SECRETS:
+            if not self._secrets:
+                return text
+            if self._regex is None:
+                # Longest first, so that a secret containing another one is replaced entirely.
+                ordered = sorted(self._secrets, key=len, reverse=True)
+                self._regex = re.compile("|".join(map(re.escape, ordered)))
+            return self._regex.sub(replacement.replace("\\", r"\\"), text)
+
+        root = self._trie
+        parts = []
+        length = len(text)
+        start = position = 0
+        while position < length:
+            node = root.get(text[position])
+            if node is None:
+                position += 1
+                continue
+            end = 0
+            index = position + 1
+            while True:
+                if None in node:
+                    end = index
+                if index == length:
+                    break
+                node = node.get(text[index])
+                if node is None:
+                    break
+                index += 1
+            if end:
+                parts.append(text[start:position])
+                parts.append(replacement)
+                start = position = end
+            else:
+                position += 1
+        if not parts:
+            return text
+        parts.append(text[start:])
+        return "".join(parts)
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: SecretsMatcher | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
@@ -213,21 +331,20 @@ class SecretsMasker(logging.Filter):
         if cls._redact is not SecretsMasker._redact:
             sig = inspect.signature(cls._redact)
             # Compat for older versions of the OpenLineage plugin which subclasses this -- call the method
-            # without the replacement character
-            for param in sig.parameters.values():
-                if param.name == "replacement" or param.kind == param.VAR_KEYWORD:
-                    break
-            else:
-                # Block only runs if no break above.
-
+            # without the replacement character, or without copy_on_write
+            if any(param.kind == param.VAR_KEYWORD for param in sig.parameters.values()):
+                return
+            unsupported = {"replacement", "copy_on_write"}.difference(sig.parameters)
+            if unsupported:
                 f = cls._redact
 
                 @functools.wraps(f)
-                def _redact(*args, replacement: str = "***", **kwargs):
+                def _redact(*args, **kwargs):
+                    for kwarg in unsupported:
+                        kwargs.pop(kwarg, None)
                     return f(*args, **kwargs)
 
                 cls._redact = _redact
-                ...
 
     @classmethod
     def enable_log_masking(cls) -> None:
@@ -287,7 +404,7 @@ class SecretsMasker(logging.Filter):
 
             visited.add(id(exception))
 
-            exception.args = tuple(self.redact(v) for v in exception.args)
+            exception.args = tuple(self.redact(v, copy_on_write=True) for v in exception.args)
             if exception.__context__:
                 exception.__context__ = self._redact_exception_with_context_or_cause(
                     exception.__context__, visited
@@ -310,7 +427,7 @@ class SecretsMasker(logging.Filter):
         if self.replacer:
             for k, v in record.__dict__.items():
                 if k not in self._record_attrs_to_ignore:
-                    record.__dict__[k] = self.redact(v)
+                    record.__dict__[k] = self.redact(v, copy_on_write=True)
             if record.exc_info and record.exc_info[1] is not None:
                 exc = record.exc_info[1]
                 self._redact_exception_with_context_or_cause(exc)
@@ -347,7 +464,13 @@ class SecretsMasker(logging.Filter):
         return item
 
     def _redact(
-        self, item: Redactable, name: str | None, depth: int, max_depth: int, replacement: str = "***"
+        self,
+        item: Redactable,
+        name: str | None,
+        depth: int,
+        max_depth: int,
+        replacement: str = "***",
+        copy_on_write: bool = False,
     ) -> Redacted:
         try:
             # Key-name-based redaction is unbounded by depth — sensitive keys
@@ -362,6 +485,23 @@ class SecretsMasker(logging.Filter):
             # by the except clause below (which fails closed via
             # "<redaction-failed>").
             if isinstance(item, dict):
+                if copy_on_write:
+                    redacted_dict = None
+                    for dict_key, subval in item.items():
+                        redacted = self._redact(
+                            subval,
+                            name=dict_key,
+                            depth=(depth + 1),
+                            max_depth=max_depth,
+                            replacement=replacement,
+                            copy_on_write=True,
+                        )
+                        if redacted_dict is None:
+                            if redacted is subval:
+                                continue
+                            redacted_dict = dict(item)
+                        redacted_dict[dict_key] = redacted
+                    return item if redacted_dict is None else redacted_dict
                 to_return = {
                     dict_key: self._redact(
                         subval, name=dict_key, depth=(depth + 1), max_depth=max_depth, replacement=replacement
@@ -393,6 +533,26 @@ class SecretsMasker(logging.Filter):
                     # the structure.
                     return self.replacer.sub(replacement, str(item))
                 return item
+            if copy_on_write and isinstance(item, (tuple, set, list)):
+                redacted_items = None
+                for index, subval in enumerate(item):
+                    redacted = self._redact(
+                        subval,
+                        name=None,
+                        depth=(depth + 1),
+                        max_depth=max_depth,
+                        replacement=replacement,
+                        copy_on_write=True,
+                    )
+                    if redacted_items is None:
+                        if redacted is subval:
+                            continue
+                        redacted_items = list(item)
+                    redacted_items[index] = redacted
+                if redacted_items is None:
+                    # Sets are turned in to tuples even when nothing is redacted, like below.
+                    return tuple(item) if isinstance(item, set) else item
+                return redacted_items if isinstance(item, list) else tuple(redacted_items)
             if isinstance(item, (tuple, set)):
                 # Turn set in to tuple!
                 return tuple(
@@ -511,6 +671,7 @@ class SecretsMasker(logging.Filter):
         name: str | None = None,
         max_depth: int | None = None,
         replacement: str = "***",
+        copy_on_write: bool = False,
     ) -> Redacted:
         """
         Redact an any secrets found in ``item``, if it is a string.
@@ -518,9 +679,18 @@ class SecretsMasker(logging.Filter):
         If ``name`` is given, and it's a "sensitive" name (see
         :func:`should_hide_value_for_key`) then all string values in the item
         is redacted.
+
+        Dicts, lists, tuples and sets are copied, even if nothing in them is redacted. With
+        ``copy_on_write``, they are only copied if something in them is redacted, and are returned
+        as they are otherwise, so the result must not be modified unless the item can be.
         """
         return self._redact(
-            item, name, depth=0, max_depth=max_depth or self.MAX_RECURSION_DEPTH, replacement=replacement
+            item,
+            name,
+            depth=0,
+            max_depth=max_depth or self.MAX_RECURSION_DEPTH,
+            replacement=replacement,
+            copy_on_write=copy_on_write,
         )
 
     def merge(
@@ -595,7 +765,6 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -607,9 +776,9 @@ class SecretsMasker(logging.Filter):
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or self.should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        if self.replacer is None:
+                            self.replacer = SecretsMatcher()
+                        self.replacer.add(s)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
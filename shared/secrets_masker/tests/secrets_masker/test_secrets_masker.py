@@ -33,6 +33,7 @@ from airflow_shared.secrets_masker.secrets_masker import (
     DEFAULT_SENSITIVE_FIELDS,
     RedactedIO,
     SecretsMasker,
+    SecretsMatcher,
     mask_secret,
     merge,
     redact,
@@ -659,6 +660,57 @@ class TestSecretsMasker:
 
         assert filt.redact(value, name, replacement="*️⃣*️⃣*️⃣") == expected
 
+    def test_redact_copy_on_write(self):
+        filt = SecretsMasker()
+        configure_secrets_masker_for_test(filt)
+        filt.add_mask("secret")
+        innocent = {"conf": {"spark.executor.memory": "4g"}, "args": ["--verbose"], "env": ("a", "b")}
+        value = {"innocent": innocent, "leaky": ["x", "my secret", {"y"}]}
+
+        redacted = filt.redact(value, copy_on_write=True)
+
+        assert redacted == {"innocent": innocent, "leaky": ["x", "my ***", ("y",)]}
+        assert redacted is not value
+        assert redacted["innocent"] is innocent
+        assert value["leaky"][1] == "my secret"
+        # Sensitive names are still redacted.
+        assert filt.redact({"password": "pass"}, copy_on_write=True) == {"password": "***"}
+
+    def test_redact_copy_on_write_turns_unchanged_set_into_tuple(self):
+        filt = SecretsMasker()
+        configure_secrets_masker_for_test(filt)
+        filt.add_mask("secret")
+
+        redacted = filt.redact({1, 2}, copy_on_write=True)
+
+        assert isinstance(redacted, tuple)
+        assert sorted(redacted) == [1, 2]
+        assert redacted == filt.redact({1, 2})
+
+    def test_redact_without_copy_on_write_copies(self):
+        filt = SecretsMasker()
+        configure_secrets_masker_for_test(filt)
+        filt.add_mask("secret")
+        value = {"conf": {"key": "value"}, "args": ["--verbose"]}
+
+        redacted = filt.redact(value)
+
+        assert redacted == value
+        assert redacted is not value
+        assert redacted["conf"] is not value["conf"]
+        assert redacted["args"] is not value["args"]
+
+    def test_redact_copy_on_write_with_subclass_not_supporting_it(self):
+        class OldMasker(SecretsMasker):
+            def _redact(self, item, name, depth, max_depth, replacement="***"):
+                return super()._redact(item, name, depth, max_depth, replacement=replacement)
+
+        filt = OldMasker()
+        configure_secrets_masker_for_test(filt)
+        filt.add_mask("secret")
+
+        assert filt.redact(["secret"], copy_on_write=True) == ["***"]
+
     def test_redact_filehandles(self, caplog):
         filt = SecretsMasker()
         configure_secrets_masker_for_test(filt)
@@ -806,6 +858,75 @@ class TestSecretsMasker:
         assert SecretsMasker.mask_secrets_in_logs == state
 
 
+class TestSecretsMatcher:
+    @pytest.fixture(params=[True, False], ids=["regex", "trie"])
+    def matcher(self, request):
+        matcher = SecretsMatcher()
+        if not request.param:
+            matcher.REGEX_MAX_SECRETS = 0
+        return matcher
+
+    def test_add(self, matcher):
+        assert not matcher
+        assert matcher.add("secret")
+        assert not matcher.add("secret")
+        assert not matcher.add("")
+        assert len(matcher) == 1
+
+    @pytest.mark.parametrize(
+        ("secrets", "text", "expected"),
+        [
+            (["secret"], "no match", "no match"),
+            (["secret"], "secret", "***"),
+            (["secret"], "a secret and secrets", "a *** and ***s"),
+            # The longest secret at a position is replaced, whatever the order it was added in.
+            (["secret", "secret_key"], "secret_key=1", "***=1"),
+            (["secret_key", "secret"], "secret_ke", "***_ke"),
+            # Replaced secrets do not overlap, the leftmost one wins.
+            (["abcdef", "defghi"], "abcdefghi", "***ghi"),
+            (["a.b*c", "x\\1y"], "a.b*c axb*c x\\1y", "*** axb*c ***"),
+        ],
+    )
+    def test_sub(self, matcher, secrets, text, expected):
+        for secret in secrets:
+            matcher.add(secret)
+
+        assert matcher.sub("***", text) == expected
+
+    def test_replacement_is_literal(self, matcher):
+        matcher.add("secret")
+
+        assert matcher.sub(r"\1\g<0>", "a secret") == r"a \1\g<0>"
+
+    def test_results_are_cached_until_a_secret_is_added(self, matcher):
+        matcher.add("secret")
+        text = "a secret"
+
+        assert matcher.sub("***", text) == "a ***"
+        assert matcher.sub("***", text) == "a ***"
+        assert matcher.sub("###", text) == "a ###"
+        matcher.add("a s")
+        assert matcher.sub("***", text) == "***ecret"
+
+    def test_text_without_secret_is_returned_as_is(self, matcher):
+        matcher.add("secret")
+        text = "".join(["no ", "match"])
+
+        assert matcher.sub("***", text) is text
+        # An equal string found in the cache is not returned instead.
+        other = "".join(["no ", "match"])
+        assert matcher.sub("***", other) is other
+
+    def test_many_secrets(self):
+        matcher = SecretsMatcher()
+        secrets = [f"secret-{i:05}" for i in range(SecretsMatcher.REGEX_MAX_SECRETS * 4)]
+        for secret in secrets:
+            matcher.add(secret)
+        text = " ".join(secrets[::7])
+
+        assert matcher.sub("***", text) == " ".join(["***"] * len(secrets[::7]))
+
+
 class TestShouldHideValueForKey:
     @pytest.mark.parametrize(
         ("key", "expected_result"),
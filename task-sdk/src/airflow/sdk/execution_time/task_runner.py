@@ -1100,7 +1100,7 @@ def _serialize_rendered_fields(task: AbstractOperator) -> dict[str, JsonValue]:
         # Redact secrets in the task process itself before sending to API server
         # This ensures that the secrets those are registered via mask_secret() on workers / dag processor are properly masked
         # on the UI.
-        redacted = redact(serialized, field)
+        redacted = redact(serialized, field, copy_on_write=True)
         rendered_fields[field] = TypeAdapter(JsonValue).validate_python(redacted)
 
     renderers = getattr(task, "template_fields_renderers", {})
@@ -1127,7 +1127,7 @@ def _serialize_rendered_fields(task: AbstractOperator) -> dict[str, JsonValue]:
 
         if current is not None:
             serialized = _serialize_template_field(current, renderer_path)
-            redacted = redact(serialized, renderer_path)
+            redacted = redact(serialized, renderer_path, copy_on_write=True)
             rendered_fields[renderer_path] = TypeAdapter(JsonValue).validate_python(redacted)
 
     return rendered_fields
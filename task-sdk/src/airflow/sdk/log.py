@@ -54,7 +54,7 @@ class _ActiveLoggingConfig:
 
 
 def mask_logs(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    event_dict = redact(event_dict)  # type: ignore[assignment]
+    event_dict = redact(event_dict, copy_on_write=True)  # type: ignore[assignment]
     return event_dict
 
 